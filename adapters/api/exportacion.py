@@ -0,0 +1,180 @@
+# adapters/api/exportacion.py
+import csv
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, Sequence
+from xml.sax.saxutils import escape
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from adapters.infrastructure.repositories.keyset import filtro_despues_de
+
+FORMATO_CSV = 'csv'
+FORMATO_XLSX = 'xlsx'
+TIPOS_CONTENIDO = {
+    FORMATO_CSV: 'text/csv; charset=utf-8',
+    FORMATO_XLSX: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+FILAS_POR_ENVIO = 500
+FILAS_POR_LOTE = 2000
+
+
+def filas_por_lotes(qs: QuerySet, campos: Sequence[str], orden: Sequence[str] = ('id',),
+                    tamano: int = FILAS_POR_LOTE) -> Iterator[tuple]:
+    """
+    Recorre `qs` en lotes keyset (WHERE orden > último ORDER BY orden LIMIT tamano).
+    No usamos `.iterator()`: en MySQL el driver trae el resultado completo al primer
+    fetch, así que un exporte grande quedaría entero en memoria. Cada lote es una
+    consulta corta sobre el índice de `orden`, sin OFFSET y sin transacción abierta.
+    """
+    n, ultimo = len(orden), None
+    while True:
+        lote = qs
+        if ultimo is not None:
+            lote = lote.filter(filtro_despues_de(orden, ultimo))
+        filas = list(lote.order_by(*orden).values_list(*orden, *campos)[:tamano])
+        for fila in filas:
+            yield fila[n:]
+        if len(filas) < tamano:
+            return
+        ultimo = filas[-1][:n]
+
+
+def respuesta_exportacion(nombre: str, encabezados: Sequence[str], filas: Iterable[Sequence[Any]],
+                          formato: str = None) -> StreamingHttpResponse:
+    """
+    Respuesta en streaming para exportes grandes (contabilidad).
+    `filas` debe ser perezoso (p. ej. `filas_por_lotes(qs, campos)`): cada lote se lee,
+    se escribe y se envía; la memoria no crece con el tamaño del exporte y el
+    encabezado sale antes de ejecutar la primera consulta.
+    Parámetro de la API: `formato` (no `format`, que DRF reserva para sus renderers).
+    """
+    formato = (formato or FORMATO_CSV).lower()
+    if formato not in TIPOS_CONTENIDO:
+        raise ValueError(f"Formato no soportado: {formato}. Use csv o xlsx.")
+
+    generador = _csv(encabezados, filas) if formato == FORMATO_CSV else _xlsx(encabezados, filas)
+    respuesta = StreamingHttpResponse(generador, content_type=TIPOS_CONTENIDO[formato])
+    respuesta['Content-Disposition'] = f'attachment; filename="{nombre}.{formato}"'
+    respuesta['X-Accel-Buffering'] = 'no'  # nginx: enviar cada bloque sin acumular
+    return respuesta
+
+
+# --- CSV ---
+class _Eco:
+    """Pseudo-archivo: csv.writer devuelve la línea en lugar de guardarla."""
+    def write(self, valor):
+        return valor
+
+
+def _csv(encabezados, filas) -> Iterator[bytes]:
+    escritor = csv.writer(_Eco())
+    # BOM: Excel abre el CSV en UTF-8 (tildes y ñ) sin asistente de importación
+    yield ('\ufeff' + escritor.writerow(encabezados)).encode('utf-8')
+    bloque = []
+    for fila in filas:
+        bloque.append(escritor.writerow([_texto(v) for v in fila]))
+        if len(bloque) >= FILAS_POR_ENVIO:
+            yield ''.join(bloque).encode('utf-8')
+            bloque = []
+    if bloque:
+        yield ''.join(bloque).encode('utf-8')
+
+
+def _texto(valor) -> str:
+    if valor is None:
+        return ''
+    if isinstance(valor, datetime):
+        return timezone.localtime(valor).strftime('%Y-%m-%d %H:%M:%S') if timezone.is_aware(valor) \
+            else valor.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, bool):
+        return 'SI' if valor else 'NO'
+    return str(valor)
+
+
+# --- XLSX (SpreadsheetML mínimo, sin dependencias) ---
+class _Sumidero:
+    """Destino no posicionable del ZIP: acumula los bytes comprimidos hasta el siguiente envío."""
+    def __init__(self):
+        self._partes = []
+
+    def write(self, datos):
+        self._partes.append(bytes(datos))
+        return len(datos)
+
+    def flush(self):
+        pass
+
+    def vaciar(self) -> bytes:
+        datos, self._partes = b''.join(self._partes), []
+        return datos
+
+
+_NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_NS_PKG = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_ESTATICOS = {
+    '[Content_Types].xml': (
+        _XML + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        _XML + f'<Relationships xmlns="{_NS_PKG}">'
+        f'<Relationship Id="rId1" Type="{_NS_REL}/officeDocument" Target="xl/workbook.xml"/></Relationships>'
+    ),
+    'xl/workbook.xml': (
+        _XML + f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}">'
+        '<sheets><sheet name="Datos" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        _XML + f'<Relationships xmlns="{_NS_PKG}">'
+        f'<Relationship Id="rId1" Type="{_NS_REL}/worksheet" Target="worksheets/sheet1.xml"/></Relationships>'
+    ),
+}
+_CONTROL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _xlsx(encabezados, filas) -> Iterator[bytes]:
+    sumidero = _Sumidero()
+    with zipfile.ZipFile(sumidero, 'w', compression=zipfile.ZIP_DEFLATED) as libro:
+        for nombre, contenido in _ESTATICOS.items():
+            libro.writestr(nombre, contenido)
+        # force_zip64: el tamaño final de la hoja no se conoce de antemano
+        with libro.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as hoja:
+            hoja.write(f'{_XML}<worksheet xmlns="{_NS_MAIN}"><sheetData>'.encode('utf-8'))
+            hoja.write(_fila_xml(encabezados))
+            yield sumidero.vaciar()
+            for numero, fila in enumerate(filas, start=1):
+                hoja.write(_fila_xml(fila))
+                if numero % FILAS_POR_ENVIO == 0:
+                    yield sumidero.vaciar()
+            hoja.write(b'</sheetData></worksheet>')
+    yield sumidero.vaciar()
+
+
+def _fila_xml(fila) -> bytes:
+    return ('<row>' + ''.join(_celda_xml(v) for v in fila) + '</row>').encode('utf-8')
+
+
+def _celda_xml(valor) -> str:
+    if valor is None:
+        return '<c/>'
+    if isinstance(valor, bool):
+        return f'<c t="b"><v>{int(valor)}</v></c>'
+    if isinstance(valor, (int, float, Decimal)):
+        return f'<c><v>{valor}</v></c>'
+    texto = escape(_CONTROL.sub('', _texto(valor)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{texto}</t></is></c>'
@@ -0,0 +1,27 @@
+# adapters/api/filtros.py
+from django.db.models import Q
+from rest_framework import filters
+
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
+
+
+class BusquedaSocioFilter(filters.SearchFilter):
+    """
+    SearchFilter (?search=) cuyo criterio sobre el socio usa el índice socios_busqueda
+    (prefijo de cédula o de nombres/apellidos, sin tildes) en lugar de LIKE '%x%' con JOIN.
+    Semántica de prefijo: una subcadena intermedia de la cédula ya no coincide.
+    La vista declara `busqueda_socio_campo`: 'id' en socios, 'socio_id' en tablas hijas.
+    Los `search_fields` que no son del socio se siguen resolviendo como SearchFilter y
+    se suman con OR.
+    """
+    def filter_queryset(self, request, queryset, view):
+        texto = ' '.join(self.get_search_terms(request))
+        campo = getattr(view, 'busqueda_socio_campo', None)
+        if not texto or campo is None:
+            return super().filter_queryset(request, queryset, view)
+
+        filtro = Q(**{f"{campo}__in": DjangoBusquedaSocioRepository().ids_coincidentes(texto)})
+        if self.get_search_fields(view, request):
+            otros = super().filter_queryset(request, queryset, view)
+            filtro |= Q(pk__in=otros.values('pk'))
+        return queryset.filter(filtro)
@@ -0,0 +1,152 @@
+# adapters/api/idempotencia.py
+import functools
+import hashlib
+import json
+import logging
+
+from django.core.files.uploadedfile import UploadedFile
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from adapters.infrastructure.repositories.django_idempotencia_repository import (
+    DjangoIdempotenciaRepository, COMPLETADA, EN_PROCESO, HUELLA_DISTINTA
+)
+
+logger = logging.getLogger(__name__)
+
+CABECERA = 'Idempotency-Key'
+REINTENTAR_EN_SEGUNDOS = 2
+
+
+class _ReservaPerdida(Exception):
+    """Otro worker tomó la clave mientras esta solicitud procesaba: se revierte todo."""
+
+
+def idempotente(alcance: str, repositorio_factory=DjangoIdempotenciaRepository, atomica: bool = True):
+    """
+    Decorador para vistas de escritura de caja (cobros, abonos, POS, emisión masiva).
+    Si la solicitud trae `Idempotency-Key`:
+    1. Reserva la clave ANTES de ejecutar (INSERT único, confirmado de inmediato).
+    2. Duplicado en vuelo -> 409 + Retry-After (no se ejecuta dos veces).
+    3. Clave ya completada -> se reproduce la respuesta guardada (cabecera Idempotent-Replayed).
+    4. Misma clave con otro cuerpo / usuario -> 422.
+    Las respuestas < 500 se guardan; ante 5xx o excepción se revierte y se libera la clave.
+    Sin cabecera la vista se ejecuta tal cual (compatibilidad con clientes antiguos).
+
+    atomica=True: la vista y el `completar` corren en UNA transacción. Si el proceso muere
+    antes del COMMIT no queda ni el cobro ni la respuesta, y la clave (aún EN_PROCESO)
+    puede re-ejecutarse sin cobrar dos veces. atomica=False solo para vistas reanudables
+    que confirman por lotes (emisión masiva con bitácora de corrida).
+
+    Debe ir DEBAJO de @action y ENCIMA de @transaction.atomic: la reserva no puede
+    vivir dentro de la transacción de negocio o sería invisible para el duplicado.
+    """
+    def decorador(vista):
+        @functools.wraps(vista)
+        def envoltura(self, request, *args, **kwargs):
+            clave = (request.headers.get(CABECERA) or '').strip()
+            if not clave:
+                return vista(self, request, *args, **kwargs)
+            if len(clave) > 255:
+                return Response({"error": f"{CABECERA} excede 255 caracteres."}, status=status.HTTP_400_BAD_REQUEST)
+
+            repo = repositorio_factory()
+            usuario_id = getattr(request.user, 'id', None)
+            resultado, registro = repo.reservar(alcance, clave, huella_solicitud(request), usuario_id)
+
+            if resultado == COMPLETADA:
+                respuesta = Response(registro["respuesta"], status=registro["status_code"])
+                respuesta['Idempotent-Replayed'] = 'true'
+                return respuesta
+            if resultado == EN_PROCESO:
+                return _respuesta_en_proceso()
+            if resultado == HUELLA_DISTINTA:
+                return Response(
+                    {"error": "La Idempotency-Key ya se usó con un cuerpo de solicitud distinto."},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+
+            if not atomica:
+                return _ejecutar_reanudable(vista, self, request, args, kwargs, repo, alcance, clave)
+
+            try:
+                with transaction.atomic():
+                    respuesta = vista(self, request, *args, **kwargs)
+                    datos = _datos_guardables(respuesta, alcance, clave)
+                    if datos is None:
+                        transaction.set_rollback(True)
+                    elif not repo.completar(alcance, clave, respuesta.status_code, datos, registro["version"]):
+                        raise _ReservaPerdida()
+            except _ReservaPerdida:
+                logger.warning("Reserva %s:%s tomada por otro worker; se revierte esta ejecución", alcance, clave)
+                return _respuesta_en_proceso()
+            except Exception:
+                repo.liberar(alcance, clave)
+                raise
+
+            if datos is None:
+                repo.liberar(alcance, clave)
+            return respuesta
+        return envoltura
+    return decorador
+
+
+def _ejecutar_reanudable(vista, vista_self, request, args, kwargs, repo, alcance: str, clave: str):
+    """La vista confirma por su cuenta (por lotes); la respuesta se guarda al final."""
+    try:
+        respuesta = vista(vista_self, request, *args, **kwargs)
+    except Exception:
+        repo.liberar(alcance, clave)
+        raise
+    datos = _datos_guardables(respuesta, alcance, clave)
+    if datos is None:
+        repo.liberar(alcance, clave)
+    else:
+        repo.completar(alcance, clave, respuesta.status_code, datos)
+    return respuesta
+
+
+def _datos_guardables(respuesta, alcance: str, clave: str):
+    """Cuerpo JSON a guardar, o None si la respuesta no se debe reproducir (5xx / no serializable)."""
+    if respuesta.status_code >= 500 or not hasattr(respuesta, 'data'):
+        return None
+    try:
+        return json.loads(json.dumps(respuesta.data, cls=DjangoJSONEncoder))
+    except (TypeError, ValueError):
+        logger.warning("Respuesta no serializable para %s:%s; se libera la clave", alcance, clave)
+        return None
+
+
+def _respuesta_en_proceso() -> Response:
+    respuesta = Response(
+        {"error": "Una solicitud con la misma Idempotency-Key aún se está procesando."},
+        status=status.HTTP_409_CONFLICT
+    )
+    respuesta['Retry-After'] = str(REINTENTAR_EN_SEGUNDOS)
+    return respuesta
+
+
+def huella_solicitud(request) -> str:
+    """SHA-256 de usuario + método + ruta + cuerpo canónico (claves ordenadas; archivos por nombre:tamaño)."""
+    contenido = {
+        "usuario": getattr(request.user, 'id', None),
+        "metodo": request.method,
+        "ruta": request.path,
+        "cuerpo": _canonico(request.data),
+    }
+    serializado = json.dumps(contenido, sort_keys=True, cls=DjangoJSONEncoder, default=str)
+    return hashlib.sha256(serializado.encode('utf-8')).hexdigest()
+
+
+def _canonico(datos):
+    if hasattr(datos, 'lists'):  # QueryDict (multipart / form)
+        return {k: [_canonico(v) for v in valores] for k, valores in datos.lists()}
+    if isinstance(datos, dict):
+        return {str(k): _canonico(v) for k, v in datos.items()}
+    if isinstance(datos, (list, tuple)):
+        return [_canonico(v) for v in datos]
+    if isinstance(datos, UploadedFile):
+        return f"{datos.name}:{datos.size}"
+    return datos
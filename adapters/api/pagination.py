@@ -0,0 +1,90 @@
+# adapters/api/pagination.py
+import base64
+import binascii
+import json
+
+from typing import Any, Callable, List, Optional
+
+from django.core.exceptions import ValidationError
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from adapters.infrastructure.repositories.keyset import filtro_despues_de
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación por llave (keyset / seek) para listados grandes.
+    En lugar de OFFSET filtra "después de la última fila vista":
+        WHERE (fecha, id) < (:fecha, :id) ORDER BY fecha DESC, id DESC
+    Con un índice compuesto sobre `ordering`, la página 1.000 cuesta lo mismo que la 1.
+    El último campo de `ordering` debe ser único (normalmente `id`) para desempatar.
+    """
+    ordering = ('-fecha', '-id')
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = queryset.order_by(*self.ordering)
+
+        def consultar(despues_de, limite):
+            qs = queryset.filter(filtro_despues_de(self.ordering, despues_de)) if despues_de else queryset
+            return qs[:limite]
+
+        return self.paginate_consulta(consultar, request)
+
+    def paginate_consulta(self, consultar: Callable[[Optional[list], int], List[Any]], request) -> List[Any]:
+        """
+        Misma paginación cuando la consulta vive en un repositorio:
+        `consultar(despues_de, limite)` aplica el keyset y el LIMIT en la BD y retorna
+        objetos con los atributos de `ordering` (modelos, entidades o DTOs).
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        despues_de = self._decodificar(cursor) if cursor else None
+        try:
+            # Una fila extra para saber si hay siguiente página sin COUNT(*)
+            filas = list(consultar(despues_de, self.page_size + 1))
+        except (ValidationError, ValueError, TypeError):
+            if despues_de is None:
+                raise
+            raise NotFound("Cursor inválido.")
+        self.siguiente = self._codificar(filas[self.page_size - 1]) if len(filas) > self.page_size else None
+        return filas[:self.page_size]
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self):
+        if self.siguiente is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.siguiente)
+
+    def get_page_size(self, request):
+        try:
+            solicitado = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(solicitado, self.max_page_size))
+
+    # --- Cursor opaco: base64(JSON con los valores de `ordering` de la última fila) ---
+    def _codificar(self, fila) -> str:
+        # Filas: modelos, entidades, DTOs o diccionarios ya armados por la vista
+        leer = fila.get if isinstance(fila, dict) else lambda campo: getattr(fila, campo)
+        valores = [leer(campo.lstrip('-')) for campo in self.ordering]
+        return base64.urlsafe_b64encode(json.dumps(valores, default=str).encode()).decode()
+
+    def _decodificar(self, cursor: str) -> list:
+        try:
+            valores = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError):
+            raise NotFound("Cursor inválido.")
+        if not isinstance(valores, list) or len(valores) != len(self.ordering):
+            raise NotFound("Cursor inválido.")
+        return valores
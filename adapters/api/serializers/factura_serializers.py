@@ -40,6 +40,16 @@ class EmisionMasivaSerializer(serializers.Serializer):
     anio = serializers.IntegerField(min_value=2020)
     usuario_id = serializers.IntegerField(required=False)
 
+class FacturacionParalelaSerializer(serializers.Serializer):
+    """
+    Valida la orden de facturación fija paralela (particionada por barrio o rango de socios).
+    """
+    mes = serializers.IntegerField(min_value=1, max_value=12)
+    anio = serializers.IntegerField(min_value=2020)
+    fecha_emision = serializers.DateField(required=False)
+    estrategia = serializers.ChoiceField(choices=['barrio', 'rango'], default='barrio')
+    tamano_rango = serializers.IntegerField(min_value=50, max_value=10000, default=500)
+
 # =============================================================================
 # 2. SERIALIZERS PARA COBROS Y PAGOS (TESORERO / SOCIO)
 # =============================================================================
@@ -79,6 +89,14 @@ class ValidarPagoSerializer(serializers.Serializer):
     accion = serializers.ChoiceField(choices=['APROBAR', 'RECHAZAR'])
     motivo_rechazo = serializers.CharField(required=False, allow_blank=True)
 
+# 5. ✅ Conciliación masiva contra el extracto bancario
+class ConciliarExtractoSerializer(serializers.Serializer):
+    archivo = serializers.FileField(help_text="Extracto bancario en CSV (fecha, referencia, monto) u OFX")
+    formato = serializers.ChoiceField(choices=['csv', 'ofx'], required=False, help_text="Por defecto se detecta")
+    tolerancia_dias = serializers.IntegerField(required=False, min_value=0, max_value=15)
+    simular = serializers.BooleanField(required=False, default=False,
+                                       help_text="Solo empareja, no aprueba")
+
 # =============================================================================
 # 3. SERIALIZERS DE SALIDA (RESPUESTA AL FRONTEND)
 # =============================================================================
@@ -47,6 +47,24 @@ class RegistrarLecturaSerializer(serializers.Serializer):
             observacion=self.validated_data.get('observacion')
         )
 
+class LecturaSyncSerializer(RegistrarLecturaSerializer):
+    """
+    Lectura subida por la app offline. `referencia_cliente` (UUID del dispositivo)
+    hace que reenviar el mismo lote sea idempotente.
+    """
+    referencia_cliente = serializers.CharField(required=True, max_length=64)
+
+    def to_dto(self) -> RegistrarLecturaDTO:
+        dto = super().to_dto()
+        return RegistrarLecturaDTO(
+            medidor_id=dto.medidor_id,
+            lectura_actual=dto.lectura_actual,
+            fecha_lectura=dto.fecha_lectura,
+            operador_id=dto.operador_id,
+            observacion=dto.observacion,
+            referencia_cliente=self.validated_data['referencia_cliente']
+        )
+
 # =============================================================================
 # 2. SERIALIZERS DE SALIDA (Response)
 # =============================================================================
@@ -74,6 +92,22 @@ class LecturaResponseSerializer(serializers.ModelSerializer):
             'observacion', 'esta_facturada'
         ]
 
+class LecturaValorSerializer(serializers.ModelSerializer):
+    """
+    Serializer 'Delgado' del historial: solo valores de la propia tabla de lecturas.
+    No toca medidor/terreno/socio (sin JOINs): para gráficos y validaciones.
+    """
+    fecha = serializers.DateField(format="%Y-%m-%d")
+    lectura_actual = serializers.DecimalField(source='valor', max_digits=12, decimal_places=2)
+    lectura_anterior = serializers.DecimalField(max_digits=12, decimal_places=2)
+    consumo = serializers.DecimalField(source='consumo_del_mes', max_digits=12, decimal_places=2)
+
+    class Meta:
+        model = LecturaModel
+        fields = ['id', 'medidor_id', 'fecha', 'anio', 'mes', 'lectura_anterior', 'lectura_actual',
+                  'consumo', 'esta_facturada']
+
+
 class LecturaHistorialSerializer(serializers.ModelSerializer):
     """
     Serializer 'Aplanado' (Flattened) optimizado para Tablas de Historial en Angular.
@@ -49,6 +49,10 @@ class MedidorSerializer(serializers.ModelSerializer):
 
         # 2. Si es un DTO o Entidad, sacamos el ID y buscamos en BD manualmente
         t_id = getattr(obj, 'terreno_id', None)
+        # Listados: la vista precarga los terrenos de la página en una consulta
+        precargados = self.context.get('terrenos')
+        if t_id and precargados is not None:
+            return precargados.get(t_id)
         if t_id:
             try:
                 # Usamos select_related para traer barrio y socio en 1 sola consulta
@@ -83,6 +87,12 @@ class MedidorSerializer(serializers.ModelSerializer):
         Busca la última lectura registrada para este medidor.
         Si no hay lecturas previas, devuelve la lectura inicial del medidor.
         """
+        # ⚡ Snapshot desnormalizado (Modelo, Entidad o DTO): sin consulta por fila
+        if hasattr(obj, 'ultima_lectura_valor'):
+            if obj.ultima_lectura_valor is not None:
+                return float(obj.ultima_lectura_valor)
+            return float(obj.lectura_inicial)
+
         try:
             # Buscamos en la tabla de lecturas, filtrando por este medidor
             # Ordenamos por fecha descendente (la más nueva primero)
@@ -90,7 +90,11 @@ from adapters.api.views import (
     # Gobernanza
     EventoViewSet, SolicitudJustificacionViewSet, AsistenciaViewSet,
     # Extras Integrados
-    CobroLecturaViewSet
+    CobroLecturaViewSet,
+    # Sync Offline
+    SincronizacionViewSet,
+    # Reportes pesados
+    ReporteAsincronoViewSet
 )
 from adapters.api.views.sri_views import SincronizadorSRIView
 
@@ -108,6 +112,7 @@ router.register(r'cobros-consulta', CobroLecturaViewSet, basename='cobro-consult
 router.register(r'facturas', FacturaViewSet, basename='factura')       # Historial
 router.register(r'pagos', PagoViewSet, basename='pago')                # Historial Pagos
 router.register(r'analytics', AnalyticsViewSet, basename='analytics')
+router.register(r'reportes', ReporteAsincronoViewSet, basename='reporte')  # Reportes pesados (async)
 
 # ✅ LA LÍNEA MÁGICA (Traída del Código 2 para salvar el Dashboard)
 router.register(r'facturas-gestion', FacturaViewSet, basename='factura-gestion')
@@ -123,6 +128,7 @@ router.register(r'ordenes-trabajo', OrdenTrabajoViewSet, basename='orden-trabajo
 router.register(r'cortes', CortesViewSet, basename='corte')
 router.register(r'medidores', MedidorViewSet, basename='medidor')
 router.register(r'lecturas', LecturaViewSet, basename='lectura')
+router.register(r'sincronizacion', SincronizacionViewSet, basename='sincronizacion') # App Lecturas Offline
 # router.register(r'servicios-agua', ServicioAguaViewSet, basename='servicio-agua') # Activar si existe
 
 # --- 5. Inventario & POS ---
@@ -18,6 +18,8 @@ from .servicio_views import OrdenTrabajoViewSet, CortesViewSet # Gestión Operat
 from .socio_views import SocioViewSet                   # Gestión de Socios
 from .terreno_views import TerrenoViewSet               # Gestión de Terrenos
 from .servicio_agua_views import ServicioAguaViewSet    # CRUD Servicios Base
+from .sincronizacion_views import SincronizacionViewSet # Sync App de Lecturas (Offline)
+from .reporte_views import ReporteAsincronoViewSet     # Reportes pesados (Celery)
 
 # --- Comercial Helpers ---
 from .comercial_views import (
@@ -5,14 +5,18 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
-from django.db.models import Sum
-from django.utils import timezone
 from datetime import datetime
 
+from adapters.api.exportacion import respuesta_exportacion, FILAS_POR_LOTE
 from adapters.infrastructure.models.factura_model import FacturaModel
-from adapters.infrastructure.models.pago_model import PagoModel
 from adapters.infrastructure.models.cuenta_por_cobrar_model import CuentaPorCobrarModel
-from core.shared.enums import EstadoFactura
+from core.shared.enums import EstadoFactura, EstadoFinanciero
+from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
+from core.use_cases.reporting.obtener_kpis_dashboard_uc import ObtenerKpisDashboardUseCase
+from core.use_cases.reporting.generar_cierre_caja_uc import GenerarCierreCajaUseCase
+from core.services.cubo_analitico_service import CuboAnaliticoService
+from adapters.infrastructure.repositories.django_hechos_analiticos_repository import DjangoHechosAnaliticosRepository
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
 
 class AnalyticsViewSet(viewsets.ViewSet):
     """
@@ -57,15 +61,70 @@ class AnalyticsViewSet(viewsets.ViewSet):
         # ⚠️ IMPORTANTE: Retornamos la LISTA directa para que Angular pueda hacer .reduce()
         return Response(lista_socios, status=status.HTTP_200_OK)
 
+    # -------------------------------------------------------------------------
+    # 1.1 ANTIGÜEDAD DE CARTERA (Tramos calculados en la BD)
+    # -------------------------------------------------------------------------
+    @extend_schema(
+        summary="Antigüedad de Cartera por Socio",
+        description="Deuda pendiente por socio en tramos (corriente / 31-90 días / > 90 días), "
+                    "ordenada de mayor a menor y paginada en la base de datos.",
+        parameters=[
+            OpenApiParameter('page', OpenApiTypes.INT, required=False),
+            OpenApiParameter('page_size', OpenApiTypes.INT, description="Máx. 500 (default 50)", required=False),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='cartera-antiguedad')
+    def cartera_antiguedad(self, request):
+        try:
+            pagina = max(1, int(request.query_params.get('page', 1)))
+            tamano = min(500, max(1, int(request.query_params.get('page_size', 50))))
+        except ValueError:
+            return Response({"error": "page y page_size deben ser enteros."}, status=status.HTTP_400_BAD_REQUEST)
+
+        uc = GenerarReporteCarteraUseCase()
+        return Response({
+            "count": uc.contar(),
+            "page": pagina,
+            "page_size": tamano,
+            "resumen": uc.resumen(),
+            "results": uc.execute(limite=tamano, offset=(pagina - 1) * tamano)
+        }, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Exportar Antigüedad de Cartera (CSV/XLSX)",
+        description="Toda la cartera por socio (orden por ID de socio), en streaming por lotes.",
+        parameters=[OpenApiParameter('formato', OpenApiTypes.STR, description="csv (default) | xlsx", required=False)],
+        responses={200: OpenApiTypes.BINARY}
+    )
+    @action(detail=False, methods=['get'], url_path='cartera-antiguedad/exportar')
+    def exportar_cartera(self, request):
+        columnas = ('socio_id', 'identificacion', 'nombre', 'barrio', 'facturas_pendientes',
+                    'corriente', 'vencido_1_3', 'incobrable', 'total_deuda')
+        filas = (
+            tuple(fila[c] for c in columnas)
+            for fila in GenerarReporteCarteraUseCase().iterar(tamano_lote=FILAS_POR_LOTE)
+        )
+        try:
+            return respuesta_exportacion('cartera', [
+                'Socio', 'Identificación', 'Nombre', 'Barrio', 'Facturas Pendientes',
+                'Corriente', 'Vencido 31-90', 'Incobrable > 90', 'Total Deuda'
+            ], filas, request.query_params.get('formato'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
     # -------------------------------------------------------------------------
     # 2. CIERRE DE CAJA
     # -------------------------------------------------------------------------
     @extend_schema(
-        summary="Cierre de Caja Diario",
-        description="Retorna el total recaudado hoy.",
+        summary="Cierre de Caja",
+        description="Total recaudado (pagos validados) en el rango, desglosado por método de pago. "
+                    "Días completos en hora de Ecuador (America/Guayaquil); por defecto, hoy.",
         parameters=[
             OpenApiParameter('fecha_inicio', OpenApiTypes.DATE, description="YYYY-MM-DD", required=False),
             OpenApiParameter('fecha_fin', OpenApiTypes.DATE, description="YYYY-MM-DD", required=False),
+            OpenApiParameter('cajero', OpenApiTypes.INT, description="ID del usuario que cobró", required=False),
+            OpenApiParameter('series', OpenApiTypes.STR, description="dia,mes,cajero", required=False),
         ],
         responses={200: OpenApiTypes.OBJECT}
     )
@@ -73,55 +132,83 @@ class AnalyticsViewSet(viewsets.ViewSet):
     def cierre_caja(self, request):
         fecha_inicio_str = request.query_params.get('fecha_inicio')
         fecha_fin_str = request.query_params.get('fecha_fin')
+        cajero = request.query_params.get('cajero')
+        series = [s.strip() for s in request.query_params.get('series', '').split(',') if s.strip()]
 
-        filtros = {}
-        # Si tu modelo tiene campo 'validado', descomenta esto:
-        # filtros = {'validado': True}
-
-        # Manejo de fechas seguro
         try:
-            if fecha_inicio_str:
-                fi = datetime.strptime(fecha_inicio_str, '%Y-%m-%d').date()
-                filtros['fecha_registro__date__gte'] = fi
-            else:
-                # Si no hay fecha inicio, usamos HOY como default
-                filtros['fecha_registro__date'] = timezone.now().date()
-
-            if fecha_fin_str:
-                ff = datetime.strptime(fecha_fin_str, '%Y-%m-%d').date()
-                filtros['fecha_registro__date__lte'] = ff
+            fi = datetime.strptime(fecha_inicio_str, '%Y-%m-%d').date() if fecha_inicio_str else None
+            ff = datetime.strptime(fecha_fin_str, '%Y-%m-%d').date() if fecha_fin_str else None
         except ValueError:
-            pass # Si la fecha viene mal formato, ignoramos filtro
-
-        pagos = PagoModel.objects.filter(**filtros)
-
-        # Sumamos 'monto' o 'monto_total' según tu base de datos
+            return Response({"error": "Formato de fecha inválido (YYYY-MM-DD)."}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            total_recaudado = pagos.aggregate(t=Sum('monto_total'))['t'] or 0.00
-        except:
-             # Fallback por si el campo se llama solo 'monto'
-            total_recaudado = pagos.aggregate(t=Sum('monto'))['t'] or 0.00
+            cierre = GenerarCierreCajaUseCase().execute(
+                fecha_inicio=fi, fecha_fin=ff, usuario_id=int(cajero) if cajero else None, series=series
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({
-            "fecha_cierre": fecha_inicio_str or str(timezone.now().date()),
-            "total_general": total_recaudado,  # <--- CAMBIO CLAVE: Angular busca 'total_general'
-            "total_recaudado": total_recaudado, # Enviamos ambos por si acaso
-            "transacciones": pagos.count()
+            **cierre,
+            "fecha_cierre": cierre["rango"]["inicio"],
+            "total_recaudado": cierre["total_general"],  # Angular usa 'total_general'; se mantiene el alias
+            "transacciones": cierre["cantidad_transacciones"]
         }, status=status.HTTP_200_OK)
 
     # -------------------------------------------------------------------------
     # 3. DASHBOARD KPIS
     # -------------------------------------------------------------------------
+    @extend_schema(
+        summary="KPIs del Dashboard (mes actual)",
+        description="Facturado, recaudado, tasa de recaudación, consumo por barrio y morosidad, "
+                    "leídos de las tablas de hechos pre-agregadas (ver `actualizado_hasta`).",
+        responses={200: OpenApiTypes.OBJECT}
+    )
     @action(detail=False, methods=['get'], url_path='dashboard-kpis')
     def dashboard(self, request):
-        now = timezone.now()
+        kpis = ObtenerKpisDashboardUseCase(DjangoHechosAnaliticosRepository(), DjangoSaldoSocioRepository()).ejecutar()
+        # Único conteo en vivo: usa idx_factura_cartera (prefijo estado_financiero)
+        kpis["facturas_pendientes"] = FacturaModel.objects.filter(
+            estado_financiero=EstadoFinanciero.PENDIENTE
+        ).count()
+        return Response(kpis, status=status.HTTP_200_OK)
+    # -------------------------------------------------------------------------
+    # 4. CUBO OLAP (consumo y recaudación)
+    # -------------------------------------------------------------------------
+    @extend_schema(
+        summary="Cubo analítico: slice / dice / roll-up",
+        description="Consumo (m³), facturado, pagado y nº de facturas por barrio × mes × tipo de servicio "
+                    "(MEDIDO/FIJO/OTRO) × tramo tarifario (BASE/EXCEDENTE/SIN_MEDICION). Se responde desde "
+                    "el cubo en memoria reconstruido cada noche (ver `generado_en`), sin consultar la BD.",
+        parameters=[
+            OpenApiParameter('medidas', OpenApiTypes.STR, description="consumo_m3,facturado,pagado,facturas", required=False),
+            OpenApiParameter('por', OpenApiTypes.STR, description="barrio,mes|anio,tipo_servicio,tramo", required=False),
+            OpenApiParameter('barrio', OpenApiTypes.STR, description="IDs separados por coma (0 = sin barrio)", required=False),
+            OpenApiParameter('tipo_servicio', OpenApiTypes.STR, required=False),
+            OpenApiParameter('tramo', OpenApiTypes.STR, required=False),
+            OpenApiParameter('desde', OpenApiTypes.STR, description="YYYY-MM", required=False),
+            OpenApiParameter('hasta', OpenApiTypes.STR, description="YYYY-MM", required=False),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='cubo')
+    def cubo(self, request):
+        cubo = CuboAnaliticoService.obtener()
+        if cubo is None:
+            return Response({"error": "El cubo analítico aún no se ha construido (construir_cubo_analitico)."},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-        # Simulamos datos si las tablas están vacías para no ver ceros feos
-        facturas_mes = FacturaModel.objects.filter(anio=now.year, mes=now.month).count()
+        def lista(nombre):
+            valor = request.query_params.get(nombre)
+            return [v.strip() for v in valor.split(',') if v.strip()] if valor else None
 
-        return Response({
-            "facturacion_mes_actual": 0.00,
-            "facturas_emitidas": facturas_mes,
-            "facturas_pendientes": 0,
-            "socios_con_deuda": 0
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        try:
+            filtros = {dim: lista(dim) for dim in ('tipo_servicio', 'tramo') if lista(dim)}
+            if lista('barrio'):
+                filtros['barrio'] = [int(b) for b in lista('barrio')]
+            resultado = cubo.consultar(
+                medidas=lista('medidas'), por=lista('por') or (), filtros=filtros,
+                desde=request.query_params.get('desde'), hasta=request.query_params.get('hasta')
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(resultado, status=status.HTTP_200_OK)
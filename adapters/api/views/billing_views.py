@@ -14,7 +14,9 @@ from adapters.api.serializers.billing_serializers import (
     EstadoCuentaSerializer
 )
 from core.use_cases.billing.process_payment import ProcesarAbonoUseCase
+from adapters.api.idempotencia import idempotente
 from adapters.infrastructure.models import SocioModel, ServicioModel, CuentaPorCobrarModel
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
 
 class ProcesarAbonoView(APIView):
     """
@@ -38,6 +40,7 @@ class ProcesarAbonoView(APIView):
         },
         tags=['Billing']
     )
+    @idempotente('billing.abonos')
     def post(self, request):
         serializer = AbonoInputSerializer(data=request.data)
         if serializer.is_valid():
@@ -82,13 +85,21 @@ class ConsultarEstadoCuentaView(APIView):
         estado_servicio = servicio.estado if servicio else "SIN_SERVICIO"
         servicio_id = servicio.id if servicio else None
         
-        # 3. Buscar Deuda Pendiente
-        cuentas_pendientes = CuentaPorCobrarModel.objects.filter(
-            socio=socio,
-            saldo_pendiente__gt=Decimal('0.00')
-        ).order_by('fecha_emision')
+        # 3. Buscar Deuda Pendiente: UNA consulta con todas las relaciones que usan los helpers
+        # (rubro, factura -> servicio -> terreno -> barrio, factura -> lectura son FKs: JOINs)
+        cuentas_pendientes = list(
+            CuentaPorCobrarModel.objects.filter(
+                socio=socio,
+                saldo_pendiente__gt=Decimal('0.00')
+            ).select_related(
+                'rubro',
+                'factura__servicio__terreno__barrio',
+                'factura__lectura'
+            ).order_by('fecha_emision', 'id')
+        )
         
-        deuda_total = sum(c.saldo_pendiente for c in cuentas_pendientes)
+        # Lectura O(1) del libro de saldos (socios_saldos)
+        deuda_total = DjangoSaldoSocioRepository().obtener_deuda_total(socio.id)
         
         # 4. Construir Respuesta DTO
         items = []
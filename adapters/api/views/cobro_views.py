@@ -1,5 +1,5 @@
 # adapters/api/views/cobro_views.py
-from rest_framework import viewsets, status, serializers, filters, permissions
+from rest_framework import viewsets, status, serializers, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
@@ -10,7 +10,6 @@ from decimal import Decimal
 # Imports del Dominio y Modelos
 from core.use_cases.registrar_cobro_uc import RegistrarCobroUseCase
 from core.shared.enums import MetodoPagoEnum, EstadoFactura, EstadoCuentaPorCobrar
-import re
 from core.shared.exceptions import BusinessRuleException, EntityNotFoundException
 from adapters.infrastructure.models import (
     FacturaModel, PagoModel, DetallePagoModel, 
@@ -18,10 +17,14 @@ from adapters.infrastructure.models import (
 )
 from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
 from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+from core.services.imputacion_pagos_service import ImputacionPagosService
+from core.use_cases.billing.conciliar_extracto_bancario import ConciliarExtractoBancarioUseCase
 from adapters.infrastructure.services.django_sri_service import DjangoSRIService
 from adapters.infrastructure.services.django_email_service import DjangoEmailService
+from adapters.api.idempotencia import idempotente
+from adapters.api.filtros import BusquedaSocioFilter
 from adapters.api.serializers.factura_serializers import (
-    RegistrarCobroSerializer, ReportarPagoSerializer, ValidarPagoSerializer
+    RegistrarCobroSerializer, ReportarPagoSerializer, ValidarPagoSerializer, ConciliarExtractoSerializer
 )
 
 # --- SERIALIZERS LOCALES (Extraídos para limpieza) ---
@@ -45,16 +48,9 @@ class CobroViewSet(viewsets.ViewSet):
     # --------------------------------------------------------------------------
     @extend_schema(request=RegistrarCobroSerializer)
     @action(detail=False, methods=['post'], url_path='registrar')
+    @idempotente('cobros.registrar') # ✅ Idempotency-Key durable (reserva fuera de la transacción)
     @transaction.atomic # ✅ Transacción controlada en el Entry Point
     def registrar_cobro(self, request):
-        # TAREA 2: Idempotencia en el Endpoint (API Layer)
-        idempotency_key = request.headers.get('Idempotency-Key')
-        if idempotency_key:
-            from django.core.cache import cache
-            cached_response = cache.get(idempotency_key)
-            if cached_response:
-                return Response(cached_response, status=status.HTTP_200_OK)
-
         serializer = RegistrarCobroSerializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -77,13 +73,10 @@ class CobroViewSet(viewsets.ViewSet):
             # Pagos directos en ventanilla nacen validados
             resultado = uc.ejecutar(
                 factura_id=serializer.validated_data['factura_id'],
-                lista_pagos=serializer.validated_data['pagos']
+                lista_pagos=serializer.validated_data['pagos'],
+                usuario_id=request.user.id
             )
-            
-            # Guardamos la respuesta si hubo un Idempotency-Key
-            if idempotency_key:
-                cache.set(idempotency_key, resultado, timeout=86400) # 24 horas
-                
+
             return Response(resultado, status=status.HTTP_200_OK)
 
         except (EntityNotFoundException, BusinessRuleException) as e:
@@ -112,7 +105,7 @@ class CobroViewSet(viewsets.ViewSet):
 
         try:
             data = serializer.validated_data
-            # Buscamos factura para obtener el SOCIO (Pago se asocia a Socio, no Factura directamente)
+            # Buscamos factura para obtener el SOCIO (el Pago queda ligado a ambos)
             factura = FacturaModel.objects.select_related('socio').get(pk=data['factura_id'])
 
             if factura.estado == EstadoFactura.PAGADA.value:
@@ -121,6 +114,7 @@ class CobroViewSet(viewsets.ViewSet):
             # 1. Crear Cabecera de Pago (Pendiente de Validación)
             pago = PagoModel.objects.create(
                 socio=factura.socio,
+                factura=factura,
                 monto_total=data['monto'],
                 validado=False,
                 observacion=f"Pago web para Factura #{factura.id}"
@@ -204,11 +198,11 @@ class CobroViewSet(viewsets.ViewSet):
                      detalle.comprobante_imagen.delete() # Limpieza S3
                 
                 # 3. Revertir estado de Factura (Si aplica)
-                # Hack: Extraer ID de la observación "Pago web para Factura #123"
-                match = re.search(r"Factura #(\d+)", pago.observacion or "")
-                if match:
-                    factura_id = int(match.group(1))
-                    FacturaModel.objects.filter(pk=factura_id).update(estado=EstadoFactura.PENDIENTE.value)
+                # save() y no .update(): queda en el historial (refresco de hechos analíticos)
+                if pago.factura_id:
+                    factura = FacturaModel.objects.get(pk=pago.factura_id)
+                    factura.estado_financiero = EstadoFactura.PENDIENTE.value
+                    factura.save(update_fields=['estado_financiero'])
 
                 pago.delete()
                 
@@ -227,43 +221,17 @@ class CobroViewSet(viewsets.ViewSet):
                 pago.validado = True
                 pago.save()
 
-                # 2. IMPUTACIÓN DE DEUDA (Lógica FIFO idéntica a ProcesarAbono)
-                # Buscamos deuda pendiente del socio
-                deudas = CuentaPorCobrarModel.objects.select_for_update().filter(
-                    socio=pago.socio,
-                    saldo_pendiente__gt=Decimal('0.00')
-                ).order_by('fecha_emision')
-
-                monto_disponible = pago.monto_total
-                cuentas_pagadas = 0
-
-                for cuenta in deudas:
-                    if monto_disponible <= 0:
-                        break
-                    
-                    abono = min(cuenta.saldo_pendiente, monto_disponible)
-                    cuenta.saldo_pendiente -= abono
-                    if cuenta.saldo_pendiente == 0:
-                        cuenta.estado = EstadoCuentaPorCobrar.PAGADA.value
-                        # Si tiene factura ligada, actualizar su estado (si aplica)
-                        if cuenta.factura:
-                            cuenta.factura.estado = EstadoFactura.PAGADA.value
-                            cuenta.factura.save()
-                    
-                    cuenta.save()
-                    monto_disponible -= abono
-                    cuentas_pagadas += 1
+                # 2. IMPUTACIÓN DE DEUDA (Motor FIFO compartido con ProcesarAbono)
+                motor = ImputacionPagosService()
+                imputacion = motor.imputar(pago.id, pago.socio_id, pago.monto_total)
+                monto_disponible = imputacion.sobrante
+                cuentas_pagadas = imputacion.cuentas_afectadas
 
                 # 3. Reactivación de Servicio (Check simple)
                 servicio = ServicioModel.objects.filter(socio=pago.socio).first()
                 msg_extra = ""
                 if servicio and servicio.estado == 'SUSPENDIDO':
-                    deuda_total = CuentaPorCobrarModel.objects.filter(
-                        socio=pago.socio, 
-                        saldo_pendiente__gt=0
-                    ).aggregate(total=models.Sum('saldo_pendiente'))['total'] or 0
-                    
-                    if deuda_total <= 0:
+                    if motor.deuda_pendiente(pago.socio_id) <= 0:
                         # Auto-Reconexión (Simplificada)
                         servicio.estado = 'ACTIVO' 
                         servicio.save()
@@ -281,6 +249,38 @@ class CobroViewSet(viewsets.ViewSet):
         except Exception as e:
             return Response({"error": "Error procesando validación", "detalle": str(e)}, status=500)
 
+    @extend_schema(
+        summary="Conciliar extracto bancario",
+        description=(
+            "Empareja las líneas del extracto (CSV u OFX) con las transferencias por validar "
+            "por referencia, monto y fecha; aprueba lo emparejado en lotes y devuelve el residuo."
+        ),
+        request={'multipart/form-data': ConciliarExtractoSerializer}
+    )
+    @action(detail=False, methods=['post'], url_path='conciliar-extracto', parser_classes=[MultiPartParser, FormParser])
+    def conciliar_extracto(self, request):
+        serializer = ConciliarExtractoSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+        datos = serializer.validated_data
+
+        crudo = datos['archivo'].read()
+        try:
+            contenido = crudo.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            contenido = crudo.decode('latin-1')  # Exportaciones bancarias en Windows-1252
+
+        try:
+            reporte = ConciliarExtractoBancarioUseCase(DjangoPagoRepository()).ejecutar(
+                contenido,
+                formato=datos.get('formato'),
+                tolerancia_dias=datos.get('tolerancia_dias'),
+                aprobar=not datos['simular']
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+        return Response(reporte, status=200)
+
 class CobroLecturaViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Vista de Lectura de Cuentas por Cobrar.
@@ -289,5 +289,5 @@ class CobroLecturaViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = CuentaPorCobrarModel.objects.select_related('socio', 'rubro').all().order_by('-fecha_emision')
     serializer_class = CobroLecturaSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['socio__identificacion', 'socio__nombres']
+    filter_backends = [BusquedaSocioFilter]
+    busqueda_socio_campo = 'socio_id'
@@ -6,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django.utils import timezone
+from datetime import datetime
 
 # Serializers
 from adapters.api.serializers import (
@@ -16,11 +17,19 @@ from adapters.api.serializers import (
     ProductoMaterialSerializer
 )
 
+from adapters.api.serializers.factura_serializers import FacturacionParalelaSerializer
+from adapters.api.idempotencia import idempotente
+from adapters.api.exportacion import respuesta_exportacion, filas_por_lotes
+from adapters.api.filtros import BusquedaSocioFilter
+from core.shared.fechas import rango_dias_locales
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
+
 # Modelos
 from adapters.infrastructure.models import (
     SocioModel,
     FacturaModel,
     PagoModel,
+    DetallePagoModel,
     CatalogoRubroModel,
     ProductoMaterial,
     LecturaModel # ✅ IMPORTADO Y ACTIVO
@@ -37,8 +46,8 @@ class FacturaViewSet(viewsets.ModelViewSet):
     queryset = FacturaModel.objects.all().order_by('-fecha_emision')
     serializer_class = FacturaSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['socio__identificacion', 'numero_secuencial']
+    filter_backends = [BusquedaSocioFilter]
+    busqueda_socio_campo = 'socio_id'
 
     # --- 1. Pre-Emisión (ACTIVO Y FUNCIONAL - REFACTORIZADO CLEAN ARCH) ---
     @action(detail=False, methods=['get'], url_path='pre-emision')
@@ -58,6 +67,7 @@ class FacturaViewSet(viewsets.ModelViewSet):
 
     # --- 1.5 Emisión Masiva (POST) ---
     @action(detail=False, methods=['post'], url_path='emision-masiva')
+    @idempotente('facturas.emision_masiva', atomica=False)  # Reanudable: confirma por lotes (bitácora)
     def emision_masiva(self, request):
         """
         Endpoint que recibe la orden del Frontend para generar las facturas reales en la Base de Datos.
@@ -69,10 +79,13 @@ class FacturaViewSet(viewsets.ModelViewSet):
         
         try:
             lista_facturas = request.data
-            resultado = service.ejecutar_emision_masiva(lista_facturas)
+            resultado = service.ejecutar_emision_masiva(lista_facturas, usuario_id=request.user.id)
             return Response({
                 "mensaje": "Emisión masiva completada con éxito.",
-                "facturas_generadas": resultado.get('cantidad', 0)
+                "facturas_generadas": resultado.get('cantidad', 0),
+                "omitidas_corrida_previa": resultado.get('omitidas', 0),
+                "corrida_id": resultado.get('corrida_id'),
+                "estado_corrida": resultado.get('estado')
             }, status=status.HTTP_201_CREATED)
         except Exception as e:
             import traceback
@@ -85,14 +98,70 @@ class FacturaViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+    # --- 1.6 Facturación Fija Paralela (Celery) ---
+    @extend_schema(summary="Facturación fija paralela por particiones", request=FacturacionParalelaSerializer)
+    @action(detail=False, methods=['post'], url_path='emision-fija-paralela')
+    @idempotente('facturas.emision_fija_paralela')
+    def emision_fija_paralela(self, request):
+        """
+        Lanza la corrida mensual de tarifa fija dividida en particiones (barrio / rango de socios)
+        que se procesan en paralelo en los workers de Celery.
+        POST /api/v1/facturas/emision-fija-paralela/
+        """
+        from core.tasks.facturacion_paralela_task import orquestar_facturacion_fija_task
+
+        serializer = FacturacionParalelaSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+
+        fecha_emision = datos.get('fecha_emision')
+        task = orquestar_facturacion_fija_task.delay(
+            anio=datos['anio'],
+            mes=datos['mes'],
+            fecha_emision=fecha_emision.isoformat() if fecha_emision else None,
+            estrategia=datos['estrategia'],
+            tamano_rango=datos['tamano_rango']
+        )
+        return Response({
+            "mensaje": "Facturación paralela iniciada en segundo plano.",
+            "task_id": task.id
+        }, status=status.HTTP_202_ACCEPTED)
+
     # --- 2. Pendientes e Historial ---
     @action(detail=False, methods=['get'], url_path='pendientes')
     def pendientes(self, request):
         """
         Retorna las facturas que NO están pagadas, con soporte de filtros.
         Si ver_historial=true, retorna el historial completo (incluyendo PAGADAS).
+        `identificacion` coincide por PREFIJO de cédula/RUC o de palabras del nombre
+        (índice socios_busqueda), no por subcadena: "2222" no encuentra "1722222222".
         """
-        from django.db.models import Q
+        serializer = self.get_serializer(self._filtrar_pendientes(request), many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    # --- 2.1 Exportación (CSV / XLSX en streaming) ---
+    @extend_schema(
+        summary="Exportar facturas (CSV/XLSX)",
+        description="Mismos filtros que /facturas/pendientes/ (identificacion, dia, mes, anio, ver_historial) "
+                    "+ formato=csv|xlsx. Se transmite en lotes keyset, en orden de emisión (ID).",
+    )
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        # Lotes por PK (orden de emisión): fecha_emision no tiene índice propio
+        filas = filas_por_lotes(self._filtrar_pendientes(request), [
+            'id', 'fecha_emision', 'fecha_vencimiento', 'anio', 'mes',
+            'socio__identificacion', 'socio__apellidos', 'socio__nombres',
+            'estado_financiero', 'estado_sri', 'clave_acceso_sri', 'subtotal', 'impuestos', 'total'
+        ])
+        try:
+            return respuesta_exportacion('facturas', [
+                'ID', 'Fecha Emisión', 'Fecha Vencimiento', 'Año', 'Mes', 'Identificación', 'Apellidos',
+                'Nombres', 'Estado', 'Estado SRI', 'Clave de Acceso', 'Subtotal', 'Impuestos', 'Total'
+            ], filas, request.query_params.get('formato'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def _filtrar_pendientes(self, request):
         qs = self.get_queryset()
         
         ver_historial = request.GET.get('ver_historial') == 'true'
@@ -104,11 +173,9 @@ class FacturaViewSet(viewsets.ModelViewSet):
         # 🔎 FILTRO POR IDENTIFICACIÓN / NOMBRE / APELLIDO
         identificacion = request.GET.get('identificacion')
         if identificacion:
-            qs = qs.filter(
-                Q(socio__identificacion__icontains=identificacion) |
-                Q(socio__nombres__icontains=identificacion) |
-                Q(socio__apellidos__icontains=identificacion)
-            )
+            # Índice de búsqueda de socios: prefijo de cédula o de nombres/apellidos (sin tildes).
+            # Antes era icontains; la subcadena intermedia de una cédula ya no coincide.
+            qs = qs.filter(socio_id__in=DjangoBusquedaSocioRepository().ids_coincidentes(identificacion))
 
         # 📅 FILTRO POR FECHA
         dia = request.GET.get('dia')
@@ -127,8 +194,7 @@ class FacturaViewSet(viewsets.ModelViewSet):
             # Por defecto, si no hay filtros explícitos, mostramos los del año actual
             qs = qs.filter(anio=timezone.now().year)
 
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return qs
 
     # --- 3. ESTADO DE CUENTA POR SOCIO (GET) ---
     @action(detail=False, methods=['get'], url_path='estado-cuenta/(?P<identificacion>[^/.]+)')
@@ -158,8 +224,8 @@ class SocioViewSet(viewsets.ModelViewSet):
     queryset = SocioModel.objects.all().order_by('apellidos')
     serializer_class = SocioSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['identificacion', 'nombres', 'apellidos']
+    filter_backends = [BusquedaSocioFilter]
+    busqueda_socio_campo = 'id'
 
 class PagoViewSet(viewsets.ModelViewSet):
     queryset = PagoModel.objects.all().order_by('-fecha_registro')
@@ -167,6 +233,42 @@ class PagoViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     http_method_names = ['get', 'post', 'head']
 
+    @extend_schema(
+        summary="Exportar pagos (CSV/XLSX)",
+        description="Una fila por método de pago. Filtros del cierre de caja: fecha_inicio, fecha_fin "
+                    "(YYYY-MM-DD, hora de Ecuador) y cajero; + formato=csv|xlsx.",
+    )
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        detalles = DetallePagoModel.objects.all()
+        try:
+            fi = request.query_params.get('fecha_inicio')
+            ff = request.query_params.get('fecha_fin')
+            if fi or ff:
+                inicio, fin = rango_dias_locales(
+                    datetime.strptime(fi or ff, '%Y-%m-%d').date(), datetime.strptime(ff or fi, '%Y-%m-%d').date()
+                )
+                detalles = detalles.filter(pago__fecha_registro__gte=inicio, pago__fecha_registro__lt=fin)
+            if request.query_params.get('cajero'):
+                detalles = detalles.filter(pago__usuario_cobro_id=int(request.query_params['cajero']))
+        except ValueError:
+            return Response({"error": "Filtros inválidos (fechas YYYY-MM-DD, cajero numérico)."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # Lotes por (pago, detalle): recorre el índice de la FK y deja juntos los métodos de cada pago
+        filas = filas_por_lotes(detalles, [
+            'pago_id', 'pago__numero_comprobante_interno', 'pago__fecha_registro',
+            'pago__socio__identificacion', 'pago__socio__apellidos', 'pago__socio__nombres',
+            'pago__factura_id', 'metodo', 'monto', 'referencia', 'pago__validado', 'pago__usuario_cobro__username'
+        ], orden=('pago_id', 'id'))
+        try:
+            return respuesta_exportacion('pagos', [
+                'Pago', 'Comprobante', 'Fecha Registro', 'Identificación', 'Apellidos', 'Nombres',
+                'Factura', 'Método', 'Monto', 'Referencia', 'Validado', 'Cajero'
+            ], filas, request.query_params.get('formato'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
 class CatalogoRubroViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = CatalogoRubroModel.objects.filter(activo=True).order_by('nombre')
     serializer_class = CatalogoRubroSerializer
@@ -1,5 +1,5 @@
 # adapters/api/views/gobernanza_views.py
-from rest_framework import viewsets, status, serializers, filters, permissions
+from rest_framework import viewsets, status, serializers, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
@@ -15,6 +15,7 @@ from adapters.api.serializers.gobernanza_serializers import (
     ResolucionSolicitudSerializer
 )
 # Use Cases
+from adapters.api.filtros import BusquedaSocioFilter
 from core.use_cases.gobernanza.registrar_asistencia_use_case import RegistrarAsistenciaUseCase
 from core.use_cases.gobernanza.procesar_multas_batch_use_case import ProcesarMultasBatchUseCase
 from core.use_cases.gobernanza.crear_solicitud_justificacion import CrearSolicitudJustificacionUseCase
@@ -134,5 +135,6 @@ class AsistenciaViewSet(viewsets.ModelViewSet):
     queryset = AsistenciaModel.objects.select_related('socio', 'evento').all()
     serializer_class = AsistenciaInlineSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['socio__identificacion', 'evento__nombre']
+    filter_backends = [BusquedaSocioFilter]
+    busqueda_socio_campo = 'socio_id'
+    search_fields = ['evento__nombre']
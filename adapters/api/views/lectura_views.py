@@ -1,12 +1,17 @@
 # adapters/api/views/lectura_views.py
+import csv
+import io
 import dataclasses # ✅ Necesario para la inyección segura de usuario
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 # Core
 from core.use_cases.registrar_lectura_uc import RegistrarLecturaUseCase
+from core.use_cases.importar_lecturas_uc import ImportarLecturasUseCase
 from core.shared.exceptions import (
     MedidorNoEncontradoError, 
     BusinessRuleException, 
@@ -23,8 +28,10 @@ from adapters.infrastructure.models import LecturaModel # Para listado eficiente
 from adapters.api.serializers.lectura_serializers import (
     RegistrarLecturaSerializer, 
     LecturaResponseSerializer,
-    LecturaHistorialSerializer
+    LecturaHistorialSerializer,
+    LecturaValorSerializer
 )
+from adapters.api.pagination import KeysetPagination
 
 class LecturaViewSet(viewsets.ViewSet):
     """
@@ -91,36 +98,160 @@ class LecturaViewSet(viewsets.ViewSet):
             return Response({"error": f"Error interno: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     # ======================================================
-    # 2. LISTAR HISTORIAL (GET)
+    # 1.5 IMPORTACIÓN MASIVA (POST JSON / CSV)
     # ======================================================
+    MAX_FILAS_IMPORTACION = 5000
+
+    @extend_schema(
+        summary="Importar Lecturas (Ruta completa)",
+        description=(
+            "Registra en lote las lecturas de una ruta. Acepta JSON "
+            "(`{\"lecturas\": [...]}` o una lista) o un archivo CSV en `archivo` con columnas "
+            "`medidor_id,lectura_actual,fecha_lectura,observacion`. "
+            "Las filas válidas se guardan; las inválidas se devuelven con su número de fila."
+        ),
+        request=RegistrarLecturaSerializer(many=True)
+    )
+    @action(detail=False, methods=['post'], url_path='importar',
+            parser_classes=[JSONParser, MultiPartParser, FormParser])
+    def importar(self, request):
+        try:
+            filas_crudas = self._leer_filas_importacion(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not filas_crudas:
+            return Response({"error": "No se recibieron lecturas."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(filas_crudas) > self.MAX_FILAS_IMPORTACION:
+            return Response(
+                {"error": f"Máximo {self.MAX_FILAS_IMPORTACION} lecturas por importación."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 1. Validación de formato por fila (la de negocio la hace el Caso de Uso)
+        operador_id = request.user.id if request.user and request.user.is_authenticated else 1
+        filas_validas, errores_formato = {}, []
+        for numero, datos in enumerate(filas_crudas, start=1):
+            serializer = RegistrarLecturaSerializer(data=datos)
+            if serializer.is_valid():
+                filas_validas[numero] = dataclasses.replace(serializer.to_dto(), operador_id=operador_id)
+            else:
+                medidor_id = datos.get('medidor_id') if isinstance(datos, dict) else None
+                errores_formato.append({"fila": numero, "medidor_id": medidor_id, "error": serializer.errors})
+
+        # 2. Reglas de negocio + inserción por lotes
+        resultado = {"creadas": 0, "errores": [], "lecturas": []}
+        if filas_validas:
+            repos = self._get_repos()
+            use_case = ImportarLecturasUseCase(lectura_repo=repos['lectura'], medidor_repo=repos['medidor'])
+            resultado = use_case.ejecutar(filas_validas)
+
+        errores = sorted(errores_formato + resultado["errores"], key=lambda e: e["fila"])
+        respuesta = {
+            "total_filas": len(filas_crudas),
+            "creadas": resultado["creadas"],
+            "con_error": len(errores),
+            "errores": errores,
+            "lecturas": resultado["lecturas"]
+        }
+        codigo = status.HTTP_201_CREATED if resultado["creadas"] else status.HTTP_400_BAD_REQUEST
+        return Response(respuesta, status=codigo)
+
+    def _leer_filas_importacion(self, request) -> list:
+        """Normaliza la entrada (CSV adjunto o JSON) a una lista de dicts."""
+        archivo = request.FILES.get('archivo')
+        if archivo:
+            try:
+                contenido = archivo.read().decode('utf-8-sig')
+            except UnicodeDecodeError:
+                raise ValueError("El archivo CSV debe estar codificado en UTF-8.")
+            lector = csv.DictReader(io.StringIO(contenido))
+            return [{k.strip(): (v.strip() if isinstance(v, str) else v) for k, v in fila.items() if k} for fila in lector]
+
+        datos = request.data
+        if isinstance(datos, dict):
+            datos = datos.get('lecturas', [])
+        if not isinstance(datos, list):
+            raise ValueError("Formato inválido: se espera una lista de lecturas.")
+        return datos
+
+    # ======================================================
+    # 1.6 DETECCIÓN DE ANOMALÍAS (Pre-Emisión)
+    # ======================================================
+    @extend_schema(
+        summary="Detectar consumos atípicos",
+        description=(
+            "Evalúa en segundo plano las lecturas por facturar contra el historial de cada medidor "
+            "(mediana/MAD y línea base estacional). Las marcas aparecen en `pre-emision`."
+        ),
+        request=None
+    )
+    @action(detail=False, methods=['post'], url_path='detectar-anomalias')
+    def detectar_anomalias(self, request):
+        from core.tasks.anomalias_lecturas_task import detectar_anomalias_lecturas_task
+
+        task = detectar_anomalias_lecturas_task.delay()
+        return Response({
+            "mensaje": "Detección de anomalías iniciada en segundo plano.",
+            "task_id": task.id
+        }, status=status.HTTP_202_ACCEPTED)
+
+    # ======================================================
+    # 2. LISTAR HISTORIAL (GET) - Paginación Keyset
+    # ======================================================
+    FILTROS_HISTORIAL = {
+        'medidor_id': 'medidor_id',
+        'barrio_id': 'medidor__terreno__barrio_id',
+        'anio': 'anio',
+        'mes': 'mes',
+    }
+
     @extend_schema(
         summary="Listar Historial de Lecturas",
-        description="Obtiene el historial de lecturas registradas.",
+        description=(
+            "Historial paginado por cursor (fecha, id), del más reciente al más antiguo. "
+            "Para la siguiente página usar el enlace `next`. "
+            "`vista=valores` devuelve solo los valores de la lectura (sin datos del socio)."
+        ),
         parameters=[
             OpenApiParameter('medidor_id', description="Filtrar por medidor", required=False, type=int),
-            OpenApiParameter('limit', description="Límite (default 12)", required=False, type=int),
+            OpenApiParameter('barrio_id', description="Filtrar por barrio", required=False, type=int),
+            OpenApiParameter('anio', description="Periodo fiscal: año", required=False, type=int),
+            OpenApiParameter('mes', description="Periodo fiscal: mes", required=False, type=int),
+            OpenApiParameter('limit', description="Tamaño de página (default 12, máx. 500)", required=False, type=int),
+            OpenApiParameter('cursor', description="Cursor devuelto en `next`", required=False, type=str),
+            OpenApiParameter('vista', description="`valores` para la respuesta delgada", required=False, type=str),
         ],
         responses={200: LecturaHistorialSerializer(many=True)}
     )
     def list(self, request):
-        medidor_id = request.query_params.get('medidor_id')
-        try:
-            limit = int(request.query_params.get('limit', 12))
-        except ValueError:
-            limit = 12
-
-        # QuerySet optimizado con select_related para evitar el problema N+1 queries
-        queryset = LecturaModel.objects.select_related(
-            'medidor', 
-            'medidor__terreno', 
-            'medidor__terreno__socio'
-        ).all().order_by('-fecha')
+        filtros = {}
+        for parametro, campo in self.FILTROS_HISTORIAL.items():
+            valor = request.query_params.get(parametro)
+            if valor in (None, ''):
+                continue
+            try:
+                filtros[campo] = int(valor)
+            except ValueError:
+                return Response({"error": f"{parametro} inválido."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if medidor_id:
-            queryset = queryset.filter(medidor_id=medidor_id)
-
-        # Límite de seguridad
-        queryset = queryset[:limit]
+        solo_valores = request.query_params.get('vista') == 'valores'
+        if solo_valores:
+            # Sin JOINs a medidor/socio: se recorre el índice (fecha, id) o (medidor, fecha, id)
+            queryset = LecturaModel.objects.filter(**filtros).only(
+                'id', 'medidor_id', 'fecha', 'anio', 'mes', 'valor', 'lectura_anterior',
+                'consumo_del_mes', 'esta_facturada'
+            )
+            serializer_class = LecturaValorSerializer
+        else:
+            queryset = LecturaModel.objects.filter(**filtros).select_related(
+                'medidor',
+                'medidor__terreno',
+                'medidor__terreno__socio'
+            )
+            serializer_class = LecturaHistorialSerializer
 
-        serializer = LecturaHistorialSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        paginator = KeysetPagination()
+        paginator.page_size = 12 # Configuración por defecto
+        pagina = paginator.paginate_queryset(queryset, request, view=self)
+        return paginator.get_paginated_response(serializer_class(pagina, many=True).data)
\ No newline at end of file
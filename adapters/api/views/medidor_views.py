@@ -8,7 +8,8 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 # --- CAPA DE INFRAESTRUCTURA ---
 from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
 from adapters.infrastructure.repositories.django_terreno_repository import DjangoTerrenoRepository
-from adapters.infrastructure.models import MedidorModel
+from adapters.infrastructure.models import MedidorModel, TerrenoModel
+from adapters.api.pagination import KeysetPagination
 # --- CAPA DE PRESENTACIÓN ---
 from adapters.api.serializers.medidor_serializers import (
     MedidorSerializer,
@@ -30,6 +31,7 @@ from core.use_cases.medidor_dtos import (
     RegistrarMedidorDTO,
     ActualizarMedidorDTO
 )
+from core.shared.enums import RolUsuario
 
 # --- EXCEPCIONES ---
 from core.shared.exceptions import (
@@ -39,6 +41,18 @@ from core.shared.exceptions import (
 )
 
 # ✅ 1. PERMISO PERSONALIZADO
+ROLES_PERSONAL_TECNICO = {RolUsuario.ADMINISTRADOR.value, RolUsuario.OPERADOR.value, RolUsuario.TESORERO.value}
+
+
+def es_personal_tecnico(user) -> bool:
+    """Staff, superusuario o socio con rol Administrador, Operador o Tesorero."""
+    if user.is_staff or user.is_superuser:
+        return True
+    if hasattr(user, 'perfil_socio') and user.perfil_socio:
+        return str(user.perfil_socio.rol).upper() in ROLES_PERSONAL_TECNICO
+    return False
+
+
 class IsAdminOrOperador(BasePermission):
     """
     Permite escritura solo a Staff, Admins, Operadores o Tesoreros.
@@ -49,12 +63,7 @@ class IsAdminOrOperador(BasePermission):
             return False
         if request.method in ['GET', 'HEAD', 'OPTIONS']:
             return True
-        if request.user.is_staff or request.user.is_superuser:
-            return True
-        if hasattr(request.user, 'perfil_socio') and request.user.perfil_socio:
-            rol = str(request.user.perfil_socio.rol).upper()
-            return rol in ['ADMIN', 'OPERADOR', 'TESORERO']
-        return False
+        return es_personal_tecnico(request.user)
 
 class MedidorViewSet(viewsets.ViewSet):
     """
@@ -70,37 +79,36 @@ class MedidorViewSet(viewsets.ViewSet):
     # ======================================================
     @extend_schema(
         summary="Listar Medidores",
-        description="Lista medidores. Admins ven todos, Socios solo los suyos.",
-        responses={200: MedidorSerializer(many=True)}
+        description=(
+            "Lista medidores paginados por cursor. Admins/operadores ven todos; un socio solo "
+            "los de sus terrenos (filtrado en la base de datos). Usar el enlace `next` para avanzar."
+        ),
+        parameters=[
+            OpenApiParameter('cursor', OpenApiTypes.STR, required=False, description="Cursor opaco de la página siguiente"),
+            OpenApiParameter('limit', OpenApiTypes.INT, required=False, description="Tamaño de página (default 50, máx. 500)"),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
     )
     def list(self, request):
-        repo = DjangoMedidorRepository()
-        use_case = ListarMedidoresUseCase(repo)
-        medidores = use_case.execute()
-
-        # Filtro de Seguridad
-        user = request.user
-        es_personal_tecnico = False
-
-        if user.is_staff or user.is_superuser:
-            es_personal_tecnico = True
-        elif hasattr(user, 'perfil_socio') and user.perfil_socio:
-            rol = str(user.perfil_socio.rol).upper()
-            if rol in ['ADMIN', 'OPERADOR', 'TESORERO']:
-                es_personal_tecnico = True
-
-        if not es_personal_tecnico:
-            medidores_filtrados = []
-            for m in medidores:
-                try:
-                    if m.terreno and m.terreno.socio and m.terreno.socio.usuario_id == user.id:
-                        medidores_filtrados.append(m)
-                except AttributeError:
-                    continue
-            medidores = medidores_filtrados
-
-        serializer = MedidorSerializer(medidores, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        use_case = ListarMedidoresUseCase(DjangoMedidorRepository())
+        # Filtro de Seguridad: el personal técnico ve todo, el socio solo lo suyo
+        usuario_id = None if es_personal_tecnico(request.user) else request.user.id
+
+        paginator = KeysetPagination()
+        paginator.ordering = ('id',)
+        pagina = paginator.paginate_consulta(
+            lambda despues_de, limite: use_case.pagina(
+                limite, int(despues_de[0]) if despues_de else None, usuario_id
+            ),
+            request
+        )
+
+        # Barrio, socio y dirección de toda la página en una sola consulta
+        terrenos = TerrenoModel.objects.select_related('barrio', 'socio').in_bulk(
+            {m.terreno_id for m in pagina if m.terreno_id}
+        )
+        serializer = MedidorSerializer(pagina, many=True, context={'terrenos': terrenos})
+        return paginator.get_paginated_response(serializer.data)
 
     # ======================================================
     # PLANILLA DE LECTURAS
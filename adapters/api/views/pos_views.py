@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated
 
 from adapters.api.serializers.pos_serializers import VentaDirectaSerializer
 from core.use_cases.pos.facturar_venta_directa import FacturarVentaDirectaUseCase
+from adapters.api.idempotencia import idempotente
 
 class POSViewSet(viewsets.ViewSet):
     """
@@ -15,6 +16,7 @@ class POSViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
     @action(detail=False, methods=['post'], url_path='vender')
+    @idempotente('pos.vender')
     def vender(self, request):
         """
         Registra una venta directa, descuenta stock y factura.
@@ -28,7 +30,8 @@ class POSViewSet(viewsets.ViewSet):
             resultado = use_case.ejecutar(
                 cliente_id=serializer.validated_data['cliente_id'],
                 items=serializer.validated_data['items'],
-                forma_pago=serializer.validated_data['forma_pago']
+                forma_pago=serializer.validated_data['forma_pago'],
+                usuario_id=request.user.id
             )
             return Response(resultado, status=status.HTTP_201_CREATED)
         except ValueError as e:
@@ -0,0 +1,122 @@
+# adapters/api/views/reporte_views.py
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+
+# Core
+from core.use_cases.reporting.reportes_asincronos_uc import SolicitarReporteUseCase, REPORTES
+from core.tasks.reportes_task import generar_reporte_task
+
+# Infraestructura
+from adapters.infrastructure.models import TrabajoReporteModel
+from adapters.infrastructure.repositories.django_trabajo_reporte_repository import DjangoTrabajoReporteRepository
+
+# Presentación
+from adapters.api.exportacion import respuesta_exportacion
+
+REINTENTO_SEGUNDOS = 5
+
+
+class ReporteAsincronoViewSet(viewsets.ViewSet):
+    """
+    Reportes pesados fuera del worker web (Celery + resultado persistido con TTL).
+    - POST /reportes/                      -> Encola (o reutiliza) el trabajo: 202 / 200 si ya está listo
+    - GET  /reportes/{id}/                 -> Estado del trabajo (polling; Retry-After mientras corre)
+    - GET  /reportes/{id}/descargar/       -> Resultado en json (default), csv o xlsx
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = None
+    lookup_value_regex = r'\d+'
+
+    @extend_schema(
+        summary="Solicitar reporte asíncrono",
+        description=f"Cuerpo: {{\"tipo\": ..., \"parametros\": {{...}}}}. Tipos: {', '.join(sorted(REPORTES))}. "
+                    "Solicitudes idénticas (mismo tipo y parámetros) comparten un solo trabajo.",
+        request=OpenApiTypes.OBJECT,
+        responses={200: OpenApiTypes.OBJECT, 202: OpenApiTypes.OBJECT}
+    )
+    def create(self, request):
+        repo = DjangoTrabajoReporteRepository()
+        uc = SolicitarReporteUseCase(repo, encolar=lambda trabajo_id: generar_reporte_task.delay(trabajo_id).id)
+        parametros = request.data.get('parametros') or {}
+        if not isinstance(parametros, dict):
+            return Response({"error": "parametros debe ser un objeto."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            trabajo, creado = uc.ejecutar(request.data.get('tipo'), parametros, request.user.id)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if trabajo["estado"] == TrabajoReporteModel.ESTADO_FALLIDO:
+            codigo = status.HTTP_503_SERVICE_UNAVAILABLE
+        elif trabajo["estado"] == TrabajoReporteModel.ESTADO_COMPLETADO:
+            codigo = status.HTTP_200_OK
+        else:
+            codigo = status.HTTP_202_ACCEPTED
+        respuesta = Response({**self._presentar(request, trabajo), "coalescido": not creado}, status=codigo)
+        respuesta['Location'] = self._url(request, trabajo["id"])
+        return self._con_reintento(respuesta, trabajo)
+
+    @extend_schema(summary="Estado del reporte", responses={200: OpenApiTypes.OBJECT})
+    def retrieve(self, request, pk=None):
+        trabajo = DjangoTrabajoReporteRepository().obtener(pk)
+        if trabajo is None:
+            return Response({"error": "Reporte no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        return self._con_reintento(Response(self._presentar(request, trabajo)), trabajo)
+
+    @extend_schema(
+        summary="Descargar resultado del reporte",
+        parameters=[OpenApiParameter('formato', OpenApiTypes.STR, description="json (default) | csv | xlsx")],
+        responses={200: OpenApiTypes.OBJECT, 409: OpenApiTypes.OBJECT, 410: OpenApiTypes.OBJECT}
+    )
+    @action(detail=True, methods=['get'], url_path='descargar')
+    def descargar(self, request, pk=None):
+        trabajo = DjangoTrabajoReporteRepository().obtener(pk, con_resultado=True)
+        if trabajo is None:
+            return Response({"error": "Reporte no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        if trabajo["estado"] != TrabajoReporteModel.ESTADO_COMPLETADO:
+            return self._con_reintento(Response(
+                {"error": "El reporte aún no está listo.", **self._presentar(request, trabajo)},
+                status=status.HTTP_409_CONFLICT
+            ), trabajo)
+        if trabajo["expira_en"] <= timezone.now():
+            return Response({"error": "El resultado expiró. Solicite el reporte nuevamente."},
+                            status=status.HTTP_410_GONE)
+
+        resultado = trabajo["resultado"]
+        formato = (request.query_params.get('formato') or 'json').lower()
+        if formato == 'json':
+            return Response(resultado, status=status.HTTP_200_OK)
+        try:
+            return respuesta_exportacion(f"{trabajo['tipo']}_{trabajo['id']}", resultado["columnas"],
+                                         resultado["filas"], formato)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    # --- Helpers ---
+    def _url(self, request, trabajo_id: int) -> str:
+        return request.build_absolute_uri(reverse('reporte-detail', kwargs={'pk': trabajo_id}))
+
+    def _presentar(self, request, trabajo: dict) -> dict:
+        datos = {
+            "id": trabajo["id"],
+            "tipo": trabajo["tipo"],
+            "parametros": trabajo["parametros"],
+            "estado": trabajo["estado"],
+            "fecha_creacion": trabajo["fecha_creacion"],
+            "fecha_fin": trabajo["fecha_fin"],
+            "expira_en": trabajo["expira_en"],
+            "error": trabajo["error"],
+        }
+        if trabajo["estado"] == TrabajoReporteModel.ESTADO_COMPLETADO:
+            datos["descarga"] = request.build_absolute_uri(reverse('reporte-descargar', kwargs={'pk': trabajo["id"]}))
+        return datos
+
+    @staticmethod
+    def _con_reintento(respuesta: Response, trabajo: dict) -> Response:
+        if trabajo["estado"] in TrabajoReporteModel.ESTADOS_ACTIVOS:
+            respuesta['Retry-After'] = str(REINTENTO_SEGUNDOS)
+        return respuesta
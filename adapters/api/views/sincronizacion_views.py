@@ -0,0 +1,99 @@
+# adapters/api/views/sincronizacion_views.py
+import dataclasses
+from django.db import IntegrityError
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+
+# Core
+from core.use_cases.sincronizacion_uc import SincronizarRutaUseCase
+from core.shared.exceptions import TokenSincronizacionExpiradoError
+
+# Infraestructura
+from adapters.infrastructure.repositories.django_sincronizacion_repository import DjangoSincronizacionRepository
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
+
+# Presentación
+from adapters.api.serializers.lectura_serializers import LecturaSyncSerializer
+from adapters.api.views.medidor_views import IsAdminOrOperador
+
+
+class SincronizacionViewSet(viewsets.ViewSet):
+    """
+    Sincronización incremental para la App de Lecturas (Offline).
+    - GET  /sincronizacion/cambios/?barrio_id=&token=  -> Delta desde el token
+    - POST /sincronizacion/lecturas/                   -> Subida idempotente de lecturas
+    """
+    permission_classes = [IsAdminOrOperador]
+    MAX_LECTURAS_LOTE = 5000
+
+    def _get_use_case(self) -> SincronizarRutaUseCase:
+        return SincronizarRutaUseCase(
+            sync_repo=DjangoSincronizacionRepository(),
+            lectura_repo=DjangoLecturaRepository(),
+            medidor_repo=DjangoMedidorRepository()
+        )
+
+    @extend_schema(
+        summary="Descargar cambios de la ruta",
+        description=(
+            "Sin `token` devuelve la ruta completa. Con el `token` de la respuesta anterior "
+            "devuelve solo medidores/terrenos cambiados y `eliminados` (tombstones). "
+            "Si `hay_mas` es true, repetir la llamada con el nuevo token. "
+            "410 (`resincronizar`): el token es anterior a la retención; descargar sin token."
+        ),
+        parameters=[
+            OpenApiParameter('barrio_id', OpenApiTypes.INT, description="Ruta (barrio) del lector"),
+            OpenApiParameter('token', OpenApiTypes.STR, description="Token de la última sincronización"),
+        ]
+    )
+    @action(detail=False, methods=['get'], url_path='cambios')
+    def cambios(self, request):
+        barrio_param = request.query_params.get('barrio_id')
+        try:
+            barrio_id = int(barrio_param) if barrio_param not in (None, '', 'null') else None
+        except ValueError:
+            return Response({"error": "barrio_id inválido."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            resultado = self._get_use_case().descargar(barrio_id, request.query_params.get('token'))
+        except TokenSincronizacionExpiradoError as e:
+            return Response({"error": str(e), "resincronizar": True}, status=status.HTTP_410_GONE)
+        return Response(resultado, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Subir lecturas (lote idempotente)",
+        description="Cada lectura lleva `referencia_cliente` (UUID). Reenviar el lote no duplica registros.",
+        request=LecturaSyncSerializer(many=True)
+    )
+    @action(detail=False, methods=['post'], url_path='lecturas')
+    def lecturas(self, request):
+        datos = request.data.get('lecturas', []) if isinstance(request.data, dict) else request.data
+        if not isinstance(datos, list) or not datos:
+            return Response({"error": "No se recibieron lecturas."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(datos) > self.MAX_LECTURAS_LOTE:
+            return Response({"error": f"Máximo {self.MAX_LECTURAS_LOTE} lecturas por lote."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        filas, errores_formato = {}, []
+        for numero, fila in enumerate(datos, start=1):
+            serializer = LecturaSyncSerializer(data=fila)
+            if serializer.is_valid():
+                filas[numero] = dataclasses.replace(serializer.to_dto(), operador_id=request.user.id)
+            else:
+                medidor_id = fila.get('medidor_id') if isinstance(fila, dict) else None
+                errores_formato.append({"fila": numero, "medidor_id": medidor_id, "error": serializer.errors})
+
+        resultado = {"aceptadas": [], "ya_registradas": [], "errores": []}
+        if filas:
+            try:
+                resultado = self._get_use_case().subir_lecturas(filas)
+            except IntegrityError:
+                # Otro envío concurrente del mismo lote ganó la carrera: el reintento será idempotente
+                return Response({"error": "Lote en proceso por otra conexión. Reintente."},
+                                status=status.HTTP_409_CONFLICT)
+
+        resultado["errores"] = sorted(errores_formato + resultado["errores"], key=lambda e: e["fila"])
+        return Response(resultado, status=status.HTTP_200_OK)
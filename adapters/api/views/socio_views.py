@@ -3,7 +3,6 @@ from django.db import transaction # IMPORTANTE PARA INTEGRIDAD
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.decorators import action
 # ✅ CAMBIO CLAVE: Reemplazamos drf_yasg por drf_spectacular
 from drf_spectacular.utils import extend_schema, OpenApiParameter
@@ -11,6 +10,8 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter
 # Importamos los "traductores" de BBDD
 from adapters.infrastructure.repositories.django_socio_repository import DjangoSocioRepository
 from adapters.infrastructure.repositories.django_auth_repository import DjangoAuthRepository
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
+from adapters.api.pagination import KeysetPagination
 
 # Importamos los "porteros" (Serializers)
 from adapters.api.serializers.socio_serializers import (
@@ -19,7 +20,7 @@ from adapters.api.serializers.socio_serializers import (
 # Importamos los "cerebros" (Use Cases) y DTOs
 from core.use_cases.socio_uc import (
     ListarSociosUseCase, ObtenerSocioUseCase, CrearSocioUseCase, 
-    ActualizarSocioUseCase, EliminarSocioUseCase
+    ActualizarSocioUseCase, EliminarSocioUseCase, BuscarSociosUseCase
 )
 from core.use_cases.socio_dtos import CrearSocioDTO, ActualizarSocioDTO
 # Importamos las excepciones de negocio
@@ -27,11 +28,7 @@ from core.shared.exceptions import SocioNoEncontradoError, ValidacionError
 
 # --- IMPORTACIONES PARA ESTADO DE CUENTA 360 ---
 from adapters.api.serializers.estado_cuenta_serializers import EstadoCuentaSerializer
-from core.use_cases.socio.obtener_estado_cuenta_use_case import ObtenerEstadoCuentaUseCase
-from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
-from adapters.infrastructure.repositories.django_terreno_repository import DjangoTerrenoRepository
-from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
-from adapters.infrastructure.repositories.django_servicio_repository import DjangoServicioRepository
+from core.services.estado_cuenta_cache_service import EstadoCuentaCacheService
 
 class SocioViewSet(viewsets.ViewSet):
     """
@@ -41,29 +38,71 @@ class SocioViewSet(viewsets.ViewSet):
 
     @extend_schema(
         summary="Listar Socios",
-        description="Obtiene el listado paginado de todos los socios registrados.",
+        description=(
+            "Listado paginado por cursor (keyset): filtros, orden y LIMIT se resuelven en la BD, "
+            "así la página N solo lee `limit` filas. Usar el enlace `next` para avanzar."
+        ),
+        parameters=[
+            OpenApiParameter(name='barrio', description='ID del barrio de domicilio', required=False, type=int),
+            OpenApiParameter(name='activo', description='true | false', required=False, type=bool),
+            OpenApiParameter(name='rol', description='ADMINISTRADOR, TESORERO, OPERADOR o SOCIO', required=False, type=str),
+            OpenApiParameter(name='q', description='Nombres, apellidos o prefijo de identificación', required=False, type=str),
+            OpenApiParameter(name='ordenar', description='apellidos (default) | identificacion | recientes', required=False, type=str),
+            OpenApiParameter(name='cursor', description='Cursor opaco de la página siguiente', required=False, type=str),
+            OpenApiParameter(name='limit', description='Tamaño de página (default 20, máx. 500)', required=False, type=int),
+        ],
         responses={200: SocioSerializer(many=True)}
     )
     def list(self, request):
         """ GET /api/v1/socios/ """
+        params = request.query_params
+        orden = params.get('ordenar', 'apellidos')
+        if orden not in DjangoSocioRepository.ORDENES:
+            return Response({"error": f"ordenar debe ser: {', '.join(DjangoSocioRepository.ORDENES)}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        filtros = {"rol": params.get('rol') or None, "busqueda": params.get('q') or None}
         try:
-            repo = DjangoSocioRepository()
-            use_case = ListarSociosUseCase(repo)
-            socios_dto = use_case.execute()
-            
-            # Paginación manual para ViewSet custom
-            paginator = PageNumberPagination()
-            paginator.page_size = 20 # Configuración por defecto
-            result_page = paginator.paginate_queryset(socios_dto, request, view=self)
-            
-            if result_page is not None:
-                serializer = SocioSerializer(result_page, many=True)
-                return paginator.get_paginated_response(serializer.data)
+            if params.get('barrio'):
+                filtros["barrio_id"] = int(params['barrio'])
+        except ValueError:
+            return Response({"error": "barrio debe ser un ID numérico."}, status=status.HTTP_400_BAD_REQUEST)
+        if params.get('activo'):
+            filtros["activo"] = params['activo'].lower() in ('true', '1', 'si')
+
+        use_case = ListarSociosUseCase(DjangoSocioRepository())
+        paginator = KeysetPagination()
+        paginator.ordering = DjangoSocioRepository.ORDENES[orden]
+        paginator.page_size = 20 # Configuración por defecto
+        pagina = paginator.paginate_consulta(
+            lambda despues_de, limite: use_case.pagina(limite, despues_de, orden, **filtros), request
+        )
+        return paginator.get_paginated_response(SocioSerializer(pagina, many=True).data)
 
-            serializer = SocioSerializer(socios_dto, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    @extend_schema(
+        summary="Buscar Socios (type-ahead)",
+        description=(
+            "Búsqueda indexada para caja: cédula exacta primero, luego prefijo de cédula y de "
+            "nombres/apellidos (sin tildes ni mayúsculas); si faltan resultados agrega coincidencias "
+            "aproximadas por trigramas (typos). Cada resultado indica `coincidencia` y `similitud`."
+        ),
+        parameters=[
+            OpenApiParameter(name='q', description='Cédula, nombres o apellidos (mín. 2 caracteres)', required=True, type=str),
+            OpenApiParameter(name='limit', description='Máximo de resultados (default 10, máx. 50)', required=False, type=int),
+        ],
+    )
+    @action(detail=False, methods=['get'], url_path='buscar')
+    def buscar(self, request):
+        """ GET /api/v1/socios/buscar/?q= """
+        try:
+            limite = int(request.query_params.get('limit', 10))
+            resultados = BuscarSociosUseCase(DjangoBusquedaSocioRepository()).execute(
+                request.query_params.get('q', ''), limite
+            )
+        except ValueError:
+            return Response({"error": "limit debe ser numérico."}, status=status.HTTP_400_BAD_REQUEST)
+        except ValidacionError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(resultados, status=status.HTTP_200_OK)
 
     @extend_schema(
         summary="Obtener Socio",
@@ -174,22 +213,10 @@ class SocioViewSet(viewsets.ViewSet):
                 return Response({"error": "No tiene permiso para ver esta cuenta"}, status=status.HTTP_403_FORBIDDEN)
         
         try:
-            # 1. Inicializar Repositorios
-            socio_repo = DjangoSocioRepository()
-            terreno_repo = DjangoTerrenoRepository()
-            factura_repo = DjangoFacturaRepository()
-            pago_repo = DjangoPagoRepository()
-            servicio_repo = DjangoServicioRepository()
-
-            # 2. Inicializar UseCase
-            use_case = ObtenerEstadoCuentaUseCase(
-                socio_repo, terreno_repo, factura_repo, pago_repo, servicio_repo
-            )
-
-            # 3. Ejecutar Lógica de Negocio
-            estado_cuenta_dto = use_case.execute(int(pk))
+            # 1. Documento precalculado (una lectura de cache; se arma en vivo si no existe)
+            estado_cuenta_dto = EstadoCuentaCacheService().obtener(int(pk))
 
-            # 4. Serializar Respuesta
+            # 2. Serializar Respuesta
             serializer = EstadoCuentaSerializer(estado_cuenta_dto)
             
             return Response(serializer.data, status=status.HTTP_200_OK)
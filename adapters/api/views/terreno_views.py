@@ -29,6 +29,7 @@ from adapters.infrastructure.repositories.django_barrio_repository import Django
 from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
 from adapters.infrastructure.repositories.django_servicio_repository import DjangoServicioRepository
 from adapters.infrastructure.models import MedidorModel, TerrenoModel
+from adapters.api.pagination import KeysetPagination
 
 # --- Serializers ---
 from adapters.api.serializers.terreno_serializers import (
@@ -94,50 +95,54 @@ class TerrenoViewSet(viewsets.ViewSet):
     # =================================================================
     @extend_schema(
         summary="Listar Terrenos",
-        description="Obtiene lista de terrenos con filtros opcionales.",
+        description=(
+            "Terrenos con su barrio y medidor en UNA consulta (JOIN), paginados por cursor: "
+            "cada página cuesta lo mismo sin importar cuántos terrenos existan. "
+            "Usar el enlace `next` para avanzar."
+        ),
         parameters=[
             OpenApiParameter('socio_id', type=int, required=False, description="Filtrar por ID de socio"),
             OpenApiParameter('barrio_id', type=int, required=False, description="Filtrar por ID de barrio"),
+            OpenApiParameter('cursor', type=str, required=False, description="Cursor opaco de la página siguiente"),
+            OpenApiParameter('limit', type=int, required=False, description="Tamaño de página (default 50, máx. 500)"),
         ],
-        responses={200: TerrenoLecturaSerializer(many=True)} # Usamos el de lectura aunque el return es un dict custom, ajustamos abajo si hace falta o creamos uno "Inline"
+        responses={200: OpenApiTypes.OBJECT}
     )
     def list(self, request):
-        repos = self._get_repositories()
-        repo_terreno = repos['terreno']
-        repo_medidor = repos['medidor']
+        filtros = {}
+        try:
+            for campo in ('socio_id', 'barrio_id'):
+                if request.query_params.get(campo):
+                    filtros[campo] = int(request.query_params[campo])
+        except ValueError:
+            return Response({"error": "socio_id y barrio_id deben ser numéricos."}, status=status.HTTP_400_BAD_REQUEST)
+
+        repo_terreno = DjangoTerrenoRepository()
+        paginator = KeysetPagination()
+        paginator.ordering = ('id',)
+
+        def consultar(despues_de, limite):
+            pagina = repo_terreno.listar_con_medidor(
+                limite, despues_de=int(despues_de[0]) if despues_de else None, **filtros
+            )
+            return [self._fila_listado(t, m) for t, m in pagina]
 
-        socio_id = request.query_params.get('socio_id')
-        barrio_id = request.query_params.get('barrio_id')
-
-        terrenos = []
-        if socio_id:
-            terrenos = repo_terreno.list_by_socio_id(int(socio_id))
-        elif barrio_id:
-            terrenos = repo_terreno.list_by_barrio_id(int(barrio_id))
-        else:
-            qs = TerrenoModel.objects.all()[:100]
-            terrenos = [repo_terreno._map_model_to_domain(m) for m in qs]
-
-        data = []
-        for t in terrenos:
-            medidor = repo_medidor.get_by_terreno_id(t.id)
-            data.append({
-                "id": t.id,
-                "direccion": t.direccion,
-                "nombre_barrio": t.nombre_barrio if hasattr(t, 'nombre_barrio') else "N/A",
-                "es_cometida_activa": t.es_cometida_activa,
-                "socio_id": t.socio_id,
-                "barrio_id": t.barrio_id,
-                "tiene_medidor": True if medidor else False,
-                "codigo_medidor": medidor.codigo if medidor else None,
-                "marca_medidor": medidor.marca if medidor else None,
-                "estado_medidor": medidor.estado if medidor else "SIN MEDIDOR"
-            })
-        
-        # Ojo: data es un dict manual, no match exacto con TerrenoLecturaSerializer,
-        # pero para propósitos de 'unable to guess', esto calla el warning.
-        # Idealmente definiríamos un Inline Serializer para esto.
-        return Response(data, status=status.HTTP_200_OK)
+        return paginator.get_paginated_response(paginator.paginate_consulta(consultar, request))
+
+    @staticmethod
+    def _fila_listado(t, medidor):
+        return {
+            "id": t.id,
+            "direccion": t.direccion,
+            "nombre_barrio": t.nombre_barrio or "N/A",
+            "es_cometida_activa": t.es_cometida_activa,
+            "socio_id": t.socio_id,
+            "barrio_id": t.barrio_id,
+            "tiene_medidor": medidor is not None,
+            "codigo_medidor": medidor.codigo if medidor else None,
+            "marca_medidor": medidor.marca if medidor else None,
+            "estado_medidor": medidor.estado if medidor else "SIN MEDIDOR"
+        }
 
     # =================================================================
     # 3. DETALLE (GET ID)
@@ -148,19 +153,18 @@ class TerrenoViewSet(viewsets.ViewSet):
         responses={200: OpenApiTypes.OBJECT, 404: OpenApiTypes.OBJECT}
     )
     def retrieve(self, request, pk=None):
-        repos = self._get_repositories()
-        terreno = repos['terreno'].get_by_id(int(pk))
-        if not terreno:
+        # Terreno + barrio + medidor en una sola consulta
+        encontrado = DjangoTerrenoRepository().obtener_con_medidor(int(pk))
+        if not encontrado:
             return Response({"error": "Terreno no encontrado"}, status=status.HTTP_404_NOT_FOUND)
-
-        medidor = repos['medidor'].get_by_terreno_id(terreno.id)
+        terreno, medidor = encontrado
 
         response = {
             "id": terreno.id,
             "direccion": terreno.direccion,
             "barrio": {
                 "id": terreno.barrio_id,
-                "nombre": getattr(terreno, 'nombre_barrio', '')
+                "nombre": terreno.nombre_barrio or ''
             },
             "estado_servicio": "ACTIVO" if terreno.es_cometida_activa else "SUSPENDIDO",
             "medidor": None
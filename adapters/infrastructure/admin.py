@@ -23,10 +23,19 @@ from .models import (
     CuentaPorCobrarModel,
     OrdenTrabajoModel,
     ProductoMaterial,
-    SolicitudJustificacionModel
+    SolicitudJustificacionModel,
+    CorridaFacturacionModel,
+    CorridaFacturacionItemModel,
+    AnomaliaLecturaModel,
+    ImputacionPagoModel,
+    SaldoSocioModel,
+    HechoAnaliticoModel,
+    MarcaAguaAnaliticaModel,
+    TrabajoReporteModel
 )
 # Hack: Importar el detalle directamente si no está en __init__
 from adapters.infrastructure.models.pago_model import DetallePagoModel
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
 
 @admin.register(BarrioModel)
 class BarrioAdmin(admin.ModelAdmin):
@@ -55,6 +64,12 @@ class SocioAdmin(SimpleHistoryAdmin):
         }),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        # Índice socios_busqueda (prefijo de cédula / palabras sin tildes) en vez de LIKE '%x%'
+        if not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(id__in=DjangoBusquedaSocioRepository().ids_coincidentes(search_term)), False
+
 @admin.register(TerrenoModel)
 class TerrenoAdmin(admin.ModelAdmin):
     list_display = ('id', 'get_socio_nombre', 'barrio', 'direccion', 'es_cometida_activa')
@@ -141,6 +156,13 @@ class DetallePagoInline(admin.TabularInline):
     extra = 1
     min_num = 1
 
+class ImputacionPagoInline(admin.TabularInline):
+    model = ImputacionPagoModel
+    extra = 0
+    fields = ('cuenta', 'factura', 'saldo_anterior', 'monto', 'fecha')
+    readonly_fields = fields
+    can_delete = False
+
 @admin.register(PagoModel)
 class PagoAdmin(SimpleHistoryAdmin):
     list_display = ('numero_comprobante_interno', 'socio', 'monto_total', 'fecha_registro', 'validado')
@@ -148,7 +170,7 @@ class PagoAdmin(SimpleHistoryAdmin):
     search_fields = ('numero_comprobante_interno', 'socio__identificacion', 'socio__apellidos')
     autocomplete_fields = ['socio']
     
-    inlines = [DetallePagoInline]
+    inlines = [DetallePagoInline, ImputacionPagoInline]
 
 # --- ✅ SECCIÓN DE SERVICIOS AGUA (NUEVO) ---
 @admin.register(ServicioModel)
@@ -259,3 +281,65 @@ class CuentaPorCobrarAdmin(SimpleHistoryAdmin):
     list_filter = ('estado', 'fecha_vencimiento', 'rubro')
     search_fields = ('socio__nombres', 'rubro__nombre')
     autocomplete_fields = ['socio', 'factura', 'rubro']
+
+# --- ✅ BITÁCORA DE CORRIDAS DE FACTURACIÓN ---
+class CorridaFacturacionItemInline(admin.TabularInline):
+    model = CorridaFacturacionItemModel
+    extra = 0
+    fields = ('clave', 'estado', 'factura', 'intentos', 'mensaje_error', 'fecha_actualizacion')
+    readonly_fields = fields
+    can_delete = False
+
+@admin.register(CorridaFacturacionModel)
+class CorridaFacturacionAdmin(admin.ModelAdmin):
+    list_display = ('id', 'tipo', 'anio', 'mes', 'estado', 'total_items', 'completados', 'con_error', 'ejecuciones', 'ultimo_checkpoint')
+    list_filter = ('tipo', 'estado', 'anio')
+    readonly_fields = ('fecha_inicio', 'fecha_fin', 'ultimo_checkpoint')
+    inlines = [CorridaFacturacionItemInline]
+
+# --- ✅ ANOMALÍAS DE LECTURA (Revisión previa a la emisión) ---
+@admin.register(AnomaliaLecturaModel)
+class AnomaliaLecturaAdmin(admin.ModelAdmin):
+    list_display = ('lectura', 'medidor', 'tipo', 'consumo_m3', 'esperado_m3', 'puntaje', 'revisada', 'fecha_deteccion')
+    list_filter = ('tipo', 'revisada')
+    list_editable = ('revisada',)
+    search_fields = ('medidor__codigo',)
+    readonly_fields = ('lectura', 'medidor', 'tipo', 'consumo_m3', 'esperado_m3', 'limite_inferior_m3',
+                       'limite_superior_m3', 'puntaje', 'meses_historial', 'fecha_deteccion')
+
+# --- ✅ LIBRO DE SALDOS POR SOCIO (Solo lectura: lo mantiene el sistema) ---
+@admin.register(SaldoSocioModel)
+class SaldoSocioAdmin(admin.ModelAdmin):
+    list_display = ('socio', 'deuda_total', 'cuentas_abiertas', 'vencimiento_mas_antiguo', 'vencimiento_corte', 'fecha_actualizacion')
+    search_fields = ('socio__nombres', 'socio__apellidos', 'socio__identificacion')
+    readonly_fields = list_display
+
+    def has_add_permission(self, request):
+        return False
+
+# --- ✅ HECHOS ANALÍTICOS (Solo lectura: refresco incremental por Celery Beat) ---
+@admin.register(HechoAnaliticoModel)
+class HechoAnaliticoAdmin(admin.ModelAdmin):
+    list_display = ('indicador', 'granularidad', 'fecha', 'barrio', 'rubro', 'metodo', 'valor', 'cantidad')
+    list_filter = ('indicador', 'granularidad', 'barrio')
+    date_hierarchy = 'fecha'
+    readonly_fields = list_display
+
+    def has_add_permission(self, request):
+        return False
+
+@admin.register(MarcaAguaAnaliticaModel)
+class MarcaAguaAnaliticaAdmin(admin.ModelAdmin):
+    list_display = ('proceso', 'marca', 'fecha_actualizacion')
+
+# --- ✅ TRABAJOS DE REPORTE (Solo lectura: los gestiona la cola de Celery) ---
+@admin.register(TrabajoReporteModel)
+class TrabajoReporteAdmin(admin.ModelAdmin):
+    list_display = ('id', 'tipo', 'estado', 'solicitado_por', 'fecha_creacion', 'fecha_fin', 'expira_en')
+    list_filter = ('tipo', 'estado')
+    readonly_fields = ('tipo', 'parametros', 'huella', 'estado', 'error', 'task_id', 'solicitado_por',
+                       'fecha_creacion', 'fecha_inicio', 'fecha_fin', 'expira_en')
+    exclude = ('resultado',)
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0005_remove_historicalfacturamodel_estado_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CorridaFacturacionModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('EMISION_MASIVA', 'Emisión Masiva (Lecturas + Fijos)')], default='EMISION_MASIVA', max_length=30)),
+                ('anio', models.PositiveSmallIntegerField(verbose_name='Año Fiscal')),
+                ('mes', models.PositiveSmallIntegerField(verbose_name='Mes Fiscal')),
+                ('parametros', models.JSONField(blank=True, default=dict)),
+                ('estado', models.CharField(choices=[('EN_CURSO', 'En Curso'), ('COMPLETADA', 'Completada'), ('COMPLETADA_CON_ERRORES', 'Completada con Errores')], default='EN_CURSO', max_length=30)),
+                ('total_items', models.PositiveIntegerField(default=0)),
+                ('completados', models.PositiveIntegerField(default=0)),
+                ('con_error', models.PositiveIntegerField(default=0)),
+                ('ejecuciones', models.PositiveIntegerField(default=0, help_text='Veces que se inició/reanudó la corrida')),
+                ('ultimo_checkpoint', models.DateTimeField(blank=True, null=True)),
+                ('fecha_inicio', models.DateTimeField(auto_now_add=True)),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
+                ('usuario', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Corrida de Facturación',
+                'verbose_name_plural': 'Corridas de Facturación',
+                'db_table': 'facturacion_corridas',
+                'ordering': ['-fecha_inicio'],
+                'unique_together': {('tipo', 'anio', 'mes')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CorridaFacturacionItemModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(max_length=50)),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('COMPLETADO', 'Completado'), ('ERROR', 'Error')], default='PENDIENTE', max_length=20)),
+                ('mensaje_error', models.TextField(blank=True, null=True)),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+                ('factura', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='infrastructure.facturamodel')),
+                ('corrida', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='infrastructure.corridafacturacionmodel')),
+            ],
+            options={
+                'verbose_name': 'Ítem de Corrida de Facturación',
+                'db_table': 'facturacion_corridas_items',
+                'indexes': [models.Index(fields=['corrida', 'estado', 'clave'], name='idx_corrida_item_estado')],
+                'unique_together': {('corrida', 'clave')},
+            },
+        ),
+    ]
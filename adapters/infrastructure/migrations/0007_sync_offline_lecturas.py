@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0006_corridas_facturacion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicallecturamodel',
+            name='referencia_cliente',
+            field=models.CharField(blank=True, db_index=True, help_text='Identificador generado por la app de lecturas (sync offline)', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='lecturamodel',
+            name='referencia_cliente',
+            field=models.CharField(blank=True, help_text='Identificador generado por la app de lecturas (sync offline)', max_length=64, null=True, unique=True),
+        ),
+        migrations.CreateModel(
+            name='CambioSyncModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entidad', models.CharField(choices=[('MEDIDOR', 'Medidor (incluye su última lectura)'), ('TERRENO', 'Terreno')], max_length=20)),
+                ('objeto_id', models.IntegerField()),
+                ('barrio_id', models.IntegerField(blank=True, null=True)),
+                ('fecha', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Cambio de Sincronización',
+                'verbose_name_plural': 'Cambios de Sincronización',
+                'db_table': 'sync_cambios',
+                'indexes': [models.Index(fields=['barrio_id', 'id'], name='idx_sync_barrio_token')],
+            },
+        ),
+    ]
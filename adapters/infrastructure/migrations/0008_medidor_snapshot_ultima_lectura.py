@@ -0,0 +1,47 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def poblar_snapshot_ultima_lectura(apps, schema_editor):
+    # Mismo UPDATE set-based que DjangoMedidorRepository.refrescar_ultima_lectura
+    MedidorModel = apps.get_model('infrastructure', 'MedidorModel')
+    LecturaModel = apps.get_model('infrastructure', 'LecturaModel')
+    ultima = LecturaModel.objects.filter(medidor_id=OuterRef('pk')).order_by('-fecha', '-id')
+    MedidorModel.objects.update(
+        ultima_lectura_id=Subquery(ultima.values('id')[:1]),
+        ultima_lectura_valor=Subquery(ultima.values('valor')[:1]),
+        ultima_lectura_fecha=Subquery(ultima.values('fecha')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0007_sync_offline_lecturas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='medidormodel',
+            name='ultima_lectura',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='infrastructure.lecturamodel', verbose_name='Última Lectura'),
+        ),
+        migrations.AddField(
+            model_name='medidormodel',
+            name='ultima_lectura_fecha',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='medidormodel',
+            name='ultima_lectura_valor',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='lecturamodel',
+            index=models.Index(fields=['medidor', 'fecha', 'id'], name='idx_lectura_medidor_fecha'),
+        ),
+        migrations.RunPython(poblar_snapshot_ultima_lectura, migrations.RunPython.noop),
+    ]
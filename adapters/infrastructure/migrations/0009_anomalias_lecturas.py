@@ -0,0 +1,40 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0008_medidor_snapshot_ultima_lectura'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnomaliaLecturaModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('CONSUMO_ALTO', 'Consumo Alto'), ('CONSUMO_BAJO', 'Consumo Bajo'), ('MEDIDOR_ESTANCADO', 'Medidor Estancado (Consumo 0)'), ('CONSUMO_NEGATIVO', 'Consumo Negativo (Vuelta / Digitación)')], max_length=20)),
+                ('consumo_m3', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('esperado_m3', models.DecimalField(decimal_places=2, help_text='Línea base (estacional o mediana)', max_digits=12)),
+                ('limite_inferior_m3', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('limite_superior_m3', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('puntaje', models.DecimalField(decimal_places=2, help_text='Desviaciones robustas (z-MAD)', max_digits=8)),
+                ('meses_historial', models.PositiveSmallIntegerField()),
+                ('revisada', models.BooleanField(default=False)),
+                ('fecha_deteccion', models.DateTimeField(auto_now=True)),
+                ('lectura', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='anomalia', to='infrastructure.lecturamodel')),
+                ('medidor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='anomalias', to='infrastructure.medidormodel')),
+                ('revisada_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Anomalía de Lectura',
+                'verbose_name_plural': 'Anomalías de Lectura',
+                'db_table': 'lecturas_anomalias',
+                'ordering': ['-puntaje'],
+            },
+        ),
+    ]
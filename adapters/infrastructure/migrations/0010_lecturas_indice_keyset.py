@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0009_anomalias_lecturas'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lecturamodel',
+            index=models.Index(fields=['fecha', 'id'], name='idx_lectura_fecha_id'),
+        ),
+    ]
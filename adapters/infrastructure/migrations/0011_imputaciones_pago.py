@@ -0,0 +1,31 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0010_lecturas_indice_keyset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImputacionPagoModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('monto', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('saldo_anterior', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('fecha', models.DateTimeField(auto_now_add=True)),
+                ('cuenta', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='imputaciones', to='infrastructure.cuentaporcobrarmodel')),
+                ('factura', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='imputaciones', to='infrastructure.facturamodel')),
+                ('pago', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='imputaciones', to='infrastructure.pagomodel')),
+            ],
+            options={
+                'verbose_name': 'Imputación de Pago',
+                'verbose_name_plural': 'Imputaciones de Pago',
+                'db_table': 'pagos_imputaciones',
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:26
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+PATRON_FACTURA = re.compile(r"Factura #(\d+)")
+
+
+def poblar_factura_desde_observacion(apps, schema_editor):
+    """
+    Backfill de la FK a partir del texto heredado "... Factura #<id> ...".
+    Solo se liga si la factura existe y pertenece al mismo socio del pago.
+    """
+    PagoModel = apps.get_model('infrastructure', 'PagoModel')
+    FacturaModel = apps.get_model('infrastructure', 'FacturaModel')
+
+    candidatos = {}
+    qs = PagoModel.objects.filter(factura__isnull=True, observacion__contains='Factura #')
+    for pago_id, socio_id, observacion in qs.values_list('id', 'socio_id', 'observacion').iterator(chunk_size=2000):
+        match = PATRON_FACTURA.search(observacion or '')
+        if match:
+            candidatos[pago_id] = (socio_id, int(match.group(1)))
+
+    ids_factura = sorted({factura_id for _, factura_id in candidatos.values()})
+    socio_de_factura = {}
+    for inicio in range(0, len(ids_factura), 500):
+        socio_de_factura.update(
+            FacturaModel.objects.filter(pk__in=ids_factura[inicio:inicio + 500]).values_list('id', 'socio_id')
+        )
+
+    pagos = [
+        PagoModel(id=pago_id, factura_id=factura_id)
+        for pago_id, (socio_id, factura_id) in candidatos.items()
+        if socio_de_factura.get(factura_id) == socio_id
+    ]
+    PagoModel.objects.bulk_update(pagos, ['factura'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0011_imputaciones_pago'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalpagomodel',
+            name='factura',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='infrastructure.facturamodel'),
+        ),
+        migrations.AddField(
+            model_name='pagomodel',
+            name='factura',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pagos', to='infrastructure.facturamodel'),
+        ),
+        migrations.RunPython(poblar_factura_desde_observacion, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:30
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, F, Min, Sum, Window
+from django.db.models.functions import RowNumber
+
+TIPOS_PLANILLA = ('AGUA', 'PLANILLA', 'AGUA_POTABLE')
+UMBRAL_CORTE = 2
+
+
+def poblar_saldos_socios(apps, schema_editor):
+    # Mismo cálculo que DjangoSaldoSocioRepository.recalcular (solo socios con cuentas abiertas)
+    CuentaPorCobrarModel = apps.get_model('infrastructure', 'CuentaPorCobrarModel')
+    SaldoSocioModel = apps.get_model('infrastructure', 'SaldoSocioModel')
+    abiertas = CuentaPorCobrarModel.objects.filter(
+        saldo_pendiente__gt=Decimal('0.00')
+    ).exclude(estado='ANULADO').order_by()
+
+    corte = dict(
+        abiertas.filter(estado='PENDIENTE', rubro__tipo__in=TIPOS_PLANILLA)
+        .annotate(posicion=Window(
+            expression=RowNumber(),
+            partition_by=[F('socio_id')],
+            order_by=[F('fecha_vencimiento').asc(), F('id').asc()]
+        ))
+        .filter(posicion=UMBRAL_CORTE)
+        .values_list('socio_id', 'fecha_vencimiento')
+    )
+    SaldoSocioModel.objects.bulk_create([
+        SaldoSocioModel(
+            socio_id=socio_id, deuda_total=deuda, cuentas_abiertas=cuentas,
+            vencimiento_mas_antiguo=vencimiento, vencimiento_corte=corte.get(socio_id)
+        )
+        for socio_id, deuda, cuentas, vencimiento in abiertas.values('socio_id').annotate(
+            deuda=Sum('saldo_pendiente'), cuentas=Count('id'), vencimiento=Min('fecha_vencimiento')
+        ).values_list('socio_id', 'deuda', 'cuentas', 'vencimiento')
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0012_pagos_factura_fk'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SaldoSocioModel',
+            fields=[
+                ('socio', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='saldo', serialize=False, to='infrastructure.sociomodel')),
+                ('deuda_total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cuentas_abiertas', models.PositiveIntegerField(default=0)),
+                ('vencimiento_mas_antiguo', models.DateField(blank=True, null=True)),
+                ('vencimiento_corte', models.DateField(blank=True, null=True)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Saldo de Socio',
+                'verbose_name_plural': 'Saldos de Socios',
+                'db_table': 'socios_saldos',
+                'indexes': [models.Index(fields=['vencimiento_corte'], name='idx_saldo_vencimiento_corte')],
+            },
+        ),
+        migrations.RunPython(poblar_saldos_socios, migrations.RunPython.noop),
+    ]
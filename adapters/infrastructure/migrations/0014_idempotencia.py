@@ -0,0 +1,37 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:39
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0013_saldos_socios'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotenciaModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alcance', models.CharField(help_text='Endpoint protegido (ej. cobros.registrar)', max_length=100)),
+                ('clave', models.CharField(max_length=255)),
+                ('huella', models.CharField(max_length=64)),
+                ('usuario_id', models.IntegerField(blank=True, null=True)),
+                ('estado', models.CharField(choices=[('EN_PROCESO', 'En proceso'), ('COMPLETADA', 'Completada')], default='EN_PROCESO', max_length=20)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('respuesta', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+                ('expira_en', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Clave de Idempotencia',
+                'verbose_name_plural': 'Claves de Idempotencia',
+                'db_table': 'api_idempotencia',
+                'indexes': [models.Index(fields=['expira_en'], name='idx_idempotencia_expira')],
+                'constraints': [models.UniqueConstraint(fields=('alcance', 'clave'), name='uq_idempotencia_alcance_clave')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0014_idempotencia'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='facturamodel',
+            index=models.Index(fields=['estado_financiero', 'socio', 'fecha_emision'], name='idx_factura_cartera'),
+        ),
+    ]
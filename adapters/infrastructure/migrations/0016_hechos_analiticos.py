@@ -0,0 +1,47 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0015_factura_cartera_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarcaAguaAnaliticaModel',
+            fields=[
+                ('proceso', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('marca', models.DateTimeField(blank=True, null=True)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Marca de Agua Analítica',
+                'verbose_name_plural': 'Marcas de Agua Analíticas',
+                'db_table': 'analytics_marcas_agua',
+            },
+        ),
+        migrations.CreateModel(
+            name='HechoAnaliticoModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularidad', models.CharField(choices=[('DIA', 'Diario'), ('MES', 'Mensual')], max_length=3)),
+                ('fecha', models.DateField(help_text='Día del hecho, o primer día del mes si la granularidad es MES')),
+                ('indicador', models.CharField(choices=[('FACTURADO_RUBRO', 'Facturado por Rubro (subtotal)'), ('FACTURAS', 'Facturas Emitidas (total)'), ('RECAUDADO', 'Recaudado por Método de Pago'), ('CONSUMO_M3', 'Consumo de Agua (m3)')], max_length=20)),
+                ('metodo', models.CharField(blank=True, default='', max_length=20)),
+                ('valor', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('cantidad', models.PositiveIntegerField(default=0, help_text='Líneas, facturas, pagos o lecturas según el indicador')),
+                ('barrio', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='infrastructure.barriomodel')),
+                ('rubro', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='infrastructure.catalogorubromodel')),
+            ],
+            options={
+                'verbose_name': 'Hecho Analítico',
+                'verbose_name_plural': 'Hechos Analíticos',
+                'db_table': 'analytics_hechos',
+                'indexes': [models.Index(fields=['indicador', 'granularidad', 'fecha'], name='idx_hecho_indicador_fecha')],
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.10 on 2026-10-18 21:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def poblar_usuario_cobro_desde_historial(apps, schema_editor):
+    """
+    Backfill del cajero: el registro de creación ('+') del historial guarda el usuario
+    de la solicitud (HistoryRequestMiddleware). Un solo UPDATE con subconsulta.
+    """
+    PagoModel = apps.get_model('infrastructure', 'PagoModel')
+    HistoricalPagoModel = apps.get_model('infrastructure', 'HistoricalPagoModel')
+
+    creador = HistoricalPagoModel.objects.filter(
+        id=OuterRef('pk'), history_type='+', history_user__isnull=False
+    ).order_by('history_date').values('history_user_id')[:1]
+    PagoModel.objects.filter(usuario_cobro__isnull=True).update(usuario_cobro_id=Subquery(creador))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0016_hechos_analiticos'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalpagomodel',
+            name='usuario_cobro',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='pagomodel',
+            name='usuario_cobro',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='cobros_registrados', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='pagomodel',
+            index=models.Index(fields=['fecha_registro'], name='idx_pago_fecha_registro'),
+        ),
+        migrations.RunPython(poblar_usuario_cobro_desde_historial, migrations.RunPython.noop),
+    ]
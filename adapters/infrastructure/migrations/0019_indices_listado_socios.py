@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-18 22:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0018_trabajos_reporte'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sociomodel',
+            index=models.Index(fields=['apellidos', 'nombres', 'id'], name='idx_socio_apellidos'),
+        ),
+        migrations.AddIndex(
+            model_name='sociomodel',
+            index=models.Index(fields=['barrio', 'apellidos', 'nombres', 'id'], name='idx_socio_barrio_apellidos'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.10 on 2026-10-18 22:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from core.services.busqueda_socios_service import TERMINO_PALABRA, terminos_socio, trigramas
+
+
+def poblar_indice_busqueda(apps, schema_editor):
+    # Mismos términos que DjangoBusquedaSocioRepository.reindexar (tablas recién creadas: solo INSERT)
+    SocioModel = apps.get_model('infrastructure', 'SocioModel')
+    TerminoBusquedaSocioModel = apps.get_model('infrastructure', 'TerminoBusquedaSocioModel')
+    TrigramaPalabraModel = apps.get_model('infrastructure', 'TrigramaPalabraModel')
+    lote, vocabulario = [], set()
+    for socio_id, identificacion, nombres, apellidos in (
+        SocioModel.objects.order_by('id').values_list('id', 'identificacion', 'nombres', 'apellidos').iterator()
+    ):
+        for tipo, termino in terminos_socio(identificacion, nombres, apellidos):
+            lote.append(TerminoBusquedaSocioModel(socio_id=socio_id, tipo=tipo, termino=termino))
+            if tipo == TERMINO_PALABRA:
+                vocabulario.add(termino)
+        if len(lote) >= 5000:
+            TerminoBusquedaSocioModel.objects.bulk_create(lote)
+            lote = []
+    TerminoBusquedaSocioModel.objects.bulk_create(lote)
+    TrigramaPalabraModel.objects.bulk_create(
+        [TrigramaPalabraModel(palabra=p, trigrama=t) for p in vocabulario for t in trigramas(p)], batch_size=5000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0019_indices_listado_socios'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrigramaPalabraModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('palabra', models.CharField(max_length=40)),
+                ('trigrama', models.CharField(max_length=3)),
+            ],
+            options={
+                'verbose_name': 'Trigrama de Palabra',
+                'verbose_name_plural': 'Trigramas de Palabras',
+                'db_table': 'socios_busqueda_trigramas',
+                'indexes': [models.Index(fields=['palabra'], name='idx_trigrama_palabra')],
+                'constraints': [models.UniqueConstraint(fields=('trigrama', 'palabra'), name='uq_trigrama_palabra')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TerminoBusquedaSocioModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('ID', 'Identificación'), ('ID_PREFIJO', 'Prefijo de identificación'), ('PALABRA', 'Palabra'), ('PREFIJO', 'Prefijo de palabra')], max_length=10)),
+                ('termino', models.CharField(max_length=40)),
+                ('socio', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terminos_busqueda', to='infrastructure.sociomodel')),
+            ],
+            options={
+                'verbose_name': 'Término de Búsqueda de Socio',
+                'verbose_name_plural': 'Términos de Búsqueda de Socios',
+                'db_table': 'socios_busqueda',
+                'constraints': [models.UniqueConstraint(fields=('termino', 'tipo', 'socio'), name='uq_busqueda_termino_tipo_socio')],
+            },
+        ),
+        migrations.RunPython(poblar_indice_busqueda, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.10 on 2026-10-18 22:48
+
+from django.db import migrations, models
+
+
+def marcar_trabajos_activos(apps, schema_editor):
+    """
+    Trabajos en vuelo al desplegar: el más reciente de cada huella toma `huella_activa`.
+    En MySQL el constraint parcial nunca existió y puede haber duplicados; los demás
+    quedan sin huella activa y terminan como cualquier otro trabajo.
+    """
+    TrabajoReporte = apps.get_model('infrastructure', 'TrabajoReporteModel')
+    vistas = set()
+    activos = TrabajoReporte.objects.filter(estado__in=['PENDIENTE', 'EN_PROCESO']).order_by('-fecha_creacion')
+    for trabajo_id, huella in activos.values_list('id', 'huella'):
+        if huella not in vistas:
+            vistas.add(huella)
+            TrabajoReporte.objects.filter(pk=trabajo_id).update(huella_activa=huella)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0020_indice_busqueda_socios'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='trabajoreportemodel',
+            name='uq_reporte_activo_huella',
+        ),
+        migrations.AddField(
+            model_name='trabajoreportemodel',
+            name='huella_activa',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(marcar_trabajos_activos, migrations.RunPython.noop),
+    ]
@@ -21,6 +21,15 @@ from .cuenta_por_cobrar_model import CuentaPorCobrarModel
 from .orden_trabajo_model import OrdenTrabajoModel
 from .evidencia_orden_model import EvidenciaOrdenTrabajoModel
 from .inventario_models import ProductoMaterial
+from .corrida_facturacion_model import CorridaFacturacionModel, CorridaFacturacionItemModel
+from .sync_model import CambioSyncModel
+from .anomalia_lectura_model import AnomaliaLecturaModel
+from .imputacion_pago_model import ImputacionPagoModel
+from .saldo_socio_model import SaldoSocioModel
+from .idempotencia_model import IdempotenciaModel
+from .hecho_analitico_model import HechoAnaliticoModel, MarcaAguaAnaliticaModel
+from .trabajo_reporte_model import TrabajoReporteModel
+from .busqueda_socio_model import TerminoBusquedaSocioModel, TrigramaPalabraModel
 
 # 4. Actualizamos la lista __all__ para exportar todo limpiamente
 __all__ = [
@@ -44,4 +53,16 @@ __all__ = [
     'OrdenTrabajoModel',
     'EvidenciaOrdenTrabajoModel',
     'ProductoMaterial',
+    'CorridaFacturacionModel',
+    'CorridaFacturacionItemModel',
+    'CambioSyncModel',
+    'AnomaliaLecturaModel',
+    'ImputacionPagoModel',
+    'SaldoSocioModel',
+    'IdempotenciaModel',
+    'HechoAnaliticoModel',
+    'MarcaAguaAnaliticaModel',
+    'TrabajoReporteModel',
+    'TerminoBusquedaSocioModel',
+    'TrigramaPalabraModel',
 ]
\ No newline at end of file
@@ -0,0 +1,37 @@
+# adapters/infrastructure/models/anomalia_lectura_model.py
+from django.db import models
+from django.conf import settings
+from .lectura_model import LecturaModel
+from .medidor_model import MedidorModel
+from core.shared.enums import TipoAnomaliaLectura
+
+
+class AnomaliaLecturaModel(models.Model):
+    """
+    Marca de consumo atípico sobre una lectura AÚN NO facturada.
+    La genera el job de detección (mediana/MAD del historial del medidor) y la
+    consume la pantalla de Pre-Emisión para revisar la lectura antes de facturar.
+    """
+    lectura = models.OneToOneField(LecturaModel, on_delete=models.CASCADE, related_name='anomalia')
+    medidor = models.ForeignKey(MedidorModel, on_delete=models.CASCADE, related_name='anomalias')
+    tipo = models.CharField(max_length=20, choices=TipoAnomaliaLectura.choices)
+
+    consumo_m3 = models.DecimalField(max_digits=12, decimal_places=2)
+    esperado_m3 = models.DecimalField(max_digits=12, decimal_places=2, help_text="Línea base (estacional o mediana)")
+    limite_inferior_m3 = models.DecimalField(max_digits=12, decimal_places=2)
+    limite_superior_m3 = models.DecimalField(max_digits=12, decimal_places=2)
+    puntaje = models.DecimalField(max_digits=8, decimal_places=2, help_text="Desviaciones robustas (z-MAD)")
+    meses_historial = models.PositiveSmallIntegerField()
+
+    revisada = models.BooleanField(default=False)
+    revisada_por = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    fecha_deteccion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'lecturas_anomalias'
+        verbose_name = 'Anomalía de Lectura'
+        verbose_name_plural = 'Anomalías de Lectura'
+        ordering = ['-puntaje']
+
+    def __str__(self):
+        return f"{self.tipo} lectura #{self.lectura_id} ({self.consumo_m3} m3)"
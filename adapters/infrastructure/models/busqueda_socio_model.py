@@ -0,0 +1,60 @@
+# adapters/infrastructure/models/busqueda_socio_model.py
+from django.db import models
+
+from core.services.busqueda_socios_service import (
+    LARGO_TERMINO, TERMINO_IDENTIFICACION, TERMINO_PALABRA, TERMINO_PREFIJO, TERMINO_PREFIJO_IDENTIFICACION
+)
+from .socio_model import SocioModel
+
+
+class TerminoBusquedaSocioModel(models.Model):
+    """
+    Índice invertido para buscar socios (caja, facturas pendientes, admin).
+    Una fila por término normalizado (sin tildes, minúsculas): identificación, prefijos
+    de la identificación, palabras de nombres/apellidos y sus prefijos. Toda búsqueda es
+    una igualdad sobre (tipo, termino) -> socio, nunca LIKE '%x%' sobre la tabla de socios.
+    Se mantiene en el save del socio (signal + DjangoSocioRepository.save).
+    """
+    TIPO_CHOICES = [
+        (TERMINO_IDENTIFICACION, 'Identificación'),
+        (TERMINO_PREFIJO_IDENTIFICACION, 'Prefijo de identificación'),
+        (TERMINO_PALABRA, 'Palabra'),
+        (TERMINO_PREFIJO, 'Prefijo de palabra'),
+    ]
+
+    socio = models.ForeignKey(SocioModel, on_delete=models.CASCADE, related_name='terminos_busqueda')
+    tipo = models.CharField(max_length=10, choices=TIPO_CHOICES)
+    termino = models.CharField(max_length=LARGO_TERMINO)
+
+    class Meta:
+        db_table = 'socios_busqueda'
+        verbose_name = 'Término de Búsqueda de Socio'
+        verbose_name_plural = 'Términos de Búsqueda de Socios'
+        constraints = [
+            models.UniqueConstraint(fields=['termino', 'tipo', 'socio'], name='uq_busqueda_termino_tipo_socio'),
+        ]
+
+    def __str__(self):
+        return f"{self.tipo}:{self.termino} -> {self.socio_id}"
+
+
+class TrigramaPalabraModel(models.Model):
+    """
+    Vocabulario de la búsqueda aproximada: trigramas de cada palabra DISTINTA de
+    nombres/apellidos (miles de palabras, no millones de filas por socio). Un typo se
+    resuelve primero contra el vocabulario y luego por igualdad en socios_busqueda.
+    """
+    palabra = models.CharField(max_length=LARGO_TERMINO)
+    trigrama = models.CharField(max_length=3)
+
+    class Meta:
+        db_table = 'socios_busqueda_trigramas'
+        verbose_name = 'Trigrama de Palabra'
+        verbose_name_plural = 'Trigramas de Palabras'
+        constraints = [
+            models.UniqueConstraint(fields=['trigrama', 'palabra'], name='uq_trigrama_palabra'),
+        ]
+        indexes = [models.Index(fields=['palabra'], name='idx_trigrama_palabra')]
+
+    def __str__(self):
+        return f"{self.trigrama} -> {self.palabra}"
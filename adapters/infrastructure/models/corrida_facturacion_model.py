@@ -0,0 +1,69 @@
+# adapters/infrastructure/models/corrida_facturacion_model.py
+from django.db import models
+from django.conf import settings
+from .factura_model import FacturaModel
+from core.shared.enums import EstadoCorridaFacturacion, EstadoItemCorrida
+
+
+class CorridaFacturacionModel(models.Model):
+    """
+    Bitácora (Ledger) de una corrida de facturación masiva.
+    Una corrida por (tipo, periodo): re-ejecutar el mismo periodo REANUDA la corrida
+    existente desde su último checkpoint en lugar de empezar de cero.
+    """
+    TIPO_EMISION_MASIVA = 'EMISION_MASIVA'
+    TIPO_CHOICES = [
+        (TIPO_EMISION_MASIVA, 'Emisión Masiva (Lecturas + Fijos)'),
+    ]
+
+    tipo = models.CharField(max_length=30, choices=TIPO_CHOICES, default=TIPO_EMISION_MASIVA)
+    anio = models.PositiveSmallIntegerField(verbose_name="Año Fiscal")
+    mes = models.PositiveSmallIntegerField(verbose_name="Mes Fiscal")
+    parametros = models.JSONField(default=dict, blank=True)
+
+    estado = models.CharField(max_length=30, choices=EstadoCorridaFacturacion.choices,
+                              default=EstadoCorridaFacturacion.EN_CURSO)
+    total_items = models.PositiveIntegerField(default=0)
+    completados = models.PositiveIntegerField(default=0)
+    con_error = models.PositiveIntegerField(default=0)
+    ejecuciones = models.PositiveIntegerField(default=0, help_text="Veces que se inició/reanudó la corrida")
+    ultimo_checkpoint = models.DateTimeField(null=True, blank=True)
+
+    usuario = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    fecha_inicio = models.DateTimeField(auto_now_add=True)
+    fecha_fin = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'facturacion_corridas'
+        verbose_name = 'Corrida de Facturación'
+        verbose_name_plural = 'Corridas de Facturación'
+        unique_together = ('tipo', 'anio', 'mes')
+        ordering = ['-fecha_inicio']
+
+    def __str__(self):
+        return f"{self.tipo} {self.anio}-{self.mes:02d} ({self.estado})"
+
+
+class CorridaFacturacionItemModel(models.Model):
+    """
+    Estado por ítem de la corrida (una lectura o un servicio fijo).
+    `clave` identifica el ítem de forma estable entre reintentos (ej: 'LECTURA:15', 'FIJO:8').
+    """
+    corrida = models.ForeignKey(CorridaFacturacionModel, on_delete=models.CASCADE, related_name='items')
+    clave = models.CharField(max_length=50)
+    estado = models.CharField(max_length=20, choices=EstadoItemCorrida.choices,
+                              default=EstadoItemCorrida.PENDIENTE)
+    factura = models.ForeignKey(FacturaModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    mensaje_error = models.TextField(null=True, blank=True)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'facturacion_corridas_items'
+        verbose_name = 'Ítem de Corrida de Facturación'
+        unique_together = ('corrida', 'clave')
+        # Lookup de reanudación: "ítems COMPLETADOS de esta corrida"
+        indexes = [models.Index(fields=['corrida', 'estado', 'clave'], name='idx_corrida_item_estado')]
+
+    def __str__(self):
+        return f"{self.clave} ({self.estado})"
@@ -87,6 +87,10 @@ class FacturaModel(models.Model):
         ordering = ['-fecha_registro']
         # Evita doble facturación del mismo servicio en el mismo mes
         unique_together = ['servicio', 'anio', 'mes']
+        indexes = [
+            # Reporte de antigüedad de cartera: filtro por estado + agrupación por socio
+            models.Index(fields=['estado_financiero', 'socio', 'fecha_emision'], name='idx_factura_cartera'),
+        ]
 
     history = HistoricalRecords()
 
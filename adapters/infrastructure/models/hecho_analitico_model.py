@@ -0,0 +1,55 @@
+# adapters/infrastructure/models/hecho_analitico_model.py
+from django.db import models
+from .barrio_model import BarrioModel
+from .catalogo_models import CatalogoRubroModel
+from core.shared.enums import IndicadorAnalitico, GranularidadHecho
+
+
+class HechoAnaliticoModel(models.Model):
+    """
+    Tabla de hechos pre-agregados para dashboards (BI).
+    Una fila = indicador × periodo (día o mes) × barrio × rubro × método de pago,
+    con las dimensiones que no aplican en NULL / vacío:
+    - FACTURADO_RUBRO: rubro        - FACTURAS: solo barrio
+    - RECAUDADO: metodo             - CONSUMO_M3: solo barrio
+    Se mantiene incrementalmente (ActualizarHechosAnaliticosUseCase): nunca editar a mano.
+    """
+    granularidad = models.CharField(max_length=3, choices=GranularidadHecho.choices)
+    fecha = models.DateField(help_text="Día del hecho, o primer día del mes si la granularidad es MES")
+    indicador = models.CharField(max_length=20, choices=IndicadorAnalitico.choices)
+
+    barrio = models.ForeignKey(BarrioModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    rubro = models.ForeignKey(CatalogoRubroModel, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    metodo = models.CharField(max_length=20, blank=True, default='')
+
+    valor = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    cantidad = models.PositiveIntegerField(default=0, help_text="Líneas, facturas, pagos o lecturas según el indicador")
+
+    class Meta:
+        db_table = 'analytics_hechos'
+        verbose_name = 'Hecho Analítico'
+        verbose_name_plural = 'Hechos Analíticos'
+        indexes = [
+            models.Index(fields=['indicador', 'granularidad', 'fecha'], name='idx_hecho_indicador_fecha'),
+        ]
+
+    def __str__(self):
+        return f"{self.indicador} {self.granularidad} {self.fecha}: {self.valor}"
+
+
+class MarcaAguaAnaliticaModel(models.Model):
+    """
+    Watermark del refresco incremental: hasta qué instante ya se procesaron los cambios
+    (tablas de historial) de cada proceso. La fila también sirve de candado entre corridas.
+    """
+    proceso = models.CharField(max_length=50, primary_key=True)
+    marca = models.DateTimeField(null=True, blank=True)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'analytics_marcas_agua'
+        verbose_name = 'Marca de Agua Analítica'
+        verbose_name_plural = 'Marcas de Agua Analíticas'
+
+    def __str__(self):
+        return f"{self.proceso}: {self.marca}"
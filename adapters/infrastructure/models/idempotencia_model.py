@@ -0,0 +1,45 @@
+# adapters/infrastructure/models/idempotencia_model.py
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotenciaModel(models.Model):
+    """
+    Registro durable de solicitudes con `Idempotency-Key` (cobros, abonos, POS, emisión).
+    La fila se RESERVA al llegar la solicitud (INSERT único por alcance + clave) y se
+    completa con la respuesta al terminar: un reintento concurrente choca con la
+    restricción única y recibe 409; uno posterior recibe la respuesta guardada.
+    `huella` = SHA-256 de usuario + método + ruta + cuerpo: la misma clave con otro
+    cuerpo (u otro usuario) se rechaza en lugar de devolver una respuesta ajena.
+    """
+    ESTADO_EN_PROCESO = 'EN_PROCESO'
+    ESTADO_COMPLETADA = 'COMPLETADA'
+    ESTADO_CHOICES = [
+        (ESTADO_EN_PROCESO, 'En proceso'),
+        (ESTADO_COMPLETADA, 'Completada'),
+    ]
+
+    alcance = models.CharField(max_length=100, help_text="Endpoint protegido (ej. cobros.registrar)")
+    clave = models.CharField(max_length=255)
+    huella = models.CharField(max_length=64)
+    usuario_id = models.IntegerField(null=True, blank=True)
+
+    estado = models.CharField(max_length=20, choices=ESTADO_CHOICES, default=ESTADO_EN_PROCESO)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    respuesta = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+    expira_en = models.DateTimeField()
+
+    class Meta:
+        db_table = 'api_idempotencia'
+        verbose_name = 'Clave de Idempotencia'
+        verbose_name_plural = 'Claves de Idempotencia'
+        constraints = [
+            models.UniqueConstraint(fields=['alcance', 'clave'], name='uq_idempotencia_alcance_clave'),
+        ]
+        indexes = [models.Index(fields=['expira_en'], name='idx_idempotencia_expira')]
+
+    def __str__(self):
+        return f"{self.alcance}:{self.clave} ({self.estado})"
@@ -0,0 +1,30 @@
+# adapters/infrastructure/models/imputacion_pago_model.py
+from django.db import models
+from .pago_model import PagoModel
+from .cuenta_por_cobrar_model import CuentaPorCobrarModel
+from .factura_model import FacturaModel
+
+
+class ImputacionPagoModel(models.Model):
+    """
+    Detalle de Imputación (Pago -> Deuda).
+    Cuánto de cada recibo se aplicó a cada cuenta por cobrar (FIFO).
+    Permite reconstruir qué pagó un recibo y qué recibos saldaron una deuda.
+    """
+    pago = models.ForeignKey(PagoModel, on_delete=models.CASCADE, related_name='imputaciones')
+    cuenta = models.ForeignKey(CuentaPorCobrarModel, on_delete=models.PROTECT, related_name='imputaciones')
+    # Desnormalizado desde la cuenta: "pagos de la factura X" sin pasar por cuentas_por_cobrar
+    factura = models.ForeignKey(FacturaModel, on_delete=models.SET_NULL, null=True, blank=True,
+                                related_name='imputaciones')
+
+    monto = models.DecimalField(max_digits=10, decimal_places=2)
+    saldo_anterior = models.DecimalField(max_digits=10, decimal_places=2)
+    fecha = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'pagos_imputaciones'
+        verbose_name = 'Imputación de Pago'
+        verbose_name_plural = 'Imputaciones de Pago'
+
+    def __str__(self):
+        return f"Pago #{self.pago_id} -> Cuenta #{self.cuenta_id}: ${self.monto}"
@@ -53,6 +53,10 @@ class LecturaModel(models.Model):
     
     observacion = models.TextField(null=True, blank=True)
     esta_facturada = models.BooleanField(default=False)
+
+    # Idempotencia de la app offline: UUID generado en el dispositivo del lector
+    referencia_cliente = models.CharField(max_length=64, unique=True, null=True, blank=True,
+                                          help_text="Identificador generado por la app de lecturas (sync offline)")
     fecha_registro = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -63,6 +67,12 @@ class LecturaModel(models.Model):
         ordering = ['-fecha']
         # Evita 2 lecturas para el mismo medidor en el mismo mes fiscal
         unique_together = ['medidor', 'anio', 'mes']
+        indexes = [
+            # "Última lectura del medidor" (snapshot) e historial filtrado por medidor
+            models.Index(fields=['medidor', 'fecha', 'id'], name='idx_lectura_medidor_fecha'),
+            # Paginación keyset del historial general (ORDER BY fecha DESC, id DESC)
+            models.Index(fields=['fecha', 'id'], name='idx_lectura_fecha_id'),
+        ]
 
     def __str__(self):
         return f"Medidor {self.medidor_id} - {self.fecha}: {self.valor} m3"
@@ -44,6 +44,16 @@ class MedidorModel(models.Model):
     observacion = models.TextField(null=True, blank=True)
     fecha_instalacion = models.DateField(auto_now_add=True)
 
+    # --- SNAPSHOT DE LA ÚLTIMA LECTURA (Desnormalizado) ---
+    # Lo mantiene DjangoMedidorRepository.refrescar_ultima_lectura en la misma transacción
+    # que guarda/corrige la lectura. Reconstruible con `manage.py reconstruir_ultima_lectura`.
+    ultima_lectura = models.ForeignKey(
+        'LecturaModel', on_delete=models.SET_NULL, null=True, blank=True, related_name='+',
+        verbose_name="Última Lectura"
+    )
+    ultima_lectura_valor = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    ultima_lectura_fecha = models.DateField(null=True, blank=True)
+
     class Meta:
         db_table = 'medidores'
         verbose_name = 'Medidor'
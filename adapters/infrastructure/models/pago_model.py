@@ -1,4 +1,5 @@
 # adapters>infrastructure>models>pago_model.py
+from django.conf import settings
 from django.db import models
 from simple_history.models import HistoricalRecords
 from core.shared.enums import MetodoPagoEnum
@@ -10,11 +11,18 @@ class PagoModel(models.Model):
     
     # Cabecera del Pago (Recibo)
     socio = models.ForeignKey(SocioModel, on_delete=models.PROTECT, related_name='pagos_realizados')
+    # Factura a la que se dirige el pago (Ventanilla, Web, POS). Null en abonos FIFO a la deuda general:
+    # esos se trazan por cuenta en ImputacionPagoModel.
+    factura = models.ForeignKey('FacturaModel', on_delete=models.SET_NULL, null=True, blank=True,
+                                related_name='pagos')
     numero_comprobante_interno = models.CharField(max_length=50, unique=True, editable=False, help_text="Código autogenerado")
     monto_total = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     
     observacion = models.TextField(null=True, blank=True)
     fecha_registro = models.DateTimeField(auto_now_add=True)
+    # Cajero que registró el cobro (null en comprobantes subidos por el socio desde el portal)
+    usuario_cobro = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+                                      related_name='cobros_registrados')
     
     # Campo opcional para validación de ingresos manuales
     validado = models.BooleanField(default=True)
@@ -24,6 +32,10 @@ class PagoModel(models.Model):
         verbose_name = 'Recibo de Pago'
         verbose_name_plural = 'Recibos de Pago'
         ordering = ['-fecha_registro']
+        indexes = [
+            # Cierre de caja: rangos semiabiertos [inicio, fin) sobre fecha_registro
+            models.Index(fields=['fecha_registro'], name='idx_pago_fecha_registro'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.numero_comprobante_interno:
@@ -0,0 +1,52 @@
+# adapters/infrastructure/models/saldo_socio_model.py
+from datetime import date
+from typing import Optional
+
+from django.db import models
+from .socio_model import SocioModel
+
+
+class SaldoSocioModel(models.Model):
+    """
+    Libro de Saldos (una fila por socio).
+    Resumen de la cartera abierta del socio, mantenido en la MISMA transacción que cada
+    cargo, pago o anulación sobre cuentas_por_cobrar (ver DjangoSaldoSocioRepository).
+    Consultar la deuda de un socio es una lectura por PK; el batch de cortes es un
+    solo barrido por idx_saldo_vencimiento_corte.
+
+    Solo se guardan FECHAS (no "meses en mora"): el atraso depende del día en que se
+    consulta y se deriva de ellas sin que la fila quede desactualizada con el tiempo.
+    """
+    socio = models.OneToOneField(SocioModel, on_delete=models.CASCADE, primary_key=True, related_name='saldo')
+
+    deuda_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cuentas_abiertas = models.PositiveIntegerField(default=0)
+    vencimiento_mas_antiguo = models.DateField(null=True, blank=True)
+    # Vencimiento de la N-ésima planilla de agua abierta (N = umbral de corte).
+    # "N planillas vencidas"  <=>  vencimiento_corte < hoy
+    vencimiento_corte = models.DateField(null=True, blank=True)
+
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'socios_saldos'
+        verbose_name = 'Saldo de Socio'
+        verbose_name_plural = 'Saldos de Socios'
+        indexes = [
+            models.Index(fields=['vencimiento_corte'], name='idx_saldo_vencimiento_corte'),
+        ]
+
+    def meses_mora(self, hoy: Optional[date] = None) -> int:
+        """Meses completos transcurridos desde el vencimiento más antiguo abierto."""
+        if not self.vencimiento_mas_antiguo:
+            return 0
+        hoy = hoy or date.today()
+        if self.vencimiento_mas_antiguo >= hoy:
+            return 0
+        meses = (hoy.year - self.vencimiento_mas_antiguo.year) * 12 + hoy.month - self.vencimiento_mas_antiguo.month
+        if hoy.day < self.vencimiento_mas_antiguo.day:
+            meses -= 1
+        return max(meses, 0)
+
+    def __str__(self):
+        return f"Saldo {self.socio_id}: ${self.deuda_total} ({self.cuentas_abiertas} cuentas)"
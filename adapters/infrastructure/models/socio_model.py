@@ -74,6 +74,11 @@ class SocioModel(models.Model):
         db_table = 'socios'
         verbose_name = 'Socio'
         verbose_name_plural = 'Socios'
+        indexes = [
+            # Listado paginado por keyset (ORDER BY apellidos, nombres, id), con y sin filtro de barrio
+            models.Index(fields=['apellidos', 'nombres', 'id'], name='idx_socio_apellidos'),
+            models.Index(fields=['barrio', 'apellidos', 'nombres', 'id'], name='idx_socio_barrio_apellidos'),
+        ]
 
     def __str__(self):
         return f"{self.nombres} {self.apellidos} ({self.identificacion})"
@@ -0,0 +1,35 @@
+# adapters/infrastructure/models/sync_model.py
+from django.db import models
+
+
+class CambioSyncModel(models.Model):
+    """
+    Bitácora de cambios para la sincronización incremental de la app de lecturas (offline).
+    El `id` (autoincremental) es el token de cambios: el cliente envía el último que vio
+    y recibe solo lo modificado después (el token entregado se acota a la ventana de
+    seguridad, ver DjangoSincronizacionRepository.token_estable). No guarda el contenido del cambio,
+    solo QUÉ objeto cambió; el estado actual se lee al sincronizar.
+    """
+    ENTIDAD_MEDIDOR = 'MEDIDOR'
+    ENTIDAD_TERRENO = 'TERRENO'
+    ENTIDAD_CHOICES = [
+        (ENTIDAD_MEDIDOR, 'Medidor (incluye su última lectura)'),
+        (ENTIDAD_TERRENO, 'Terreno'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    entidad = models.CharField(max_length=20, choices=ENTIDAD_CHOICES)
+    objeto_id = models.IntegerField()
+    # Sin FK a propósito: el cambio debe sobrevivir al borrado del barrio/objeto (tombstones)
+    barrio_id = models.IntegerField(null=True, blank=True)
+    fecha = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'sync_cambios'
+        verbose_name = 'Cambio de Sincronización'
+        verbose_name_plural = 'Cambios de Sincronización'
+        # Delta por ruta: "cambios del barrio X con id > token"
+        indexes = [models.Index(fields=['barrio_id', 'id'], name='idx_sync_barrio_token')]
+
+    def __str__(self):
+        return f"#{self.id} {self.entidad}:{self.objeto_id} (barrio {self.barrio_id})"
@@ -0,0 +1,56 @@
+# adapters/infrastructure/models/trabajo_reporte_model.py
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class TrabajoReporteModel(models.Model):
+    """
+    Trabajo de reporte pesado (cartera, recaudación anual, consumo) ejecutado por Celery.
+    `huella` = SHA-256 de tipo + parámetros canónicos: dos solicitudes iguales en vuelo
+    comparten UN trabajo (único sobre `huella_activa`) y un resultado vigente se sirve
+    desde aquí hasta `expira_en` sin recalcular.
+    """
+    ESTADO_PENDIENTE = 'PENDIENTE'
+    ESTADO_EN_PROCESO = 'EN_PROCESO'
+    ESTADO_COMPLETADO = 'COMPLETADO'
+    ESTADO_FALLIDO = 'FALLIDO'
+    ESTADO_CHOICES = [
+        (ESTADO_PENDIENTE, 'Pendiente'),
+        (ESTADO_EN_PROCESO, 'En proceso'),
+        (ESTADO_COMPLETADO, 'Completado'),
+        (ESTADO_FALLIDO, 'Fallido'),
+    ]
+    ESTADOS_ACTIVOS = (ESTADO_PENDIENTE, ESTADO_EN_PROCESO)
+
+    tipo = models.CharField(max_length=50)
+    parametros = models.JSONField(default=dict)
+    huella = models.CharField(max_length=64)
+    # = huella mientras está PENDIENTE/EN_PROCESO, NULL al terminar o fallar. Único normal
+    # (no parcial): MySQL no soporta índices con condición y Django omitiría el constraint;
+    # los NULL no chocan entre sí en ningún motor.
+    huella_activa = models.CharField(max_length=64, null=True, blank=True, unique=True)
+
+    estado = models.CharField(max_length=20, choices=ESTADO_CHOICES, default=ESTADO_PENDIENTE)
+    resultado = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(null=True, blank=True)
+    task_id = models.CharField(max_length=255, null=True, blank=True)
+
+    solicitado_por = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True,
+                                       related_name='reportes_solicitados')
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_inicio = models.DateTimeField(null=True, blank=True)
+    fecha_fin = models.DateTimeField(null=True, blank=True)
+    expira_en = models.DateTimeField(null=True, blank=True, help_text="Vigencia del resultado (TTL)")
+
+    class Meta:
+        db_table = 'reportes_trabajos'
+        verbose_name = 'Trabajo de Reporte'
+        verbose_name_plural = 'Trabajos de Reporte'
+        indexes = [
+            models.Index(fields=['huella', 'estado', 'expira_en'], name='idx_reporte_huella_estado'),
+            models.Index(fields=['expira_en'], name='idx_reporte_expira'),
+        ]
+
+    def __str__(self):
+        return f"{self.tipo} #{self.pk} ({self.estado})"
@@ -0,0 +1,55 @@
+# adapters/infrastructure/repositories/django_anomalia_lectura_repository.py
+from typing import Any, List, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+
+from core.interfaces.repositories import IAnomaliaLecturaRepository
+from adapters.infrastructure.models import LecturaModel, AnomaliaLecturaModel
+
+
+class DjangoAnomaliaLecturaRepository(IAnomaliaLecturaRepository):
+    """
+    Carga columnar (values_list) para el detector vectorizado y persistencia de las marcas.
+    """
+    TAMANO_LOTE = 500
+
+    def obtener_lecturas_pendientes(self) -> List[Tuple[int, int, int, int, float]]:
+        return list(
+            LecturaModel.objects.filter(esta_facturada=False).order_by()
+            .values_list('id', 'medidor_id', 'anio', 'mes', 'consumo_del_mes')
+        )
+
+    def obtener_historial_consumos(self, desde_anio: int, desde_mes: int) -> List[Tuple[int, int, int, float]]:
+        qs = LecturaModel.objects.filter(esta_facturada=True).filter(
+            Q(anio__gt=desde_anio) | Q(anio=desde_anio, mes__gte=desde_mes)
+        )
+        return list(
+            qs.order_by().values_list('medidor_id', 'anio', 'mes', 'consumo_del_mes').iterator(chunk_size=5000)
+        )
+
+    def reemplazar_anomalias(self, lectura_ids: List[int], anomalias: List[Any]) -> int:
+        with transaction.atomic():
+            revisadas = set()
+            for inicio in range(0, len(lectura_ids), self.TAMANO_LOTE):
+                lote = lectura_ids[inicio:inicio + self.TAMANO_LOTE]
+                AnomaliaLecturaModel.objects.filter(lectura_id__in=lote, revisada=False).delete()
+                # Las revisadas por un operador se conservan: esas lecturas no reciben marca nueva
+                revisadas.update(AnomaliaLecturaModel.objects.filter(lectura_id__in=lote)
+                                 .values_list('lectura_id', flat=True))
+            modelos = [
+                AnomaliaLecturaModel(
+                    lectura_id=a.lectura_id,
+                    medidor_id=a.medidor_id,
+                    tipo=a.tipo,
+                    consumo_m3=a.consumo_m3,
+                    esperado_m3=a.esperado_m3,
+                    limite_inferior_m3=a.limite_inferior_m3,
+                    limite_superior_m3=a.limite_superior_m3,
+                    puntaje=a.puntaje,
+                    meses_historial=a.meses_historial
+                )
+                for a in anomalias if a.lectura_id not in revisadas
+            ]
+            AnomaliaLecturaModel.objects.bulk_create(modelos, batch_size=self.TAMANO_LOTE)
+        return len(modelos)
@@ -0,0 +1,206 @@
+# adapters/infrastructure/repositories/django_busqueda_socio_repository.py
+import math
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import Case, Count, FloatField, Q, Value, When
+
+from core.interfaces.repositories import ISocioBusquedaRepository
+from core.services.busqueda_socios_service import (
+    MINIMO_APROXIMADA, TERMINO_IDENTIFICACION, TERMINO_PALABRA, TERMINO_PREFIJO,
+    TERMINO_PREFIJO_IDENTIFICACION, UMBRAL_SIMILITUD, palabras, similitud, terminos_socio, trigramas
+)
+from adapters.infrastructure.models import SocioModel, TerminoBusquedaSocioModel, TrigramaPalabraModel
+
+TIPOS_IDENTIFICACION = (TERMINO_IDENTIFICACION, TERMINO_PREFIJO_IDENTIFICACION)
+TIPOS_PALABRA = (TERMINO_PALABRA, TERMINO_PREFIJO)
+
+
+class DjangoBusquedaSocioRepository(ISocioBusquedaRepository):
+    """
+    Índice de búsqueda de socios (socios_busqueda + vocabulario de trigramas).
+    - reindexar(): recalcula los términos de los socios dados y aplica solo la diferencia
+      (el save de un socio sin cambios de nombre no escribe nada). La invocan el signal
+      post_save de SocioModel y DjangoSocioRepository.save (que actualiza con .update()).
+    - buscar(): type-ahead por etapas, todas igualdades sobre (termino, tipo):
+        1. identificación exacta, luego por prefijo
+        2. cada palabra de la consulta como palabra o prefijo del socio (exactas primero)
+        3. aproximada (typos) solo si aún faltan resultados: trigramas contra el
+           vocabulario de palabras distintas y luego igualdad en socios_busqueda
+    """
+    TAMANO_LOTE = 1000
+    MAXIMO_PARECIDAS = 20
+
+    # --- Mantenimiento del índice ---
+    def reindexar(self, socio_ids: Optional[Iterable[int]] = None) -> int:
+        """socio_ids=None -> reconstruye el índice completo. Retorna los términos escritos."""
+        escritos = 0
+        for lote in self._lotes(socio_ids):
+            deseados = {
+                (socio_id, tipo, termino)
+                for socio_id, identificacion, nombres, apellidos in SocioModel.objects.filter(id__in=lote)
+                .values_list('id', 'identificacion', 'nombres', 'apellidos')
+                for tipo, termino in terminos_socio(identificacion, nombres, apellidos)
+            }
+            with transaction.atomic():
+                actuales = {
+                    (socio_id, tipo, termino): pk for pk, socio_id, tipo, termino
+                    in TerminoBusquedaSocioModel.objects.filter(socio_id__in=lote)
+                    .values_list('id', 'socio_id', 'tipo', 'termino')
+                }
+                sobrantes = [pk for clave, pk in actuales.items() if clave not in deseados]
+                if sobrantes:
+                    TerminoBusquedaSocioModel.objects.filter(id__in=sobrantes).delete()
+                nuevos = deseados - actuales.keys()
+                TerminoBusquedaSocioModel.objects.bulk_create(
+                    [TerminoBusquedaSocioModel(socio_id=s, tipo=t, termino=x) for s, t, x in nuevos],
+                    batch_size=self.TAMANO_LOTE
+                )
+                self._registrar_vocabulario({x for _, t, x in nuevos if t == TERMINO_PALABRA})
+            escritos += len(nuevos)
+
+        if socio_ids is None:
+            # Reconstrucción completa: fuera del vocabulario las palabras que ya nadie usa
+            en_uso = TerminoBusquedaSocioModel.objects.filter(tipo=TERMINO_PALABRA).values('termino')
+            TrigramaPalabraModel.objects.exclude(palabra__in=en_uso).delete()
+        return escritos
+
+    def _registrar_vocabulario(self, nuevas: set) -> None:
+        if not nuevas:
+            return
+        conocidas = set(TrigramaPalabraModel.objects.filter(palabra__in=nuevas)
+                        .values_list('palabra', flat=True).distinct())
+        TrigramaPalabraModel.objects.bulk_create(
+            [TrigramaPalabraModel(palabra=p, trigrama=t) for p in nuevas - conocidas for t in trigramas(p)],
+            batch_size=self.TAMANO_LOTE, ignore_conflicts=True
+        )
+
+    def _lotes(self, socio_ids: Optional[Iterable[int]]):
+        if socio_ids is None:
+            ids = list(SocioModel.objects.order_by('id').values_list('id', flat=True))
+        else:
+            ids = sorted({i for i in socio_ids if i is not None})
+        for inicio in range(0, len(ids), self.TAMANO_LOTE):
+            yield ids[inicio:inicio + self.TAMANO_LOTE]
+
+    # --- Consultas ---
+    def buscar(self, texto: str, limite: int = 10) -> List[Dict[str, Any]]:
+        # socio_id -> (coincidencia, similitud), en orden de ranking
+        encontrados: Dict[int, tuple] = {}
+
+        identificacion = self._identificacion(texto)
+        if identificacion:
+            filas = (
+                TerminoBusquedaSocioModel.objects
+                .filter(termino=identificacion, tipo__in=TIPOS_IDENTIFICACION)
+                .order_by('tipo', 'socio_id').values_list('socio_id', 'tipo')[:limite]  # 'ID' < 'ID_PREFIJO'
+            )
+            for socio_id, tipo in filas:
+                exacta = tipo == TERMINO_IDENTIFICACION
+                encontrados[socio_id] = ('IDENTIFICACION' if exacta else 'PREFIJO_IDENTIFICACION', 1.0)
+
+        lista = palabras(texto)
+        if lista and len(encontrados) < limite:
+            # Palabra completa antes que prefijo ('PALABRA' < 'PREFIJO'); sin duplicados por socio
+            filas = (
+                self._socios_con({p: {p} for p in lista}, excluir=encontrados)
+                .order_by('tipo', 'socio_id').values_list('socio_id', 'tipo')[:(limite - len(encontrados)) * 2]
+            )
+            for socio_id, tipo in filas:
+                if len(encontrados) >= limite:
+                    break
+                encontrados.setdefault(socio_id, ('NOMBRE' if tipo == TERMINO_PALABRA else 'PREFIJO_NOMBRE', 1.0))
+
+        aproximables = [p for p in lista if len(p) >= MINIMO_APROXIMADA and not p.isdigit()]
+        if aproximables and len(encontrados) < limite:
+            # Palabras cortas o numéricas se exigen tal cual (palabra o prefijo); las demás pueden variar
+            parecidas = {p: self._parecidas(p) if p in aproximables else {p: 1.0} for p in lista}
+            if all(parecidas.values()):
+                guia = max(reversed(aproximables), key=len)
+                puntaje = Case(*(When(termino=p, then=Value(s)) for p, s in parecidas[guia].items()),
+                               default=Value(0.0), output_field=FloatField())
+                filas = (
+                    self._socios_con({p: set(c) for p, c in parecidas.items()}, excluir=encontrados, guia=guia)
+                    .annotate(puntaje=puntaje).order_by('-puntaje', 'socio_id')
+                    .values_list('socio_id', 'puntaje')[:(limite - len(encontrados)) * 2]
+                )
+                for socio_id, valor in filas:
+                    if len(encontrados) >= limite:
+                        break
+                    encontrados.setdefault(socio_id, ('APROXIMADA', round(valor, 2)))
+
+        if not encontrados:
+            return []
+        socios = SocioModel.objects.in_bulk(list(encontrados))
+        return [
+            {
+                "id": socio_id,
+                "identificacion": socios[socio_id].identificacion,
+                "nombres": socios[socio_id].nombres,
+                "apellidos": socios[socio_id].apellidos,
+                "barrio_id": socios[socio_id].barrio_id,
+                "esta_activo": socios[socio_id].esta_activo,
+                "coincidencia": coincidencia,
+                "similitud": valor,
+            }
+            for socio_id, (coincidencia, valor) in encontrados.items() if socio_id in socios
+        ]
+
+    def ids_coincidentes(self, texto: str):
+        """
+        Subconsulta de socio_id para filtrar otros listados (facturas, socios, admin):
+        prefijo de identificación O todas las palabras como palabra/prefijo. Sin aproximada:
+        un filtro no debe traer socios "parecidos".
+        """
+        condiciones = []
+        identificacion = self._identificacion(texto)
+        if identificacion:
+            condiciones.append(Q(termino=identificacion, tipo__in=TIPOS_IDENTIFICACION))
+        lista = palabras(texto)
+        if lista:
+            condiciones.append(self._q_socios_con({p: {p} for p in lista}))
+        if not condiciones:
+            return TerminoBusquedaSocioModel.objects.none().values('socio_id')
+        return TerminoBusquedaSocioModel.objects.filter(reduce(or_, condiciones)).values('socio_id')
+
+    # --- Helpers ---
+    @staticmethod
+    def _identificacion(texto: str) -> str:
+        # Cédula, RUC o pasaporte: una sola "palabra" con al menos un dígito
+        valor = (texto or '').strip()
+        return valor if valor and ' ' not in valor and any(c.isdigit() for c in valor) else ''
+
+    def _parecidas(self, palabra: str) -> Dict[str, float]:
+        """Palabras del vocabulario con similitud de trigramas >= UMBRAL_SIMILITUD."""
+        consulta = trigramas(palabra)
+        # Jaccard >= u implica compartir al menos u·|consulta| trigramas: filtro previo en la BD
+        minimo = max(1, math.ceil(len(consulta) * UMBRAL_SIMILITUD))
+        filas = (
+            TrigramaPalabraModel.objects.filter(trigrama__in=consulta)
+            .values('palabra').annotate(comunes=Count('id')).filter(comunes__gte=minimo)
+            .order_by('-comunes', 'palabra').values_list('palabra', 'comunes')[:self.MAXIMO_PARECIDAS * 2]
+        )
+        puntajes = {p: similitud(c, len(consulta), len(trigramas(p))) for p, c in filas}
+        mejores = sorted(((s, p) for p, s in puntajes.items() if s >= UMBRAL_SIMILITUD), reverse=True)
+        return {p: round(s, 4) for s, p in mejores[:self.MAXIMO_PARECIDAS]}
+
+    @staticmethod
+    def _q_socios_con(candidatas: Dict[str, set], guia: Optional[str] = None) -> Q:
+        """
+        Filas de la palabra guía (la más larga: la más selectiva; a igual largo, la última,
+        que es la que se está tecleando) cuyo socio también tiene, por cada otra palabra
+        de la consulta, alguno de sus términos candidatos.
+        """
+        guia = guia or max(reversed(list(candidatas)), key=len)
+        filtro = Q(termino__in=candidatas[guia], tipo__in=TIPOS_PALABRA)
+        for palabra, terminos in candidatas.items():
+            if palabra != guia:
+                filtro &= Q(socio_id__in=TerminoBusquedaSocioModel.objects
+                            .filter(termino__in=terminos, tipo__in=TIPOS_PALABRA).values('socio_id'))
+        return filtro
+
+    def _socios_con(self, candidatas: Dict[str, set], excluir, guia: Optional[str] = None):
+        return (TerminoBusquedaSocioModel.objects.filter(self._q_socios_con(candidatas, guia))
+                .exclude(socio_id__in=list(excluir)))
@@ -0,0 +1,97 @@
+# adapters/infrastructure/repositories/django_corrida_facturacion_repository.py
+from typing import List, Optional, Set
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from core.interfaces.repositories import ICorridaFacturacionRepository
+from core.shared.enums import EstadoCorridaFacturacion, EstadoItemCorrida
+from adapters.infrastructure.models import CorridaFacturacionModel, CorridaFacturacionItemModel
+
+
+class DjangoCorridaFacturacionRepository(ICorridaFacturacionRepository):
+
+    def iniciar_o_reanudar(self, tipo: str, anio: int, mes: int, claves: List[str],
+                           parametros: Optional[dict] = None, usuario_id: Optional[int] = None) -> int:
+        with transaction.atomic():
+            corrida, _ = CorridaFacturacionModel.objects.select_for_update().get_or_create(
+                tipo=tipo, anio=anio, mes=mes,
+                defaults={'parametros': parametros or {}, 'usuario_id': usuario_id}
+            )
+
+            # Ítems nuevos (los existentes se respetan gracias a unique_together + ignore_conflicts)
+            CorridaFacturacionItemModel.objects.bulk_create(
+                [CorridaFacturacionItemModel(corrida=corrida, clave=clave) for clave in claves],
+                batch_size=1000,
+                ignore_conflicts=True
+            )
+
+            CorridaFacturacionModel.objects.filter(pk=corrida.pk).update(
+                estado=EstadoCorridaFacturacion.EN_CURSO,
+                total_items=CorridaFacturacionItemModel.objects.filter(corrida=corrida).count(),
+                ejecuciones=F('ejecuciones') + 1,
+                fecha_fin=None
+            )
+        return corrida.pk
+
+    def obtener_claves_completadas(self, corrida_id: int) -> Set[str]:
+        # Cubierto por idx_corrida_item_estado (corrida, estado, clave)
+        return set(
+            CorridaFacturacionItemModel.objects.filter(
+                corrida_id=corrida_id, estado=EstadoItemCorrida.COMPLETADO
+            ).values_list('clave', flat=True)
+        )
+
+    def registrar_checkpoint(self, corrida_id: int, completados: dict, errores: dict) -> None:
+        claves = list(completados) + list(errores)
+        if not claves:
+            return
+
+        items = list(CorridaFacturacionItemModel.objects.filter(corrida_id=corrida_id, clave__in=claves))
+        for item in items:
+            item.intentos += 1
+            if item.clave in completados:
+                item.estado = EstadoItemCorrida.COMPLETADO
+                item.factura_id = completados[item.clave]
+                item.mensaje_error = None
+            else:
+                item.estado = EstadoItemCorrida.ERROR
+                item.mensaje_error = errores[item.clave]
+            item.fecha_actualizacion = timezone.now()
+
+        CorridaFacturacionItemModel.objects.bulk_update(
+            items, ['estado', 'factura', 'mensaje_error', 'intentos', 'fecha_actualizacion']
+        )
+        self._actualizar_contadores(corrida_id, ultimo_checkpoint=timezone.now())
+
+    def finalizar(self, corrida_id: int) -> dict:
+        self._actualizar_contadores(corrida_id)
+        corrida = CorridaFacturacionModel.objects.get(pk=corrida_id)
+        corrida.estado = (
+            EstadoCorridaFacturacion.COMPLETADA_CON_ERRORES if corrida.con_error
+            else EstadoCorridaFacturacion.COMPLETADA
+        )
+        corrida.fecha_fin = timezone.now()
+        corrida.save(update_fields=['estado', 'fecha_fin'])
+
+        return {
+            "corrida_id": corrida.pk,
+            "estado": corrida.estado,
+            "total_items": corrida.total_items,
+            "completados": corrida.completados,
+            "con_error": corrida.con_error,
+            "ejecuciones": corrida.ejecuciones,
+        }
+
+    # --- Helpers Privados ---
+
+    def _actualizar_contadores(self, corrida_id: int, **extra) -> None:
+        conteo = dict(
+            CorridaFacturacionItemModel.objects.filter(corrida_id=corrida_id)
+            .values_list('estado').annotate(total=Count('id')).order_by()
+        )
+        CorridaFacturacionModel.objects.filter(pk=corrida_id).update(
+            completados=conteo.get(EstadoItemCorrida.COMPLETADO, 0),
+            con_error=conteo.get(EstadoItemCorrida.ERROR, 0),
+            **extra
+        )
@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import Iterable, Optional, List, Set
+from django.db import transaction, OperationalError, InterfaceError
+from simple_history.utils import bulk_create_with_history
 from core.interfaces.repositories import IFacturaRepository
 from core.domain.factura import Factura as FacturaEntity, DetalleFactura, EstadoFactura
 from core.domain.socio import Socio as SocioEntity, RolUsuario
-from adapters.infrastructure.models import FacturaModel
+from core.shared.exceptions import PersistenciaTransitoriaError
+from adapters.infrastructure.models import FacturaModel, DetalleFacturaModel
+from core.services.estado_cuenta_cache_service import EstadoCuentaCacheService
 
 class DjangoFacturaRepository(IFacturaRepository):
     
@@ -41,40 +45,125 @@ class DjangoFacturaRepository(IFacturaRepository):
             estado_financiero__in=[EstadoFactura.PENDIENTE.value, EstadoFactura.PAGADA.value]
         ).exists()
 
+    TAMANO_LOTE_IDS = 1000
+
+    def obtener_servicios_facturados_mes(self, anio: int, mes: int,
+                                         servicio_ids: Optional[Iterable[int]] = None) -> Set[int]:
+        # Una sola consulta para todo el periodo (reemplaza N llamadas a existe_factura_fija_mes)
+        qs = FacturaModel.objects.filter(
+            anio=anio,
+            mes=mes,
+            servicio_id__isnull=False,
+            estado_financiero__in=[EstadoFactura.PENDIENTE.value, EstadoFactura.PAGADA.value]
+        ).order_by()
+        if servicio_ids is None:
+            return set(qs.values_list('servicio_id', flat=True))
+
+        # Partición: solo sus servicios (IN por lotes para no exceder el límite de parámetros)
+        ids = sorted(set(servicio_ids))
+        facturados = set()
+        for inicio in range(0, len(ids), self.TAMANO_LOTE_IDS):
+            lote = ids[inicio:inicio + self.TAMANO_LOTE_IDS]
+            facturados.update(qs.filter(servicio_id__in=lote).values_list('servicio_id', flat=True))
+        return facturados
+
+    def guardar_masivo(self, facturas: List[FacturaEntity], batch_size: int = 500) -> List[FacturaEntity]:
+        """
+        Inserción por lotes de cabeceras + detalles.
+        Usa bulk_create_with_history para no perder la auditoría (simple_history),
+        que no se dispara con bulk_create puro.
+        El lote es atómico: si falla, no queda ninguna cabecera huérfana.
+        """
+        nuevas = [f for f in facturas if not f.id]
+        if not nuevas:
+            return facturas
+        try:
+            return self._guardar_masivo(facturas, nuevas, batch_size)
+        except (OperationalError, InterfaceError) as e:
+            raise PersistenciaTransitoriaError(str(e)) from e
+
+    def _guardar_masivo(self, facturas: List[FacturaEntity], nuevas: List[FacturaEntity],
+                        batch_size: int) -> List[FacturaEntity]:
+        with transaction.atomic():
+            cabeceras = [
+                FacturaModel(
+                    socio_id=f.socio_id,
+                    servicio_id=f.servicio_id,
+                    medidor_id=f.medidor_id,
+                    lectura_id=f.lectura.id if f.lectura else None,
+                    fecha_emision=f.fecha_emision,
+                    fecha_vencimiento=f.fecha_vencimiento,
+                    anio=f.anio,
+                    mes=f.mes,
+                    estado_financiero=f.estado.value if hasattr(f.estado, 'value') else f.estado,
+                    subtotal=f.subtotal,
+                    impuestos=f.impuestos,
+                    total=f.total,
+                    sri_ambiente=f.sri_ambiente,
+                    sri_tipo_emision=f.sri_tipo_emision
+                )
+                for f in nuevas
+            ]
+            # Retorna los objetos con PK en el mismo orden (también en motores sin RETURNING)
+            creadas = bulk_create_with_history(cabeceras, FacturaModel, batch_size=batch_size)
+
+            detalles_db = []
+            for entidad, f_db in zip(nuevas, creadas):
+                entidad.id = f_db.id  # Actualizamos ID en dominio
+                for det in entidad.detalles:
+                    detalles_db.append(DetalleFacturaModel(
+                        factura_id=f_db.id,
+                        concepto=det.concepto,
+                        cantidad=det.cantidad,
+                        precio_unitario=det.precio_unitario,
+                        subtotal=det.subtotal
+                    ))
+
+            if detalles_db:
+                bulk_create_with_history(detalles_db, DetalleFacturaModel, batch_size=batch_size)
+
+            # bulk_create no emite signals: invalidamos el estado de cuenta de los socios del lote
+            EstadoCuentaCacheService().invalidar({f.socio_id for f in nuevas})
+
+        return facturas
+
+    def _crear(self, factura: FacturaEntity) -> None:
+        f_db = FacturaModel.objects.create(
+            socio_id=factura.socio_id,
+            servicio_id=factura.servicio_id,
+            medidor_id=factura.medidor_id,
+            lectura_id=factura.lectura.id if factura.lectura else None,
+            fecha_emision=factura.fecha_emision,
+            fecha_vencimiento=factura.fecha_vencimiento,
+            anio=factura.anio,
+            mes=factura.mes,
+            estado_financiero=factura.estado.value if hasattr(factura.estado, 'value') else factura.estado,
+            subtotal=factura.subtotal,
+            impuestos=factura.impuestos,
+            total=factura.total,
+            sri_ambiente=factura.sri_ambiente,
+            sri_tipo_emision=factura.sri_tipo_emision
+        )
+        factura.id = f_db.id # Actualizamos ID en dominio
+
+        for det in factura.detalles:
+            DetalleFacturaModel.objects.create(
+                factura=f_db,
+                concepto=det.concepto,
+                cantidad=det.cantidad,
+                precio_unitario=det.precio_unitario,
+                subtotal=det.subtotal
+            )
+
     def guardar(self, factura: FacturaEntity) -> None:
         # Aquí actualizamos el registro en BD desde la Entidad
         # Asumimos que la entidad tiene ID (es update)
         if not factura.id:
             # Creación de nueva factura
-            f_db = FacturaModel.objects.create(
-                socio_id=factura.socio_id,
-                servicio_id=factura.servicio_id,
-                medidor_id=factura.medidor_id,
-                lectura_id=factura.lectura.id if factura.lectura else None,
-                fecha_emision=factura.fecha_emision,
-                fecha_vencimiento=factura.fecha_vencimiento,
-                anio=factura.anio,
-                mes=factura.mes,
-                estado_financiero=factura.estado.value if hasattr(factura.estado, 'value') else factura.estado,
-                subtotal=factura.subtotal,
-                impuestos=factura.impuestos,
-                total=factura.total,
-                sri_ambiente=factura.sri_ambiente,
-                sri_tipo_emision=factura.sri_tipo_emision
-            )
-            factura.id = f_db.id # Actualizamos ID en dominio
-            
-            from adapters.infrastructure.models import DetalleFacturaModel
-
-            for det in factura.detalles:
-                DetalleFacturaModel.objects.create(
-                    factura=f_db,
-                    concepto=det.concepto,
-                    cantidad=det.cantidad,
-                    precio_unitario=det.precio_unitario,
-                    subtotal=det.subtotal
-                )
-            
+            try:
+                self._crear(factura)
+            except (OperationalError, InterfaceError) as e:
+                raise PersistenciaTransitoriaError(str(e)) from e
             return
 
         try:
@@ -140,7 +229,7 @@ class DjangoFacturaRepository(IFacturaRepository):
     def obtener_pendientes_por_socio(self, socio_id: int) -> list[FacturaEntity]:
         f_dbs = FacturaModel.objects.filter(
             socio_id=socio_id,
-            estado=EstadoFactura.PENDIENTE.value
+            estado_financiero=EstadoFactura.PENDIENTE.value
         ).select_related('socio', 'medidor', 'servicio').prefetch_related('detalles')
         
         return [self._mapear_a_dominio(f) for f in f_dbs]
@@ -0,0 +1,217 @@
+# adapters/infrastructure/repositories/django_hechos_analiticos_repository.py
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.db.models import Count, F, IntegerField, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
+from django.utils import timezone
+
+from core.interfaces.repositories import IHechosAnaliticosRepository
+from core.shared.enums import EstadoFinanciero, GranularidadHecho, IndicadorAnalitico
+from adapters.infrastructure.models import (
+    HechoAnaliticoModel, MarcaAguaAnaliticaModel, FacturaModel, DetalleFacturaModel,
+    PagoModel, DetallePagoModel, LecturaModel
+)
+
+# Dimensiones de lectura: `por` -> columnas del GROUP BY
+DIMENSIONES = {
+    'barrio': ('barrio_id', 'barrio__nombre'),
+    'rubro': ('rubro_id', 'rubro__nombre'),
+    'metodo': ('metodo',),
+    'fecha': ('fecha',),
+}
+
+
+class DjangoHechosAnaliticosRepository(IHechosAnaliticosRepository):
+    """
+    Hechos diarios y mensuales (analytics_hechos) derivados de facturas, pagos y lecturas.
+    - Los cambios se detectan en las tablas de historial (simple_history), que registran
+      también los bulk_create/bulk_update de la app (*_with_history) y los borrados.
+    - Recalcular = borrar e insertar el "slice" de los días tocados con un GROUP BY sobre
+      la fuente: es idempotente, por eso el watermark puede solaparse sin duplicar.
+    - El mes se consolida desde las filas diarias (≤ 31 días × dimensiones), no desde la fuente.
+    """
+    TAMANO_LOTE_DIAS = 200
+    TAMANO_INSERCION = 1000
+
+    # --- Watermark ---
+    def bloquear_marca(self, proceso: str) -> Optional[datetime]:
+        MarcaAguaAnaliticaModel.objects.get_or_create(proceso=proceso)
+        return MarcaAguaAnaliticaModel.objects.select_for_update().get(pk=proceso).marca
+
+    def obtener_marca(self, proceso: str) -> Optional[datetime]:
+        return MarcaAguaAnaliticaModel.objects.filter(pk=proceso).values_list('marca', flat=True).first()
+
+    def guardar_marca(self, proceso: str, marca: datetime) -> None:
+        MarcaAguaAnaliticaModel.objects.update_or_create(proceso=proceso, defaults={'marca': marca})
+
+    # --- Detección de cambios ---
+    def dias_modificados(self, desde: datetime) -> Dict[str, Set[date]]:
+        tz = timezone.get_current_timezone()
+        # order_by(): el Meta.ordering del historial rompería el DISTINCT
+        facturas_detalle = DetalleFacturaModel.history.filter(history_date__gt=desde).values('factura_id')
+        dias_factura = set(
+            FacturaModel.history.filter(history_date__gt=desde)
+            .order_by().values_list('fecha_emision', flat=True).distinct()
+        ) | set(
+            FacturaModel.objects.filter(pk__in=Subquery(facturas_detalle))
+            .order_by().values_list('fecha_emision', flat=True).distinct()
+        )
+
+        pagos_detalle = DetallePagoModel.history.filter(history_date__gt=desde).values('pago_id')
+        dias_pago = set(
+            PagoModel.history.filter(history_date__gt=desde)
+            .annotate(dia=TruncDate('fecha_registro', tzinfo=tz))
+            .order_by().values_list('dia', flat=True).distinct()
+        ) | set(
+            PagoModel.objects.filter(pk__in=Subquery(pagos_detalle))
+            .annotate(dia=TruncDate('fecha_registro', tzinfo=tz))
+            .order_by().values_list('dia', flat=True).distinct()
+        )
+
+        # Todas las versiones de las lecturas tocadas: una corrección que mueve la
+        # fecha también invalida el día anterior
+        lecturas_tocadas = LecturaModel.history.filter(history_date__gt=desde).values('id')
+        dias_lectura = set(
+            LecturaModel.history.filter(id__in=Subquery(lecturas_tocadas))
+            .order_by().values_list('fecha', flat=True).distinct()
+        )
+        return {
+            IndicadorAnalitico.FACTURADO_RUBRO: dias_factura,
+            IndicadorAnalitico.FACTURAS: dias_factura,
+            IndicadorAnalitico.RECAUDADO: dias_pago,
+            IndicadorAnalitico.CONSUMO_M3: dias_lectura,
+        }
+
+    # --- Recalculo ---
+    def recalcular(self, indicador: str, dias: Optional[Iterable[date]] = None) -> int:
+        if dias is None:
+            HechoAnaliticoModel.objects.filter(indicador=indicador).delete()
+            escritas = self._insertar(indicador, GranularidadHecho.DIA, self._agregar(indicador, None))
+            return escritas + self._consolidar_meses(indicador, None)
+
+        dias = sorted({d for d in dias if d is not None})
+        escritas = 0
+        for inicio in range(0, len(dias), self.TAMANO_LOTE_DIAS):
+            lote = dias[inicio:inicio + self.TAMANO_LOTE_DIAS]
+            HechoAnaliticoModel.objects.filter(
+                indicador=indicador, granularidad=GranularidadHecho.DIA, fecha__in=lote
+            ).delete()
+            escritas += self._insertar(indicador, GranularidadHecho.DIA, self._agregar(indicador, lote))
+        return escritas + self._consolidar_meses(indicador, {d.replace(day=1) for d in dias})
+
+    def _agregar(self, indicador: str, dias: Optional[List[date]]):
+        """GROUP BY sobre la fuente -> filas {d_fecha, d_barrio, d_rubro?, d_metodo?, valor, cantidad}"""
+        if indicador in (IndicadorAnalitico.FACTURADO_RUBRO, IndicadorAnalitico.FACTURAS):
+            prefijo = 'factura__' if indicador == IndicadorAnalitico.FACTURADO_RUBRO else ''
+            modelo = DetalleFacturaModel if prefijo else FacturaModel
+            qs = modelo.objects.exclude(**{f'{prefijo}estado_financiero': EstadoFinanciero.ANULADA})
+            if dias is not None:
+                qs = qs.filter(**{f'{prefijo}fecha_emision__in': dias})
+            # Barrio del terreno servido; facturas sin servicio (POS, multas) caen al barrio del socio
+            dimensiones = {
+                'd_fecha': F(f'{prefijo}fecha_emision'),
+                'd_barrio': Coalesce(f'{prefijo}servicio__terreno__barrio', f'{prefijo}socio__barrio',
+                                     output_field=IntegerField()),
+            }
+            if prefijo:
+                dimensiones['d_rubro'] = F('rubro')
+                medidas = {'valor': Sum('subtotal'), 'cantidad': Count('id')}
+            else:
+                medidas = {'valor': Sum('total'), 'cantidad': Count('id')}
+            return qs.values(**dimensiones).annotate(**medidas).order_by()
+
+        if indicador == IndicadorAnalitico.RECAUDADO:
+            # Solo lo efectivamente cobrado: transferencias por validar no cuentan hasta aprobarse
+            qs = DetallePagoModel.objects.filter(pago__validado=True)
+            if dias is not None:
+                qs = qs.filter(self._rangos_locales('pago__fecha_registro', dias))
+            return qs.values(
+                d_fecha=TruncDate('pago__fecha_registro', tzinfo=timezone.get_current_timezone()),
+                d_barrio=F('pago__socio__barrio'),
+                d_metodo=F('metodo')
+            ).annotate(valor=Sum('monto'), cantidad=Count('pago', distinct=True)).order_by()
+
+        if indicador == IndicadorAnalitico.CONSUMO_M3:
+            qs = LecturaModel.objects.all()
+            if dias is not None:
+                qs = qs.filter(fecha__in=dias)
+            return qs.values(
+                d_fecha=F('fecha'), d_barrio=F('medidor__terreno__barrio')
+            ).annotate(valor=Sum('consumo_del_mes'), cantidad=Count('id')).order_by()
+
+        raise ValueError(f"Indicador no soportado: {indicador}")
+
+    def _consolidar_meses(self, indicador: str, meses: Optional[Set[date]]) -> int:
+        diarios = HechoAnaliticoModel.objects.filter(indicador=indicador, granularidad=GranularidadHecho.DIA)
+        mensuales = HechoAnaliticoModel.objects.filter(indicador=indicador, granularidad=GranularidadHecho.MES)
+        if meses is not None:
+            if not meses:
+                return 0
+            rango = Q()
+            for mes in meses:
+                rango |= Q(fecha__gte=mes, fecha__lt=self._mes_siguiente(mes))
+            diarios = diarios.filter(rango)
+            mensuales = mensuales.filter(fecha__in=meses)
+        mensuales.delete()
+        return self._insertar(indicador, GranularidadHecho.MES, diarios.values(
+            d_fecha=TruncMonth('fecha'), d_barrio=F('barrio'), d_rubro=F('rubro'), d_metodo=F('metodo')
+        ).annotate(valor=Sum('valor'), cantidad=Sum('cantidad')).order_by())
+
+    def _insertar(self, indicador: str, granularidad: str, filas) -> int:
+        lote, total = [], 0
+        for fila in filas.iterator(chunk_size=self.TAMANO_INSERCION):
+            lote.append(HechoAnaliticoModel(
+                granularidad=granularidad,
+                fecha=fila['d_fecha'],
+                indicador=indicador,
+                barrio_id=fila['d_barrio'],
+                rubro_id=fila.get('d_rubro'),
+                metodo=fila.get('d_metodo') or '',
+                valor=fila['valor'] or Decimal('0.00'),
+                cantidad=fila['cantidad']
+            ))
+            if len(lote) >= self.TAMANO_INSERCION:
+                total += len(HechoAnaliticoModel.objects.bulk_create(lote))
+                lote = []
+        if lote:
+            total += len(HechoAnaliticoModel.objects.bulk_create(lote))
+        return total
+
+    # --- Lectura (dashboards) ---
+    def totales(self, indicador: str, granularidad: str, desde: date, hasta: date,
+                por: Optional[str] = None) -> Any:
+        qs = HechoAnaliticoModel.objects.filter(
+            indicador=indicador, granularidad=granularidad, fecha__gte=desde, fecha__lte=hasta
+        )
+        if por is None:
+            return qs.aggregate(valor=Coalesce(Sum('valor'), Decimal('0.00')), cantidad=Coalesce(Sum('cantidad'), 0))
+        if por not in DIMENSIONES:
+            raise ValueError(f"Dimensión no soportada: {por}")
+        columnas = DIMENSIONES[por]
+        return list(
+            qs.values(*columnas).annotate(valor=Sum('valor'), cantidad=Sum('cantidad')).order_by(columnas[0])
+        )
+
+    # --- Internos ---
+    @staticmethod
+    def _mes_siguiente(mes: date) -> date:
+        return (mes.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+    @staticmethod
+    def _rangos_locales(campo: str, dias: List[date]) -> Q:
+        """Días locales contiguos -> rangos semiabiertos [00:00, 00:00 siguiente) sobre el índice del campo."""
+        tramos: List[List[date]] = []
+        for dia in sorted(dias):
+            if tramos and dia == tramos[-1][1]:
+                tramos[-1][1] = dia + timedelta(days=1)
+            else:
+                tramos.append([dia, dia + timedelta(days=1)])
+
+        tz = timezone.get_current_timezone()
+        rangos = Q()
+        for inicio, fin in tramos:
+            rangos |= Q(**{f'{campo}__gte': timezone.make_aware(datetime.combine(inicio, time.min), tz),
+                           f'{campo}__lt': timezone.make_aware(datetime.combine(fin, time.min), tz)})
+        return rangos
@@ -0,0 +1,96 @@
+# adapters/infrastructure/repositories/django_idempotencia_repository.py
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.interfaces.repositories import IIdempotenciaRepository
+from adapters.infrastructure.models import IdempotenciaModel
+
+RESERVADA = 'RESERVADA'
+EN_PROCESO = 'EN_PROCESO'
+COMPLETADA = 'COMPLETADA'
+HUELLA_DISTINTA = 'HUELLA_DISTINTA'
+
+
+class DjangoIdempotenciaRepository(IIdempotenciaRepository):
+    """
+    Almacén durable de Idempotency-Key (tabla api_idempotencia).
+    La reserva es un INSERT protegido por la restricción única (alcance, clave):
+    entre dos solicitudes simultáneas con la misma clave solo una inserta, la otra
+    recibe IntegrityError y lee el estado del ganador. No depende de la cache
+    (que se pierde al reiniciar y no es compartida entre workers con LocMem).
+
+    `completar` se ejecuta DENTRO de la transacción de negocio (ver adapters/api/idempotencia.py):
+    una clave que sigue EN_PROCESO tras BLOQUEO_MAXIMO nunca confirmó su cobro, así que
+    tomarla y re-ejecutar es seguro. Si el dueño original sigue vivo, su `completar` ya no
+    coincide con la versión y su transacción se revierte: solo uno de los dos cobra.
+    """
+    TTL = timedelta(hours=24)
+    # Reserva en proceso sin actividad: el worker murió a mitad de la solicitud
+    BLOQUEO_MAXIMO = timedelta(minutes=5)
+
+    def reservar(self, alcance: str, clave: str, huella: str,
+                 usuario_id: Optional[int] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        ahora = timezone.now()
+        try:
+            # Savepoint propio: el IntegrityError no invalida una transacción externa
+            with transaction.atomic():
+                fila = IdempotenciaModel.objects.create(
+                    alcance=alcance, clave=clave, huella=huella, usuario_id=usuario_id,
+                    expira_en=ahora + self.TTL
+                )
+            return RESERVADA, {"version": fila.fecha_actualizacion}
+        except IntegrityError:
+            pass
+
+        fila = IdempotenciaModel.objects.filter(alcance=alcance, clave=clave).first()
+        if fila is None:
+            # Purgada entre el INSERT y la lectura: se reintenta una vez
+            return self.reservar(alcance, clave, huella, usuario_id)
+
+        abandonada = fila.estado == IdempotenciaModel.ESTADO_EN_PROCESO and \
+            fila.fecha_actualizacion < ahora - self.BLOQUEO_MAXIMO
+        if fila.expira_en <= ahora or abandonada:
+            if self._tomar(fila, huella, usuario_id, ahora):
+                return RESERVADA, {"version": ahora}
+            return EN_PROCESO, None
+
+        if fila.huella != huella:
+            return HUELLA_DISTINTA, None
+        if fila.estado == IdempotenciaModel.ESTADO_COMPLETADA:
+            return COMPLETADA, {"status_code": fila.status_code, "respuesta": fila.respuesta}
+        return EN_PROCESO, None
+
+    def completar(self, alcance: str, clave: str, status_code: int, respuesta: Any,
+                  version: Any = None) -> bool:
+        filas = IdempotenciaModel.objects.filter(alcance=alcance, clave=clave,
+                                                 estado=IdempotenciaModel.ESTADO_EN_PROCESO)
+        if version is not None:
+            # Compare-and-swap: la reserva no fue tomada por otro worker
+            filas = filas.filter(fecha_actualizacion=version)
+        return filas.update(
+            estado=IdempotenciaModel.ESTADO_COMPLETADA,
+            status_code=status_code,
+            respuesta=respuesta,
+            fecha_actualizacion=timezone.now()
+        ) == 1
+
+    def liberar(self, alcance: str, clave: str) -> None:
+        IdempotenciaModel.objects.filter(
+            alcance=alcance, clave=clave, estado=IdempotenciaModel.ESTADO_EN_PROCESO
+        ).delete()
+
+    def purgar_expirados(self) -> int:
+        borradas, _ = IdempotenciaModel.objects.filter(expira_en__lte=timezone.now()).delete()
+        return borradas
+
+    def _tomar(self, fila: IdempotenciaModel, huella: str, usuario_id: Optional[int], ahora) -> bool:
+        """Compare-and-swap sobre fecha_actualizacion: de dos rescatadores solo uno gana."""
+        return IdempotenciaModel.objects.filter(
+            pk=fila.pk, fecha_actualizacion=fila.fecha_actualizacion
+        ).update(
+            huella=huella, usuario_id=usuario_id, estado=IdempotenciaModel.ESTADO_EN_PROCESO,
+            status_code=None, respuesta=None, fecha_actualizacion=ahora, expira_en=ahora + self.TTL
+        ) == 1
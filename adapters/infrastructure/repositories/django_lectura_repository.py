@@ -1,9 +1,14 @@
 # adapters/infrastructure/repositories/django_lectura_repository.py
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Set, Tuple
+from django.db import transaction
+from django.db.models import Q
+from simple_history.utils import bulk_create_with_history
 from core.interfaces.repositories import ILecturaRepository
 from core.domain.lectura import Lectura
 from adapters.infrastructure.models import LecturaModel
+from adapters.infrastructure.repositories.django_sincronizacion_repository import DjangoSincronizacionRepository
+from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
 
 class DjangoLecturaRepository(ILecturaRepository):
     """
@@ -29,7 +34,8 @@ class DjangoLecturaRepository(ILecturaRepository):
             lectura_anterior=ant,
             consumo_del_mes_m3=consumo, 
             observacion=model.observacion,
-            esta_facturada=model.esta_facturada
+            esta_facturada=model.esta_facturada,
+            referencia_cliente=model.referencia_cliente
         )
 
     # =================================================================
@@ -46,17 +52,57 @@ class DjangoLecturaRepository(ILecturaRepository):
             'lectura_anterior': lectura.lectura_anterior,
             'consumo_del_mes': getattr(lectura, 'consumo_del_mes_m3', 0),
             'observacion': lectura.observacion,
-            'esta_facturada': lectura.esta_facturada
+            'esta_facturada': lectura.esta_facturada,
+            'referencia_cliente': lectura.referencia_cliente
         }
 
-        if lectura.id:
-            LecturaModel.objects.filter(pk=lectura.id).update(**data_db)
-        else:
-            model = LecturaModel.objects.create(**data_db)
-            lectura.id = model.id
+        # Lectura + snapshot del medidor en la misma transacción.
+        # save() (no .update()): deja fila en el historial, de donde el refresco de
+        # hechos analíticos toma los días modificados, y dispara los signals
+        # de snapshot y sync offline (ver signals.py)
+        with transaction.atomic():
+            if lectura.id:
+                model = LecturaModel.objects.get(pk=lectura.id)
+                for campo, valor in data_db.items():
+                    setattr(model, campo, valor)
+                model.save(update_fields=list(data_db))
+            else:
+                model = LecturaModel.objects.create(**data_db)
+                lectura.id = model.id
         
         return lectura
 
+    def bulk_create(self, lecturas: List[Lectura], batch_size: int = 500) -> List[Lectura]:
+        """
+        Inserción por lotes (Importación masiva de rutas).
+        El periodo fiscal (anio/mes) se deriva de la fecha de toma.
+        """
+        modelos = [
+            LecturaModel(
+                medidor_id=l.medidor_id,
+                fecha=l.fecha,
+                anio=l.fecha.year,
+                mes=l.fecha.month,
+                valor=l.valor,
+                lectura_anterior=l.lectura_anterior,
+                consumo_del_mes=l.consumo_del_mes_m3,
+                observacion=l.observacion,
+                esta_facturada=l.esta_facturada,
+                referencia_cliente=l.referencia_cliente
+            )
+            for l in lecturas
+        ]
+        with transaction.atomic():
+            # Conserva la auditoría (simple_history) que bulk_create puro no dispara
+            creados = bulk_create_with_history(modelos, LecturaModel, batch_size=batch_size)
+            for entidad, model in zip(lecturas, creados):
+                entidad.id = model.id
+            # bulk_create tampoco dispara post_save: snapshot y sync offline explícitos
+            medidor_ids = {l.medidor_id for l in lecturas}
+            DjangoMedidorRepository().refrescar_ultima_lectura(medidor_ids)
+            DjangoSincronizacionRepository().registrar_medidores(medidor_ids)
+        return lecturas
+
     # =================================================================
     # 3. IMPLEMENTACIÓN DE LA INTERFAZ (LECTURA)
     # =================================================================
@@ -79,6 +125,25 @@ class DjangoLecturaRepository(ILecturaRepository):
         except LecturaModel.DoesNotExist:
             return None
 
+    def get_ids_por_referencia(self, referencias: Set[str]) -> Dict[str, int]:
+        if not referencias:
+            return {}
+        return dict(
+            LecturaModel.objects.filter(referencia_cliente__in=referencias)
+            .order_by().values_list('referencia_cliente', 'id')
+        )
+
+    def get_periodos_registrados(self, medidor_ids: List[int], periodos: Set[Tuple[int, int]]) -> Set[Tuple[int, int, int]]:
+        if not medidor_ids or not periodos:
+            return set()
+        filtro_periodos = Q()
+        for anio, mes in periodos:
+            filtro_periodos |= Q(anio=anio, mes=mes)
+        return set(
+            LecturaModel.objects.filter(medidor_id__in=medidor_ids).filter(filtro_periodos)
+            .order_by().values_list('medidor_id', 'anio', 'mes')
+        )
+
     # ✅ CORRECCIÓN 2: Renombrado de 'list_by_medidor_id' a 'list_by_medidor'
     def list_by_medidor(self, medidor_id: int) -> List[Lectura]:
         """
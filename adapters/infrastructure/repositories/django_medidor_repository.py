@@ -1,7 +1,8 @@
 # adapters/infrastructure/repositories/django_medidor_repository.py
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Iterable
 from django.db import IntegrityError
+from django.db.models import OuterRef, Subquery
 
 # Imports de Core
 from core.interfaces.repositories import IMedidorRepository
@@ -10,6 +11,7 @@ from core.shared.exceptions import MedidorDuplicadoError
 
 # Imports de Infraestructura
 from adapters.infrastructure.models.medidor_model import MedidorModel
+from adapters.infrastructure.models.lectura_model import LecturaModel
 
 class DjangoMedidorRepository(IMedidorRepository):
     """
@@ -33,7 +35,10 @@ class DjangoMedidorRepository(IMedidorRepository):
             # El estado ahora es un string ('ACTIVO', 'INACTIVO', etc.)
             estado=model.estado, 
             observacion=model.observacion,
-            fecha_instalacion=model.fecha_instalacion
+            fecha_instalacion=model.fecha_instalacion,
+            ultima_lectura_id=model.ultima_lectura_id,
+            ultima_lectura_valor=float(model.ultima_lectura_valor) if model.ultima_lectura_valor is not None else None,
+            ultima_lectura_fecha=model.ultima_lectura_fecha
         )
 
     # --- IMPLEMENTACIÓN DE LA INTERFAZ ---
@@ -85,6 +90,10 @@ class DjangoMedidorRepository(IMedidorRepository):
         except MedidorModel.DoesNotExist:
             return None
 
+    def get_by_ids(self, medidor_ids: List[int]) -> Dict[int, Medidor]:
+        """Carga por lotes (una sola consulta) para validaciones masivas."""
+        return {m.id: self._to_entity(m) for m in MedidorModel.objects.filter(pk__in=medidor_ids)}
+
     def get_by_codigo(self, codigo: str) -> Optional[Medidor]:
         try:
             model = MedidorModel.objects.get(codigo=codigo)
@@ -105,4 +114,38 @@ class DjangoMedidorRepository(IMedidorRepository):
     def list_all(self) -> List[Medidor]:
         """Lista TODOS los medidores del sistema."""
         models = MedidorModel.objects.all()
-        return [self._to_entity(m) for m in models]
\ No newline at end of file
+        return [self._to_entity(m) for m in models]
+
+    def listar_pagina(self, limite: int, despues_de: Optional[int] = None,
+                      usuario_id: Optional[int] = None) -> List[Medidor]:
+        """
+        Página keyset ordenada por id. El filtro de propietario se resuelve en SQL
+        (medidores -> terrenos -> socios.usuario_id): un socio no recorre la tabla completa.
+        """
+        qs = MedidorModel.objects.all()
+        if usuario_id is not None:
+            qs = qs.filter(terreno__socio__usuario_id=usuario_id)
+        if despues_de is not None:
+            qs = qs.filter(id__gt=despues_de)
+        return [self._to_entity(m) for m in qs.order_by('id')[:limite]]
+
+    def refrescar_ultima_lectura(self, medidor_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recalcula el snapshot de última lectura con un único UPDATE set-based
+        (subconsulta correlacionada sobre idx_lectura_medidor_fecha).
+        Sirve tanto para altas como para correcciones/borrados de lecturas.
+        medidor_ids=None -> reconstruye TODOS los medidores.
+        """
+        ultima = LecturaModel.objects.filter(medidor_id=OuterRef('pk')).order_by('-fecha', '-id')
+        qs = MedidorModel.objects.all()
+        if medidor_ids is not None:
+            medidor_ids = set(medidor_ids)
+            if not medidor_ids:
+                return 0
+            qs = qs.filter(pk__in=medidor_ids)
+
+        return qs.update(
+            ultima_lectura_id=Subquery(ultima.values('id')[:1]),
+            ultima_lectura_valor=Subquery(ultima.values('valor')[:1]),
+            ultima_lectura_fecha=Subquery(ultima.values('fecha')[:1])
+        )
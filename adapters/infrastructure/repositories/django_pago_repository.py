@@ -1,16 +1,20 @@
+from datetime import date
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 from django.db.models import Sum
+from django.utils import timezone
 from core.interfaces.repositories import IPagoRepository
-from adapters.infrastructure.models import PagoModel
+from core.domain.conciliacion_bancaria import TransferenciaPendiente
+from adapters.infrastructure.models import PagoModel, DetallePagoModel
 from core.shared.enums import MetodoPagoEnum
+from core.shared.fechas import rango_dias_locales
 
 class DjangoPagoRepository(IPagoRepository):
 
     def obtener_sumatoria_validada(self, factura_id: int) -> float:
-        # El vínculo Factura-Pago web ahora vive en la observación para pagos directos a una factura
+        # JOIN indexado por la FK pagos.factura_id (antes: LIKE '%Factura #id%' sobre toda la tabla)
         suma = PagoModel.objects.filter(
-            observacion__icontains=f"Factura #{factura_id}",
+            factura_id=factura_id,
             detalles_metodos__metodo=MetodoPagoEnum.TRANSFERENCIA.value,
             validado=True
         ).aggregate(Sum('monto_total'))
@@ -20,12 +24,12 @@ class DjangoPagoRepository(IPagoRepository):
 
     def tiene_pagos_pendientes(self, factura_id: int) -> bool:
         return PagoModel.objects.filter(
-            observacion__icontains=f"Factura #{factura_id}",
+            factura_id=factura_id,
             detalles_metodos__metodo=MetodoPagoEnum.TRANSFERENCIA.value,
             validado=False
         ).exists()
 
-    def registrar_pagos(self, factura_id: int, pagos: List[dict]) -> None:
+    def registrar_pagos(self, factura_id: int, pagos: List[dict], usuario_id: Optional[int] = None) -> None:
         """
         Registra pagos provenientes de caja (Ventanilla).
         Crea una cabecera PagoModel y sus DetallePagoModel.
@@ -40,8 +44,10 @@ class DjangoPagoRepository(IPagoRepository):
         
         pago_header = PagoModel.objects.create(
             socio=factura.socio,
+            factura=factura,
             monto_total=total_monto,
             validado=True,
+            usuario_cobro_id=usuario_id,
             observacion=f"Pago en Ventanilla (Factura #{factura_id})"
         )
         
@@ -67,9 +73,9 @@ class DjangoPagoRepository(IPagoRepository):
         Retorna los últimos pagos realizados por el socio.
         Incluye el link al PDF de la factura pagada si existe.
         """
-        # Obtenemos los pagos a través de la relación con Factura -> Socio
+        # Pagos del socio (los abonos FIFO no tienen factura directa)
         pagos = PagoModel.objects.filter(
-            factura__socio_id=socio_id,
+            socio_id=socio_id,
             validado=True
         ).select_related('factura').order_by('-fecha_registro')[:limite]
 
@@ -77,16 +83,39 @@ class DjangoPagoRepository(IPagoRepository):
         for p in pagos:
             # Construimos la URL del PDF si existe en la factura
             pdf_url = None
-            if p.factura.archivo_pdf:
+            if p.factura and p.factura.archivo_pdf:
                 pdf_url = p.factura.archivo_pdf.url
             
             # Formato simple para cumplir contrato
             item = {
                 "fecha": p.fecha_registro.date(),
-                "monto": p.monto,
+                "monto": p.monto_total,
                 "recibo_nro": f"PAG-{p.id}", # Generamos un ID de recibo virtual
                 "archivo_pdf": pdf_url
             }
             resultado.append(item)
             
         return resultado
+
+    def obtener_transferencias_por_validar(self, desde: date, hasta: date) -> List[TransferenciaPendiente]:
+        """
+        Una sola consulta (detalle -> cabecera) con lo necesario para conciliar.
+        La fecha es la de subida del comprobante en hora local; el rango va como datetimes
+        semiabiertos para usar idx_pago_fecha_registro.
+        """
+        inicio, fin = rango_dias_locales(desde, hasta)
+        filas = DetallePagoModel.objects.filter(
+            metodo=MetodoPagoEnum.TRANSFERENCIA.value,
+            pago__validado=False,
+            pago__fecha_registro__gte=inicio,
+            pago__fecha_registro__lt=fin
+        ).order_by('pago_id').values_list(
+            'pago_id', 'pago__socio_id', 'referencia', 'pago__monto_total', 'pago__fecha_registro'
+        )
+        return [
+            TransferenciaPendiente(
+                pago_id=pago_id, socio_id=socio_id, referencia=referencia or '',
+                monto=monto, fecha=timezone.localtime(registrado).date()
+            )
+            for pago_id, socio_id, referencia, monto, registrado in filas
+        ]
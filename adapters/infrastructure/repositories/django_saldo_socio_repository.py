@@ -0,0 +1,122 @@
+# adapters/infrastructure/repositories/django_saldo_socio_repository.py
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db.models import Count, F, Min, Q, Sum, Window
+from django.db.models.functions import RowNumber
+
+from core.interfaces.repositories import ISaldoSocioRepository
+from core.shared.enums import EstadoCuentaPorCobrar, TipoRubro
+from adapters.infrastructure.models import SocioModel, CuentaPorCobrarModel, SaldoSocioModel
+
+# (deuda_total, cuentas_abiertas, vencimiento_mas_antiguo, vencimiento_corte)
+Resumen = Tuple[Decimal, int, Optional[date], Optional[date]]
+RESUMEN_VACIO: Resumen = (Decimal('0.00'), 0, None, None)
+
+
+class DjangoSaldoSocioRepository(ISaldoSocioRepository):
+    """
+    Libro de saldos por socio (socios_saldos).
+    El resumen se recalcula set-based SOLO para los socios tocados, con consultas
+    sobre sus cuentas abiertas (FK socio indexada), y se escribe con un upsert.
+    Quien modifica cuentas_por_cobrar lo invoca en su propia transacción:
+    - save()/delete() individuales: signal en adapters/infrastructure/signals.py
+    - bulk_update / update(): explícitamente (ImputacionPagosService, seeds).
+    """
+    # Planillas de consumo que cuentan para el corte (incluye los tipos históricos del catálogo)
+    TIPOS_PLANILLA = ('AGUA', 'PLANILLA', TipoRubro.AGUA_POTABLE.value)
+    UMBRAL_CORTE = 2
+    TAMANO_LOTE = 1000
+
+    def recalcular(self, socio_ids: Optional[Iterable[int]] = None) -> int:
+        """socio_ids=None -> reconstruye el libro de TODOS los socios. Retorna las filas escritas."""
+        total = 0
+        for lote in self._lotes(socio_ids):
+            resumenes = self._calcular(lote)
+            SaldoSocioModel.objects.bulk_create(
+                [self._fila(socio_id, resumenes.get(socio_id, RESUMEN_VACIO)) for socio_id in lote],
+                update_conflicts=True,
+                unique_fields=['socio'],
+                update_fields=['deuda_total', 'cuentas_abiertas', 'vencimiento_mas_antiguo',
+                               'vencimiento_corte', 'fecha_actualizacion']
+            )
+            total += len(lote)
+        return total
+
+    def verificar(self, socio_ids: Optional[Iterable[int]] = None) -> List[Dict]:
+        """Compara el libro contra un recálculo desde cero. Retorna las diferencias (sin corregirlas)."""
+        diferencias = []
+        for lote in self._lotes(socio_ids):
+            esperado = self._calcular(lote)
+            guardado = {
+                fila[0]: tuple(fila[1:]) for fila in SaldoSocioModel.objects.filter(socio_id__in=lote)
+                .values_list('socio_id', 'deuda_total', 'cuentas_abiertas',
+                             'vencimiento_mas_antiguo', 'vencimiento_corte')
+            }
+            for socio_id in lote:
+                real = esperado.get(socio_id, RESUMEN_VACIO)
+                libro = guardado.get(socio_id, RESUMEN_VACIO)  # sin fila == sin deuda
+                if libro != real:
+                    diferencias.append({"socio_id": socio_id, "libro": libro, "real": real})
+        return diferencias
+
+    def obtener_deuda_total(self, socio_id: int) -> Decimal:
+        deuda = SaldoSocioModel.objects.filter(socio_id=socio_id).values_list('deuda_total', flat=True).first()
+        return deuda if deuda is not None else Decimal('0.00')
+
+    def socios_en_mora_para_corte(self, hoy: date) -> List[int]:
+        # Barrido único por idx_saldo_vencimiento_corte
+        return list(
+            SaldoSocioModel.objects.filter(vencimiento_corte__lt=hoy).values_list('socio_id', flat=True)
+        )
+
+    def resumen_morosidad(self, hoy: date) -> Dict[str, int]:
+        return SaldoSocioModel.objects.aggregate(
+            socios_con_deuda=Count('pk', filter=Q(deuda_total__gt=0)),
+            socios_en_mora=Count('pk', filter=Q(vencimiento_mas_antiguo__lt=hoy))
+        )
+
+    # --- Internos ---
+    def _lotes(self, socio_ids: Optional[Iterable[int]]):
+        if socio_ids is None:
+            ids = list(SocioModel.objects.order_by('id').values_list('id', flat=True))
+        else:
+            ids = sorted({i for i in socio_ids if i is not None})
+        for inicio in range(0, len(ids), self.TAMANO_LOTE):
+            yield ids[inicio:inicio + self.TAMANO_LOTE]
+
+    def _cuentas_abiertas(self, socio_ids: List[int]):
+        return CuentaPorCobrarModel.objects.filter(
+            socio_id__in=socio_ids, saldo_pendiente__gt=Decimal('0.00')
+        ).exclude(estado=EstadoCuentaPorCobrar.ANULADO.value).order_by()
+
+    def _calcular(self, socio_ids: List[int]) -> Dict[int, Resumen]:
+        agregados = (
+            self._cuentas_abiertas(socio_ids).values('socio_id')
+            .annotate(deuda=Sum('saldo_pendiente'), cuentas=Count('id'), vencimiento=Min('fecha_vencimiento'))
+            .values_list('socio_id', 'deuda', 'cuentas', 'vencimiento')
+        )
+        # N-ésima planilla más antigua por socio (ROW_NUMBER() OVER PARTITION BY socio)
+        corte = dict(
+            self._cuentas_abiertas(socio_ids)
+            .filter(estado=EstadoCuentaPorCobrar.PENDIENTE.value, rubro__tipo__in=self.TIPOS_PLANILLA)
+            .annotate(posicion=Window(
+                expression=RowNumber(),
+                partition_by=[F('socio_id')],
+                order_by=[F('fecha_vencimiento').asc(), F('id').asc()]
+            ))
+            .filter(posicion=self.UMBRAL_CORTE)
+            .values_list('socio_id', 'fecha_vencimiento')
+        )
+        return {
+            socio_id: (deuda, cuentas, vencimiento, corte.get(socio_id))
+            for socio_id, deuda, cuentas, vencimiento in agregados
+        }
+
+    def _fila(self, socio_id: int, resumen: Resumen) -> SaldoSocioModel:
+        deuda, cuentas, vencimiento, corte = resumen
+        return SaldoSocioModel(
+            socio_id=socio_id, deuda_total=deuda, cuentas_abiertas=cuentas,
+            vencimiento_mas_antiguo=vencimiento, vencimiento_corte=corte
+        )
@@ -1,16 +1,45 @@
-from typing import List, Any
+from typing import List, Any, Optional
 from core.interfaces.repositories import IServicioRepository
 from adapters.infrastructure.models.servicio_model import ServicioModel
 
 class DjangoServicioRepository(IServicioRepository):
-    def obtener_servicios_fijos_activos(self) -> List[Any]:
+    def obtener_servicios_fijos_activos(self, barrio_id: Optional[int] = None, sin_barrio: bool = False,
+                                        socio_id_desde: Optional[int] = None,
+                                        socio_id_hasta: Optional[int] = None) -> List[Any]:
         # Retorna queryset de Django (que cumple con ser iterable)
         # Select related para optimizar acceso a socio y terreno (usado luego en el UseCase)
-        return ServicioModel.objects.filter(
+        qs = ServicioModel.objects.filter(
             tipo='FIJO',
             activo=True
         ).select_related('socio', 'terreno')
 
+        # Filtros de partición (Facturación paralela)
+        if sin_barrio:
+            qs = qs.filter(socio__barrio__isnull=True)
+        elif barrio_id is not None:
+            qs = qs.filter(socio__barrio_id=barrio_id)
+        if socio_id_desde is not None:
+            qs = qs.filter(socio_id__gte=socio_id_desde)
+        if socio_id_hasta is not None:
+            qs = qs.filter(socio_id__lte=socio_id_hasta)
+        return qs
+
+    def listar_barrios_servicios_fijos(self) -> List[Optional[int]]:
+        return list(
+            ServicioModel.objects.filter(tipo='FIJO', activo=True)
+            .order_by('socio__barrio_id')
+            .values_list('socio__barrio_id', flat=True)
+            .distinct()
+        )
+
+    def listar_socio_ids_servicios_fijos(self) -> List[int]:
+        return list(
+            ServicioModel.objects.filter(tipo='FIJO', activo=True)
+            .order_by('socio_id')
+            .values_list('socio_id', flat=True)
+            .distinct()
+        )
+
     def create_automatico(self, terreno_id: int, socio_id: int, tipo: str, valor: float) -> Any:
         return ServicioModel.objects.create(
             terreno_id=terreno_id,
@@ -0,0 +1,128 @@
+# adapters/infrastructure/repositories/django_sincronizacion_repository.py
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from core.interfaces.repositories import ISincronizacionRepository
+from adapters.infrastructure.models import CambioSyncModel, MedidorModel, TerrenoModel
+
+
+class DjangoSincronizacionRepository(ISincronizacionRepository):
+    """
+    Bitácora de cambios + lectura del estado actual para la app de lecturas offline.
+    La escritura la disparan los signals (save/delete individuales) y los
+    repositorios en operaciones masivas (bulk_create / update no disparan signals).
+    """
+
+    # =================================================================
+    # 1. ESCRITURA (Registro de cambios)
+    # =================================================================
+    def registrar(self, cambios: Iterable[Tuple[str, int, Optional[int]]]) -> None:
+        """cambios: [(entidad, objeto_id, barrio_id)]"""
+        filas = [
+            CambioSyncModel(entidad=entidad, objeto_id=objeto_id, barrio_id=barrio_id)
+            for entidad, objeto_id, barrio_id in set(cambios)
+        ]
+        if filas:
+            CambioSyncModel.objects.bulk_create(filas, batch_size=1000)
+
+    def registrar_medidores(self, medidor_ids: Iterable[int]) -> None:
+        """Registra cambios de medidores resolviendo su barrio actual en una consulta."""
+        medidor_ids = list(medidor_ids)
+        if not medidor_ids:
+            return
+        pares = MedidorModel.objects.filter(pk__in=medidor_ids).values_list('id', 'terreno__barrio_id')
+        self.registrar((CambioSyncModel.ENTIDAD_MEDIDOR, m_id, barrio_id) for m_id, barrio_id in pares)
+
+    def barrios_de_terrenos(self, terreno_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+        terreno_ids = [t for t in terreno_ids if t]
+        if not terreno_ids:
+            return {}
+        return dict(TerrenoModel.objects.filter(pk__in=terreno_ids).values_list('id', 'barrio_id'))
+
+    # =================================================================
+    # 2. LECTURA (Protocolo de sincronización)
+    # =================================================================
+    def token_actual(self) -> int:
+        return CambioSyncModel.objects.aggregate(ultimo=Max('id'))['ultimo'] or 0
+
+    def token_estable(self) -> int:
+        """
+        Los IDs se asignan al insertar, no al confirmar: una transacción larga (importación
+        masiva) puede confirmar un ID menor después de que el cliente vio uno mayor.
+        Solo se entregan tokens de cambios más antiguos que la ventana de seguridad;
+        lo más reciente se re-envía en el próximo delta (el cliente aplica estado, no diffs).
+        """
+        limite = timezone.now() - timedelta(seconds=settings.SYNC_VENTANA_SEGURIDAD_SEGUNDOS)
+        return (CambioSyncModel.objects.filter(fecha__lte=limite)
+                .order_by('-id').values_list('id', flat=True).first()) or 0
+
+    def token_minimo_vigente(self) -> int:
+        primero = CambioSyncModel.objects.aggregate(primero=Min('id'))['primero']
+        return primero - 1 if primero else 0
+
+    def purgar(self, dias: Optional[int] = None) -> int:
+        """
+        Borra la bitácora más antigua que la retención. Conserva siempre el último cambio
+        para que token_actual() no retroceda y los tokens vigentes sigan siendo válidos.
+        """
+        limite = timezone.now() - timedelta(days=dias if dias is not None else settings.SYNC_RETENCION_DIAS)
+        corte = (CambioSyncModel.objects.filter(fecha__lt=limite)
+                 .order_by('-id').values_list('id', flat=True).first())
+        if corte is None:
+            return 0
+        corte = min(corte, self.token_actual() - 1)
+        borrados, _ = CambioSyncModel.objects.filter(id__lte=corte).delete()
+        return borrados
+
+    def obtener_cambios(self, desde_token: int, barrio_id: Optional[int], limite: int) -> List[Tuple[int, str, int]]:
+        qs = CambioSyncModel.objects.filter(id__gt=desde_token)
+        if barrio_id is not None:
+            # Cubierto por idx_sync_barrio_token (barrio_id, id)
+            qs = qs.filter(barrio_id=barrio_id)
+        return list(qs.order_by('id').values_list('id', 'entidad', 'objeto_id')[:limite])
+
+    def obtener_medidores(self, barrio_id: Optional[int], ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        qs = MedidorModel.objects.filter(estado='ACTIVO', terreno__isnull=False).select_related('terreno')
+        if barrio_id is not None:
+            qs = qs.filter(terreno__barrio_id=barrio_id)
+        if ids is not None:
+            qs = qs.filter(pk__in=ids)
+
+        return {
+            m.id: {
+                "id": m.id,
+                "codigo": m.codigo,
+                "terreno_id": m.terreno_id,
+                "estado": m.estado,
+                "lectura_inicial": float(m.lectura_inicial),
+                # Snapshot desnormalizado: sin consulta extra a lecturas
+                "ultima_lectura": {
+                    "id": m.ultima_lectura_id,
+                    "valor": float(m.ultima_lectura_valor),
+                    "fecha": str(m.ultima_lectura_fecha),
+                } if m.ultima_lectura_id else None,
+            }
+            for m in qs
+        }
+
+    def obtener_terrenos(self, barrio_id: Optional[int], ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        qs = TerrenoModel.objects.select_related('socio')
+        if barrio_id is not None:
+            qs = qs.filter(barrio_id=barrio_id)
+        if ids is not None:
+            qs = qs.filter(pk__in=ids)
+
+        return {
+            t.id: {
+                "id": t.id,
+                "direccion": t.direccion,
+                "barrio_id": t.barrio_id,
+                "socio_id": t.socio_id,
+                "socio_nombre": f"{t.socio.apellidos} {t.socio.nombres}" if t.socio else None,
+            }
+            for t in qs
+        }
@@ -1,8 +1,10 @@
 # adapters/infrastructure/repositories/django_socio_repository.py
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 from core.domain.socio import Socio
 from core.interfaces.repositories import ISocioRepository
 from adapters.infrastructure.models import SocioModel
+from adapters.infrastructure.repositories.keyset import filtro_despues_de
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
 
 # Manejo robusto de Enums para evitar errores de importación
 try:
@@ -15,6 +17,12 @@ class DjangoSocioRepository(ISocioRepository):
     Implementación del repositorio de Socios usando el ORM de Django.
     Cumple estrictamente con el contrato de ISocioRepository.
     """
+    # Órdenes del listado paginado; el último campo es único (desempate del keyset)
+    ORDENES = {
+        'apellidos': ('apellidos', 'nombres', 'id'),
+        'identificacion': ('identificacion',),
+        'recientes': ('-id',),
+    }
 
     # =================================================================
     # 1. TRADUCTOR (ORM -> DOMINIO)
@@ -45,8 +53,8 @@ class DjangoSocioRepository(ISocioRepository):
             direccion=model.direccion,
             esta_activo=getattr(model, 'esta_activo', True),
             rol=rol_valor,
-            # Mapeo seguro del usuario de sistema
-            usuario_id=model.usuario_id if hasattr(model, 'usuario') and model.usuario else None,
+            # Mapeo seguro del usuario de sistema (solo la FK: no dispara un SELECT por fila)
+            usuario_id=model.usuario_id,
             _validate=False  # Hidratación segura para lecturas
         )
 
@@ -92,6 +100,30 @@ class DjangoSocioRepository(ISocioRepository):
         qs = SocioModel.objects.select_related('usuario').filter(esta_activo=True, barrio_id=barrio_id).order_by('apellidos')
         return [self._map_model_to_domain(m) for m in qs]
 
+    def listar_pagina(self, limite: int, despues_de: Optional[Sequence[Any]] = None,
+                      orden: str = 'apellidos', barrio_id: Optional[int] = None,
+                      activo: Optional[bool] = None, rol: Optional[str] = None,
+                      busqueda: Optional[str] = None) -> List[Socio]:
+        """
+        Una página del listado resuelta en la BD: filtros + keyset + LIMIT.
+        Con los índices (apellidos, nombres, id) y (barrio, apellidos, nombres, id)
+        la página N lee `limite` filas sin importar cuántos socios existan.
+        """
+        ordering = self.ORDENES[orden]
+        qs = SocioModel.objects.all()
+        if barrio_id is not None:
+            qs = qs.filter(barrio_id=barrio_id)
+        if activo is not None:
+            qs = qs.filter(esta_activo=activo)
+        if rol:
+            qs = qs.filter(rol=rol)
+        if busqueda:
+            # Índice de búsqueda: prefijo de identificación o de cada palabra (sin tildes)
+            qs = qs.filter(id__in=DjangoBusquedaSocioRepository().ids_coincidentes(busqueda))
+        if despues_de:
+            qs = qs.filter(filtro_despues_de(ordering, despues_de))
+        return [self._map_model_to_domain(m) for m in qs.order_by(*ordering)[:limite]]
+
     # =================================================================
     # 3. IMPLEMENTACIÓN DE LA INTERFAZ (ESCRITURA)
     # =================================================================
@@ -125,6 +157,8 @@ class DjangoSocioRepository(ISocioRepository):
             SocioModel.objects.filter(pk=socio.id).update(**data_db)
             # Recargamos para devolver el objeto fresco
             model = SocioModel.objects.get(pk=socio.id)
+            # .update() no dispara post_save: el índice de búsqueda se actualiza aquí
+            DjangoBusquedaSocioRepository().reindexar([socio.id])
         else:
             # Create
             model = SocioModel.objects.create(**data_db)
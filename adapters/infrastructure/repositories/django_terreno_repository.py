@@ -1,14 +1,16 @@
 # adapters/infrastructure/repositories/django_terreno_repository.py
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from django.db import transaction, IntegrityError
 
 # 1. Imports de Core (Contratos y Dominio)
 from core.interfaces.repositories import ITerrenoRepository
 from core.domain.terreno import Terreno
+from core.domain.medidor import Medidor
 
 # 2. Imports de Infraestructura (Modelos Django)
 from adapters.infrastructure.models.terreno_model import TerrenoModel
+from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
 
 class DjangoTerrenoRepository(ITerrenoRepository):
     """
@@ -80,6 +82,37 @@ class DjangoTerrenoRepository(ITerrenoRepository):
         qs = TerrenoModel.objects.select_related('barrio').filter(socio_id=socio_id)
         return [self._map_model_to_domain(model) for model in qs]
 
+    # --- LECTURA CON MEDIDOR (un solo JOIN: terreno + barrio + medidor) ---
+
+    def listar_con_medidor(self, limite: int, despues_de: Optional[int] = None,
+                           socio_id: Optional[int] = None,
+                           barrio_id: Optional[int] = None) -> List[Tuple[Terreno, Optional[Medidor]]]:
+        """
+        Página keyset ordenada por id: WHERE id > :despues_de ORDER BY id LIMIT :limite.
+        El medidor (OneToOne inverso) y el barrio llegan con LEFT JOIN en la misma consulta.
+        """
+        qs = self._con_medidor()
+        if socio_id is not None:
+            qs = qs.filter(socio_id=socio_id)
+        if barrio_id is not None:
+            qs = qs.filter(barrio_id=barrio_id)
+        if despues_de is not None:
+            qs = qs.filter(id__gt=despues_de)
+        return [self._map_con_medidor(model) for model in qs.order_by('id')[:limite]]
+
+    def obtener_con_medidor(self, terreno_id: int) -> Optional[Tuple[Terreno, Optional[Medidor]]]:
+        model = self._con_medidor().filter(id=terreno_id).first()
+        return self._map_con_medidor(model) if model else None
+
+    @staticmethod
+    def _con_medidor():
+        return TerrenoModel.objects.select_related('barrio', 'medidor')
+
+    def _map_con_medidor(self, model: TerrenoModel) -> Tuple[Terreno, Optional[Medidor]]:
+        # Sin medidor instalado el accessor inverso lanza RelatedObjectDoesNotExist (AttributeError)
+        medidor = getattr(model, 'medidor', None)
+        return self._map_model_to_domain(model), (DjangoMedidorRepository()._to_entity(medidor) if medidor else None)
+
     # --- MÉTODOS AUXILIARES DE MAPEO ---
 
     def _map_model_to_domain(self, model: TerrenoModel) -> Terreno:
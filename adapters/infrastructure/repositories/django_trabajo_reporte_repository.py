@@ -0,0 +1,94 @@
+# adapters/infrastructure/repositories/django_trabajo_reporte_repository.py
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.interfaces.repositories import ITrabajoReporteRepository
+from adapters.infrastructure.models import TrabajoReporteModel
+
+CAMPOS = ('id', 'tipo', 'parametros', 'estado', 'error', 'task_id', 'solicitado_por_id',
+          'fecha_creacion', 'fecha_inicio', 'fecha_fin', 'expira_en')
+
+
+class DjangoTrabajoReporteRepository(ITrabajoReporteRepository):
+    """
+    Cola de reportes pesados (tabla reportes_trabajos).
+    La coalescencia la garantiza la BD: `huella_activa` es única y solo está llena en
+    PENDIENTE/EN_PROCESO, así que de dos solicitudes simultáneas inserta una sola; la otra
+    recibe IntegrityError y se adjunta al trabajo del ganador. Toda transición a un estado
+    final la vuelve a NULL para liberar la huella.
+    """
+    # Trabajo activo sin terminar en este plazo: el worker murió o el mensaje se perdió
+    ABANDONO = timedelta(minutes=30)
+
+    def solicitar(self, tipo: str, parametros: Dict[str, Any], huella: str,
+                  usuario_id: Optional[int] = None) -> Tuple[Dict[str, Any], bool]:
+        ahora = timezone.now()
+        existente = (
+            TrabajoReporteModel.objects
+            .filter(Q(estado__in=TrabajoReporteModel.ESTADOS_ACTIVOS) |
+                    Q(estado=TrabajoReporteModel.ESTADO_COMPLETADO, expira_en__gt=ahora), huella=huella)
+            .order_by('-fecha_creacion').values(*CAMPOS).first()
+        )
+        if existente and not self._abandonado(existente, ahora):
+            return existente, False
+        if existente and existente['estado'] in TrabajoReporteModel.ESTADOS_ACTIVOS:
+            TrabajoReporteModel.objects.filter(pk=existente['id'], estado=existente['estado']).update(
+                estado=TrabajoReporteModel.ESTADO_FALLIDO, error="Abandonado sin completar.", fecha_fin=ahora,
+                huella_activa=None
+            )
+
+        try:
+            # Savepoint propio: el IntegrityError no invalida una transacción externa
+            with transaction.atomic():
+                trabajo = TrabajoReporteModel.objects.create(
+                    tipo=tipo, parametros=parametros, huella=huella, huella_activa=huella,
+                    solicitado_por_id=usuario_id
+                )
+            return self.obtener(trabajo.id), True
+        except IntegrityError:
+            activo = TrabajoReporteModel.objects.filter(huella_activa=huella).values(*CAMPOS).first()
+            if activo is None:
+                # El ganador terminó entre el INSERT y la lectura
+                return self.solicitar(tipo, parametros, huella, usuario_id)
+            return activo, False
+
+    def obtener(self, trabajo_id: int, con_resultado: bool = False) -> Optional[Dict[str, Any]]:
+        campos = CAMPOS + ('resultado',) if con_resultado else CAMPOS
+        return TrabajoReporteModel.objects.filter(pk=trabajo_id).values(*campos).first()
+
+    def asignar_task_id(self, trabajo_id: int, task_id: str) -> None:
+        TrabajoReporteModel.objects.filter(pk=trabajo_id).update(task_id=task_id)
+
+    def iniciar(self, trabajo_id: int) -> bool:
+        return TrabajoReporteModel.objects.filter(
+            pk=trabajo_id, estado=TrabajoReporteModel.ESTADO_PENDIENTE
+        ).update(estado=TrabajoReporteModel.ESTADO_EN_PROCESO, fecha_inicio=timezone.now()) == 1
+
+    def completar(self, trabajo_id: int, resultado: Any, expira_en: datetime) -> None:
+        TrabajoReporteModel.objects.filter(pk=trabajo_id).update(
+            estado=TrabajoReporteModel.ESTADO_COMPLETADO, resultado=resultado,
+            fecha_fin=timezone.now(), expira_en=expira_en, huella_activa=None
+        )
+
+    def fallar(self, trabajo_id: int, error: str) -> None:
+        TrabajoReporteModel.objects.filter(pk=trabajo_id).update(
+            estado=TrabajoReporteModel.ESTADO_FALLIDO, error=error[:2000], fecha_fin=timezone.now(),
+            huella_activa=None
+        )
+
+    def purgar_expirados(self) -> int:
+        ahora = timezone.now()
+        borrados, _ = TrabajoReporteModel.objects.filter(
+            Q(expira_en__lte=ahora) |
+            Q(estado=TrabajoReporteModel.ESTADO_FALLIDO, fecha_creacion__lte=ahora - timedelta(days=1))
+        ).delete()
+        return borrados
+
+    def _abandonado(self, trabajo: Dict[str, Any], ahora: datetime) -> bool:
+        if trabajo['estado'] not in TrabajoReporteModel.ESTADOS_ACTIVOS:
+            return False
+        return (trabajo['fecha_inicio'] or trabajo['fecha_creacion']) < ahora - self.ABANDONO
@@ -0,0 +1,19 @@
+# adapters/infrastructure/repositories/keyset.py
+from typing import Any, Sequence
+
+from django.db.models import Q
+
+
+def filtro_despues_de(ordering: Sequence[str], valores: Sequence[Any]) -> Q:
+    """
+    Condición keyset "después de la fila (valores)" para un ORDER BY `ordering`.
+    (a, b) < (x, y)  ==  a < x  OR  (a = x AND b < y)   (generalizado a N campos)
+    La comparten la paginación de la API (querysets) y los repositorios que paginan.
+    """
+    filtro, iguales = Q(), {}
+    for campo, valor in zip(ordering, valores):
+        nombre = campo.lstrip('-')
+        operador = 'lt' if campo.startswith('-') else 'gt'
+        filtro |= Q(**iguales, **{f"{nombre}__{operador}": valor})
+        iguales[nombre] = valor
+    return filtro
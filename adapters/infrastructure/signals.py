@@ -0,0 +1,158 @@
+# adapters/infrastructure/signals.py
+from django.db.models.signals import post_init, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from adapters.infrastructure.models import (
+    MedidorModel, TerrenoModel, LecturaModel, CambioSyncModel, CuentaPorCobrarModel,
+    SocioModel, ServicioModel, FacturaModel, PagoModel
+)
+from adapters.infrastructure.repositories.django_sincronizacion_repository import DjangoSincronizacionRepository
+from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
+from core.services.estado_cuenta_cache_service import EstadoCuentaCacheService
+
+# =============================================================================
+# SINCRONIZACIÓN OFFLINE (App de Lecturas)
+# Cada alta/cambio/baja de Terreno, Medidor o Lectura deja un registro en la
+# bitácora `sync_cambios`. Si un objeto cambia de barrio, también se registra
+# en el barrio anterior para que esa ruta reciba el tombstone.
+# =============================================================================
+
+@receiver(post_init, sender=TerrenoModel)
+def _terreno_recordar_barrio(sender, instance, **kwargs):
+    instance._sync_barrio_original = instance.barrio_id
+
+
+@receiver(post_init, sender=MedidorModel)
+def _medidor_recordar_terreno(sender, instance, **kwargs):
+    instance._sync_terreno_original = instance.terreno_id
+
+
+@receiver(pre_delete, sender=TerrenoModel)
+def _terreno_recordar_medidores(sender, instance, **kwargs):
+    # El borrado desvincula sus medidores con SET_NULL (UPDATE directo, sin post_save)
+    instance._sync_medidores = list(MedidorModel.objects.filter(terreno_id=instance.id).values_list('id', flat=True))
+
+
+@receiver(post_save, sender=TerrenoModel)
+@receiver(post_delete, sender=TerrenoModel)
+def sync_terreno(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    barrios = {instance.barrio_id, getattr(instance, '_sync_barrio_original', instance.barrio_id)}
+    cambios = [(CambioSyncModel.ENTIDAD_TERRENO, instance.id, barrio_id) for barrio_id in barrios]
+    # Medidores que quedaron sin terreno: tombstone en la ruta del terreno borrado
+    cambios += [(CambioSyncModel.ENTIDAD_MEDIDOR, medidor_id, barrio_id)
+                for medidor_id in getattr(instance, '_sync_medidores', []) for barrio_id in barrios]
+    DjangoSincronizacionRepository().registrar(cambios)
+    instance._sync_barrio_original = instance.barrio_id
+
+
+@receiver(post_save, sender=MedidorModel)
+@receiver(post_delete, sender=MedidorModel)
+def sync_medidor(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    repo = DjangoSincronizacionRepository()
+    terrenos = {instance.terreno_id, getattr(instance, '_sync_terreno_original', instance.terreno_id)}
+    barrios = set(repo.barrios_de_terrenos(terrenos).values()) or {None}
+    repo.registrar((CambioSyncModel.ENTIDAD_MEDIDOR, instance.id, barrio_id) for barrio_id in barrios)
+    instance._sync_terreno_original = instance.terreno_id
+
+
+@receiver(post_save, sender=LecturaModel)
+@receiver(post_delete, sender=LecturaModel)
+def sync_lectura(sender, instance, raw=False, **kwargs):
+    # La lectura viaja dentro del medidor (última lectura): el cambio es del medidor
+    if raw:
+        return
+    DjangoSincronizacionRepository().registrar_medidores([instance.medidor_id])
+
+
+# =============================================================================
+# SNAPSHOT DE ÚLTIMA LECTURA (MedidorModel.ultima_lectura_*)
+# Alta, corrección o borrado individual (API, admin) recalcula el snapshot del
+# medidor dentro de la misma transacción del save/delete. Las operaciones
+# masivas lo hacen desde DjangoLecturaRepository.
+# =============================================================================
+
+@receiver(post_save, sender=LecturaModel)
+@receiver(post_delete, sender=LecturaModel)
+def snapshot_ultima_lectura(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    DjangoMedidorRepository().refrescar_ultima_lectura([instance.medidor_id])
+
+
+# =============================================================================
+# LIBRO DE SALDOS POR SOCIO (socios_saldos)
+# Cada cargo, abono o anulación individual sobre cuentas_por_cobrar recalcula el
+# resumen del socio dentro de la misma transacción. Las escrituras masivas
+# (bulk_update, update) lo hacen explícitamente con DjangoSaldoSocioRepository.
+# =============================================================================
+
+@receiver(post_init, sender=CuentaPorCobrarModel)
+def _cuenta_recordar_socio(sender, instance, **kwargs):
+    instance._saldo_socio_original = instance.socio_id
+
+
+@receiver(post_save, sender=CuentaPorCobrarModel)
+@receiver(post_delete, sender=CuentaPorCobrarModel)
+def saldo_socio(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    DjangoSaldoSocioRepository().recalcular(
+        {instance.socio_id, getattr(instance, '_saldo_socio_original', instance.socio_id)}
+    )
+    instance._saldo_socio_original = instance.socio_id
+
+
+# =============================================================================
+# ESTADO DE CUENTA 360 (read model cacheado del portal)
+# Cambios en facturas, pagos, servicios, terrenos o datos del socio invalidan el
+# documento del socio al confirmar la transacción y encolan su reconstrucción.
+# Si un terreno/servicio cambia de dueño se invalidan ambos socios.
+# =============================================================================
+
+@receiver(post_init, sender=TerrenoModel)
+@receiver(post_init, sender=ServicioModel)
+def _estado_cuenta_recordar_socio(sender, instance, **kwargs):
+    instance._estado_cuenta_socio_original = instance.socio_id
+
+
+@receiver(post_save, sender=FacturaModel)
+@receiver(post_delete, sender=FacturaModel)
+@receiver(post_save, sender=PagoModel)
+@receiver(post_delete, sender=PagoModel)
+@receiver(post_save, sender=ServicioModel)
+@receiver(post_delete, sender=ServicioModel)
+@receiver(post_save, sender=TerrenoModel)
+@receiver(post_delete, sender=TerrenoModel)
+def invalidar_estado_cuenta(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    original = getattr(instance, '_estado_cuenta_socio_original', instance.socio_id)
+    EstadoCuentaCacheService().invalidar({instance.socio_id, original})
+    instance._estado_cuenta_socio_original = instance.socio_id
+
+
+@receiver(post_save, sender=SocioModel)
+def invalidar_estado_cuenta_socio(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    EstadoCuentaCacheService().invalidar([instance.id])
+
+
+# =============================================================================
+# ÍNDICE DE BÚSQUEDA DE SOCIOS (socios_busqueda)
+# Alta o edición individual (API, admin) recalcula los términos del socio en la
+# misma transacción. DjangoSocioRepository.save actualiza con .update() y lo
+# invoca explícitamente; la baja del socio borra sus términos en cascada.
+# =============================================================================
+
+@receiver(post_save, sender=SocioModel)
+def indexar_busqueda_socio(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    DjangoBusquedaSocioRepository().reindexar([instance.id])
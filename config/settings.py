@@ -10,6 +10,7 @@ from pathlib import Path
 from datetime import timedelta
 import dotenv
 import dj_database_url
+from celery.schedules import crontab
 
 # ==============================================================================
 # 0. UTILITIES & ENV
@@ -297,9 +298,60 @@ LOGGING = {
     },
 }
 
+# Cache compartido (Redis): los 3 workers de Gunicorn y el worker de Celery deben ver los
+# mismos documentos (estado de cuenta 360, marcas de reconstrucción). LocMemCache es por
+# proceso: una invalidación solo limpiaría el worker que atendió la escritura.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'junta_agua',
+        }
+    }
+elif get_env_bool('RAILWAY_ENVIRONMENT') and not IS_BUILD_PROCESS:
+    raise ValueError("❌ CRITICAL: REDIS_URL missing in Production (cache compartido y broker de Celery).")
+else:
+    # Solo desarrollo / tests / build: un único proceso
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
 # Celery
 CELERY_BROKER_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+CELERY_BEAT_SCHEDULE = {
+    # Tablas de hechos de los dashboards: solo procesa lo cambiado desde el último watermark
+    'actualizar-hechos-analiticos': {
+        'task': 'actualizar_hechos_analiticos',
+        'schedule': 600.0,  # cada 10 minutos
+    },
+    # Resultados de reportes asíncronos con TTL vencido
+    'purgar-reportes-expirados': {
+        'task': 'purgar_reportes_expirados',
+        'schedule': 3600.0,  # cada hora
+    },
+    # Bitácora de sincronización offline más antigua que SYNC_RETENCION_DIAS
+    'purgar-cambios-sincronizacion': {
+        'task': 'purgar_cambios_sincronizacion',
+        'schedule': crontab(hour=3, minute=15),
+    },
+    # Marcas de consumo atípico sobre las lecturas por facturar. La emisión se lanza a mano
+    # desde Pre-Emisión en cualquier momento: cada hora (~0.5 s con 10k medidores) las
+    # lecturas subidas ya llegan revisadas; /lecturas/detectar-anomalias/ la fuerza al instante
+    'detectar-anomalias-lecturas': {
+        'task': 'detectar_anomalias_lecturas',
+        'schedule': 3600.0,  # cada hora
+    },
+    # Cubo OLAP de consumo y recaudación (reconstrucción nocturna)
+    'construir-cubo-analitico': {
+        'task': 'construir_cubo_analitico',
+        'schedule': crontab(hour=2, minute=30),
+    },
+}
+# Sincronización offline: un cambio más nuevo que la ventana puede pertenecer a una transacción
+# que aún no confirma (los IDs se asignan al insertar); el token entregado nunca la supera.
+SYNC_VENTANA_SEGURIDAD_SEGUNDOS = int(os.getenv('SYNC_VENTANA_SEGURIDAD_SEGUNDOS', '300'))
+SYNC_RETENCION_DIAS = int(os.getenv('SYNC_RETENCION_DIAS', '90'))
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
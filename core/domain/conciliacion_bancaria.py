@@ -0,0 +1,166 @@
+import csv
+import io
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LineaExtracto:
+    """Crédito del extracto bancario (solo ingresos: los débitos se descartan al leer)."""
+    numero_linea: int
+    fecha: date
+    referencia: str
+    monto: Decimal
+    descripcion: str = ""
+
+
+@dataclass(frozen=True)
+class TransferenciaPendiente:
+    """Pago web subido por el socio y aún no validado por Tesorería."""
+    pago_id: int
+    socio_id: int
+    referencia: str
+    monto: Decimal
+    fecha: date
+
+
+@dataclass
+class ResultadoConciliacion:
+    emparejados: List[Tuple[LineaExtracto, TransferenciaPendiente]] = field(default_factory=list)
+    lineas_sin_conciliar: List[LineaExtracto] = field(default_factory=list)
+    transferencias_sin_conciliar: List[TransferenciaPendiente] = field(default_factory=list)
+
+
+def normalizar_referencia(referencia: Optional[str]) -> str:
+    """'  0001234-5 ' -> '12345'. Bancos y socios escriben el mismo número con ceros, guiones o espacios."""
+    return re.sub(r'[^0-9A-Z]', '', (referencia or '').upper()).lstrip('0')
+
+
+def conciliar(lineas: List[LineaExtracto], pendientes: List[TransferenciaPendiente],
+              tolerancia_dias: int = 3) -> ResultadoConciliacion:
+    """
+    Hash-join en una pasada: índice {(referencia normalizada, monto): [transferencias]}
+    y búsqueda O(1) por cada línea del extracto. Entre candidatos con la misma llave
+    gana el de fecha más cercana dentro de la tolerancia; cada transferencia se usa una vez.
+    Líneas sin referencia nunca se emparejan (quedan para revisión manual).
+    """
+    indice: Dict[Tuple[str, Decimal], List[TransferenciaPendiente]] = defaultdict(list)
+    for transferencia in pendientes:
+        referencia = normalizar_referencia(transferencia.referencia)
+        if referencia:
+            indice[(referencia, transferencia.monto)].append(transferencia)
+
+    resultado = ResultadoConciliacion()
+    usados = set()
+    for linea in lineas:
+        candidatos = [
+            t for t in indice.get((normalizar_referencia(linea.referencia), linea.monto), ())
+            if t.pago_id not in usados and abs((t.fecha - linea.fecha).days) <= tolerancia_dias
+        ]
+        if not candidatos:
+            resultado.lineas_sin_conciliar.append(linea)
+            continue
+        elegido = min(candidatos, key=lambda t: (abs((t.fecha - linea.fecha).days), t.pago_id))
+        usados.add(elegido.pago_id)
+        resultado.emparejados.append((linea, elegido))
+
+    resultado.transferencias_sin_conciliar = [t for t in pendientes if t.pago_id not in usados]
+    return resultado
+
+
+# --- Lectura de extractos (CSV / OFX) ---
+
+COLUMNAS_CSV = {
+    'fecha': ('fecha', 'date', 'fecha_transaccion', 'fecha_valor', 'fecha_contable'),
+    'referencia': ('referencia', 'ref', 'documento', 'numero_documento', 'comprobante', 'no_documento'),
+    'monto': ('monto', 'valor', 'importe', 'credito', 'amount'),
+    'descripcion': ('descripcion', 'concepto', 'detalle', 'memo'),
+}
+FORMATOS_FECHA = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%Y/%m/%d', '%Y%m%d')
+
+
+def leer_extracto_csv(contenido: str) -> Tuple[List[LineaExtracto], List[str]]:
+    """Retorna (créditos, errores por línea). Acepta ',' o ';' como separador."""
+    muestra = contenido[:2048]
+    delimitador = ';' if muestra.count(';') > muestra.count(',') else ','
+    lector = csv.DictReader(io.StringIO(contenido), delimiter=delimitador)
+    columnas = _mapear_columnas(lector.fieldnames or [])
+    faltantes = [c for c in ('fecha', 'referencia', 'monto') if c not in columnas]
+    if faltantes:
+        raise ValueError(f"El extracto no tiene las columnas: {', '.join(faltantes)}")
+
+    lineas, errores = [], []
+    for numero, fila in enumerate(lector, start=2):
+        try:
+            monto = _parsear_monto(fila[columnas['monto']])
+            if monto <= 0:
+                continue
+            lineas.append(LineaExtracto(
+                numero_linea=numero,
+                fecha=_parsear_fecha(fila[columnas['fecha']]),
+                referencia=(fila[columnas['referencia']] or '').strip(),
+                monto=monto,
+                descripcion=(fila.get(columnas.get('descripcion')) or '').strip()
+            ))
+        except (ValueError, TypeError) as e:
+            errores.append(f"Línea {numero}: {e}")
+    return lineas, errores
+
+
+def leer_extracto_ofx(contenido: str) -> Tuple[List[LineaExtracto], List[str]]:
+    """OFX 1.x (SGML, etiquetas sin cerrar) o 2.x (XML). Referencia: REFNUM > CHECKNUM > FITID."""
+    lineas, errores = [], []
+    bloques = re.findall(r'<STMTTRN>(.*?)(?:</STMTTRN>|(?=<STMTTRN>)|</BANKTRANLIST>)', contenido, re.S | re.I)
+    for numero, bloque in enumerate(bloques, start=1):
+        etiquetas = {k.upper(): v.strip() for k, v in re.findall(r'<(\w+)>([^<\r\n]*)', bloque)}
+        try:
+            monto = _parsear_monto(etiquetas.get('TRNAMT', ''))
+            if monto <= 0:
+                continue
+            lineas.append(LineaExtracto(
+                numero_linea=numero,
+                fecha=_parsear_fecha(etiquetas.get('DTPOSTED', '')[:8]),
+                referencia=etiquetas.get('REFNUM') or etiquetas.get('CHECKNUM') or etiquetas.get('FITID', ''),
+                monto=monto,
+                descripcion=etiquetas.get('MEMO') or etiquetas.get('NAME', '')
+            ))
+        except (ValueError, TypeError) as e:
+            errores.append(f"Transacción {numero}: {e}")
+    return lineas, errores
+
+
+def _mapear_columnas(encabezados: List[str]) -> Dict[str, str]:
+    normalizados = {re.sub(r'\s+', '_', (h or '').strip().lower()): h for h in encabezados}
+    return {
+        campo: normalizados[alias]
+        for campo, alias_campo in COLUMNAS_CSV.items()
+        for alias in alias_campo if alias in normalizados
+    }
+
+
+def _parsear_fecha(texto: str) -> date:
+    texto = (texto or '').strip()
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    raise ValueError(f"fecha inválida '{texto}'")
+
+
+def _parsear_monto(texto: str) -> Decimal:
+    limpio = re.sub(r'[^\d,.\-]', '', texto or '')
+    if ',' in limpio and '.' in limpio:
+        # El último separador es el decimal: 1.234,56 / 1,234.56
+        miles = '.' if limpio.rfind(',') > limpio.rfind('.') else ','
+        limpio = limpio.replace(miles, '').replace(',', '.')
+    elif ',' in limpio:
+        limpio = limpio.replace(',', '.')
+    try:
+        return Decimal(limpio).quantize(Decimal('0.01'))
+    except InvalidOperation:
+        raise ValueError(f"monto inválido '{texto}'")
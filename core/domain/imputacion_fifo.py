@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class LineaImputacion:
+    """Porción de un pago aplicada a UNA cuenta por cobrar."""
+    cuenta_id: int
+    monto: Decimal
+    saldo_anterior: Decimal
+    saldo_nuevo: Decimal
+
+    @property
+    def saldada(self) -> bool:
+        return self.saldo_nuevo == Decimal('0.00')
+
+
+def calcular_imputacion_fifo(deudas: Iterable[Tuple[int, Decimal]], monto: Decimal) -> List[LineaImputacion]:
+    """
+    Reparte `monto` sobre las deudas en el orden recibido (la más antigua primero).
+    deudas: [(cuenta_id, saldo_pendiente)] ya ordenadas FIFO.
+    Función pura: no toca la base de datos; el sobrante (si lo hay) es monto - sum(lineas).
+    """
+    lineas = []
+    restante = monto
+    for cuenta_id, saldo in deudas:
+        if restante <= Decimal('0.00'):
+            break
+        if saldo <= Decimal('0.00'):
+            continue
+        aplicado = min(saldo, restante)
+        lineas.append(LineaImputacion(cuenta_id, aplicado, saldo, saldo - aplicado))
+        restante -= aplicado
+    return lineas
@@ -27,6 +27,7 @@ class Lectura:
     # --- METADATOS Y OPCIONALES (Defaults al final) ---
     observacion: Optional[str] = None
     esta_facturada: bool = False
+    referencia_cliente: Optional[str] = None  # UUID de la app offline (idempotencia)
 
     # NOTA DE DISEÑO:
     # Se eliminó la @property 'consumo_calculado'. 
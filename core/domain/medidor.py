@@ -28,4 +28,15 @@ class Medidor:
     estado: str = 'ACTIVO' 
     
     observacion: Optional[str] = None
-    fecha_instalacion: Optional[date] = None
\ No newline at end of file
+    fecha_instalacion: Optional[date] = None
+
+    # Snapshot de la última lectura (None = sin lecturas registradas)
+    ultima_lectura_id: Optional[int] = None
+    ultima_lectura_valor: Optional[float] = None
+    ultima_lectura_fecha: Optional[date] = None
+
+    def lectura_base(self) -> float:
+        """Valor contra el que se valida/calcula la próxima lectura."""
+        if self.ultima_lectura_valor is not None:
+            return self.ultima_lectura_valor
+        return self.lectura_inicial
\ No newline at end of file
@@ -1,6 +1,7 @@
 # core/interfaces/repositories.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any
+from datetime import date, datetime
+from typing import List, Optional, Any, Set, Dict, Tuple, Iterable
 from decimal import Decimal
 from core.domain.factura import Factura
 from core.domain.socio import Socio
@@ -37,6 +38,17 @@ class IFacturaRepository(ABC):
     def guardar(self, factura: Factura) -> Factura:
         """Persiste los cambios de la factura. Retorna la factura guardada (o None)"""
         pass
+
+    @abstractmethod
+    def obtener_servicios_facturados_mes(self, anio: int, mes: int,
+                                         servicio_ids: Optional[Iterable[int]] = None) -> Set[int]:
+        """IDs de servicios ya facturados en el periodo. servicio_ids -> solo entre esos (partición)"""
+        pass
+
+    @abstractmethod
+    def guardar_masivo(self, facturas: List[Factura], batch_size: int = 500) -> List[Factura]:
+        """Crea cabeceras y detalles por lotes (bulk). Asigna el ID generado a cada entidad."""
+        pass
     
     # Alias para compatibilidad con código legacy
     def save(self, factura: Factura) -> Any:
@@ -62,13 +74,18 @@ class IPagoRepository(ABC):
         pass
 
     @abstractmethod
-    def registrar_pagos(self, factura_id: int, pagos: List[dict]) -> None:
+    def registrar_pagos(self, factura_id: int, pagos: List[dict], usuario_id: Optional[int] = None) -> None:
         pass
 
     @abstractmethod
     def obtener_ultimos_pagos(self, socio_id: int, limite: int = 5) -> List[Any]:
         pass
 
+    @abstractmethod
+    def obtener_transferencias_por_validar(self, desde: date, hasta: date) -> List[Any]:
+        """Transferencias web no validadas subidas en el rango: [TransferenciaPendiente]"""
+        pass
+
 class IAuthRepository(ABC):
     @abstractmethod
     def crear_usuario(self, username: str, password: str, email: str = None, rol: Any = None) -> int:
@@ -121,6 +138,21 @@ class ILecturaRepository(ABC):
     def get_latest_by_medidor(self, medidor_id: int) -> Optional[Lectura]:
         pass
 
+    @abstractmethod
+    def get_periodos_registrados(self, medidor_ids: List[int], periodos: Set[Tuple[int, int]]) -> Set[Tuple[int, int, int]]:
+        """(medidor_id, anio, mes) ya registrados para los periodos dados"""
+        pass
+
+    @abstractmethod
+    def bulk_create(self, lecturas: List[Lectura]) -> List[Lectura]:
+        """Inserción por lotes. Asigna el ID generado a cada entidad."""
+        pass
+
+    @abstractmethod
+    def get_ids_por_referencia(self, referencias: Set[str]) -> Dict[str, int]:
+        """Lecturas ya registradas por la app offline. {referencia_cliente: lectura_id}"""
+        pass
+
     @abstractmethod
     def get_by_id(self, lectura_id: int) -> Optional[Lectura]:
         pass
@@ -131,7 +163,20 @@ class ILecturaRepository(ABC):
 
 class IServicioRepository(ABC):
     @abstractmethod
-    def obtener_servicios_fijos_activos(self) -> List[Any]:
+    def obtener_servicios_fijos_activos(self, barrio_id: Optional[int] = None, sin_barrio: bool = False,
+                                        socio_id_desde: Optional[int] = None,
+                                        socio_id_hasta: Optional[int] = None) -> List[Any]:
+        """Filtros opcionales para procesar una partición (barrio o rango de socios)"""
+        pass
+
+    @abstractmethod
+    def listar_barrios_servicios_fijos(self) -> List[Optional[int]]:
+        """IDs de barrio (del socio) con servicios fijos activos. None = socios sin barrio"""
+        pass
+
+    @abstractmethod
+    def listar_socio_ids_servicios_fijos(self) -> List[int]:
+        """IDs de socio (ordenados) con servicios fijos activos"""
         pass
 
     @abstractmethod
@@ -151,6 +196,17 @@ class IMedidorRepository(ABC):
     def get_by_id(self, medidor_id: int) -> Optional[Any]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, medidor_ids: List[int]) -> Dict[int, Any]:
+        """Varios medidores en UNA consulta. {medidor_id: Medidor}"""
+        pass
+
+    @abstractmethod
+    def listar_pagina(self, limite: int, despues_de: Optional[int] = None,
+                      usuario_id: Optional[int] = None) -> List[Any]:
+        """Página keyset por id. usuario_id -> solo los medidores de los terrenos de ese socio."""
+        pass
+
 class ISocioRepository(ABC):
     @abstractmethod
     def get_by_id(self, socio_id: int) -> Optional[Socio]:
@@ -164,6 +220,14 @@ class ISocioRepository(ABC):
     def list_by_barrio(self, barrio_id: int) -> List[Socio]:
         pass
 
+    @abstractmethod
+    def listar_pagina(self, limite: int, despues_de: Optional[List[Any]] = None,
+                      orden: str = 'apellidos', barrio_id: Optional[int] = None,
+                      activo: Optional[bool] = None, rol: Optional[str] = None,
+                      busqueda: Optional[str] = None) -> List[Socio]:
+        """Página keyset filtrada: hasta `limite` socios después de `despues_de` (valores del orden)."""
+        pass
+
 class ITerrenoRepository(ABC):
     @abstractmethod
     def get_by_id(self, terreno_id: int) -> Optional[Any]:
@@ -173,6 +237,17 @@ class ITerrenoRepository(ABC):
     def get_by_socio(self, socio_id: int) -> List[Any]:
         pass
 
+    @abstractmethod
+    def listar_con_medidor(self, limite: int, despues_de: Optional[int] = None,
+                           socio_id: Optional[int] = None, barrio_id: Optional[int] = None) -> List[Tuple[Any, Any]]:
+        """Página keyset por id: [(Terreno, Medidor | None)] en una sola consulta."""
+        pass
+
+    @abstractmethod
+    def obtener_con_medidor(self, terreno_id: int) -> Optional[Tuple[Any, Any]]:
+        """(Terreno, Medidor | None) en una sola consulta; None si el terreno no existe."""
+        pass
+
 try:
     from core.domain.evento import Evento
 except ImportError:
@@ -224,3 +299,233 @@ class IGobernanzaRepository(ABC):
     @abstractmethod
     def marcar_multa_como_facturada(self, asistencia_id: int, factura_id: int) -> None:
         pass
+
+class ICorridaFacturacionRepository(ABC):
+    """
+    Puerto para la bitácora de corridas masivas (reanudables e idempotentes).
+    """
+    @abstractmethod
+    def iniciar_o_reanudar(self, tipo: str, anio: int, mes: int, claves: List[str],
+                           parametros: Optional[dict] = None, usuario_id: Optional[int] = None) -> int:
+        """Crea (o reabre) la corrida del periodo y registra los ítems nuevos. Retorna el ID."""
+        pass
+
+    @abstractmethod
+    def obtener_claves_completadas(self, corrida_id: int) -> Set[str]:
+        """Ítems ya completados (una consulta indexada)"""
+        pass
+
+    @abstractmethod
+    def registrar_checkpoint(self, corrida_id: int, completados: dict, errores: dict) -> None:
+        """completados: {clave: factura_id|None}, errores: {clave: mensaje}"""
+        pass
+
+    @abstractmethod
+    def finalizar(self, corrida_id: int) -> dict:
+        """Cierra la corrida y retorna su resumen"""
+        pass
+
+class ISincronizacionRepository(ABC):
+    """
+    Puerto para la sincronización incremental (delta) de la app de lecturas offline.
+    """
+    @abstractmethod
+    def token_actual(self) -> int:
+        """Último ID de la bitácora de cambios"""
+        pass
+
+    @abstractmethod
+    def token_estable(self) -> int:
+        """Último ID que se puede entregar: ningún cambio con ID menor sigue sin confirmar"""
+        pass
+
+    @abstractmethod
+    def token_minimo_vigente(self) -> int:
+        """Tokens menores a este apuntan a cambios ya purgados (hay que re-descargar la ruta)"""
+        pass
+
+    @abstractmethod
+    def obtener_cambios(self, desde_token: int, barrio_id: Optional[int], limite: int) -> List[Tuple[int, str, int]]:
+        """Cambios posteriores al token, ordenados: [(id, entidad, objeto_id)]"""
+        pass
+
+    @abstractmethod
+    def obtener_medidores(self, barrio_id: Optional[int], ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        """Medidores ACTIVOS dentro del alcance (barrio). ids=None -> todos (sync completo)"""
+        pass
+
+    @abstractmethod
+    def obtener_terrenos(self, barrio_id: Optional[int], ids: Optional[List[int]] = None) -> Dict[int, dict]:
+        """Terrenos dentro del alcance (barrio). ids=None -> todos (sync completo)"""
+        pass
+
+class IAnomaliaLecturaRepository(ABC):
+    """
+    Puerto para la detección de consumos atípicos previa a la facturación.
+    """
+    @abstractmethod
+    def obtener_lecturas_pendientes(self) -> List[Tuple[int, int, int, int, float]]:
+        """Lecturas por facturar: [(lectura_id, medidor_id, anio, mes, consumo_m3)]"""
+        pass
+
+    @abstractmethod
+    def obtener_historial_consumos(self, desde_anio: int, desde_mes: int) -> List[Tuple[int, int, int, float]]:
+        """Consumos ya facturados desde el periodo dado: [(medidor_id, anio, mes, consumo_m3)]"""
+        pass
+
+    @abstractmethod
+    def reemplazar_anomalias(self, lectura_ids: List[int], anomalias: List[Any]) -> int:
+        """Reemplaza las marcas NO revisadas de las lecturas evaluadas. Retorna las marcas creadas
+        (las lecturas con marca ya revisada se conservan y no cuentan)."""
+        pass
+
+class ISaldoSocioRepository(ABC):
+    """
+    Puerto para el libro de saldos por socio (resumen de cartera abierta).
+    """
+    @abstractmethod
+    def recalcular(self, socio_ids: Optional[Iterable[int]] = None) -> int:
+        """Recalcula el resumen de los socios dados (None -> todos). Retorna las filas escritas."""
+        pass
+
+    @abstractmethod
+    def verificar(self, socio_ids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Diferencias entre el libro y un recálculo desde cero: [{socio_id, libro, real}]"""
+        pass
+
+    @abstractmethod
+    def obtener_deuda_total(self, socio_id: int) -> Decimal:
+        pass
+
+    @abstractmethod
+    def socios_en_mora_para_corte(self, hoy: date) -> List[int]:
+        """Socios cuya planilla de corte (N-ésima abierta) ya venció"""
+        pass
+
+    @abstractmethod
+    def resumen_morosidad(self, hoy: date) -> Dict[str, int]:
+        """{'socios_con_deuda', 'socios_en_mora'} en un solo agregado sobre el libro"""
+        pass
+
+class IIdempotenciaRepository(ABC):
+    """
+    Puerto para el almacén durable de claves de idempotencia (Idempotency-Key).
+    """
+    @abstractmethod
+    def reservar(self, alcance: str, clave: str, huella: str, usuario_id: Optional[int] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Reserva atómica al llegar la solicitud. Retorna (resultado, registro):
+        'RESERVADA' (ejecutar; registro = {"version"}), 'EN_PROCESO' (duplicado en vuelo),
+        'COMPLETADA' (reproducir registro) o 'HUELLA_DISTINTA' (misma clave, otro cuerpo).
+        """
+        pass
+
+    @abstractmethod
+    def completar(self, alcance: str, clave: str, status_code: int, respuesta: Any,
+                  version: Any = None) -> bool:
+        """
+        Guarda la respuesta. Con `version` solo si la reserva sigue siendo la nuestra;
+        False -> otro worker la tomó (la transacción de negocio debe revertirse).
+        """
+        pass
+
+    @abstractmethod
+    def liberar(self, alcance: str, clave: str) -> None:
+        """Borra una reserva en proceso (la solicitud falló y puede reintentarse)."""
+        pass
+
+    @abstractmethod
+    def purgar_expirados(self) -> int:
+        pass
+
+class IHechosAnaliticosRepository(ABC):
+    """
+    Puerto para las tablas de hechos pre-agregados (dashboards BI) y su watermark.
+    """
+    @abstractmethod
+    def bloquear_marca(self, proceso: str) -> Optional[datetime]:
+        """Lee y bloquea el watermark del proceso (usar dentro de una transacción)."""
+        pass
+
+    @abstractmethod
+    def obtener_marca(self, proceso: str) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    def guardar_marca(self, proceso: str, marca: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def dias_modificados(self, desde: datetime) -> Dict[str, Set[date]]:
+        """Días con cambios desde el instante dado, por indicador: {indicador: {fechas}}"""
+        pass
+
+    @abstractmethod
+    def recalcular(self, indicador: str, dias: Optional[Iterable[date]] = None) -> int:
+        """Reconstruye los hechos diarios de esos días (None -> todos) y sus meses. Retorna filas escritas."""
+        pass
+
+    @abstractmethod
+    def totales(self, indicador: str, granularidad: str, desde: date, hasta: date,
+                por: Optional[str] = None) -> Any:
+        """Suma de valor/cantidad en [desde, hasta]; con `por` (barrio|rubro|metodo|fecha) retorna una lista."""
+        pass
+
+class ITrabajoReporteRepository(ABC):
+    """
+    Puerto para la cola de reportes pesados (trabajos Celery con resultado persistido).
+    Los trabajos se representan como diccionarios planos (id, tipo, parametros, estado, ...).
+    """
+    @abstractmethod
+    def solicitar(self, tipo: str, parametros: Dict[str, Any], huella: str,
+                  usuario_id: Optional[int] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Retorna (trabajo, creado). Si hay un trabajo activo o un resultado vigente con la
+        misma huella se retorna ese (creado=False); si no, se crea uno PENDIENTE.
+        """
+        pass
+
+    @abstractmethod
+    def obtener(self, trabajo_id: int, con_resultado: bool = False) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def asignar_task_id(self, trabajo_id: int, task_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def iniciar(self, trabajo_id: int) -> bool:
+        """PENDIENTE -> EN_PROCESO de forma atómica. False si otro worker ya lo tomó."""
+        pass
+
+    @abstractmethod
+    def completar(self, trabajo_id: int, resultado: Any, expira_en: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def fallar(self, trabajo_id: int, error: str) -> None:
+        pass
+
+    @abstractmethod
+    def purgar_expirados(self) -> int:
+        pass
+
+
+class ISocioBusquedaRepository(ABC):
+    """
+    Puerto del índice de búsqueda de socios (identificación, palabras normalizadas, trigramas).
+    """
+    @abstractmethod
+    def reindexar(self, socio_ids: Optional[Iterable[int]] = None) -> int:
+        """Recalcula los términos de los socios dados (None -> todos). Retorna los términos escritos."""
+        pass
+
+    @abstractmethod
+    def buscar(self, texto: str, limite: int = 10) -> List[Dict[str, Any]]:
+        """Type-ahead rankeado: identificación exacta/prefijo, palabras por prefijo, aproximada."""
+        pass
+
+    @abstractmethod
+    def ids_coincidentes(self, texto: str) -> Any:
+        """Subconsulta de socio_id (sin aproximada) para filtrar otros listados."""
+        pass
@@ -0,0 +1,21 @@
+# core/management/commands/actualizar_hechos_analiticos.py
+from django.core.management.base import BaseCommand
+
+from core.use_cases.reporting.actualizar_hechos_analiticos_uc import ActualizarHechosAnaliticosUseCase
+from adapters.infrastructure.repositories.django_hechos_analiticos_repository import DjangoHechosAnaliticosRepository
+
+
+class Command(BaseCommand):
+    help = 'Refresca las tablas de hechos de los dashboards (incremental por watermark, o completo con --completo)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--completo', action='store_true',
+                            help='Reconstruye todos los hechos desde cero (tras cargas por SQL o borrados masivos)')
+
+    def handle(self, *args, **options):
+        resultado = ActualizarHechosAnaliticosUseCase(DjangoHechosAnaliticosRepository()).ejecutar(
+            completo=options['completo']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Hechos analíticos ({resultado['modo']}) en {resultado['segundos']}s: {resultado['filas_escritas']}"
+        ))
@@ -0,0 +1,149 @@
+# core/management/commands/construir_cubo_analitico.py
+import statistics
+import time
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from adapters.infrastructure.models import (
+    BarrioModel, SocioModel, TerrenoModel, ServicioModel, MedidorModel, LecturaModel, FacturaModel
+)
+from core.domain.tarifas_el_arbolito import COSTO_M3_EXTRA, LIMITE, TARIFA_FIJA
+from core.services.cubo_analitico_service import CuboOLAP
+from core.shared.enums import EstadoFinanciero
+from core.use_cases.reporting.construir_cubo_analitico_uc import ConstruirCuboAnaliticoUseCase
+
+LOTE_INSERCION = 5000
+
+
+class Command(BaseCommand):
+    help = ('Reconstruye el cubo OLAP de consumo y recaudación (barrio × mes × tipo × tramo). '
+            'Con --benchmark siembra socios × años × 12 facturas en una transacción que se revierte '
+            'y mide la extracción real (SQL), la construcción y las consultas.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--benchmark', action='store_true', help='Siembra datos, mide y revierte (no publica)')
+        parser.add_argument('--socios', type=int, default=10000)
+        parser.add_argument('--anios', type=int, default=5)
+        parser.add_argument('--barrios', type=int, default=40)
+        parser.add_argument('--repeticiones', type=int, default=1000, help='Consultas por escenario')
+
+    def handle(self, *args, **options):
+        if options['benchmark']:
+            return self._benchmark(options)
+        resultado = ConstruirCuboAnaliticoUseCase().ejecutar()
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Cubo analítico en {resultado['segundos']}s: {resultado['filas_origen']} grupos, "
+            f"{resultado['celdas']} celdas, {resultado['meses']} meses (versión {resultado['version']})"
+        ))
+
+    def _benchmark(self, o):
+        with transaction.atomic():
+            inicio = time.perf_counter()
+            facturas = self._sembrar(o)
+            self.stdout.write(f"Sembradas {facturas:,} facturas en {time.perf_counter() - inicio:.1f}s")
+
+            # Mismo camino que la tarea nocturna, salvo la publicación
+            uc = ConstruirCuboAnaliticoUseCase()
+            inicio = time.perf_counter()
+            filas, barrios = uc.extraer()
+            extraccion = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            cubo = uc.construir(filas, barrios)
+            construccion = time.perf_counter() - inicio
+            transaction.set_rollback(True)
+
+        inicio = time.perf_counter()
+        contenido = cubo.a_bytes()
+        serializado = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        cubo = CuboOLAP.desde_bytes(contenido)
+        carga = time.perf_counter() - inicio
+
+        self.stdout.write(f"Extracción (SQL agrupado): {extraccion * 1000:.1f} ms, {len(filas):,} grupos | "
+                          f"construcción: {construccion * 1000:.1f} ms")
+        self.stdout.write(f"Serialización: {serializado * 1000:.1f} ms | carga: {carga * 1000:.1f} ms | "
+                          f"{len(contenido) / 1024:.0f} KiB | celdas: {cubo.datos.size:,}")
+
+        escenarios = {
+            "total general": dict(),
+            "por barrio": dict(por=['barrio']),
+            "MEDIDO por mes (último año)": dict(por=['mes'], filtros={'tipo_servicio': ['MEDIDO']},
+                                               desde=cubo.etiquetas['mes'][-12]),
+            "año × tramo (consumo)": dict(medidas=['consumo_m3'], por=['anio', 'tramo']),
+            "barrio × mes × tipo": dict(por=['barrio', 'mes', 'tipo_servicio']),
+        }
+        for nombre, consulta in escenarios.items():
+            tiempos = []
+            for _ in range(o['repeticiones']):
+                inicio = time.perf_counter()
+                resultado = cubo.consultar(**consulta)
+                tiempos.append(time.perf_counter() - inicio)
+            self.stdout.write(
+                f"  {nombre:<30} mediana {statistics.median(tiempos) * 1e6:9.1f} µs | "
+                f"p95 {sorted(tiempos)[int(len(tiempos) * 0.95)] * 1e6:9.1f} µs | {len(resultado['filas'])} filas"
+            )
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark del cubo analítico completado (datos revertidos)."))
+
+    def _sembrar(self, o) -> int:
+        """Socios con terreno y servicio (70% MEDIDO con medidor), una lectura y una factura por mes."""
+        rng = np.random.default_rng(7)
+        n, meses = o['socios'], o['anios'] * 12
+        sufijo = timezone.now().strftime('%H%M%S')
+
+        barrios = self._insertar(BarrioModel, [
+            BarrioModel(nombre=f"Benchmark {sufijo} #{i}") for i in range(o['barrios'])
+        ])
+        barrio_de = rng.choice(barrios, n)
+        socios = self._insertar(SocioModel, [
+            SocioModel(identificacion=f"B{sufijo}{i:06d}", nombres="Socio", apellidos=f"Benchmark {i}",
+                       barrio_id=int(barrio_de[i])) for i in range(n)
+        ])
+        terrenos = self._insertar(TerrenoModel, [
+            TerrenoModel(socio_id=socio, barrio_id=int(barrio_de[i]), direccion=f"Lote {i}")
+            for i, socio in enumerate(socios)
+        ])
+        medido = rng.random(n) < 0.7
+        servicios = self._insertar(ServicioModel, [
+            ServicioModel(socio_id=socios[i], terreno_id=terrenos[i], tipo='MEDIDO' if medido[i] else 'FIJO')
+            for i in range(n)
+        ])
+        con_medidor = np.flatnonzero(medido)
+        medidores = self._insertar(MedidorModel, [
+            MedidorModel(codigo=f"BENCH-{sufijo}-{i}", terreno_id=terrenos[i]) for i in con_medidor
+        ])
+
+        primer_anio = timezone.localdate().year - o['anios']
+        total = 0
+        for k in range(meses):
+            anio, mes = primer_anio + k // 12, k % 12 + 1
+            consumo = np.zeros(n, dtype=np.int64)
+            consumo[con_medidor] = rng.gamma(4.0, 30.0, len(con_medidor)).round()
+            lecturas = dict(zip(con_medidor.tolist(), self._insertar(LecturaModel, [
+                LecturaModel(medidor_id=medidor, valor=int(consumo[i]), lectura_anterior=0,
+                             consumo_del_mes=int(consumo[i]),
+                             fecha=date(anio, mes, 28), anio=anio, mes=mes)
+                for i, medidor in zip(con_medidor, medidores)
+            ])))
+            pagada = rng.random(n) < 0.85
+            total += len(FacturaModel.objects.bulk_create([
+                FacturaModel(
+                    socio_id=socios[i], servicio_id=servicios[i], lectura_id=lecturas.get(i),
+                    anio=anio, mes=mes, fecha_emision=date(anio, mes, 1), fecha_vencimiento=date(anio, mes, 28),
+                    total=TARIFA_FIJA + max(Decimal(int(consumo[i])) - LIMITE, 0) * COSTO_M3_EXTRA,
+                    estado_financiero=EstadoFinanciero.PAGADA if pagada[i] else EstadoFinanciero.PENDIENTE
+                ) for i in range(n)
+            ], batch_size=LOTE_INSERCION))
+        return total
+
+    @staticmethod
+    def _insertar(modelo, objetos) -> list:
+        """bulk_create + IDs en orden de inserción (MySQL no los devuelve en el INSERT)."""
+        ultimo = modelo.objects.aggregate(maximo=Max('pk'))['maximo'] or 0
+        modelo.objects.bulk_create(objetos, batch_size=LOTE_INSERCION)
+        return list(modelo.objects.filter(pk__gt=ultimo).order_by('pk').values_list('pk', flat=True))
@@ -0,0 +1,12 @@
+# core/management/commands/purgar_idempotencia.py
+from django.core.management.base import BaseCommand
+
+from adapters.infrastructure.repositories.django_idempotencia_repository import DjangoIdempotenciaRepository
+
+
+class Command(BaseCommand):
+    help = 'Elimina las claves de idempotencia vencidas (api_idempotencia). Programar a diario.'
+
+    def handle(self, *args, **options):
+        borradas = DjangoIdempotenciaRepository().purgar_expirados()
+        self.stdout.write(self.style.SUCCESS(f'✅ {borradas} claves de idempotencia vencidas eliminadas.'))
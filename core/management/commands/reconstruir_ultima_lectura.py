@@ -0,0 +1,34 @@
+# core/management/commands/reconstruir_ultima_lectura.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from adapters.infrastructure.models import MedidorModel
+from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el snapshot de última lectura de los medidores desde la tabla de lecturas'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--medidor', type=int, action='append', dest='medidores',
+                            help='ID de medidor a reconstruir (repetible). Por defecto: todos.')
+        parser.add_argument('--tamano-lote', type=int, default=1000,
+                            help='Medidores por transacción (default: 1000)')
+
+    def handle(self, *args, **options):
+        repo = DjangoMedidorRepository()
+        qs = MedidorModel.objects.order_by('id')
+        if options['medidores']:
+            qs = qs.filter(pk__in=options['medidores'])
+
+        ids = list(qs.values_list('id', flat=True))
+        tamano = max(1, options['tamano_lote'])
+        self.stdout.write(self.style.WARNING(f'Reconstruyendo snapshot de {len(ids)} medidores...'))
+
+        total = 0
+        for inicio in range(0, len(ids), tamano):
+            # Lotes cortos: no bloquea la tabla de medidores durante toda la reconstrucción
+            with transaction.atomic():
+                total += repo.refrescar_ultima_lectura(ids[inicio:inicio + tamano])
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Snapshot reconstruido en {total} medidores.'))
@@ -0,0 +1,87 @@
+# core/management/commands/reindexar_busqueda_socios.py
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from adapters.infrastructure.models import SocioModel, TerminoBusquedaSocioModel
+from adapters.infrastructure.repositories.django_busqueda_socio_repository import DjangoBusquedaSocioRepository
+
+NOMBRES = ('María', 'José', 'Luis', 'Ana', 'Carlos', 'Rosa', 'Juan', 'Lucía', 'Pedro', 'Mariana',
+           'Jorge', 'Gloria', 'Andrés', 'Patricia', 'Héctor', 'Verónica', 'Ángel', 'Nube', 'Segundo', 'Fanny')
+APELLIDOS = ('Vaca', 'Pérez', 'Guamán', 'Quishpe', 'Chicaiza', 'Muñoz', 'Álvarez', 'Toapanta', 'Caiza',
+             'Andrade', 'Cevallos', 'Yánez', 'Sánchez', 'Tipán', 'Simbaña', 'Zambrano', 'Ortiz', 'Lema',
+             'Pilataxi', 'Morocho', 'Chiluisa', 'Ushiña', 'Guallichico', 'Ayala', 'Benítez')
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Reconstruye el índice de búsqueda de socios (socios_busqueda). Con --benchmark mide '
+            'el type-ahead sobre socios sintéticos dentro de una transacción que se revierte.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--socio', type=int, action='append', dest='socios',
+                            help='ID de socio a reindexar (repetible). Por defecto: todos.')
+        parser.add_argument('--benchmark', action='store_true')
+        parser.add_argument('--cantidad', type=int, default=50000, help='Socios sintéticos del benchmark')
+        parser.add_argument('--repeticiones', type=int, default=200, help='Consultas por escenario')
+
+    def handle(self, *args, **options):
+        if options['benchmark']:
+            return self._benchmark(options)
+        inicio = time.perf_counter()
+        escritos = DjangoBusquedaSocioRepository().reindexar(options['socios'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Índice de búsqueda actualizado: {escritos} términos nuevos en {time.perf_counter() - inicio:.2f}s "
+            f"({TerminoBusquedaSocioModel.objects.count()} en total)."
+        ))
+
+    def _benchmark(self, o):
+        rng = random.Random(7)
+        repo = DjangoBusquedaSocioRepository()
+        try:
+            with transaction.atomic():
+                base = 9_000_000_000
+                socios = SocioModel.objects.bulk_create([
+                    SocioModel(identificacion=str(base + i), nombres=f"{rng.choice(NOMBRES)} {rng.choice(NOMBRES)}",
+                               apellidos=f"{rng.choice(APELLIDOS)} {rng.choice(APELLIDOS)}")
+                    for i in range(o['cantidad'])
+                ], batch_size=2000)
+                ids = [s.id for s in socios] if socios[0].id else list(
+                    SocioModel.objects.filter(identificacion__gte=str(base)).values_list('id', flat=True))
+
+                inicio = time.perf_counter()
+                escritos = repo.reindexar(ids)
+                self.stdout.write(f"Indexación: {o['cantidad']:,} socios, {escritos:,} términos en "
+                                  f"{time.perf_counter() - inicio:.1f}s")
+
+                muestra = str(base + o['cantidad'] // 2)
+                escenarios = {
+                    "cédula exacta": muestra,
+                    "prefijo de cédula": muestra[:6],
+                    "apellido (prefijo)": "quish",
+                    "nombre + apellido": "maria muno",
+                    "con tildes/mayúsculas": "ÁLVAREZ Ángel",
+                    "typo (aproximada)": "chicayza",
+                }
+                for nombre, texto in escenarios.items():
+                    tiempos, resultado = [], []
+                    for _ in range(o['repeticiones']):
+                        inicio = time.perf_counter()
+                        resultado = repo.buscar(texto, 10)
+                        tiempos.append(time.perf_counter() - inicio)
+                    primero = resultado[0]["coincidencia"] if resultado else '-'
+                    self.stdout.write(
+                        f"  {nombre:<24} mediana {statistics.median(tiempos) * 1000:7.2f} ms | "
+                        f"p95 {sorted(tiempos)[int(len(tiempos) * 0.95)] * 1000:7.2f} ms | "
+                        f"{len(resultado)} resultados ({primero})"
+                    )
+                raise _Rollback()
+        except _Rollback:
+            pass
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark de búsqueda completado (datos revertidos)."))
@@ -12,6 +12,7 @@ from adapters.infrastructure.models import (
     PagoModel, DetallePagoModel
 )
 from core.shared.enums import EstadoFactura, MetodoPagoEnum
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
 
 class Command(BaseCommand):
     help = 'Seeds production DB with a minimal dataset for smoke testing (Idempotent)'
@@ -108,6 +109,7 @@ class Command(BaseCommand):
         )
         # Ensure no pending debt
         CuentaPorCobrarModel.objects.filter(socio=socio).update(saldo_pendiente=0, estado='PAGADA')
+        DjangoSaldoSocioRepository().recalcular([socio.id])
         return socio
 
     def _seed_pago_pendiente(self, socio):
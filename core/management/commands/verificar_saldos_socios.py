@@ -0,0 +1,50 @@
+# core/management/commands/verificar_saldos_socios.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from adapters.infrastructure.models import SocioModel
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
+
+
+class Command(BaseCommand):
+    help = 'Recalcula desde cero el libro de saldos por socio, reporta las diferencias y opcionalmente las corrige'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--socio', type=int, action='append', dest='socios',
+                            help='ID de socio a verificar (repetible). Por defecto: todos.')
+        parser.add_argument('--reparar', action='store_true',
+                            help='Reconstruye las filas con diferencias')
+        parser.add_argument('--tamano-lote', type=int, default=1000,
+                            help='Socios por transacción (default: 1000)')
+
+    def handle(self, *args, **options):
+        repo = DjangoSaldoSocioRepository()
+        qs = SocioModel.objects.order_by('id')
+        if options['socios']:
+            qs = qs.filter(pk__in=options['socios'])
+
+        ids = list(qs.values_list('id', flat=True))
+        tamano = max(1, options['tamano_lote'])
+        self.stdout.write(self.style.WARNING(f'Verificando libro de saldos de {len(ids)} socios...'))
+
+        diferencias = []
+        for inicio in range(0, len(ids), tamano):
+            lote = ids[inicio:inicio + tamano]
+            # Lectura y reparación del lote en la misma transacción
+            with transaction.atomic():
+                encontradas = repo.verificar(lote)
+                if encontradas and options['reparar']:
+                    repo.recalcular([d["socio_id"] for d in encontradas])
+            diferencias += encontradas
+
+        for d in diferencias:
+            self.stdout.write(f'  Socio #{d["socio_id"]}: libro={d["libro"]} real={d["real"]}')
+
+        if not diferencias:
+            self.stdout.write(self.style.SUCCESS('✅ Libro de saldos consistente.'))
+        elif options['reparar']:
+            self.stdout.write(self.style.SUCCESS(f'✅ {len(diferencias)} socios reconstruidos.'))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f'⚠️ {len(diferencias)} socios con diferencias. Ejecute con --reparar para reconstruirlos.'
+            ))
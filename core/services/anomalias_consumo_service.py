@@ -0,0 +1,142 @@
+# core/services/anomalias_consumo_service.py
+import warnings
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from core.shared.enums import TipoAnomaliaLectura
+
+
+@dataclass(frozen=True)
+class AnomaliaConsumo:
+    """Resultado de la detección para UNA lectura marcada."""
+    lectura_id: int
+    medidor_id: int
+    tipo: str
+    consumo_m3: float
+    esperado_m3: float
+    limite_inferior_m3: float
+    limite_superior_m3: float
+    puntaje: float
+    meses_historial: int
+
+
+class DetectorAnomaliasConsumo:
+    """
+    Detección vectorizada de consumos atípicos (digitación, vuelta de medidor, medidor trabado).
+
+    El historial de todos los medidores se carga en una matriz contigua
+    [lectura candidata x periodo] (NaN = mes sin lectura) y las estadísticas
+    robustas se calculan en una sola pasada por columnas:
+    - Mediana y MAD (desviación absoluta mediana) de los últimos `ventana_meses`.
+    - Línea base estacional: mediana del mismo mes calendario en años anteriores
+      (si hay al menos MIN_MESES_ESTACIONAL); si no, la mediana general.
+    - Puntaje z robusto = (consumo - línea base) / (1.4826 * MAD), con piso de dispersión
+      para no marcar todo en consumos muy estables (MAD = 0).
+    """
+    FACTOR_MAD = 1.4826
+    UMBRAL_Z = 3.5
+    VENTANA_MESES = 60
+    MIN_MESES = 6
+    MIN_MESES_ESTACIONAL = 2
+    PISO_DESVIACION_M3 = 2.0
+    PISO_DESVIACION_RELATIVO = 0.10
+
+    def __init__(self, umbral_z: float = UMBRAL_Z, ventana_meses: int = VENTANA_MESES,
+                 min_meses: int = MIN_MESES):
+        self.umbral_z = umbral_z
+        self.ventana_meses = ventana_meses
+        self.min_meses = min_meses
+
+    def detectar(self, historial: Sequence[Tuple[int, int, int, float]],
+                 candidatas: Sequence[Tuple[int, int, int, int, float]]) -> List[AnomaliaConsumo]:
+        """
+        historial:  [(medidor_id, anio, mes, consumo_m3)] de lecturas ya facturadas.
+        candidatas: [(lectura_id, medidor_id, anio, mes, consumo_m3)] por facturar.
+        Cada candidata se compara solo contra meses ANTERIORES a su propio periodo.
+        """
+        if not candidatas:
+            return []
+
+        cand = np.asarray(candidatas, dtype=np.float64)
+        cand_lectura = cand[:, 0].astype(np.int64)
+        cand_medidor = cand[:, 1].astype(np.int64)
+        cand_periodo = (cand[:, 2] * 12 + cand[:, 3] - 1).astype(np.int64)
+        cand_consumo = cand[:, 4]
+
+        # 1. Índice denso de medidores (solo los que tienen lectura por facturar)
+        medidores = np.unique(cand_medidor)
+        fila_cand = np.searchsorted(medidores, cand_medidor)
+
+        # 2. Matriz [medidor x periodo] con el historial dentro de la ventana
+        inicio = int(cand_periodo.min()) - self.ventana_meses
+        n_cols = int(cand_periodo.max()) - inicio
+        matriz = np.full((len(medidores), n_cols), np.nan)
+
+        hist = np.asarray(historial, dtype=np.float64).reshape(-1, 4)
+        if len(hist):
+            h_medidor = hist[:, 0].astype(np.int64)
+            h_col = (hist[:, 1] * 12 + hist[:, 2] - 1).astype(np.int64) - inicio
+            h_fila = np.minimum(np.searchsorted(medidores, h_medidor), len(medidores) - 1)
+            validos = (medidores[h_fila] == h_medidor) & (h_col >= 0) & (h_col < n_cols)
+            matriz[h_fila[validos], h_col[validos]] = hist[validos, 3]
+
+        # 3. Vista por candidata: solo los `ventana_meses` previos a SU periodo
+        valores = matriz[fila_cand]
+        col_periodo = inicio + np.arange(n_cols)
+        desfase = cand_periodo[:, None] - col_periodo[None, :]
+        valores[(desfase <= 0) | (desfase > self.ventana_meses)] = np.nan
+        mismo_mes = (desfase % 12) == 0
+
+        n_historial = np.count_nonzero(~np.isnan(valores), axis=1)
+        estacional_valores = np.where(mismo_mes, valores, np.nan)
+        n_estacional = np.count_nonzero(~np.isnan(estacional_valores), axis=1)
+
+        with warnings.catch_warnings():
+            # Filas sin historial -> "All-NaN slice": quedan en NaN y no se evalúan
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mediana = np.nanmedian(valores, axis=1)
+            mad = np.nanmedian(np.abs(valores - mediana[:, None]), axis=1)
+            estacional = np.nanmedian(estacional_valores, axis=1)
+
+        esperado = np.where(n_estacional >= self.MIN_MESES_ESTACIONAL, estacional, mediana)
+        sigma = np.maximum(
+            np.maximum(self.FACTOR_MAD * mad, self.PISO_DESVIACION_M3),
+            self.PISO_DESVIACION_RELATIVO * np.abs(esperado)
+        )
+        inferior = np.maximum(esperado - self.umbral_z * sigma, 0.0)
+        superior = esperado + self.umbral_z * sigma
+        puntaje = np.clip((cand_consumo - esperado) / sigma, -99999, 99999)
+
+        # 4. Clasificación (por prioridad)
+        con_historial = n_historial >= self.min_meses
+        negativo = cand_consumo < 0
+        estancado = con_historial & (cand_consumo == 0) & (mediana >= self.PISO_DESVIACION_M3)
+        alto = con_historial & (cand_consumo > superior)
+        bajo = con_historial & (cand_consumo < inferior)
+        tipos = np.select(
+            [negativo, estancado, alto, bajo],
+            [TipoAnomaliaLectura.CONSUMO_NEGATIVO.value, TipoAnomaliaLectura.MEDIDOR_ESTANCADO.value,
+             TipoAnomaliaLectura.CONSUMO_ALTO.value, TipoAnomaliaLectura.CONSUMO_BAJO.value],
+            default=''
+        )
+
+        # Solo se materializan las filas marcadas (pocas): el resto nunca sale de NumPy
+        esperado, inferior, superior, puntaje = (
+            np.nan_to_num(a) for a in (esperado, inferior, superior, puntaje)
+        )
+        return [
+            AnomaliaConsumo(
+                lectura_id=int(cand_lectura[i]),
+                medidor_id=int(cand_medidor[i]),
+                tipo=str(tipos[i]),
+                consumo_m3=round(float(cand_consumo[i]), 2),
+                esperado_m3=round(float(esperado[i]), 2),
+                limite_inferior_m3=round(float(inferior[i]), 2),
+                limite_superior_m3=round(float(superior[i]), 2),
+                puntaje=round(float(puntaje[i]), 2),
+                meses_historial=int(n_historial[i])
+            )
+            for i in np.flatnonzero(tipos != '')
+        ]
@@ -0,0 +1,57 @@
+# core/services/busqueda_socios_service.py
+import re
+import unicodedata
+from typing import List, Optional, Set, Tuple
+
+# Tipos de término del índice de búsqueda (socios_busqueda)
+TERMINO_IDENTIFICACION = 'ID'
+TERMINO_PREFIJO_IDENTIFICACION = 'ID_PREFIJO'
+TERMINO_PALABRA = 'PALABRA'
+TERMINO_PREFIJO = 'PREFIJO'
+
+LARGO_TERMINO = 40
+MINIMO_PREFIJO_IDENTIFICACION = 2
+# Similitud de trigramas (Jaccard, como pg_trgm) para aceptar una palabra parecida
+UMBRAL_SIMILITUD = 0.3
+MINIMO_APROXIMADA = 3
+
+_NO_ALFANUMERICO = re.compile(r'[^a-z0-9]+')
+
+
+def normalizar(texto: Optional[str]) -> str:
+    """'  Muñoz-Álvarez ' -> 'munoz alvarez' (sin tildes, minúsculas, solo [a-z0-9] y espacios)."""
+    plano = unicodedata.normalize('NFKD', texto or '')
+    plano = ''.join(c for c in plano if not unicodedata.combining(c)).lower()
+    return _NO_ALFANUMERICO.sub(' ', plano).strip()
+
+
+def palabras(texto: Optional[str]) -> List[str]:
+    return [p[:LARGO_TERMINO] for p in normalizar(texto).split()]
+
+
+def trigramas(palabra: str) -> Set[str]:
+    """Trigramas con relleno al estilo pg_trgm: 'vaca' -> {'$$v', '$va', 'vac', 'aca', 'ca$'}."""
+    relleno = f"$${palabra}$"
+    return {relleno[i:i + 3] for i in range(len(relleno) - 2)}
+
+
+def similitud(comunes: int, a: int, b: int) -> float:
+    """Jaccard entre dos conjuntos de trigramas de tamaños a y b que comparten `comunes`."""
+    return comunes / (a + b - comunes) if a + b - comunes else 0.0
+
+
+def terminos_socio(identificacion: str, nombres: str, apellidos: str) -> Set[Tuple[str, str]]:
+    """
+    Términos indexados de un socio. Los prefijos se guardan explícitos para que toda
+    búsqueda sea una igualdad sobre el índice (sin LIKE, válido en cualquier motor y collation):
+    identificación completa y sus prefijos; cada palabra normalizada de nombres/apellidos
+    y sus prefijos.
+    """
+    identificacion = (identificacion or '').strip()[:LARGO_TERMINO]
+    terminos = {(TERMINO_IDENTIFICACION, identificacion)}
+    terminos.update((TERMINO_PREFIJO_IDENTIFICACION, identificacion[:n])
+                    for n in range(MINIMO_PREFIJO_IDENTIFICACION, len(identificacion)))
+    for palabra in palabras(f"{nombres} {apellidos}"):
+        terminos.add((TERMINO_PALABRA, palabra))
+        terminos.update((TERMINO_PREFIJO, palabra[:n]) for n in range(1, len(palabra)))
+    return {(tipo, termino) for tipo, termino in terminos if termino}
@@ -0,0 +1,224 @@
+# core/services/cubo_analitico_service.py
+import io
+import json
+import threading
+import uuid
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from django.core.cache import cache
+
+# Dimensiones (orden de los ejes) y medidas del cubo
+DIMENSIONES = ('barrio', 'mes', 'tipo_servicio', 'tramo')
+MEDIDAS = ('consumo_m3', 'facturado', 'pagado', 'facturas')
+TIPOS_SERVICIO = ('MEDIDO', 'FIJO', 'OTRO')            # OTRO: facturas sin servicio (POS, multas)
+TRAMOS = ('BASE', 'EXCEDENTE', 'SIN_MEDICION')         # según el límite de la tarifa base (m³)
+SIN_BARRIO = 0
+
+
+class CuboOLAP:
+    """
+    Cubo analítico en memoria: un único arreglo float64 [medida × barrio × mes × tipo × tramo].
+    Cada dimensión se codifica como índice entero (posición en `etiquetas`), así que:
+    - dice  = slice (vista sin copia) o np.take sobre el eje filtrado,
+    - slice = dice con un solo valor,
+    - roll-up = suma sobre los ejes que no se piden (mes -> año con np.add.reduceat).
+    Con ~50 barrios × 60 meses × 3 × 3 son ~27k celdas por medida: la consulta no
+    toca la BD y responde en microsegundos.
+    """
+
+    def __init__(self, datos, barrios: Sequence[int], nombres_barrio: Sequence[str],
+                 meses: Sequence[str], generado_en: str):
+        self.datos = datos
+        self.etiquetas = {
+            'barrio': list(barrios),
+            'mes': list(meses),
+            'tipo_servicio': list(TIPOS_SERVICIO),
+            'tramo': list(TRAMOS),
+        }
+        self.nombres_barrio = dict(zip(barrios, nombres_barrio))
+        self.generado_en = generado_en
+
+    # --- Construcción ---
+    @classmethod
+    def construir(cls, barrios: Dict[int, str], mes_inicial: str, n_meses: int,
+                  codigos, valores, generado_en: str) -> 'CuboOLAP':
+        """
+        `codigos`: enteros [n × 4] = (barrio_id, indice_mes, tipo, tramo)
+        `valores`: [n × len(MEDIDAS)] en el orden de MEDIDAS.
+        Las filas pueden venir ya agrupadas (GROUP BY) o sueltas: se acumulan con bincount.
+        """
+        ids = sorted(set(barrios) | {SIN_BARRIO})
+        forma = (len(ids), max(n_meses, 0), len(TIPOS_SERVICIO), len(TRAMOS))
+        datos = np.zeros((len(MEDIDAS),) + forma, dtype=np.float64)
+
+        codigos = np.asarray(codigos, dtype=np.int64).reshape(-1, len(DIMENSIONES))
+        valores = np.asarray(valores, dtype=np.float64).reshape(-1, len(MEDIDAS))
+        if len(codigos) and n_meses > 0:
+            # barrio_id -> posición (ids desconocidos caen en SIN_BARRIO)
+            ids_arr = np.asarray(ids, dtype=np.int64)
+            pos = np.clip(np.searchsorted(ids_arr, codigos[:, 0]), 0, len(ids) - 1)
+            pos = np.where(ids_arr[pos] == codigos[:, 0], pos, ids.index(SIN_BARRIO))
+            plano = np.ravel_multi_index((pos, codigos[:, 1], codigos[:, 2], codigos[:, 3]), forma)
+            celdas = int(np.prod(forma))
+            for m in range(len(MEDIDAS)):
+                datos[m] = np.bincount(plano, weights=valores[:, m], minlength=celdas).reshape(forma)
+
+        anio, mes = (int(p) for p in mes_inicial.split('-'))
+        meses = [f"{anio + (mes - 1 + i) // 12:04d}-{(mes - 1 + i) % 12 + 1:02d}" for i in range(n_meses)]
+        nombres = [barrios.get(i) or "Sin Barrio" for i in ids]
+        return cls(datos, ids, nombres, meses, generado_en)
+
+    # --- Serialización (.npz en memoria) ---
+    def a_bytes(self) -> bytes:
+        meta = {
+            "barrios": self.etiquetas['barrio'],
+            "nombres_barrio": [self.nombres_barrio[b] for b in self.etiquetas['barrio']],
+            "meses": self.etiquetas['mes'],
+            "generado_en": self.generado_en,
+        }
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, datos=self.datos, meta=np.array(json.dumps(meta)))
+        return buffer.getvalue()
+
+    @classmethod
+    def desde_bytes(cls, contenido: bytes) -> 'CuboOLAP':
+        with np.load(io.BytesIO(contenido), allow_pickle=False) as archivo:
+            meta = json.loads(str(archivo['meta']))
+            return cls(archivo['datos'], meta['barrios'], meta['nombres_barrio'], meta['meses'], meta['generado_en'])
+
+    # --- Consultas ---
+    def consultar(self, medidas: Optional[Sequence[str]] = None, por: Sequence[str] = (),
+                  filtros: Optional[Dict[str, Sequence[Any]]] = None,
+                  desde: Optional[str] = None, hasta: Optional[str] = None) -> Dict[str, Any]:
+        """
+        medidas: subconjunto de MEDIDAS (default todas).
+        por: ejes a conservar (barrio, mes, anio, tipo_servicio, tramo); el resto se suma.
+        filtros: {dimensión: [valores]} (dice); desde/hasta: 'YYYY-MM' inclusive.
+        """
+        medidas = list(medidas or MEDIDAS)
+        if set(medidas) - set(MEDIDAS):
+            raise ValueError(f"Medidas soportadas: {', '.join(MEDIDAS)}")
+        por = list(por)
+        if set(por) - set(DIMENSIONES) - {'anio'} or ('mes' in por and 'anio' in por) or len(set(por)) != len(por):
+            raise ValueError(f"Agrupaciones soportadas: {', '.join(DIMENSIONES)}, anio (anio excluye mes)")
+        filtros = filtros or {}
+        if set(filtros) - set(DIMENSIONES):
+            raise ValueError(f"Filtros soportados: {', '.join(DIMENSIONES)}")
+
+        # Dice: vistas (slices) en los ejes sin filtro, np.take solo en los filtrados
+        sub = self.datos if medidas == list(MEDIDAS) else self.datos.take([MEDIDAS.index(m) for m in medidas], axis=0)
+        etiquetas = {}
+        for eje, dim in enumerate(DIMENSIONES, start=1):
+            valores = self.etiquetas[dim]
+            if dim == 'mes':
+                # Meses ordenados: desde/hasta es un rango contiguo -> slice sin copia
+                inicio = bisect_left(valores, desde) if desde else 0
+                fin = bisect_right(valores, hasta) if hasta else len(valores)
+                sub = sub[(slice(None),) * eje + (slice(inicio, max(inicio, fin)),)]
+                valores = valores[inicio:max(inicio, fin)]
+            if dim in filtros:
+                posiciones = sorted({valores.index(v) for v in filtros[dim] if v in valores})
+                sub = sub.take(posiciones, axis=eje)
+                valores = [valores[p] for p in posiciones]
+            etiquetas[dim] = valores
+        ejes = ['medida', *DIMENSIONES]
+
+        # Roll-up mes -> año: los meses son crecientes, los años quedan contiguos
+        if 'anio' in por:
+            anios = [m[:4] for m in etiquetas['mes']]
+            cortes = [i for i, a in enumerate(anios) if i == 0 or a != anios[i - 1]]
+            eje_mes = ejes.index('mes')
+            sub = np.add.reduceat(sub, cortes, axis=eje_mes) if cortes else sub.take([], axis=eje_mes)
+            ejes[eje_mes] = 'anio'
+            etiquetas['anio'] = [int(anios[i]) for i in cortes]
+
+        sumar = tuple(i for i, eje in enumerate(ejes) if eje != 'medida' and eje not in por)
+        sub = sub.sum(axis=sumar)
+        conservados = [eje for eje in ejes if eje == 'medida' or eje in por]
+        # Orden de salida = orden pedido en `por`
+        sub = np.moveaxis(sub, [conservados.index(e) for e in ['medida', *por]], range(len(por) + 1))
+        planos = sub.reshape(len(medidas), -1)
+
+        filas: List[Dict[str, Any]] = []
+        if por:
+            # Celdas vacías (sin facturas ni consumo) no se devuelven; armado por columnas
+            ocupadas = np.flatnonzero(planos.any(axis=0))
+            coordenadas = np.unravel_index(ocupadas, sub.shape[1:])
+            claves = list(por)
+            columnas = [[etiquetas[dim][c] for c in coord.tolist()] for dim, coord in zip(por, coordenadas)]
+            if 'barrio' in por:
+                claves.append('barrio_nombre')
+                columnas.append([self.nombres_barrio[b] for b in columnas[por.index('barrio')]])
+            claves.extend(medidas)
+            columnas.extend(self._valores(m, planos[k, ocupadas]) for k, m in enumerate(medidas))
+            filas = [dict(zip(claves, fila)) for fila in zip(*columnas)]
+
+        totales = planos.sum(axis=1)
+        return {
+            "generado_en": self.generado_en,
+            "por": por,
+            "filas": filas,
+            "totales": {m: self._valores(m, totales[k:k + 1])[0] for k, m in enumerate(medidas)},
+        }
+
+    @staticmethod
+    def _valores(medida: str, valores) -> List[Any]:
+        return np.rint(valores).astype(np.int64).tolist() if medida == 'facturas' else np.round(valores, 2).tolist()
+
+
+class CuboAnaliticoService:
+    """
+    Publicación del cubo en el backend de cache compartido (Redis, CACHES en
+    config/settings.py): el worker de Celery que lo reconstruye y los procesos web
+    no comparten disco.
+    - publicar: el .npz va a una clave versionada y después se mueve el puntero
+      `actual`; la versión anterior se borra.
+    - obtener: un GET del puntero por consulta. El .npz solo se descarga cuando la
+      versión cambió; el cubo cargado queda en memoria del proceso.
+    """
+    PREFIJO = "cubo_analitico"
+    _cubo: Optional[CuboOLAP] = None
+    _version: Optional[str] = None
+    _candado = threading.Lock()
+
+    @classmethod
+    def clave_actual(cls) -> str:
+        return f"{cls.PREFIJO}:actual"
+
+    @classmethod
+    def clave_datos(cls, version: str) -> str:
+        return f"{cls.PREFIJO}:datos:{version}"
+
+    @classmethod
+    def publicar(cls, cubo: CuboOLAP) -> str:
+        version = uuid.uuid4().hex
+        anterior = cache.get(cls.clave_actual())
+        # Sin TTL: el cubo vigente se sirve hasta que lo reemplace la siguiente reconstrucción
+        cache.set(cls.clave_datos(version), cubo.a_bytes(), None)
+        cache.set(cls.clave_actual(), version, None)
+        if anterior:
+            cache.delete(cls.clave_datos(anterior))
+        return version
+
+    @classmethod
+    def obtener(cls) -> Optional[CuboOLAP]:
+        version = cache.get(cls.clave_actual())
+        if version is None:
+            return None
+        if version != cls._version:
+            with cls._candado:
+                if version != cls._version:
+                    contenido = cache.get(cls.clave_datos(version))
+                    if contenido is None:
+                        # Reemplazado entre los dos GET: se sirve el ya cargado (si hay)
+                        return cls._cubo
+                    cls._cubo, cls._version = CuboOLAP.desde_bytes(contenido), version
+        return cls._cubo
+
+    @classmethod
+    def invalidar(cls) -> None:
+        """Olvida el cubo cargado en este proceso (el publicado sigue en cache)."""
+        with cls._candado:
+            cls._cubo, cls._version = None, None
@@ -0,0 +1,96 @@
+# core/services/estado_cuenta_cache_service.py
+import logging
+from typing import Callable, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from core.domain.dtos import EstadoCuentaDTO
+
+logger = logging.getLogger(__name__)
+
+
+class EstadoCuentaCacheService:
+    """
+    Read model del "Estado de Cuenta 360" (portal del socio).
+    El documento (EstadoCuentaDTO ya armado) vive en el backend de cache:
+    - Lectura: una sola consulta a cache. Si falta (primer acceso, expiró, recién
+      invalidado) se calcula en vivo con ObtenerEstadoCuentaUseCase y se guarda.
+    - Invalidación por eventos: facturas, pagos, servicios, terrenos o datos del socio
+      que cambian borran el documento AL CONFIRMAR la transacción y encolan su
+      reconstrucción asíncrona (una tarea por transacción, socios ya encolados se omiten).
+    - TTL como red de seguridad ante escrituras que no pasan por signals.
+    El backend debe ser compartido (Redis, CACHES en config/settings.py): el worker de
+    Celery publica los documentos y cualquier worker de Gunicorn los lee o invalida.
+    """
+    PREFIJO = "estado_cuenta_360"
+    TTL = 60 * 60 * 24
+    TTL_PENDIENTE = 60 * 5
+
+    def __init__(self, calculador: Optional[Callable[[int], EstadoCuentaDTO]] = None):
+        self._calculador = calculador
+
+    def clave(self, socio_id: int) -> str:
+        return f"{self.PREFIJO}:{socio_id}"
+
+    def clave_pendiente(self, socio_id: int) -> str:
+        return f"{self.PREFIJO}:pendiente:{socio_id}"
+
+    def obtener(self, socio_id: int) -> EstadoCuentaDTO:
+        documento = cache.get(self.clave(socio_id))
+        if documento is None:
+            documento = self.calcular(socio_id)
+            cache.set(self.clave(socio_id), documento, self.TTL)
+        return documento
+
+    def calcular(self, socio_id: int) -> EstadoCuentaDTO:
+        """Cálculo en vivo (sin cache). Lanza ValueError si el socio no existe."""
+        return (self._calculador or self._calculador_por_defecto())(socio_id)
+
+    def reconstruir(self, socio_ids: Iterable[int]) -> int:
+        """Recalcula y publica los documentos. Socios inexistentes solo se eliminan del cache."""
+        socio_ids = sorted(set(socio_ids))
+        # Se libera la marca ANTES de calcular: un cambio durante el cálculo vuelve a encolar
+        cache.delete_many([self.clave_pendiente(i) for i in socio_ids])
+        documentos = {}
+        for socio_id in socio_ids:
+            try:
+                documentos[self.clave(socio_id)] = self.calcular(socio_id)
+            except ValueError:
+                cache.delete(self.clave(socio_id))
+        cache.set_many(documentos, self.TTL)
+        return len(documentos)
+
+    def invalidar(self, socio_ids: Iterable[int]) -> None:
+        socio_ids = {i for i in socio_ids if i is not None}
+        if socio_ids:
+            transaction.on_commit(lambda: self._invalidar_confirmado(socio_ids))
+
+    # --- Internos ---
+    def _invalidar_confirmado(self, socio_ids: set) -> None:
+        cache.delete_many([self.clave(i) for i in socio_ids])
+        por_encolar = [i for i in sorted(socio_ids) if cache.add(self.clave_pendiente(i), 1, self.TTL_PENDIENTE)]
+        if not por_encolar:
+            return
+        from core.tasks.estado_cuenta_task import reconstruir_estados_cuenta_task
+        try:
+            reconstruir_estados_cuenta_task.delay(por_encolar)
+        except Exception as e:
+            # Sin broker el documento se reconstruye en la próxima lectura (cache miss)
+            cache.delete_many([self.clave_pendiente(i) for i in por_encolar])
+            logger.warning(f"No se pudo encolar la reconstrucción del estado de cuenta: {e}")
+
+    @staticmethod
+    def _calculador_por_defecto() -> Callable[[int], EstadoCuentaDTO]:
+        # Import diferido: los repositorios importan este servicio para invalidar
+        from core.use_cases.socio.obtener_estado_cuenta_use_case import ObtenerEstadoCuentaUseCase
+        from adapters.infrastructure.repositories.django_socio_repository import DjangoSocioRepository
+        from adapters.infrastructure.repositories.django_terreno_repository import DjangoTerrenoRepository
+        from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+        from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+        from adapters.infrastructure.repositories.django_servicio_repository import DjangoServicioRepository
+
+        return ObtenerEstadoCuentaUseCase(
+            DjangoSocioRepository(), DjangoTerrenoRepository(), DjangoFacturaRepository(),
+            DjangoPagoRepository(), DjangoServicioRepository()
+        ).execute
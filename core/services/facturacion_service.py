@@ -71,6 +71,20 @@ class FacturacionService:
             "total_pagar": float(factura_temp.total)
         }
         
+    @staticmethod
+    def _serializar_anomalia(lectura):
+        # Relación inversa OneToOne: hasattr es False si la lectura no tiene marca
+        if not hasattr(lectura, 'anomalia'):
+            return None
+        anomalia = lectura.anomalia
+        return {
+            "tipo": anomalia.tipo,
+            "esperado_m3": float(anomalia.esperado_m3),
+            "rango_m3": [float(anomalia.limite_inferior_m3), float(anomalia.limite_superior_m3)],
+            "puntaje": float(anomalia.puntaje),
+            "revisada": anomalia.revisada
+        }
+
     @staticmethod
     def calcular_pre_emision_masiva():
         """
@@ -81,7 +95,7 @@ class FacturacionService:
 
         try:
             # Solo buscamos lecturas que AÚN NO hayan sido facturadas
-            lecturas = LecturaModel.objects.filter(esta_facturada=False).select_related('medidor', 'medidor__terreno', 'medidor__terreno__socio').all()
+            lecturas = LecturaModel.objects.filter(esta_facturada=False).select_related('medidor', 'medidor__terreno', 'medidor__terreno__socio', 'anomalia').all()
         except Exception:
             return []
 
@@ -118,7 +132,9 @@ class FacturacionService:
                 "consumo_m3": float(consumo),
                 "valor_agua": round(float(valor_agua), 2),
                 "multas": 0.00,       
-                "subtotal": round(float(valor_agua), 2)
+                "subtotal": round(float(valor_agua), 2),
+                # Marca del job de detección de anomalías (None = lectura normal o no evaluada)
+                "anomalia": FacturacionService._serializar_anomalia(lectura)
             }
             datos_pendientes.append(item)
 
@@ -157,80 +173,137 @@ class FacturacionService:
                     "consumo_m3": 0.0,
                     "valor_agua": float(TARIFA_FIJA),
                     "multas": 0.00,
-                    "subtotal": float(TARIFA_FIJA)
+                    "subtotal": float(TARIFA_FIJA),
+                    "anomalia": None
                 })
         except Exception as e:
             print(f"Error cargando servicios fijos: {e}")
 
         return datos_pendientes
 
-    def ejecutar_emision_masiva(self, lista_facturas: list) -> Dict:
+    def ejecutar_emision_masiva(self, lista_facturas: list, corrida_repo=None,
+                                usuario_id: int = None, tamano_lote: int = 100) -> Dict:
         """
-        Toma los datos confirmados del Frontend y crea las Facturas en MySQL de forma Atómica.
+        Toma los datos confirmados del Frontend y crea las Facturas en MySQL.
+
+        Reanudable e idempotente: cada ítem queda registrado en la bitácora de la corrida
+        del periodo (CorridaFacturacionModel). Cada lote se confirma junto con su checkpoint,
+        así que si el proceso muere a mitad de camino, re-ejecutar el mismo periodo
+        solo procesa los ítems que no quedaron COMPLETADOS.
         """
-        from django.db import transaction
+        from django.db import transaction, IntegrityError, OperationalError, InterfaceError
         from django.utils import timezone
         import uuid
-        from adapters.infrastructure.models import FacturaModel, LecturaModel
+        from adapters.infrastructure.models import FacturaModel, LecturaModel, CorridaFacturacionModel
 
         if not lista_facturas or not isinstance(lista_facturas, list):
             raise ValueError("No hay datos válidos para la emisión masiva")
 
+        if corrida_repo is None:
+            from adapters.infrastructure.repositories.django_corrida_facturacion_repository import (
+                DjangoCorridaFacturacionRepository
+            )
+            corrida_repo = DjangoCorridaFacturacionRepository()
+
         facturas_creadas = 0
         ahora = timezone.now()
         vencimiento = ahora + timezone.timedelta(days=15)
 
-        with transaction.atomic():
-            for item in lista_facturas:
-                id_lectura_db = item.get('lectura_real_id')
+        # 1. Bitácora: abrir (o reanudar) la corrida del periodo
+        items = {self._clave_item(item): item for item in lista_facturas}
+        corrida_id = corrida_repo.iniciar_o_reanudar(
+            tipo=CorridaFacturacionModel.TIPO_EMISION_MASIVA,
+            anio=ahora.year,
+            mes=ahora.month,
+            claves=list(items),
+            parametros={"items_recibidos": len(lista_facturas)},
+            usuario_id=usuario_id
+        )
+
+        # 2. Saltar lo ya completado (una sola consulta indexada)
+        completadas = corrida_repo.obtener_claves_completadas(corrida_id)
+        pendientes = [(clave, item) for clave, item in items.items() if clave not in completadas]
 
-                from django.db import IntegrityError
+        # 3. Procesar por lotes: facturas + checkpoint en la MISMA transacción
+        for inicio in range(0, len(pendientes), tamano_lote):
+            lote = pendientes[inicio:inicio + tamano_lote]
+            completados_lote, errores_lote = {}, {}
 
+            with transaction.atomic():
                 # --- NUEVA VALIDACIÓN PARA SERVICIOS FIJOS (Sin medidor) ---
-                if not id_lectura_db:
-                    ya_facturado = FacturaModel.objects.filter(
-                        socio_id=item.get('socio_id'),
+                # Socios del lote con acometida ya facturada este mes: una consulta por lote
+                fijos_facturados = set(
+                    FacturaModel.objects.filter(
+                        socio_id__in={item.get('socio_id') for _, item in lote if not item.get('lectura_real_id')},
                         lectura_id__isnull=True,
                         anio=ahora.year,
                         mes=ahora.month
-                    ).exists()
-                    
-                    if ya_facturado:
-                        # Ya se le cobró la Acometida este mes, saltamos al siguiente
-                        continue
-
-                try:
-                    # Crear la Factura cabecera
-                    FacturaModel.objects.create(
-                        socio_id=item.get('socio_id'),
-                        lectura_id=id_lectura_db, # ID numérico (o None para tarifa fija)
-                        medidor_id=item.get('medidor_id'),
-                        subtotal=item.get('subtotal', 0),
-                        total=item.get('subtotal', 0),
-                        impuestos=0.0,
-                        estado_financiero='PENDIENTE',
-                        fecha_emision=ahora.date(),
-                        fecha_registro=ahora,
-                        fecha_vencimiento=vencimiento.date(),
-                        anio=ahora.year,
-                        mes=ahora.month,
-                        sri_ambiente=1,
-                        sri_tipo_emision=1,
-                        clave_acceso_sri=f"TEMP-{uuid.uuid4().hex[:10]}", # Temporal, luego se firma
-                        estado_sri='NO_ENVIADA'
-                    )
+                    ).values_list('socio_id', flat=True)
+                )
 
-                    # Marcar lectura como facturada para no duplicar cobros
-                    if id_lectura_db:
-                        LecturaModel.objects.filter(id=id_lectura_db).update(esta_facturada=True)
+                for clave, item in lote:
+                    id_lectura_db = item.get('lectura_real_id')
 
-                    facturas_creadas += 1
+                    if not id_lectura_db:
+                        if item.get('socio_id') in fijos_facturados:
+                            # Ya se le cobró la Acometida este mes, saltamos al siguiente
+                            completados_lote[clave] = None
+                            continue
 
-                except IntegrityError:
-                    # Si la factura ya existe (Duplicado de lectura_id), la ignoramos y pasamos a la siguiente
-                    continue
+                    try:
+                        # Savepoint por ítem: un duplicado no invalida el resto del lote
+                        with transaction.atomic():
+                            # Crear la Factura cabecera
+                            factura = FacturaModel.objects.create(
+                                socio_id=item.get('socio_id'),
+                                lectura_id=id_lectura_db, # ID numérico (o None para tarifa fija)
+                                medidor_id=item.get('medidor_id'),
+                                subtotal=item.get('subtotal', 0),
+                                total=item.get('subtotal', 0),
+                                impuestos=0.0,
+                                estado_financiero='PENDIENTE',
+                                fecha_emision=ahora.date(),
+                                fecha_registro=ahora,
+                                fecha_vencimiento=vencimiento.date(),
+                                anio=ahora.year,
+                                mes=ahora.month,
+                                sri_ambiente=1,
+                                sri_tipo_emision=1,
+                                clave_acceso_sri=f"TEMP-{uuid.uuid4().hex[:10]}", # Temporal, luego se firma
+                                estado_sri='NO_ENVIADA'
+                            )
+
+                            # Marcar lectura como facturada para no duplicar cobros
+                            if id_lectura_db:
+                                LecturaModel.objects.filter(id=id_lectura_db).update(esta_facturada=True)
+
+                        completados_lote[clave] = factura.id
+                        facturas_creadas += 1
+
+                    except IntegrityError:
+                        # Si la factura ya existe (Duplicado de lectura_id), el ítem ya está cubierto
+                        completados_lote[clave] = None
+                    except (OperationalError, InterfaceError):
+                        # Caída de BD: abortamos el lote; la corrida se reanuda desde el último checkpoint
+                        raise
+                    except Exception as e:
+                        errores_lote[clave] = str(e)
+
+                corrida_repo.registrar_checkpoint(corrida_id, completados_lote, errores_lote)
+
+        resumen = corrida_repo.finalizar(corrida_id)
 
         return {
-            "estado": "COMPLETADA",
-            "cantidad": facturas_creadas
-        }
\ No newline at end of file
+            "estado": resumen["estado"],
+            "cantidad": facturas_creadas,
+            "omitidas": len(completadas),
+            "corrida_id": corrida_id,
+            "errores": resumen["con_error"]
+        }
+
+    @staticmethod
+    def _clave_item(item: dict) -> str:
+        """Identificador estable del ítem dentro de la corrida (lectura o servicio fijo del socio)."""
+        if item.get('lectura_real_id'):
+            return f"LECTURA:{item['lectura_real_id']}"
+        return f"FIJO:{item.get('socio_id')}"
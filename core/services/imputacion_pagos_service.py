@@ -0,0 +1,128 @@
+# core/services/imputacion_pagos_service.py
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List
+
+from django.db import transaction
+from django.db.models import F, Sum, Window
+from simple_history.utils import bulk_update_with_history
+
+from core.domain.imputacion_fifo import LineaImputacion, calcular_imputacion_fifo
+from core.shared.enums import EstadoCuentaPorCobrar, EstadoFactura
+from adapters.infrastructure.models import (
+    SocioModel,
+    CuentaPorCobrarModel,
+    FacturaModel,
+    ImputacionPagoModel
+)
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
+
+
+@dataclass
+class ResultadoImputacion:
+    lineas: List[LineaImputacion] = field(default_factory=list)
+    monto_aplicado: Decimal = Decimal('0.00')
+    sobrante: Decimal = Decimal('0.00')
+    facturas_pagadas: List[int] = field(default_factory=list)
+
+    @property
+    def cuentas_afectadas(self) -> int:
+        return len(self.lineas)
+
+
+class ImputacionPagosService:
+    """
+    Motor ÚNICO de imputación FIFO de pagos a cuentas por cobrar
+    (Caja: ProcesarAbonoUseCase / Tesorería: validar_transferencia).
+
+    El número de consultas y de filas bloqueadas depende de las cuentas que el pago
+    alcanza a cubrir, no del total de deudas del socio:
+    1. Bloqueo del socio: serializa cobros concurrentes del mismo socio.
+    2. Prefijo FIFO: SUM() OVER (ORDER BY fecha_emision, id) selecciona solo las cuentas
+       que el monto cubre; únicamente esas se bloquean (SELECT ... FOR UPDATE).
+    3. Reparto en memoria (función pura) + bulk_update de saldos, bulk_create de la
+       imputación (pago -> deuda) y cierre de las facturas que quedaron saldadas.
+    4. Libro de saldos del socio recalculado en la misma transacción (bulk_update no emite signals).
+    """
+    ORDEN_FIFO = ('fecha_emision', 'id')
+
+    def __init__(self, saldo_repo=None):
+        self.saldo_repo = saldo_repo or DjangoSaldoSocioRepository()
+
+    def deuda_pendiente(self, socio_id: int) -> Decimal:
+        # Lectura por PK en el libro de saldos (socios_saldos)
+        return self.saldo_repo.obtener_deuda_total(socio_id)
+
+    @transaction.atomic
+    def imputar(self, pago_id: int, socio_id: int, monto: Decimal) -> ResultadoImputacion:
+        list(SocioModel.objects.select_for_update().filter(pk=socio_id).values_list('id', flat=True))
+
+        # FOR UPDATE no admite funciones de ventana: primero se calcula el prefijo, luego se bloquea
+        prefijo_ids = list(
+            CuentaPorCobrarModel.objects.filter(socio_id=socio_id, saldo_pendiente__gt=Decimal('0.00'))
+            .annotate(acumulado_previo=Window(
+                expression=Sum('saldo_pendiente'),
+                order_by=[F(campo).asc() for campo in self.ORDEN_FIFO]
+            ) - F('saldo_pendiente'))
+            .filter(acumulado_previo__lt=monto)
+            .values_list('id', flat=True)
+        )
+        if not prefijo_ids:
+            return ResultadoImputacion(sobrante=monto)
+
+        cuentas = list(
+            CuentaPorCobrarModel.objects.select_for_update()
+            .filter(pk__in=prefijo_ids, saldo_pendiente__gt=Decimal('0.00'))
+            .order_by(*self.ORDEN_FIFO)
+        )
+        lineas = calcular_imputacion_fifo([(c.id, c.saldo_pendiente) for c in cuentas], monto)
+        por_id = {c.id: c for c in cuentas}
+
+        afectadas = []
+        for linea in lineas:
+            cuenta = por_id[linea.cuenta_id]
+            cuenta.saldo_pendiente = linea.saldo_nuevo
+            if linea.saldada:
+                cuenta.estado = EstadoCuentaPorCobrar.PAGADA.value
+            afectadas.append(cuenta)
+
+        bulk_update_with_history(afectadas, CuentaPorCobrarModel, ['saldo_pendiente', 'estado'], batch_size=500)
+        ImputacionPagoModel.objects.bulk_create([
+            ImputacionPagoModel(
+                pago_id=pago_id,
+                cuenta_id=linea.cuenta_id,
+                factura_id=por_id[linea.cuenta_id].factura_id,
+                monto=linea.monto,
+                saldo_anterior=linea.saldo_anterior
+            )
+            for linea in lineas
+        ], batch_size=500)
+        self.saldo_repo.recalcular([socio_id])
+
+        aplicado = sum((linea.monto for linea in lineas), Decimal('0.00'))
+        return ResultadoImputacion(
+            lineas=lineas,
+            monto_aplicado=aplicado,
+            sobrante=monto - aplicado,
+            facturas_pagadas=self._cerrar_facturas_saldadas(
+                {por_id[l.cuenta_id].factura_id for l in lineas if l.saldada and por_id[l.cuenta_id].factura_id}
+            )
+        )
+
+    def _cerrar_facturas_saldadas(self, factura_ids: set) -> List[int]:
+        """Marca PAGADA la factura solo si ya no le quedan cuentas abiertas (puede tener varios rubros)."""
+        if not factura_ids:
+            return []
+        con_saldo = set(
+            CuentaPorCobrarModel.objects.filter(factura_id__in=factura_ids, saldo_pendiente__gt=Decimal('0.00'))
+            .values_list('factura_id', flat=True)
+        )
+        facturas = list(
+            FacturaModel.objects.filter(pk__in=factura_ids - con_saldo)
+            .exclude(estado_financiero=EstadoFactura.PAGADA.value)
+        )
+        for factura in facturas:
+            factura.estado_financiero = EstadoFactura.PAGADA.value
+        if facturas:
+            bulk_update_with_history(facturas, FacturaModel, ['estado_financiero'], batch_size=500)
+        return [f.id for f in facturas]
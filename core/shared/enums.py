@@ -94,4 +94,31 @@ class EstadoSRI(models.TextChoices):
     AUTORIZADA = 'AUTORIZADA', 'Autorizada'
     DEVUELTA = 'DEVUELTA', 'Devuelta'
     RECHAZADA = 'RECHAZADA', 'Rechazada'
-    ERROR = 'ERROR', 'Error'
\ No newline at end of file
+    ERROR = 'ERROR', 'Error'
+
+
+class EstadoCorridaFacturacion(models.TextChoices):
+    EN_CURSO = 'EN_CURSO', 'En Curso'
+    COMPLETADA = 'COMPLETADA', 'Completada'
+    COMPLETADA_CON_ERRORES = 'COMPLETADA_CON_ERRORES', 'Completada con Errores'
+
+class EstadoItemCorrida(models.TextChoices):
+    PENDIENTE = 'PENDIENTE', 'Pendiente'
+    COMPLETADO = 'COMPLETADO', 'Completado'
+    ERROR = 'ERROR', 'Error'
+
+class TipoAnomaliaLectura(models.TextChoices):
+    CONSUMO_ALTO = 'CONSUMO_ALTO', 'Consumo Alto'
+    CONSUMO_BAJO = 'CONSUMO_BAJO', 'Consumo Bajo'
+    MEDIDOR_ESTANCADO = 'MEDIDOR_ESTANCADO', 'Medidor Estancado (Consumo 0)'
+    CONSUMO_NEGATIVO = 'CONSUMO_NEGATIVO', 'Consumo Negativo (Vuelta / Digitación)'
+
+class IndicadorAnalitico(models.TextChoices):
+    FACTURADO_RUBRO = 'FACTURADO_RUBRO', 'Facturado por Rubro (subtotal)'
+    FACTURAS = 'FACTURAS', 'Facturas Emitidas (total)'
+    RECAUDADO = 'RECAUDADO', 'Recaudado por Método de Pago'
+    CONSUMO_M3 = 'CONSUMO_M3', 'Consumo de Agua (m3)'
+
+class GranularidadHecho(models.TextChoices):
+    DIA = 'DIA', 'Diario'
+    MES = 'MES', 'Mensual'
@@ -69,4 +69,18 @@ class ValidacionError(BusinessRuleException):
 
 class MedidorDuplicadoError(BusinessRuleException):
     """[NUEVO] Cuando se intenta registrar un código de medidor que ya existe."""
+    pass
+
+class TokenSincronizacionExpiradoError(BusinessRuleException):
+    """El token es anterior a la retención de la bitácora: el cliente debe re-descargar la ruta."""
+    pass
+
+
+# --- Errores de Infraestructura (no son de negocio: se reintentan) ---
+
+class PersistenciaTransitoriaError(Exception):
+    """
+    Caída de conexión, deadlock o timeout de la BD. Los repositorios la lanzan en lugar
+    del error del driver para que los casos de uso no la confundan con un error por fila.
+    """
     pass
\ No newline at end of file
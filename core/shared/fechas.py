@@ -0,0 +1,19 @@
+# core/shared/fechas.py
+from datetime import date, datetime, time, timedelta
+from typing import Tuple
+from zoneinfo import ZoneInfo
+
+# La caja cierra a medianoche de Ecuador, sin importar la zona del servidor o de la BD
+ZONA_CAJA = ZoneInfo("America/Guayaquil")
+
+
+def rango_dias_locales(fecha_inicio: date, fecha_fin: date) -> Tuple[datetime, datetime]:
+    """
+    Días locales [fecha_inicio, fecha_fin] -> datetimes aware semiabiertos [inicio, fin).
+    Filtrar `campo__gte=inicio, campo__lt=fin` usa el índice de la columna; `campo__date`
+    aplica una función a la columna y lo anula.
+    """
+    return (
+        datetime.combine(fecha_inicio, time.min, tzinfo=ZONA_CAJA),
+        datetime.combine(fecha_fin + timedelta(days=1), time.min, tzinfo=ZONA_CAJA),
+    )
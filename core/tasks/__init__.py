@@ -0,0 +1,10 @@
+# core/tasks/__init__.py
+# Importamos los módulos para que `app.autodiscover_tasks()` registre las tareas en el worker
+from . import procesar_cortes_task  # noqa: F401
+from . import facturacion_paralela_task  # noqa: F401
+from . import anomalias_lecturas_task  # noqa: F401
+from . import estado_cuenta_task  # noqa: F401
+from . import hechos_analiticos_task  # noqa: F401
+from . import reportes_task  # noqa: F401
+from . import cubo_analitico_task  # noqa: F401
+from . import sincronizacion_task  # noqa: F401
@@ -0,0 +1,24 @@
+# core/tasks/anomalias_lecturas_task.py
+from celery import shared_task
+import logging
+
+from core.use_cases.detectar_anomalias_lecturas_uc import DetectarAnomaliasLecturasUseCase
+from adapters.infrastructure.repositories.django_anomalia_lectura_repository import DjangoAnomaliaLecturaRepository
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="detectar_anomalias_lecturas")
+def detectar_anomalias_lecturas_task():
+    """
+    Marca los consumos atípicos de las lecturas por facturar.
+    Programada cada hora en CELERY_BEAT_SCHEDULE (config/settings.py), así las marcas
+    están al día cuando se abre Pre-Emisión; también se dispara desde la API.
+    """
+    logger.info("Iniciando detección de anomalías de lecturas...")
+    resultado = DetectarAnomaliasLecturasUseCase(DjangoAnomaliaLecturaRepository()).ejecutar()
+    logger.info(
+        f"Detección completada: {resultado['evaluadas']} lecturas evaluadas, "
+        f"{resultado['marcadas']} marcadas en {resultado['segundos']}s."
+    )
+    return resultado
@@ -0,0 +1,21 @@
+# core/tasks/cubo_analitico_task.py
+from celery import shared_task
+import logging
+
+from core.use_cases.reporting.construir_cubo_analitico_uc import ConstruirCuboAnaliticoUseCase
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="construir_cubo_analitico")
+def construir_cubo_analitico_task():
+    """
+    Reconstruye el cubo OLAP (barrio × mes × tipo de servicio × tramo) y lo publica en el cache.
+    Programada cada noche en CELERY_BEAT_SCHEDULE (config/settings.py).
+    """
+    resultado = ConstruirCuboAnaliticoUseCase().ejecutar()
+    logger.info(
+        f"Cubo analítico: {resultado['filas_origen']} grupos -> {resultado['celdas']} celdas "
+        f"({resultado['meses']} meses) en {resultado['segundos']}s."
+    )
+    return resultado
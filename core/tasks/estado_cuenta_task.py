@@ -0,0 +1,18 @@
+# core/tasks/estado_cuenta_task.py
+from celery import shared_task
+import logging
+
+from core.services.estado_cuenta_cache_service import EstadoCuentaCacheService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="reconstruir_estados_cuenta")
+def reconstruir_estados_cuenta_task(socio_ids):
+    """
+    Recalcula el documento cacheado "Estado de Cuenta 360" de los socios dados.
+    Se encola al confirmar cambios en facturas, pagos o servicios (ver EstadoCuentaCacheService).
+    """
+    publicados = EstadoCuentaCacheService().reconstruir(socio_ids)
+    logger.info(f"Estado de cuenta reconstruido para {publicados} de {len(socio_ids)} socios.")
+    return publicados
@@ -0,0 +1,82 @@
+# core/tasks/facturacion_paralela_task.py
+from datetime import date
+import logging
+
+from celery import shared_task, chord
+from django.db import OperationalError, InterfaceError
+
+from core.shared.exceptions import PersistenciaTransitoriaError
+from core.use_cases.generar_factura_fija_uc import GenerarFacturaFijaUseCase, ESTRATEGIA_BARRIO
+from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+from adapters.infrastructure.repositories.django_servicio_repository import DjangoServicioRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _build_use_case() -> GenerarFacturaFijaUseCase:
+    return GenerarFacturaFijaUseCase(DjangoFacturaRepository(), DjangoServicioRepository())
+
+
+@shared_task(name="facturacion_fija_particion", bind=True, max_retries=3)
+def facturar_particion_task(self, anio: int, mes: int, fecha_emision: str, particion: dict):
+    """
+    Factura UNA partición (barrio o rango de socios) usando el modo bulk.
+    Es idempotente: al reintentar, los servicios ya facturados se omiten.
+    Errores transitorios de BD -> reintento de la partición (no de toda la corrida).
+    """
+    try:
+        reporte = _build_use_case().ejecutar_masivo(
+            anio=anio, mes=mes, fecha_emision=date.fromisoformat(fecha_emision), **particion
+        )
+    except (OperationalError, InterfaceError, PersistenciaTransitoriaError) as exc:
+        if self.request.retries < self.max_retries:
+            logger.warning(f"⚠️ Partición {particion} falló ({exc}). Reintento {self.request.retries + 1}...")
+            raise self.retry(exc=exc, countdown=10 * (2 ** self.request.retries))
+
+        # Reintentos agotados: devolvemos un reporte de fallo para no romper el chord
+        logger.error(f"❌ Partición {particion} agotó reintentos: {exc}")
+        reporte = {
+            "periodo_fiscal": f"{anio}-{mes}",
+            "fecha_emision": fecha_emision,
+            "total_servicios": 0, "creadas": 0, "omitidas": 0,
+            "errores": [f"Partición {particion}: {exc}"],
+            "fallida": True
+        }
+
+    reporte["particion"] = particion
+    return reporte
+
+
+@shared_task(name="facturacion_fija_consolidar")
+def consolidar_facturacion_task(reportes: list):
+    """Callback del chord: un único reporte para toda la corrida."""
+    consolidado = GenerarFacturaFijaUseCase.consolidar_reportes(reportes)
+    logger.info(
+        f"✅ Facturación paralela {consolidado['periodo_fiscal']}: "
+        f"{consolidado['creadas']} creadas, {consolidado['omitidas']} omitidas, "
+        f"{len(consolidado['errores'])} errores en {consolidado['particiones']} particiones."
+    )
+    return consolidado
+
+
+@shared_task(name="facturacion_fija_orquestador")
+def orquestar_facturacion_fija_task(anio: int, mes: int, fecha_emision: str = None,
+                                    estrategia: str = ESTRATEGIA_BARRIO, tamano_rango: int = 500):
+    """
+    Orquestador de la corrida mensual de tarifa fija.
+    Divide el periodo en particiones y las lanza en paralelo (group) con un
+    chord que consolida el resultado. Retorna el ID del chord para consultar el reporte.
+    """
+    fecha_emision = fecha_emision or date.today().isoformat()
+    particiones = _build_use_case().planificar_particiones(estrategia, tamano_rango)
+
+    if not particiones:
+        logger.info(f"Facturación paralela {anio}-{mes}: no hay servicios fijos activos.")
+        return {"particiones": 0, "resultado_id": None}
+
+    resultado = chord(
+        facturar_particion_task.s(anio, mes, fecha_emision, particion) for particion in particiones
+    )(consolidar_facturacion_task.s())
+
+    logger.info(f"🚀 Facturación paralela {anio}-{mes}: {len(particiones)} particiones ({estrategia}).")
+    return {"particiones": len(particiones), "resultado_id": resultado.id}
@@ -0,0 +1,22 @@
+# core/tasks/hechos_analiticos_task.py
+from celery import shared_task
+import logging
+
+from core.use_cases.reporting.actualizar_hechos_analiticos_uc import ActualizarHechosAnaliticosUseCase
+from adapters.infrastructure.repositories.django_hechos_analiticos_repository import DjangoHechosAnaliticosRepository
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="actualizar_hechos_analiticos")
+def actualizar_hechos_analiticos_task(completo: bool = False):
+    """
+    Refresca las tablas de hechos de los dashboards desde el último watermark.
+    Programada en CELERY_BEAT_SCHEDULE (config/settings.py).
+    """
+    resultado = ActualizarHechosAnaliticosUseCase(DjangoHechosAnaliticosRepository()).ejecutar(completo=completo)
+    logger.info(
+        f"Hechos analíticos ({resultado['modo']}): {resultado['filas_escritas']} filas "
+        f"en {resultado['segundos']}s."
+    )
+    return {**resultado, "marca": resultado["marca"].isoformat()}
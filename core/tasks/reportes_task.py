@@ -0,0 +1,30 @@
+# core/tasks/reportes_task.py
+from celery import shared_task
+import logging
+
+from core.use_cases.reporting.reportes_asincronos_uc import EjecutarReporteUseCase
+from adapters.infrastructure.repositories.django_trabajo_reporte_repository import DjangoTrabajoReporteRepository
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="generar_reporte")
+def generar_reporte_task(trabajo_id: int):
+    """
+    Calcula un reporte pesado encolado desde /reportes/ y persiste el resultado con su TTL.
+    Corre en el worker: el reporte ya no depende del timeout de Gunicorn.
+    """
+    resumen = EjecutarReporteUseCase(DjangoTrabajoReporteRepository()).ejecutar(trabajo_id)
+    if resumen is None:
+        logger.info(f"Reporte #{trabajo_id} ya tomado por otro worker o inexistente; se omite.")
+    else:
+        logger.info(f"✅ Reporte #{trabajo_id} ({resumen['tipo']}): {resumen['filas']} filas.")
+    return resumen
+
+
+@shared_task(name="purgar_reportes_expirados")
+def purgar_reportes_expirados_task():
+    """Borra resultados vencidos y trabajos fallidos antiguos (CELERY_BEAT_SCHEDULE)."""
+    borrados = DjangoTrabajoReporteRepository().purgar_expirados()
+    logger.info(f"Reportes expirados eliminados: {borrados}.")
+    return borrados
@@ -0,0 +1,18 @@
+# core/tasks/sincronizacion_task.py
+from celery import shared_task
+import logging
+
+from adapters.infrastructure.repositories.django_sincronizacion_repository import DjangoSincronizacionRepository
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="purgar_cambios_sincronizacion")
+def purgar_cambios_sincronizacion_task():
+    """
+    Retención de `sync_cambios` (SYNC_RETENCION_DIAS, CELERY_BEAT_SCHEDULE).
+    Los clientes con tokens anteriores reciben 410 y vuelven a descargar su ruta.
+    """
+    borrados = DjangoSincronizacionRepository().purgar()
+    logger.info(f"Cambios de sincronización purgados: {borrados}.")
+    return borrados
@@ -0,0 +1,116 @@
+# core/use_cases/billing/conciliar_extracto_bancario.py
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from django.db import transaction
+from django.db.models import Q
+from simple_history.utils import bulk_update_with_history
+
+from core.domain.conciliacion_bancaria import (
+    conciliar, leer_extracto_csv, leer_extracto_ofx, LineaExtracto, TransferenciaPendiente
+)
+from core.interfaces.repositories import IPagoRepository
+from core.services.imputacion_pagos_service import ImputacionPagosService
+from core.services.estado_cuenta_cache_service import EstadoCuentaCacheService
+from adapters.infrastructure.models import PagoModel, ServicioModel
+
+FORMATO_CSV = "csv"
+FORMATO_OFX = "ofx"
+
+
+class ConciliarExtractoBancarioUseCase:
+    """
+    Conciliación masiva de transferencias web contra el extracto bancario (fin de mes).
+    1. Lee el extracto (CSV u OFX) y carga en UNA consulta las transferencias por validar
+       del rango de fechas del extracto (± tolerancia).
+    2. Empareja por referencia + monto + fecha con un hash-join en memoria.
+    3. Aprueba lo emparejado en lotes: cada lote es una transacción corta que bloquea solo
+       sus pagos (los ya validados por otra vía se omiten) e imputa FIFO con el motor común.
+    Retorna el residuo (líneas del banco y transferencias sin pareja) para revisión manual.
+    """
+    TOLERANCIA_DIAS = 3
+    TAMANO_LOTE = 200
+
+    def __init__(self, pago_repo: IPagoRepository, motor: ImputacionPagosService = None):
+        self.pago_repo = pago_repo
+        self.motor = motor or ImputacionPagosService()
+
+    def ejecutar(self, contenido: str, formato: str = None, tolerancia_dias: int = None,
+                 aprobar: bool = True) -> Dict[str, Any]:
+        tolerancia = self.TOLERANCIA_DIAS if tolerancia_dias is None else max(0, tolerancia_dias)
+        lineas, errores = self._leer(contenido, formato)
+
+        pendientes: List[TransferenciaPendiente] = []
+        if lineas:
+            margen = timedelta(days=tolerancia)
+            pendientes = self.pago_repo.obtener_transferencias_por_validar(
+                min(l.fecha for l in lineas) - margen, max(l.fecha for l in lineas) + margen
+            )
+        resultado = conciliar(lineas, pendientes, tolerancia)
+
+        aprobados = set()
+        if aprobar:
+            pago_ids = [t.pago_id for _, t in resultado.emparejados]
+            for inicio in range(0, len(pago_ids), self.TAMANO_LOTE):
+                aprobados |= self._aprobar_lote(pago_ids[inicio:inicio + self.TAMANO_LOTE])
+
+        return {
+            "lineas_extracto": len(lineas),
+            "transferencias_pendientes": len(pendientes),
+            "conciliadas": [
+                {**self._linea(linea), "pago_id": t.pago_id, "socio_id": t.socio_id,
+                 "aprobado": t.pago_id in aprobados}
+                for linea, t in resultado.emparejados
+            ],
+            "aprobadas": len(aprobados),
+            "lineas_sin_conciliar": [self._linea(l) for l in resultado.lineas_sin_conciliar],
+            "transferencias_sin_conciliar": [
+                {"pago_id": t.pago_id, "socio_id": t.socio_id, "referencia": t.referencia,
+                 "monto": t.monto, "fecha": t.fecha}
+                for t in resultado.transferencias_sin_conciliar
+            ],
+            "errores": errores
+        }
+
+    @transaction.atomic
+    def _aprobar_lote(self, pago_ids: List[int]) -> set:
+        # Orden estable de bloqueo (socio, pago): evita interbloqueos con otras aprobaciones
+        pagos = list(
+            PagoModel.objects.select_for_update()
+            .filter(pk__in=pago_ids, validado=False)
+            .order_by('socio_id', 'id')
+        )
+        if not pagos:
+            return set()
+        for pago in pagos:
+            pago.validado = True
+        bulk_update_with_history(pagos, PagoModel, ['validado'], batch_size=500)
+
+        for pago in pagos:
+            self.motor.imputar(pago.id, pago.socio_id, pago.monto_total)
+
+        socio_ids = {p.socio_id for p in pagos}
+        self._reactivar_servicios(socio_ids)
+        # bulk_update no emite signals: el portal debe ver los pagos aprobados
+        EstadoCuentaCacheService().invalidar(socio_ids)
+        return {p.id for p in pagos}
+
+    def _reactivar_servicios(self, socio_ids: set) -> None:
+        """Misma regla que la aprobación individual: suspendido + deuda cero -> ACTIVO."""
+        sin_deuda = Q(socio__saldo__isnull=True) | Q(socio__saldo__deuda_total__lte=0)
+        for servicio in ServicioModel.objects.filter(socio_id__in=socio_ids, estado='SUSPENDIDO').filter(sin_deuda):
+            servicio.estado = 'ACTIVO'
+            servicio.save()
+
+    def _leer(self, contenido: str, formato: str = None):
+        formato = (formato or "").lower() or (FORMATO_OFX if "<OFX>" in contenido.upper() else FORMATO_CSV)
+        if formato == FORMATO_OFX:
+            return leer_extracto_ofx(contenido)
+        if formato == FORMATO_CSV:
+            return leer_extracto_csv(contenido)
+        raise ValueError(f"Formato de extracto no soportado: {formato}")
+
+    @staticmethod
+    def _linea(linea: LineaExtracto) -> Dict[str, Any]:
+        return {"linea": linea.numero_linea, "fecha": linea.fecha, "referencia": linea.referencia,
+                "monto": linea.monto, "descripcion": linea.descripcion}
@@ -15,6 +15,7 @@ from adapters.infrastructure.models import (
     OrdenTrabajoModel,
     CatalogoRubroModel
 )
+from core.services.imputacion_pagos_service import ImputacionPagosService
 
 @dataclass
 class AbonoResponse:
@@ -43,20 +44,16 @@ class ProcesarAbonoUseCase:
         if monto_abono <= Decimal('0.00'):
             raise ValueError("El monto del abono debe ser mayor a 0.")
             
-        # 2. Obtener Socio y Deudas con BLOQUEO DE ESCRITURA (SELECT FOR UPDATE)
+        # 2. Obtener Socio con BLOQUEO DE ESCRITURA (SELECT FOR UPDATE)
         # Esto evita que dos cajeros cobren la misma deuda al mismo tiempo.
         try:
             socio = SocioModel.objects.select_for_update().get(id=socio_id)
         except SocioModel.DoesNotExist:
             raise ValueError(f"El socio con ID {socio_id} no existe.")
             
-        # Obtener todas las cuentas por cobrar pendientes (Saldo > 0), ordenadas por antigüedad (FIFO)
-        deudas_pendientes = CuentaPorCobrarModel.objects.select_for_update().filter(
-            socio_id=socio_id,
-            saldo_pendiente__gt=Decimal('0.00')
-        ).order_by('fecha_emision')
-        
-        deuda_total = sum(d.saldo_pendiente for d in deudas_pendientes)
+        # Deuda total con un agregado (sin cargar ni bloquear todas las cuentas)
+        motor = ImputacionPagosService()
+        deuda_total = motor.deuda_pendiente(socio_id)
         
         # Validación de Overpayment
         if monto_abono > deuda_total:
@@ -66,7 +63,7 @@ class ProcesarAbonoUseCase:
         pago = PagoModel.objects.create(
             socio=socio,
             monto_total=monto_abono,
-            # usuario_cobro_id=usuario_id, 
+            usuario_cobro_id=usuario_id,
             # fecha_pago=timezone.now(),  # Removed: field does not exist, uses auto_now_add in fecha_registro
             numero_comprobante_interno=self._generar_comprobante_interno()
         )
@@ -78,33 +75,10 @@ class ProcesarAbonoUseCase:
             metodo='EFECTIVO' # Por defecto
         )
         
-        # 4. Algoritmo de Imputación (Distribution Logic)
-        monto_restante_por_asignar = monto_abono
-        cuentas_afectadas_count = 0
-        
-        for cuenta in deudas_pendientes:
-            if monto_restante_por_asignar <= Decimal('0.00'):
-                break
-                
-            # Calcular cuánto se puede pagar de esta cuenta específica
-            monto_a_pagar = min(cuenta.saldo_pendiente, monto_restante_por_asignar)
-            
-            # Actualizar Cuenta
-            cuenta.saldo_pendiente -= monto_a_pagar
-            if cuenta.saldo_pendiente == Decimal('0.00'):
-                cuenta.estado = 'PAGADA'
-            # Si la cuenta está ligada a una Factura Fiscal, actualizar referencia (si aplica)
-            # if cuenta.factura:
-            #     cuenta.factura.saldo_pendiente -= monto_a_pagar
-            #     cuenta.factura.save()
-            
-            cuenta.save()
-            
-            # Nota: No creamos DetallePagoModel aquí porque ese modelo es para "Métodos de Pago" (Tarjeta, Efectivo),
-            # no para "Detalle de Imputación". La trazabilidad detallada requeriría una tabla intermedia (PagoDeuda).
-            
-            monto_restante_por_asignar -= monto_a_pagar
-            cuentas_afectadas_count += 1
+        # 4. Algoritmo de Imputación (Motor FIFO compartido con Tesorería)
+        # Bloquea y actualiza solo las cuentas que el abono cubre y deja la traza pago -> deuda.
+        imputacion = motor.imputar(pago.id, socio_id, monto_abono)
+        cuentas_afectadas_count = imputacion.cuentas_afectadas
             
         # 5. Lógica Operativa (Trigger de Reconexión)
         # Buscar servicio asociado al socio
@@ -122,7 +96,7 @@ class ProcesarAbonoUseCase:
             try:
                 uc_reconexion = SolicitarReconexionUseCase()
                 # Ejecutamos la reconexión. Al estar en la misma transacción, 
-                # SolicitarReconexion verá que la deuda ya fue saldada (saldo=0) por el loop anterior.
+                # SolicitarReconexion verá que la deuda ya fue saldada (saldo=0) por la imputación anterior.
                 res_reconexion = uc_reconexion.ejecutar(this_servicio.id)
                 
                 estado_servicio_actual = res_reconexion['nuevo_estado']
@@ -0,0 +1,43 @@
+# core/use_cases/detectar_anomalias_lecturas_uc.py
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from core.interfaces.repositories import IAnomaliaLecturaRepository
+from core.services.anomalias_consumo_service import DetectorAnomaliasConsumo
+
+
+class DetectarAnomaliasLecturasUseCase:
+    """
+    Caso de Uso: Revisión automática de lecturas antes de la emisión.
+    Evalúa TODAS las lecturas pendientes de facturar contra el historial facturado
+    de su medidor y deja las marcas para la pantalla de Pre-Emisión.
+    """
+
+    def __init__(self, anomalia_repo: IAnomaliaLecturaRepository,
+                 detector: Optional[DetectorAnomaliasConsumo] = None):
+        self.anomalia_repo = anomalia_repo
+        self.detector = detector or DetectorAnomaliasConsumo()
+
+    def ejecutar(self) -> Dict[str, Any]:
+        inicio = time.monotonic()
+
+        candidatas = self.anomalia_repo.obtener_lecturas_pendientes()
+        if not candidatas:
+            return {"evaluadas": 0, "detectadas": 0, "marcadas": 0, "por_tipo": {}, "segundos": 0.0}
+
+        # El historial solo necesita cubrir la ventana de la candidata más antigua
+        periodo_min = min(anio * 12 + mes - 1 for _, _, anio, mes, _ in candidatas) - self.detector.ventana_meses
+        historial = self.anomalia_repo.obtener_historial_consumos(periodo_min // 12, periodo_min % 12 + 1)
+
+        anomalias = self.detector.detectar(historial, candidatas)
+        marcadas = self.anomalia_repo.reemplazar_anomalias([c[0] for c in candidatas], anomalias)
+
+        return {
+            "evaluadas": len(candidatas),
+            "detectadas": len(anomalias),
+            # Sin las lecturas cuya marca ya revisó un operador (se conservan tal cual)
+            "marcadas": marcadas,
+            "por_tipo": dict(Counter(a.tipo for a in anomalias)),
+            "segundos": round(time.monotonic() - inicio, 3)
+        }
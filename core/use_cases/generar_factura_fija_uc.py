@@ -1,10 +1,16 @@
 # core>use_cases>generar_factura_fija_uc.py
 from datetime import date, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 # Domain
 from core.domain.factura import Factura, EstadoFactura, DetalleFactura, TARIFA_FIJA_SIN_MEDIDOR
 from core.interfaces.repositories import IFacturaRepository, IServicioRepository
+from core.shared.exceptions import PersistenciaTransitoriaError
+
+# Estrategias de partición para la facturación paralela
+ESTRATEGIA_BARRIO = "barrio"
+ESTRATEGIA_RANGO = "rango"
+
 
 class GenerarFacturaFijaUseCase:
     """
@@ -21,14 +27,8 @@ class GenerarFacturaFijaUseCase:
         Genera facturas para un PERIODO FISCAL específico (anio/mes).
         Si no se especifican, se asume el mes actual.
         """
-        if not fecha_emision:
-            fecha_emision = date.today()
-        
         # Defaults a fecha actual si no se envia periodo fiscal
-        if not anio: anio = fecha_emision.year
-        if not mes: mes = fecha_emision.month
-
-        fecha_vencimiento = fecha_emision + timedelta(days=15)
+        fecha_emision, anio, mes, fecha_vencimiento = self._resolver_periodo(anio, mes, fecha_emision)
 
         # 1. Obtener servicios fijos activos para procesar (Delegado al repositorio)
         servicios_fijos = self.servicio_repo.obtener_servicios_fijos_activos()
@@ -49,25 +49,8 @@ class GenerarFacturaFijaUseCase:
                     reporte["omitidas"] += 1
                     continue
 
-                # 3. Construir Agregado de Factura (Dominio Puro)
-                nuev_factura = Factura(
-                    id=None,
-                    socio_id=servicio.socio.id,
-                    servicio_id=servicio.id,
-                    medidor_id=None,
-                    fecha_emision=fecha_emision,
-                    fecha_vencimiento=fecha_vencimiento,
-                    anio=anio,  # Periodo Fiscal Estricto
-                    mes=mes,    # Periodo Fiscal Estricto
-                    estado=EstadoFactura.PENDIENTE,
-                    detalles=[],
-                    # SRI Defaults (se pueden mover a config o servicio)
-                    sri_ambiente=1,
-                    sri_tipo_emision=1
-                )
-
-                # 4. Calcular Totales (Lógica de Negocio del Dominio)
-                nuev_factura.calcular_total_sin_medidor()
+                # 3. Construir Agregado de Factura (Dominio Puro) + 4. Calcular Totales
+                nuev_factura = self._construir_factura(servicio, anio, mes, fecha_emision, fecha_vencimiento)
 
                 # 5. Persistencia (Repositorio)
                 self.factura_repo.guardar(nuev_factura)
@@ -75,9 +58,151 @@ class GenerarFacturaFijaUseCase:
                 reporte["creadas"] += 1
 
             except Exception as e:
-                # Identificación del error
-                identificacion = getattr(servicio.socio, 'identificacion', 'Unknown')
-                msg_error = f"Servicio ID {servicio.id} (Socio: {identificacion}): {str(e)}"
-                reporte["errores"].append(msg_error)
+                reporte["errores"].append(self._formatear_error(servicio, e))
+
+        return reporte
+
+    def ejecutar_masivo(self, anio: int = None, mes: int = None, fecha_emision: date = None,
+                        batch_size: int = 500, **particion) -> Dict[str, Any]:
+        """
+        Variante BULK de `ejecutar` para corridas grandes (miles de servicios).
+        - 1 consulta para los servicios ya facturados del periodo (en vez de N `exists`).
+        - Construcción en memoria de todas las facturas faltantes.
+        - Inserción por lotes (`bulk_create`) de cabeceras y detalles.
+        Si un lote falla, se reintenta fila por fila para reportar el error por servicio.
+
+        `particion` (opcional) restringe la corrida a un barrio o rango de socios,
+        ver `planificar_particiones`.
+        """
+        fecha_emision, anio, mes, fecha_vencimiento = self._resolver_periodo(anio, mes, fecha_emision)
+
+        servicios_fijos = list(self.servicio_repo.obtener_servicios_fijos_activos(**particion))
+        # En una partición solo interesan sus servicios, no todo el periodo
+        ya_facturados = self.factura_repo.obtener_servicios_facturados_mes(
+            anio, mes, servicio_ids=[s.id for s in servicios_fijos] if particion else None
+        )
+
+        reporte = {
+            "periodo_fiscal": f"{anio}-{mes}",
+            "fecha_emision": str(fecha_emision),
+            "total_servicios": len(servicios_fijos),
+            "creadas": 0,
+            "omitidas": 0,
+            "errores": []
+        }
+
+        # 1. Construcción en memoria (errores de dominio se reportan por servicio)
+        pendientes: List[Tuple[Any, Factura]] = []
+        for servicio in servicios_fijos:
+            if servicio.id in ya_facturados:
+                reporte["omitidas"] += 1
+                continue
+            try:
+                factura = self._construir_factura(servicio, anio, mes, fecha_emision, fecha_vencimiento)
+                pendientes.append((servicio, factura))
+            except Exception as e:
+                reporte["errores"].append(self._formatear_error(servicio, e))
+
+        # 2. Persistencia por lotes
+        for inicio in range(0, len(pendientes), batch_size):
+            lote = pendientes[inicio:inicio + batch_size]
+            try:
+                self.factura_repo.guardar_masivo([f for _, f in lote], batch_size=batch_size)
+                reporte["creadas"] += len(lote)
+            except PersistenciaTransitoriaError:
+                # Caída de BD / deadlock: no es culpa de las filas; que reintente la partición
+                raise
+            except Exception:
+                # Fallback: aislamos la(s) fila(s) problemática(s) del lote
+                for servicio, factura in lote:
+                    try:
+                        factura.id = None
+                        self.factura_repo.guardar(factura)
+                        reporte["creadas"] += 1
+                    except PersistenciaTransitoriaError:
+                        raise
+                    except Exception as e:
+                        reporte["errores"].append(self._formatear_error(servicio, e))
+
+        return reporte
+
+    # --- Facturación Paralela (Particiones) ---
+
+    def planificar_particiones(self, estrategia: str = ESTRATEGIA_BARRIO,
+                               tamano_rango: int = 500) -> List[Dict[str, Any]]:
+        """
+        Divide la corrida en particiones independientes (sin servicios compartidos).
+        - 'barrio': una partición por barrio del socio (+ una para socios sin barrio).
+        - 'rango': rangos contiguos de socio_id con `tamano_rango` socios cada uno.
+        Cada partición es un dict serializable (JSON) de filtros para `ejecutar_masivo`.
+        """
+        if estrategia == ESTRATEGIA_BARRIO:
+            return [
+                {"sin_barrio": True} if barrio_id is None else {"barrio_id": barrio_id}
+                for barrio_id in self.servicio_repo.listar_barrios_servicios_fijos()
+            ]
+
+        if estrategia == ESTRATEGIA_RANGO:
+            socio_ids = self.servicio_repo.listar_socio_ids_servicios_fijos()
+            return [
+                {"socio_id_desde": bloque[0], "socio_id_hasta": bloque[-1]}
+                for bloque in (socio_ids[i:i + tamano_rango] for i in range(0, len(socio_ids), tamano_rango))
+            ]
+
+        raise ValueError(f"Estrategia de partición no soportada: {estrategia}")
+
+    @staticmethod
+    def consolidar_reportes(reportes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Une los reportes de cada partición en un único reporte de corrida."""
+        consolidado = {
+            "periodo_fiscal": reportes[0]["periodo_fiscal"] if reportes else None,
+            "fecha_emision": reportes[0]["fecha_emision"] if reportes else None,
+            "particiones": len(reportes),
+            "particiones_fallidas": [],
+            "total_servicios": 0,
+            "creadas": 0,
+            "omitidas": 0,
+            "errores": []
+        }
+        for reporte in reportes:
+            consolidado["total_servicios"] += reporte.get("total_servicios", 0)
+            consolidado["creadas"] += reporte.get("creadas", 0)
+            consolidado["omitidas"] += reporte.get("omitidas", 0)
+            consolidado["errores"].extend(reporte.get("errores", []))
+            if reporte.get("fallida"):
+                consolidado["particiones_fallidas"].append(reporte.get("particion"))
+        return consolidado
+
+    # --- Helpers Privados ---
+
+    def _resolver_periodo(self, anio: int, mes: int, fecha_emision: date):
+        if not fecha_emision:
+            fecha_emision = date.today()
+        if not anio: anio = fecha_emision.year
+        if not mes: mes = fecha_emision.month
+        return fecha_emision, anio, mes, fecha_emision + timedelta(days=15)
+
+    def _construir_factura(self, servicio: Any, anio: int, mes: int,
+                           fecha_emision: date, fecha_vencimiento: date) -> Factura:
+        factura = Factura(
+            id=None,
+            socio_id=servicio.socio.id,
+            servicio_id=servicio.id,
+            medidor_id=None,
+            fecha_emision=fecha_emision,
+            fecha_vencimiento=fecha_vencimiento,
+            anio=anio,  # Periodo Fiscal Estricto
+            mes=mes,    # Periodo Fiscal Estricto
+            estado=EstadoFactura.PENDIENTE,
+            detalles=[],
+            # SRI Defaults (se pueden mover a config o servicio)
+            sri_ambiente=1,
+            sri_tipo_emision=1
+        )
+        # Lógica de Negocio del Dominio
+        factura.calcular_total_sin_medidor()
+        return factura
 
-        return reporte
\ No newline at end of file
+    def _formatear_error(self, servicio: Any, error: Exception) -> str:
+        identificacion = getattr(getattr(servicio, 'socio', None), 'identificacion', 'Unknown')
+        return f"Servicio ID {servicio.id} (Socio: {identificacion}): {str(error)}"
\ No newline at end of file
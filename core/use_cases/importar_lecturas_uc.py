@@ -0,0 +1,109 @@
+# core/use_cases/importar_lecturas_uc.py
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple
+
+from core.domain.lectura import Lectura
+from core.interfaces.repositories import ILecturaRepository, IMedidorRepository
+from core.use_cases.lectura_dtos import RegistrarLecturaDTO
+
+
+class ImportarLecturasUseCase:
+    """
+    Caso de Uso: Importación Masiva de Lecturas (Ruta completa del lector).
+    Misma regla de negocio que RegistrarLecturaUseCase, pero resuelta en lote:
+    - 1 consulta para los medidores (traen el snapshot de su última lectura)
+      y 1 para los periodos ya registrados.
+    - Validación de consistencia (monotonía) en memoria.
+    - Inserción por lotes de las filas válidas; las inválidas se reportan por fila.
+    """
+
+    def __init__(self, lectura_repo: ILecturaRepository, medidor_repo: IMedidorRepository):
+        self.lectura_repo = lectura_repo
+        self.medidor_repo = medidor_repo
+
+    def ejecutar(self, filas: Dict[int, RegistrarLecturaDTO]) -> Dict[str, Any]:
+        """
+        filas: {numero_de_fila: DTO}. El número de fila se devuelve en los errores
+        para que el lector pueda corregir su planilla.
+        """
+        medidor_ids = sorted({dto.medidor_id for dto in filas.values()})
+        periodos = {(dto.fecha_lectura.year, dto.fecha_lectura.month) for dto in filas.values()}
+
+        # 1. Carga por lotes (sin N+1)
+        medidores = self.medidor_repo.get_by_ids(medidor_ids)
+        # Base de validación por medidor: (fecha, valor) de su última lectura
+        ultimas: Dict[int, Tuple[Optional[date], float]] = {
+            m_id: (m.ultima_lectura_fecha, m.lectura_base()) for m_id, m in medidores.items()
+        }
+        registrados = self.lectura_repo.get_periodos_registrados(medidor_ids, periodos)
+
+        errores: List[Dict[str, Any]] = []
+        validas: List[Tuple[int, Lectura]] = []
+
+        # 2. Orden cronológico por medidor: admite varias lecturas del mismo medidor en el lote
+        for fila, dto in sorted(filas.items(), key=lambda x: (x[1].medidor_id, x[1].fecha_lectura, x[0])):
+            medidor = medidores.get(dto.medidor_id)
+            if not medidor:
+                errores.append(self._error(fila, dto, f"Medidor {dto.medidor_id} no existe."))
+                continue
+
+            periodo = (dto.medidor_id, dto.fecha_lectura.year, dto.fecha_lectura.month)
+            if periodo in registrados:
+                errores.append(self._error(
+                    fila, dto, f"Ya existe una lectura del medidor para el periodo {periodo[1]}-{periodo[2]:02d}."
+                ))
+                continue
+
+            ultima_fecha, lectura_anterior_valor = ultimas[dto.medidor_id]
+            if ultima_fecha and dto.fecha_lectura < ultima_fecha:
+                errores.append(self._error(
+                    fila, dto, f"La fecha ({dto.fecha_lectura}) es anterior a la última lectura ({ultima_fecha})."
+                ))
+                continue
+
+            lectura_actual = float(dto.lectura_actual)
+
+            # REGLA DE NEGOCIO: Validación de Consistencia
+            if lectura_actual < lectura_anterior_valor:
+                errores.append(self._error(
+                    fila, dto,
+                    f"Error de Lectura: La lectura actual ({lectura_actual}) "
+                    f"no puede ser menor a la lectura anterior ({lectura_anterior_valor})."
+                ))
+                continue
+
+            nueva_lectura = Lectura(
+                id=None,
+                medidor_id=dto.medidor_id,
+                valor=lectura_actual,
+                fecha=dto.fecha_lectura,
+                lectura_anterior=lectura_anterior_valor,
+                consumo_del_mes_m3=round(lectura_actual - lectura_anterior_valor, 2),
+                observacion=dto.observacion,
+                referencia_cliente=dto.referencia_cliente
+            )
+            validas.append((fila, nueva_lectura))
+
+            # La lectura aceptada pasa a ser la "anterior" de la siguiente fila del mismo medidor
+            ultimas[dto.medidor_id] = (nueva_lectura.fecha, lectura_actual)
+            registrados.add(periodo)
+
+        # 3. Persistencia por lotes
+        if validas:
+            self.lectura_repo.bulk_create([lectura for _, lectura in validas])
+
+        return {
+            "total_filas": len(filas),
+            "creadas": len(validas),
+            "con_error": len(errores),
+            "errores": sorted(errores, key=lambda e: e["fila"]),
+            "lecturas": [
+                {"fila": fila, "id": l.id, "medidor_id": l.medidor_id, "consumo_m3": l.consumo_del_mes_m3,
+                 "referencia_cliente": l.referencia_cliente}
+                for fila, l in sorted(validas, key=lambda x: x[0])
+            ]
+        }
+
+    @staticmethod
+    def _error(fila: int, dto: RegistrarLecturaDTO, mensaje: str) -> Dict[str, Any]:
+        return {"fila": fila, "medidor_id": dto.medidor_id, "error": mensaje}
@@ -16,4 +16,5 @@ class RegistrarLecturaDTO:
     
     fecha_lectura: date
     operador_id: int
-    observacion: Optional[str] = None
\ No newline at end of file
+    observacion: Optional[str] = None
+    referencia_cliente: Optional[str] = None  # UUID de la app offline (idempotencia)
\ No newline at end of file
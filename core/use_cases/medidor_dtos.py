@@ -20,6 +20,7 @@ class MedidorDTO:
     estado: str               # 'ACTIVO', 'INACTIVO', 'DANADO', etc.
     observacion: Optional[str]
     fecha_instalacion: Optional[str] = None # Opcional, como string ISO
+    ultima_lectura_valor: Optional[float] = None # Snapshot (None = sin lecturas)
 
 # =============================================================================
 # 2. DTOs de ENTRADA (Lo que recibimos del Frontend)
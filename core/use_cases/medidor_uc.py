@@ -28,7 +28,8 @@ def _map_medidor_to_dto(medidor: Medidor) -> MedidorDTO:
         lectura_inicial=medidor.lectura_inicial,
         estado=medidor.estado, # 'ACTIVO', 'INACTIVO', etc.
         observacion=medidor.observacion,
-        fecha_instalacion=str(medidor.fecha_instalacion) if medidor.fecha_instalacion else None
+        fecha_instalacion=str(medidor.fecha_instalacion) if medidor.fecha_instalacion else None,
+        ultima_lectura_valor=medidor.ultima_lectura_valor
     )
 
 class ListarMedidoresUseCase:
@@ -40,6 +41,12 @@ class ListarMedidoresUseCase:
         medidores = self.medidor_repo.list_all()
         return [_map_medidor_to_dto(m) for m in medidores]
 
+    def pagina(self, limite: int, despues_de: Optional[int] = None,
+               usuario_id: Optional[int] = None) -> List[MedidorDTO]:
+        """Listado paginado en el repositorio; usuario_id limita a los medidores del socio."""
+        medidores = self.medidor_repo.listar_pagina(limite, despues_de, usuario_id)
+        return [_map_medidor_to_dto(m) for m in medidores]
+
 class ObtenerMedidorUseCase:
     """Obtiene un medidor por ID."""
     def __init__(self, medidor_repo: IMedidorRepository):
@@ -103,8 +103,10 @@ class FacturarVentaDirectaUseCase:
         # 5. Generar Pago Automático (Contado)
         pago = PagoModel.objects.create(
             socio=cliente,
+            factura=factura,
             monto_total=total_venta,
             fecha_registro=timezone.now(),
+            usuario_cobro_id=usuario_id,
             observacion=f"Venta Directa POS. Factura #{factura.id}"
         )
         
@@ -1,6 +1,6 @@
 # core/use_cases/registrar_cobro_uc.py
 from decimal import Decimal
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 import hashlib
 from django.core.cache import cache
@@ -33,7 +33,7 @@ class RegistrarCobroUseCase:
         self.sri_service = sri_service
         self.email_service = email_service
 
-    def ejecutar(self, factura_id: int, lista_pagos: List[Dict]) -> Dict:
+    def ejecutar(self, factura_id: int, lista_pagos: List[Dict], usuario_id: Optional[int] = None) -> Dict:
         # 1. Obtener Entidad (Agnóstico de la BD)
         factura = self.factura_repo.obtener_por_id(factura_id)
         if not factura:
@@ -81,7 +81,7 @@ class RegistrarCobroUseCase:
         # 6. Persistencia
         # Registramos los nuevos pagos (Efectivo, Transferencia, Cheque, etc.)
         # El repositorio ya sabe cómo guardarlos y marcarlos como válidos si vienen de caja.
-        self.pago_repo.registrar_pagos(factura.id, lista_pagos)
+        self.pago_repo.registrar_pagos(factura.id, lista_pagos, usuario_id=usuario_id)
         
         # Actualizamos estado de la factura
         factura.estado = EstadoFactura.PAGADA
@@ -26,12 +26,8 @@ class RegistrarLecturaUseCase:
              # if medidor.estado != 'ACTIVO': ...
             raise MedidorNoEncontradoError(f"Medidor {input_dto.medidor_id} no existe.")
 
-        # 2. Obtener la última lectura para determinar la base de cálculo
-        ultima_lectura = self.lectura_repo.get_latest_by_medidor(input_dto.medidor_id)
-        
-        lectura_anterior_valor = medidor.lectura_inicial
-        if ultima_lectura:
-            lectura_anterior_valor = float(ultima_lectura.valor)
+        # 2. Base de cálculo: snapshot de la última lectura del medidor (o lectura inicial)
+        lectura_anterior_valor = medidor.lectura_base()
 
         # ✅ CORRECCIÓN 3: Leemos el campo correcto del DTO ('lectura_actual')
         lectura_actual = float(input_dto.lectura_actual)
@@ -0,0 +1,56 @@
+# core/use_cases/reporting/actualizar_hechos_analiticos_uc.py
+import time
+from datetime import timedelta
+from typing import Any, Dict
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.interfaces.repositories import IHechosAnaliticosRepository
+from core.shared.enums import IndicadorAnalitico
+
+PROCESO_HECHOS = 'hechos_analiticos'
+
+
+class ActualizarHechosAnaliticosUseCase:
+    """
+    Refresco incremental de las tablas de hechos (Celery Beat cada pocos minutos).
+    1. Bloquea el watermark (una sola corrida a la vez).
+    2. Sin watermark (primera vez) o `completo=True` -> reconstrucción total.
+    3. Si no, recalcula SOLO los días con cambios desde el watermark − MARGEN.
+       El margen cubre transacciones largas que confirmaron después de la corrida
+       anterior con una hora de cambio previa; recalcular un día dos veces es inocuo.
+    4. El nuevo watermark es el instante de INICIO de la corrida.
+    """
+    MARGEN = timedelta(minutes=10)
+
+    def __init__(self, repo: IHechosAnaliticosRepository):
+        self.repo = repo
+
+    def ejecutar(self, completo: bool = False) -> Dict[str, Any]:
+        inicio = time.monotonic()
+        ahora = timezone.now()
+
+        with transaction.atomic():
+            marca = self.repo.bloquear_marca(PROCESO_HECHOS)
+            completo = completo or marca is None
+            dias_por_indicador = {} if completo else self.repo.dias_modificados(marca - self.MARGEN)
+
+            filas, dias = {}, {}
+            for indicador in IndicadorAnalitico.values:
+                if completo:
+                    filas[indicador] = self.repo.recalcular(indicador)
+                    continue
+                tocados = dias_por_indicador.get(indicador) or set()
+                dias[indicador] = len(tocados)
+                filas[indicador] = self.repo.recalcular(indicador, tocados) if tocados else 0
+
+            self.repo.guardar_marca(PROCESO_HECHOS, ahora)
+
+        return {
+            "modo": "completo" if completo else "incremental",
+            "dias_recalculados": dias,
+            "filas_escritas": filas,
+            "marca": ahora,
+            "segundos": round(time.monotonic() - inicio, 3)
+        }
@@ -1,46 +1,93 @@
 # core/use_cases/reporting/generar_cierre_caja_uc.py
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from datetime import date
-from django.db.models import Sum
+from decimal import Decimal
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDate, TruncMonth
 from django.utils import timezone
-from adapters.infrastructure.models.pago_model import PagoModel
+from adapters.infrastructure.models.pago_model import PagoModel, DetallePagoModel
+from core.shared.fechas import ZONA_CAJA, rango_dias_locales
+
+SERIES = ('dia', 'mes', 'cajero')
+
 
 class GenerarCierreCajaUseCase:
     """
-    Caso de Uso: Generar Cierre de Caja Diario.
-    Permite al tesorero ver cuánto ha recaudado en el día (o rango).
+    Caso de Uso: Cierre de Caja (motor único para la API y los reportes).
+    - Rango [inicio 00:00, fin+1 00:00) en America/Guayaquil como datetimes: el filtro
+      usa idx_pago_fecha_registro (nada de `fecha_registro__date`, que aplica una
+      función a la columna y anula el índice).
+    - Solo pagos validados: una transferencia por validar no está en la caja.
+    - El desglose por método (vive en DetallePagoModel) es UNA consulta agrupada; las
+      series por día y por cajero son una consulta cada una, sea un día o un mes.
     """
 
-    def execute(self, fecha_inicio: Optional[date] = None, fecha_fin: Optional[date] = None) -> Dict[str, Any]:
+    def execute(self, fecha_inicio: Optional[date] = None, fecha_fin: Optional[date] = None,
+                usuario_id: Optional[int] = None, series: Iterable[str] = ()) -> Dict[str, Any]:
         if not fecha_inicio:
-            fecha_inicio = timezone.now().date()
+            fecha_inicio = timezone.localdate(timezone=ZONA_CAJA)
         if not fecha_fin:
             fecha_fin = fecha_inicio
+        if fecha_fin < fecha_inicio:
+            raise ValueError("fecha_fin no puede ser anterior a fecha_inicio.")
+        series = set(series)
+        if series - set(SERIES):
+            raise ValueError(f"Series soportadas: {', '.join(SERIES)}")
 
-        # Filtrar Pagos en el rango (considerando fecha_registro)
-        # Ajustamos el filtro para capturar todo el día si es DateTime
-        pagos = PagoModel.objects.filter(
-            fecha_registro__date__range=[fecha_inicio, fecha_fin]
-        )
+        inicio, fin = rango_dias_locales(fecha_inicio, fecha_fin)
+        pagos = PagoModel.objects.filter(fecha_registro__gte=inicio, fecha_registro__lt=fin, validado=True)
+        if usuario_id is not None:
+            pagos = pagos.filter(usuario_cobro_id=usuario_id)
+        detalles = DetallePagoModel.objects.filter(pago__in=pagos)
 
-        # Agregaciones
-        total_recaudado = pagos.aggregate(Sum('monto'))['monto__sum'] or 0.00
-        
-        # Desglose por método
-        por_metodo = pagos.values('metodo').annotate(total=Sum('monto'))
-        
-        desglose = {item['metodo']: float(item['total']) for item in por_metodo}
+        por_metodo = {
+            fila['metodo']: fila['total']
+            for fila in detalles.values('metodo').annotate(total=Sum('monto')).order_by('metodo')
+        }
+        total_general = sum(por_metodo.values(), Decimal('0.00'))
 
-        return {
+        resultado = {
             "rango": {
                 "inicio": fecha_inicio,
                 "fin": fecha_fin
             },
-            "total_general": float(total_recaudado),
+            "zona_horaria": str(ZONA_CAJA),
+            "cajero_id": usuario_id,
+            "total_general": total_general,
             "desglose_medios": {
-                "EFECTIVO": desglose.get("EFECTIVO", 0.00),
-                "TRANSFERENCIA": desglose.get("TRANSFERENCIA", 0.00),
-                "OTROS": sum(v for k, v in desglose.items() if k not in ["EFECTIVO", "TRANSFERENCIA"])
+                "EFECTIVO": por_metodo.get("EFECTIVO", Decimal('0.00')),
+                "TRANSFERENCIA": por_metodo.get("TRANSFERENCIA", Decimal('0.00')),
+                "OTROS": sum((v for k, v in por_metodo.items() if k not in ("EFECTIVO", "TRANSFERENCIA")),
+                             Decimal('0.00'))
             },
+            "por_metodo": por_metodo,
             "cantidad_transacciones": pagos.count()
         }
+        if 'dia' in series:
+            resultado["por_dia"] = self._serie(detalles, dia=TruncDate('pago__fecha_registro', tzinfo=ZONA_CAJA))
+        if 'mes' in series:
+            resultado["por_mes"] = self._serie(detalles, mes=TruncMonth('pago__fecha_registro', tzinfo=ZONA_CAJA))
+        if 'cajero' in series:
+            resultado["por_cajero"] = self._serie(
+                detalles, cajero_id=F('pago__usuario_cobro'), cajero=F('pago__usuario_cobro__username')
+            )
+        return resultado
+
+    @staticmethod
+    def _serie(detalles, **claves):
+        """Una consulta agrupada (claves × método) -> [{claves..., total, por_metodo}]"""
+        filas = (
+            detalles.values(**claves, metodo_pago=F('metodo'))
+            .annotate(total=Sum('monto'))
+            .order_by(*claves, 'metodo_pago')
+        )
+        serie: Dict[Tuple, Dict[str, Any]] = {}
+        for fila in filas:
+            grupo = serie.setdefault(tuple(fila[c] for c in claves), {
+                **{c: fila[c] for c in claves},
+                "total": Decimal('0.00'),
+                "por_metodo": {}
+            })
+            grupo["total"] += fila["total"]
+            grupo["por_metodo"][fila["metodo_pago"]] = fila["total"]
+        return list(serie.values())
@@ -1,75 +1,114 @@
 # core/use_cases/reporting/generar_reporte_cartera_uc.py
-from typing import List, Dict, Any
-from datetime import date
-from django.db.models import Sum, Q, F
+from typing import List, Dict, Any, Iterator, Optional
+from datetime import date, timedelta
+from decimal import Decimal
+from django.db.models import Sum, Count, Case, When, Value, F, DecimalField
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-from core.interfaces.repositories import IFacturaRepository, ISocioRepository
-# Importamos el modelo concreto solo para type hinting si es necesario, 
-# pero idealmente deberíamos usar repositorios. 
-# Para reportes complejos, a veces es aceptable usar el ORM directo para agregaciones 
-# si el repositorio es muy genérico, pero intentaremos mantenerlo limpio.
-from adapters.infrastructure.models.factura_model import FacturaModel 
-from core.shared.enums import EstadoFactura
+# Para reportes complejos usamos el ORM directo: la agregación la resuelve la BD
+# (un repositorio genérico obligaría a traer las facturas a Python).
+from adapters.infrastructure.models.factura_model import FacturaModel
+from core.shared.enums import EstadoFinanciero
+
+CERO = Value(Decimal('0.00'), output_field=DecimalField(max_digits=12, decimal_places=2))
+
 
 class GenerarReporteCarteraUseCase:
     """
     Caso de Uso: Generar Reporte de Cartera Vencida (Aging Report).
     Clasifica la deuda de los socios en:
-    - Corriente (Mes actual)
-    - Vencida 1-3 Meses
-    - Incobrable (> 3 Meses)
+    - Corriente (<= 30 días desde la emisión)
+    - Vencida 1-3 Meses (31 - 90 días)
+    - Incobrable (> 90 días)
+
+    Una sola consulta agrupada por socio: los tramos son SUM(CASE WHEN fecha_emision ...)
+    comparando contra fechas de corte fijas (sin calcular la edad fila por fila), y el
+    orden por deuda + LIMIT/OFFSET se resuelven en la BD. Python solo recibe una fila
+    por socio de la página pedida.
     """
+    DIAS_CORRIENTE = 30
+    DIAS_INCOBRABLE = 90
+
+    def execute(self, limite: Optional[int] = None, offset: int = 0, hoy: date = None) -> List[Dict[str, Any]]:
+        """
+        Retorna una lista de diccionarios con el resumen de deuda por socio,
+        ordenada de mayor a menor deuda. `limite=None` -> todos los socios.
+        """
+        qs = self._consulta(hoy)
+        if limite is not None:
+            qs = qs[offset:offset + limite]
+        elif offset:
+            qs = qs[offset:]
+        return [self._fila(r) for r in qs]
 
-    def execute(self) -> List[Dict[str, Any]]:
+    def iterar(self, hoy: date = None, tamano_lote: int = 2000) -> Iterator[Dict[str, Any]]:
         """
-        Retorna una lista de diccionarios con el resumen de deuda por socio.
+        Recorre toda la cartera en lotes keyset por socio (memoria constante, para exportes).
+        Orden por socio y no por deuda: `socio_id > último` va en el WHERE, así cada lote
+        agrupa solo sus socios recorriendo idx_factura_cartera, en vez de reagrupar
+        toda la cartera por lote (lo que exigiría paginar por el total agregado).
         """
-        hoy = timezone.now().date()
-        
-        # 1. Obtener todas las facturas pendientes
-        # Nota: Idealmente esto iría en un metría específica del Repositorio,
-        # pero para analytics usamos ORM para optimizar agregaciones.
-        facturas_pendientes = FacturaModel.objects.filter(
-            estado=EstadoFactura.PENDIENTE.value
-        ).select_related('socio__barrio', 'medidor')
+        ultimo = 0
+        while True:
+            lote = list(self._consulta(hoy).filter(socio_id__gt=ultimo).order_by('socio_id')[:tamano_lote])
+            for r in lote:
+                yield self._fila(r)
+            if len(lote) < tamano_lote:
+                return
+            ultimo = lote[-1]["socio_id"]
 
-        reporte = {}
+    def contar(self) -> int:
+        """Socios con al menos una factura pendiente (total para la paginación)."""
+        return FacturaModel.objects.filter(
+            estado_financiero=EstadoFinanciero.PENDIENTE
+        ).values('socio_id').distinct().count()
 
-        for factura in facturas_pendientes:
-            socio_id = factura.socio.id
-            nombre_socio = f"{factura.socio.apellidos} {factura.socio.nombres}"
-            
-            if socio_id not in reporte:
-                reporte[socio_id] = {
-                    "socio_id": socio_id,
-                    "nombre": nombre_socio,
-                    "barrio": factura.socio.barrio.nombre if factura.socio.barrio else "Sin Barrio",
-                    "identificacion": factura.socio.identificacion,
-                    "total_deuda": 0.00,
-                    "corriente": 0.00,      # < 30 días
-                    "vencido_1_3": 0.00,    # 30 - 90 días
-                    "incobrable": 0.00,     # > 90 días
-                    "facturas_pendientes": 0
-                }
+    def resumen(self, hoy: date = None) -> Dict[str, Decimal]:
+        """Totales de la cartera por tramo (un solo agregado, sin agrupar)."""
+        return FacturaModel.objects.filter(
+            estado_financiero=EstadoFinanciero.PENDIENTE
+        ).aggregate(total_deuda=Coalesce(Sum('total'), CERO), **self._tramos(hoy))
 
-            # Calcular días de mora
-            dias_mora = (hoy - factura.fecha_emision).days
-            monto = float(factura.total)
+    def _consulta(self, hoy: date = None):
+        return (
+            FacturaModel.objects
+            .filter(estado_financiero=EstadoFinanciero.PENDIENTE)
+            .values(
+                'socio_id', 'socio__apellidos', 'socio__nombres',
+                'socio__identificacion', 'socio__barrio__nombre'
+            )
+            .annotate(
+                total_deuda=Sum('total'),
+                facturas_pendientes=Count('id'),
+                **self._tramos(hoy)
+            )
+            .order_by('-total_deuda', 'socio_id')
+        )
 
-            # Acumular
-            reporte[socio_id]["total_deuda"] += monto
-            reporte[socio_id]["facturas_pendientes"] += 1
+    def _tramos(self, hoy: date = None) -> Dict[str, Any]:
+        hoy = hoy or timezone.localdate()
+        corte_corriente = hoy - timedelta(days=self.DIAS_CORRIENTE)
+        corte_incobrable = hoy - timedelta(days=self.DIAS_INCOBRABLE)
 
-            # Clasificar
-            if dias_mora <= 30:
-                reporte[socio_id]["corriente"] += monto
-            elif 30 < dias_mora <= 90:
-                reporte[socio_id]["vencido_1_3"] += monto
-            else:
-                reporte[socio_id]["incobrable"] += monto
+        def tramo(**condicion):
+            return Coalesce(Sum(Case(When(then=F('total'), **condicion), default=CERO)), CERO)
 
-        # Convertir a lista y ordenar por deuda (Mayor a menor)
-        lista_reporte = list(reporte.values())
-        lista_reporte.sort(key=lambda x: x["total_deuda"], reverse=True)
+        return {
+            "corriente": tramo(fecha_emision__gte=corte_corriente),
+            "vencido_1_3": tramo(fecha_emision__lt=corte_corriente, fecha_emision__gte=corte_incobrable),
+            "incobrable": tramo(fecha_emision__lt=corte_incobrable),
+        }
 
-        return lista_reporte
+    @staticmethod
+    def _fila(r: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "socio_id": r["socio_id"],
+            "nombre": f"{r['socio__apellidos']} {r['socio__nombres']}",
+            "barrio": r["socio__barrio__nombre"] or "Sin Barrio",
+            "identificacion": r["socio__identificacion"],
+            "total_deuda": r["total_deuda"],
+            "corriente": r["corriente"],
+            "vencido_1_3": r["vencido_1_3"],
+            "incobrable": r["incobrable"],
+            "facturas_pendientes": r["facturas_pendientes"]
+        }
@@ -0,0 +1,50 @@
+# core/use_cases/reporting/obtener_kpis_dashboard_uc.py
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict
+
+from django.utils import timezone
+
+from core.interfaces.repositories import IHechosAnaliticosRepository, ISaldoSocioRepository
+from core.shared.enums import GranularidadHecho, IndicadorAnalitico
+from core.use_cases.reporting.actualizar_hechos_analiticos_uc import PROCESO_HECHOS
+
+
+class ObtenerKpisDashboardUseCase:
+    """
+    KPIs del mes para el dashboard, leídos de filas pre-agregadas:
+    hechos mensuales (facturado, recaudado, consumo por barrio) + libro de saldos
+    (socios con deuda / en mora). Costo constante: no toca facturas ni pagos.
+    """
+
+    def __init__(self, hechos_repo: IHechosAnaliticosRepository, saldo_repo: ISaldoSocioRepository):
+        self.hechos_repo = hechos_repo
+        self.saldo_repo = saldo_repo
+
+    def ejecutar(self, hoy: date = None) -> Dict[str, Any]:
+        hoy = hoy or timezone.localdate()
+        mes = hoy.replace(day=1)
+
+        def del_mes(indicador, por=None):
+            return self.hechos_repo.totales(indicador, GranularidadHecho.MES, mes, mes, por=por)
+
+        facturado = del_mes(IndicadorAnalitico.FACTURAS)
+        recaudado = del_mes(IndicadorAnalitico.RECAUDADO)
+        morosidad = self.saldo_repo.resumen_morosidad(hoy)
+
+        tasa = None
+        if facturado["valor"]:
+            tasa = (recaudado["valor"] / facturado["valor"] * 100).quantize(Decimal('0.01'))
+
+        return {
+            "periodo": mes.strftime('%Y-%m'),
+            "facturacion_mes_actual": facturado["valor"],
+            "facturas_emitidas": facturado["cantidad"],
+            "recaudacion_mes_actual": recaudado["valor"],
+            "tasa_recaudacion": tasa,
+            "recaudacion_por_metodo": del_mes(IndicadorAnalitico.RECAUDADO, por='metodo'),
+            "consumo_por_barrio": del_mes(IndicadorAnalitico.CONSUMO_M3, por='barrio'),
+            "socios_con_deuda": morosidad["socios_con_deuda"],
+            "socios_en_mora": morosidad["socios_en_mora"],
+            "actualizado_hasta": self.hechos_repo.obtener_marca(PROCESO_HECHOS)
+        }
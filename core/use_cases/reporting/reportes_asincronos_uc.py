@@ -0,0 +1,183 @@
+# core/use_cases/reporting/reportes_asincronos_uc.py
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.db.models import Avg, Count, F, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from core.interfaces.repositories import ITrabajoReporteRepository
+from core.use_cases.reporting.generar_cierre_caja_uc import GenerarCierreCajaUseCase
+from core.shared.fechas import ZONA_CAJA
+from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
+# Reportes de agregación: ORM directo, igual que los demás casos de uso de reporting
+from adapters.infrastructure.models import LecturaModel
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# 📚 CATÁLOGO DE REPORTES
+# Cada generador retorna {"resumen": {...}, "columnas": [...], "filas": [[...]]}
+# (JSON serializable con DjangoJSONEncoder y exportable a CSV/XLSX tal cual).
+# =============================================================================
+@dataclass(frozen=True)
+class DefinicionReporte:
+    normalizar: Callable[[Dict[str, Any]], Dict[str, Any]]
+    generar: Callable[..., Dict[str, Any]]
+    ttl: timedelta
+
+
+def _fecha(valor: Any, defecto: date) -> str:
+    return (date.fromisoformat(str(valor)) if valor else defecto).isoformat()
+
+
+def _anio(valor: Any) -> int:
+    anio = int(valor) if valor else timezone.localdate().year
+    if not 2000 <= anio <= 2100:
+        raise ValueError("anio fuera de rango.")
+    return anio
+
+
+def _cartera(fecha_corte: str) -> Dict[str, Any]:
+    uc = GenerarReporteCarteraUseCase()
+    hoy = date.fromisoformat(fecha_corte)
+    columnas = ('socio_id', 'identificacion', 'nombre', 'barrio', 'facturas_pendientes',
+                'corriente', 'vencido_1_3', 'incobrable', 'total_deuda')
+    return {
+        "resumen": uc.resumen(hoy),
+        "columnas": list(columnas),
+        "filas": [[fila[c] for c in columnas] for fila in uc.iterar(hoy)],
+    }
+
+
+def _recaudacion_anual(anio: int) -> Dict[str, Any]:
+    cierre = GenerarCierreCajaUseCase().execute(date(anio, 1, 1), date(anio, 12, 31), series=('mes',))
+    metodos = sorted(cierre["por_metodo"])
+    return {
+        "resumen": {
+            "total_general": cierre["total_general"],
+            "por_metodo": cierre["por_metodo"],
+            "cantidad_transacciones": cierre["cantidad_transacciones"],
+        },
+        "columnas": ['mes', *metodos, 'total'],
+        "filas": [
+            [timezone.localtime(m["mes"], ZONA_CAJA).strftime('%Y-%m'),
+             *(m["por_metodo"].get(metodo, 0) for metodo in metodos), m["total"]]
+            for m in cierre["por_mes"]
+        ],
+    }
+
+
+def _consumo_anual(anio: int, barrio_id: Optional[int] = None) -> Dict[str, Any]:
+    lecturas = LecturaModel.objects.filter(fecha__gte=date(anio, 1, 1), fecha__lt=date(anio + 1, 1, 1))
+    if barrio_id is not None:
+        lecturas = lecturas.filter(medidor__terreno__barrio_id=barrio_id)
+    filas = (
+        lecturas.values(nombre_barrio=F('medidor__terreno__barrio__nombre'), periodo=TruncMonth('fecha'))
+        .annotate(total_lecturas=Count('id'), consumo_m3=Sum('consumo_del_mes'), promedio_m3=Avg('consumo_del_mes'))
+        .order_by('nombre_barrio', 'periodo')
+    )
+    resumen = lecturas.aggregate(lecturas=Count('id'), consumo_m3=Sum('consumo_del_mes'))
+    return {
+        "resumen": resumen,
+        "columnas": ['barrio', 'mes', 'lecturas', 'consumo_m3', 'promedio_m3'],
+        "filas": [
+            [f["nombre_barrio"] or "Sin Barrio", f["periodo"].strftime('%Y-%m'), f["total_lecturas"], f["consumo_m3"],
+             round(f["promedio_m3"] or 0, 2)]
+            for f in filas
+        ],
+    }
+
+
+REPORTES: Dict[str, DefinicionReporte] = {
+    # La cartera cambia con cada cobro: vigencia corta
+    'cartera_antiguedad': DefinicionReporte(
+        normalizar=lambda p: {"fecha_corte": _fecha(p.get('fecha_corte'), timezone.localdate())},
+        generar=_cartera,
+        ttl=timedelta(hours=1),
+    ),
+    'recaudacion_anual': DefinicionReporte(
+        normalizar=lambda p: {"anio": _anio(p.get('anio'))},
+        generar=_recaudacion_anual,
+        ttl=timedelta(hours=6),
+    ),
+    'consumo_anual': DefinicionReporte(
+        normalizar=lambda p: {"anio": _anio(p.get('anio')),
+                              "barrio_id": int(p['barrio_id']) if p.get('barrio_id') else None},
+        generar=_consumo_anual,
+        ttl=timedelta(hours=24),
+    ),
+}
+
+
+def huella_reporte(tipo: str, parametros: Dict[str, Any]) -> str:
+    canonico = json.dumps({"tipo": tipo, "parametros": parametros}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonico.encode('utf-8')).hexdigest()
+
+
+# =============================================================================
+# 🚀 CASOS DE USO
+# =============================================================================
+class SolicitarReporteUseCase:
+    """
+    Encola un reporte pesado fuera del worker web.
+    - Parámetros normalizados (defaults explícitos) -> huella: "cartera sin fecha" y
+      "cartera con la fecha de hoy" son la misma solicitud.
+    - Huella con trabajo en vuelo o resultado vigente -> se retorna ese trabajo, sin
+      encolar otro (coalescencia).
+    """
+
+    def __init__(self, repo: ITrabajoReporteRepository, encolar: Callable[[int], Optional[str]]):
+        self.repo = repo
+        self.encolar = encolar
+
+    def ejecutar(self, tipo: str, parametros: Optional[Dict[str, Any]] = None,
+                 usuario_id: Optional[int] = None) -> Tuple[Dict[str, Any], bool]:
+        definicion = REPORTES.get(tipo)
+        if definicion is None:
+            raise ValueError(f"Tipo de reporte no soportado: {tipo}. Opciones: {', '.join(sorted(REPORTES))}")
+        try:
+            parametros = definicion.normalizar(parametros or {})
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Parámetros inválidos para {tipo}: {exc}")
+
+        trabajo, creado = self.repo.solicitar(tipo, parametros, huella_reporte(tipo, parametros), usuario_id)
+        if creado:
+            try:
+                task_id = self.encolar(trabajo["id"])
+            except Exception as exc:
+                # Sin broker el trabajo nunca correría: se marca fallido para no bloquear la huella
+                logger.error(f"❌ No se pudo encolar el reporte #{trabajo['id']}: {exc}")
+                self.repo.fallar(trabajo["id"], f"No se pudo encolar: {exc}")
+                return self.repo.obtener(trabajo["id"]), creado
+            if task_id:
+                self.repo.asignar_task_id(trabajo["id"], task_id)
+                trabajo["task_id"] = task_id
+        return trabajo, creado
+
+
+class EjecutarReporteUseCase:
+    """Lo corre el worker de Celery: PENDIENTE -> EN_PROCESO -> COMPLETADO (con TTL) | FALLIDO."""
+
+    def __init__(self, repo: ITrabajoReporteRepository):
+        self.repo = repo
+
+    def ejecutar(self, trabajo_id: int) -> Optional[Dict[str, Any]]:
+        trabajo = self.repo.obtener(trabajo_id)
+        # Entrega duplicada del mensaje u otro worker ya lo tomó
+        if trabajo is None or not self.repo.iniciar(trabajo_id):
+            return None
+
+        definicion = REPORTES[trabajo["tipo"]]
+        try:
+            resultado = definicion.generar(**trabajo["parametros"])
+        except Exception as exc:
+            self.repo.fallar(trabajo_id, str(exc) or exc.__class__.__name__)
+            raise
+        self.repo.completar(trabajo_id, resultado, timezone.now() + definicion.ttl)
+        return {"trabajo_id": trabajo_id, "tipo": trabajo["tipo"], "filas": len(resultado["filas"])}
@@ -2,41 +2,52 @@
 from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
+from django.db.models import Count
 from adapters.infrastructure.models import (
     ServicioModel, OrdenTrabajoModel, CuentaPorCobrarModel, 
     CatalogoRubroModel, MultaModel
 )
 from core.shared.enums import EstadoCuentaPorCobrar
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
 
 class ProcesarCortesBatchUseCase:
     """
     Analiza todos los servicios ACTIVOS.
     Si tienen >= 2 planillas vencidas, cambia estado a SUSPENDIDO y genera Orden de Corte.
+    Los candidatos salen del libro de saldos (socios_saldos) en un solo barrido indexado;
+    solo para ellos se cuentan las planillas vencidas (una consulta agrupada).
     """
     
-    UMBRAL_MORA_MESES = 2
+    UMBRAL_MORA_MESES = DjangoSaldoSocioRepository.UMBRAL_CORTE
+
+    def __init__(self, saldo_repo=None):
+        self.saldo_repo = saldo_repo or DjangoSaldoSocioRepository()
 
     @transaction.atomic
     def ejecutar(self) -> dict:
-        servicios_activos = ServicioModel.objects.filter(estado='ACTIVO')
+        hoy = timezone.now().date()
+        socios_en_mora = self.saldo_repo.socios_en_mora_para_corte(hoy)
         cortes_generados = 0
         ordenes_creadas = []
 
         # Rubro opcional: Multa por Corte (si aplica)
         rubro_corte = CatalogoRubroModel.objects.filter(tipo='MULTA', nombre__icontains='CORTE').first()
 
-        for servicio in servicios_activos:
-            # 1. Calcular Meses en Mora (Planillas vencidas)
-            deudas_vencidas = CuentaPorCobrarModel.objects.filter(
-                # Asumiendo que Cuenta no tiene FK servicio directo, usamos el Socio.
-                # Si un socio tiene multiples servicios, esto contaría todas las deudas del socio.
-                # Para MVP v1: 1 Socio = 1 Servicio activo usualmente, o deuda global bloquea todo.
-                socio=servicio.socio,
-                rubro__tipo__in=['AGUA', 'PLANILLA'], # Ajustar según catálogo
+        # 1. Meses en Mora (Planillas vencidas) solo de los socios candidatos.
+        # Cuenta no tiene FK servicio directo: se usa el Socio (1 Socio = 1 Servicio activo usualmente).
+        deudas_por_socio = dict(
+            CuentaPorCobrarModel.objects.filter(
+                socio_id__in=socios_en_mora,
+                rubro__tipo__in=DjangoSaldoSocioRepository.TIPOS_PLANILLA,
                 estado=EstadoCuentaPorCobrar.PENDIENTE.value,
-                fecha_vencimiento__lt=timezone.now().date()
-            ).count()
+                saldo_pendiente__gt=0,
+                fecha_vencimiento__lt=hoy
+            ).order_by().values('socio_id').annotate(n=Count('id')).values_list('socio_id', 'n')
+        )
+        servicios = ServicioModel.objects.filter(estado='ACTIVO', socio_id__in=socios_en_mora).order_by('id')
 
+        for servicio in servicios:
+            deudas_vencidas = deudas_por_socio.get(servicio.socio_id, 0)
             if deudas_vencidas >= self.UMBRAL_MORA_MESES:
                 # 2. Transición de Estado
                 servicio.estado = 'SUSPENDIDO'
@@ -59,13 +70,13 @@ class ProcesarCortesBatchUseCase:
                         rubro=rubro_corte,
                         monto_inicial=rubro_corte.valor_unitario,
                         saldo_pendiente=rubro_corte.valor_unitario,
-                        fecha_vencimiento=timezone.now().date() + timedelta(days=30),
+                        fecha_vencimiento=hoy + timedelta(days=30),
                         estado=EstadoCuentaPorCobrar.PENDIENTE.value,
-                        origen_referencia=f"CORTE_SERVICIO_{servicio.id}_{timezone.now().date()}"
+                        origen_referencia=f"CORTE_SERVICIO_{servicio.id}_{hoy}"
                     )
 
         return {
-            "procesados": servicios_activos.count(),
+            "procesados": ServicioModel.objects.filter(estado='ACTIVO').count(),
             "cortes_generados": cortes_generados,
             "ordenes_ids": ordenes_creadas
         }
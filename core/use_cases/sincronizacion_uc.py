@@ -0,0 +1,134 @@
+# core/use_cases/sincronizacion_uc.py
+from typing import Dict, Any, Optional, Tuple
+
+from core.interfaces.repositories import ILecturaRepository, IMedidorRepository, ISincronizacionRepository
+from core.shared.exceptions import TokenSincronizacionExpiradoError
+from core.use_cases.lectura_dtos import RegistrarLecturaDTO
+from core.use_cases.importar_lecturas_uc import ImportarLecturasUseCase
+
+
+class SincronizarRutaUseCase:
+    """
+    Caso de Uso: Sincronización incremental de la app de lecturas (offline).
+
+    Protocolo:
+    1. DESCARGA: el cliente envía su token. Sin token (o inválido / de otra ruta)
+       recibe la ruta completa; con token recibe solo medidores y terrenos cambiados
+       desde entonces, más `eliminados` (tombstones) para lo que salió de su ruta.
+       El token nunca supera `token_estable()`: un cambio reciente puede llegar dos veces,
+       pero nunca se salta uno confirmado tarde. Un token anterior a la retención de la
+       bitácora -> TokenSincronizacionExpiradoError (re-descargar sin token).
+    2. SUBIDA: lote de lecturas con `referencia_cliente` (UUID del dispositivo).
+       Reenviar el mismo lote es seguro: lo ya registrado se devuelve como tal.
+    """
+    LIMITE_CAMBIOS = 2000
+
+    def __init__(self, sync_repo: ISincronizacionRepository,
+                 lectura_repo: ILecturaRepository, medidor_repo: IMedidorRepository):
+        self.sync_repo = sync_repo
+        self.lectura_repo = lectura_repo
+        self.medidor_repo = medidor_repo
+
+    # =================================================================
+    # 1. DESCARGA (Pull)
+    # =================================================================
+    def descargar(self, barrio_id: Optional[int], token: Optional[str] = None) -> Dict[str, Any]:
+        desde = self._leer_token(token, barrio_id)
+
+        if desde is None:
+            return self._snapshot_completo(barrio_id)
+        if desde < self.sync_repo.token_minimo_vigente():
+            raise TokenSincronizacionExpiradoError(
+                "El token es anterior a la retención de cambios. Descargue la ruta completa (sin token)."
+            )
+
+        # Tope ANTES de leer: lo que se lea por encima se re-enviará en el próximo delta
+        tope = self.sync_repo.token_estable()
+        cambios = self.sync_repo.obtener_cambios(desde, barrio_id, self.LIMITE_CAMBIOS)
+        if not cambios:
+            return self._respuesta(barrio_id, desde, completo=False, hay_mas=False,
+                                   medidores={}, terrenos={}, eliminados=([], []))
+
+        medidor_ids = sorted({obj_id for _, entidad, obj_id in cambios if entidad == 'MEDIDOR'})
+        terreno_ids = sorted({obj_id for _, entidad, obj_id in cambios if entidad == 'TERRENO'})
+
+        medidores = self.sync_repo.obtener_medidores(barrio_id, medidor_ids) if medidor_ids else {}
+        terrenos = self.sync_repo.obtener_terrenos(barrio_id, terreno_ids) if terreno_ids else {}
+
+        # Lo que cambió pero ya no está en la ruta (baja, inactivo, cambio de barrio) -> tombstone
+        eliminados = (
+            [m_id for m_id in medidor_ids if m_id not in medidores],
+            [t_id for t_id in terreno_ids if t_id not in terrenos],
+        )
+        ultimo = cambios[-1][0]
+        return self._respuesta(barrio_id, max(desde, min(ultimo, tope)), completo=False,
+                               hay_mas=len(cambios) == self.LIMITE_CAMBIOS and ultimo <= tope,
+                               medidores=medidores, terrenos=terrenos, eliminados=eliminados)
+
+    def _snapshot_completo(self, barrio_id: Optional[int]) -> Dict[str, Any]:
+        # El token se toma ANTES de leer: un cambio concurrente se re-enviará en el próximo delta
+        # (nunca por debajo de lo purgado: ese token se rechazaría en el siguiente delta)
+        token = max(self.sync_repo.token_estable(), self.sync_repo.token_minimo_vigente())
+        return self._respuesta(barrio_id, token, completo=True, hay_mas=False,
+                               medidores=self.sync_repo.obtener_medidores(barrio_id),
+                               terrenos=self.sync_repo.obtener_terrenos(barrio_id),
+                               eliminados=([], []))
+
+    def _respuesta(self, barrio_id, token: int, completo: bool, hay_mas: bool,
+                   medidores: Dict[int, dict], terrenos: Dict[int, dict],
+                   eliminados: Tuple[list, list]) -> Dict[str, Any]:
+        # Cada medidor ya trae su "ultima_lectura" (snapshot en la tabla de medidores)
+        return {
+            "token": self._emitir_token(token, barrio_id),
+            "completo": completo,
+            "hay_mas": hay_mas,
+            "medidores": list(medidores.values()),
+            "terrenos": list(terrenos.values()),
+            "eliminados": {"medidores": eliminados[0], "terrenos": eliminados[1]},
+        }
+
+    # --- Token opaco: "<barrio>:<id_cambio>" (ligado a la ruta) ---
+    @staticmethod
+    def _emitir_token(token: int, barrio_id: Optional[int]) -> str:
+        return f"{barrio_id or 0}:{token}"
+
+    def _leer_token(self, token: Optional[str], barrio_id: Optional[int]) -> Optional[int]:
+        """Retorna el ID de cambio, o None si hay que enviar la ruta completa."""
+        if not token:
+            return None
+        try:
+            barrio_token, id_cambio = (int(parte) for parte in token.split(':'))
+        except (ValueError, AttributeError):
+            return None
+        if barrio_token != (barrio_id or 0) or id_cambio < 0 or id_cambio > self.sync_repo.token_actual():
+            return None
+        return id_cambio
+
+    # =================================================================
+    # 2. SUBIDA (Push idempotente)
+    # =================================================================
+    def subir_lecturas(self, filas: Dict[int, RegistrarLecturaDTO]) -> Dict[str, Any]:
+        existentes = self.lectura_repo.get_ids_por_referencia({dto.referencia_cliente for dto in filas.values()})
+
+        nuevas: Dict[int, RegistrarLecturaDTO] = {}
+        ya_registradas, errores, vistas = [], [], set()
+        for fila, dto in sorted(filas.items()):
+            referencia = dto.referencia_cliente
+            if referencia in existentes:
+                ya_registradas.append({"fila": fila, "referencia_cliente": referencia, "id": existentes[referencia]})
+            elif referencia in vistas:
+                errores.append({"fila": fila, "medidor_id": dto.medidor_id,
+                                "error": f"Referencia {referencia} repetida en el lote."})
+            else:
+                vistas.add(referencia)
+                nuevas[fila] = dto
+
+        resultado = {"creadas": 0, "errores": [], "lecturas": []}
+        if nuevas:
+            resultado = ImportarLecturasUseCase(self.lectura_repo, self.medidor_repo).ejecutar(nuevas)
+
+        return {
+            "aceptadas": resultado["lecturas"],
+            "ya_registradas": ya_registradas,
+            "errores": sorted(errores + resultado["errores"], key=lambda e: e["fila"]),
+        }
@@ -1,7 +1,7 @@
 # core/use_cases/socio_uc.py
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from core.domain.socio import Socio
-from core.interfaces.repositories import ISocioRepository, IAuthRepository
+from core.interfaces.repositories import ISocioRepository, IAuthRepository, ISocioBusquedaRepository
 from core.use_cases.socio_dtos import SocioDTO, CrearSocioDTO, ActualizarSocioDTO
 from core.shared.exceptions import SocioNoEncontradoError, ValidacionError
 
@@ -51,6 +51,29 @@ class ListarSociosUseCase:
         # Mapeamos cada entidad usando el helper seguro
         return [_map_socio_to_dto(socio) for socio in socios]
 
+    def pagina(self, limite: int, despues_de: Optional[List[Any]] = None, orden: str = 'apellidos',
+               **filtros) -> List[SocioDTO]:
+        """Listado paginado en el repositorio (barrio_id, activo, rol, busqueda)."""
+        socios = self.socio_repo.listar_pagina(limite, despues_de, orden, **filtros)
+        return [_map_socio_to_dto(socio) for socio in socios]
+
+class BuscarSociosUseCase:
+    """
+    Type-ahead de caja: cédula exacta primero, luego prefijos de cédula y de
+    nombres/apellidos (sin tildes) y, si faltan resultados, coincidencias aproximadas.
+    """
+    MINIMO_CARACTERES = 2
+    LIMITE_MAXIMO = 50
+
+    def __init__(self, busqueda_repo: ISocioBusquedaRepository):
+        self.busqueda_repo = busqueda_repo
+
+    def execute(self, texto: str, limite: int = 10) -> List[Dict[str, Any]]:
+        texto = (texto or '').strip()
+        if len(texto) < self.MINIMO_CARACTERES:
+            raise ValidacionError(f"Ingrese al menos {self.MINIMO_CARACTERES} caracteres para buscar.")
+        return self.busqueda_repo.buscar(texto, max(1, min(limite, self.LIMITE_MAXIMO)))
+
 class ObtenerSocioUseCase:
     def __init__(self, socio_repo: ISocioRepository):
         self.socio_repo = socio_repo
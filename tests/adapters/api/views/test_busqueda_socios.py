@@ -0,0 +1,75 @@
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import SocioModel, FacturaModel, TerminoBusquedaSocioModel
+from adapters.infrastructure.repositories.django_socio_repository import DjangoSocioRepository
+
+
+class TestBusquedaSocios(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(user=User.objects.create_user(username='cajera', password='x'))
+        self.ana = SocioModel.objects.create(identificacion="1711111111", nombres="Ana María", apellidos="Muñoz Álvarez")
+        # Su cédula es prefijo de la de Ana: la exacta debe salir primero
+        self.rosa = SocioModel.objects.create(identificacion="17111111", nombres="Rosa", apellidos="Chicaiza")
+        self.luis = SocioModel.objects.create(identificacion="1722222222", nombres="Luis", apellidos="Munizaga")
+
+    def _buscar(self, texto, **extra):
+        respuesta = self.client.get('/api/v1/socios/buscar/', {'q': texto, **extra})
+        self.assertEqual(respuesta.status_code, status.HTTP_200_OK)
+        return [(r["id"], r["coincidencia"]) for r in respuesta.data]
+
+    def test_cedula_exacta_primero_y_luego_prefijos(self):
+        self.assertEqual(self._buscar("17111111"), [(self.rosa.id, 'IDENTIFICACION'),
+                                                     (self.ana.id, 'PREFIJO_IDENTIFICACION')])
+        self.assertEqual(self._buscar("17", limit=2)[0][1], 'PREFIJO_IDENTIFICACION')
+
+    def test_nombres_sin_tildes_por_prefijo_y_con_typos(self):
+        self.assertEqual(self._buscar("MUÑOZ"), [(self.ana.id, 'NOMBRE')])
+        self.assertEqual(self._buscar("ana alv"), [(self.ana.id, 'PREFIJO_NOMBRE')])
+        # Prefijo compartido: "mun" llega a Muñoz y Munizaga
+        self.assertEqual({socio for socio, _ in self._buscar("mun")}, {self.ana.id, self.luis.id})
+
+        aproximados = self._buscar("chicayza")
+        self.assertEqual(aproximados, [(self.rosa.id, 'APROXIMADA')])
+        self.assertEqual(self._buscar("zz"), [])
+        self.assertEqual(self.client.get('/api/v1/socios/buscar/', {'q': 'a'}).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+
+    def test_el_indice_sigue_los_cambios_del_socio(self):
+        socio = DjangoSocioRepository().get_by_id(self.luis.id)
+        socio.apellidos = "Quishpe"
+        DjangoSocioRepository().save(socio)  # .update(): sin post_save
+
+        self.assertEqual(self._buscar("quishpe"), [(self.luis.id, 'NOMBRE')])
+        self.assertNotIn(self.luis.id, [s for s, c in self._buscar("munizaga") if c != 'APROXIMADA'])
+
+        self.luis.delete()
+        self.assertFalse(TerminoBusquedaSocioModel.objects.filter(socio_id=self.luis.id).exists())
+
+    def test_facturas_pendientes_y_search_usan_el_indice(self):
+        for socio in (self.ana, self.rosa):
+            FacturaModel.objects.create(socio=socio, anio=2026, mes=3, total=Decimal('3.00'),
+                                        fecha_emision=date(2026, 3, 1), fecha_vencimiento=date(2026, 3, 31))
+
+        respuesta = self.client.get('/api/v1/facturas/pendientes/', {'identificacion': 'alvarez'})
+        self.assertEqual({f["socio"] for f in respuesta.data}, {self.ana.id})
+
+        respuesta = self.client.get('/api/v1/facturas/', {'search': '1711111111'})
+        self.assertEqual({f["socio"] for f in respuesta.data}, {self.ana.id})
+
+        listado = self.client.get('/api/v1/socios/', {'q': 'rosa chic'})
+        self.assertEqual([s["id"] for s in listado.data["results"]], [self.rosa.id])
+
+    def test_identificacion_coincide_por_prefijo_no_por_subcadena(self):
+        FacturaModel.objects.create(socio=self.luis, anio=2026, mes=3, total=Decimal('3.00'),
+                                    fecha_emision=date(2026, 3, 1), fecha_vencimiento=date(2026, 3, 31))
+
+        pendientes = lambda texto: [f["socio"] for f in self.client.get(
+            '/api/v1/facturas/pendientes/', {'identificacion': texto}).data]
+        self.assertEqual(pendientes('17222'), [self.luis.id])
+        # Subcadena intermedia o final de la cédula: ya no coincide (antes icontains)
+        self.assertEqual(pendientes('2222'), [])
+        self.assertEqual(self.client.get('/api/v1/facturas/', {'search': '22222222'}).data, [])
@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import (
+    SocioModel, BarrioModel, TerrenoModel, ServicioModel, MedidorModel, LecturaModel,
+    FacturaModel, CatalogoRubroModel, CuentaPorCobrarModel
+)
+
+
+class TestConsultarEstadoCuentaCajero(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(user=User.objects.create_user(username='cajero', password='x'))
+        self.barrio = BarrioModel.objects.create(nombre="Sur")
+        self.rubro = CatalogoRubroModel.objects.create(nombre="Agua Potable", valor_unitario=Decimal('3.00'))
+
+    def _socio_con_deudas(self, identificacion, cantidad):
+        socio = SocioModel.objects.create(identificacion=identificacion, nombres="Raúl", apellidos="Paz")
+        terreno = TerrenoModel.objects.create(socio=socio, barrio=self.barrio, direccion="Calle 1")
+        servicio = ServicioModel.objects.create(socio=socio, terreno=terreno, tipo='MEDIDO', activo=True)
+        medidor = MedidorModel.objects.create(codigo=f"MED-{identificacion}", terreno=terreno, lectura_inicial=0)
+        for mes in range(1, cantidad + 1):
+            lectura = LecturaModel.objects.create(
+                medidor=medidor, valor=mes * 10, lectura_anterior=(mes - 1) * 10, consumo_del_mes=10,
+                fecha=date(2025, (mes - 1) % 12 + 1, 5), anio=2025, mes=(mes - 1) % 12 + 1
+            )
+            factura = FacturaModel.objects.create(
+                socio=socio, servicio=servicio, medidor=medidor, lectura=lectura, anio=2025, mes=lectura.mes,
+                fecha_emision=date(2025, lectura.mes, 10), fecha_vencimiento=date(2025, lectura.mes, 28)
+            )
+            CuentaPorCobrarModel.objects.create(
+                socio=socio, factura=factura, rubro=self.rubro, monto_inicial=Decimal('3.00'),
+                saldo_pendiente=Decimal('3.00'), fecha_vencimiento=factura.fecha_vencimiento
+            )
+        return socio
+
+    def _consultar(self, socio):
+        return self.client.get(f'/api/v1/billing/estado-cuenta/{socio.id}/')
+
+    def test_consultas_constantes_sin_importar_el_numero_de_deudas(self):
+        pocas = self._socio_con_deudas("1700000040", 2)
+        muchas = self._socio_con_deudas("1700000041", 12)
+
+        # socio + servicio + deudas (con JOINs) + libro de saldos
+        with self.assertNumQueries(4):
+            self._consultar(pocas)
+        with self.assertNumQueries(4):
+            respuesta = self._consultar(muchas)
+
+        self.assertEqual(respuesta.status_code, status.HTTP_200_OK)
+        items = respuesta.data["items_pendientes"]
+        self.assertEqual(len(items), 12)
+        self.assertEqual(Decimal(str(respuesta.data["deuda_total"])), Decimal('36.00'))
+        self.assertEqual(items[0]["nombre_terreno"], "Calle 1 (Sur)")
+        self.assertEqual(items[0]["detalle_consumo"], "Lectura: 0 -> 10.00 (10.00 m3)")
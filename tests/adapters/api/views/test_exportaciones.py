@@ -0,0 +1,65 @@
+import csv
+import io
+import re
+import zipfile
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.api.exportacion import filas_por_lotes
+from adapters.infrastructure.models import SocioModel, FacturaModel, PagoModel, DetallePagoModel
+from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
+
+
+class TestExportaciones(APITestCase):
+    def setUp(self):
+        self.cajero = User.objects.create_user(username='cajero', password='x')
+        self.client.force_authenticate(user=self.cajero)
+        self.ana = SocioModel.objects.create(identificacion="1700000070", nombres="Ana", apellidos="Núñez")
+        self.luis = SocioModel.objects.create(identificacion="1700000071", nombres="Luis", apellidos="Vera")
+        for socio, total in ((self.ana, '3.50'), (self.ana, '4.00'), (self.luis, '9.00')):
+            FacturaModel.objects.create(socio=socio, fecha_emision=date(2026, 3, 5), fecha_vencimiento=date(2026, 3, 31),
+                                        anio=2026, mes=3, subtotal=Decimal(total), total=Decimal(total))
+
+    def _contenido(self, respuesta) -> bytes:
+        self.assertEqual(respuesta.status_code, status.HTTP_200_OK)
+        self.assertTrue(respuesta.streaming)
+        return b''.join(respuesta.streaming_content)
+
+    def test_facturas_csv_respeta_los_filtros_de_pendientes(self):
+        respuesta = self.client.get('/api/v1/facturas/exportar/', {'identificacion': 'Núñez', 'anio': 2026})
+        self.assertEqual(respuesta['Content-Disposition'], 'attachment; filename="facturas.csv"')
+
+        filas = list(csv.reader(io.StringIO(self._contenido(respuesta).decode('utf-8-sig'))))
+        self.assertEqual(filas[0][:2], ['ID', 'Fecha Emisión'])
+        self.assertEqual([(f[6], f[-1]) for f in filas[1:]], [('Núñez', '3.50'), ('Núñez', '4.00')])
+
+    def test_pagos_xlsx_una_fila_por_metodo(self):
+        pago = PagoModel.objects.create(socio=self.luis, monto_total=Decimal('9.00'), usuario_cobro=self.cajero)
+        DetallePagoModel.objects.create(pago=pago, metodo='EFECTIVO', monto=Decimal('5.00'))
+        DetallePagoModel.objects.create(pago=pago, metodo='TRANSFERENCIA', monto=Decimal('4.00'), referencia='A<1>')
+
+        respuesta = self.client.get('/api/v1/pagos/exportar/', {'formato': 'xlsx', 'cajero': self.cajero.id})
+        libro = zipfile.ZipFile(io.BytesIO(self._contenido(respuesta)))
+        self.assertIn('xl/workbook.xml', libro.namelist())
+
+        hoja = libro.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertEqual(hoja.count('<row>'), 3)
+        self.assertIn('A&lt;1&gt;', hoja)
+        self.assertEqual(len(re.findall(r'<t xml:space="preserve">(?:EFECTIVO|TRANSFERENCIA)</t>', hoja)), 2)
+
+    def test_formato_no_soportado(self):
+        respuesta = self.client.get('/api/v1/analytics/cartera-antiguedad/exportar/', {'formato': 'pdf'})
+        self.assertEqual(respuesta.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_lotes_keyset_recorren_todo_sin_repetir(self):
+        # 3 facturas en lotes de 2: dos consultas cortas, sin OFFSET ni cursor abierto
+        with self.assertNumQueries(2):
+            filas = list(filas_por_lotes(FacturaModel.objects.all(), ['total'], tamano=2))
+        self.assertEqual(filas, [(Decimal('3.50'),), (Decimal('4.00'),), (Decimal('9.00'),)])
+
+        cartera = [(f["identificacion"], f["total_deuda"])
+                   for f in GenerarReporteCarteraUseCase().iterar(tamano_lote=1)]
+        self.assertEqual(cartera, [("1700000070", Decimal('7.50')), ("1700000071", Decimal('9.00'))])
@@ -0,0 +1,49 @@
+from datetime import date
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import MedidorModel, LecturaModel
+
+
+class TestHistorialLecturasKeyset(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='lector', password='password')
+        self.client.force_authenticate(user=self.user)
+        self.medidores = [MedidorModel.objects.create(codigo=f"MED-{i}", lectura_inicial=0) for i in range(3)]
+        # Toda una ruta leída el mismo día: el desempate por id es obligatorio
+        for mes in (1, 2):
+            for medidor in self.medidores:
+                LecturaModel.objects.create(
+                    medidor=medidor, valor=mes * 10, lectura_anterior=0, consumo_del_mes=10,
+                    fecha=date(2026, mes, 15), anio=2026, mes=mes
+                )
+
+    def _recorrer(self, url):
+        ids, paginas = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [fila["id"] for fila in response.data["results"]]
+            url, paginas = response.data["next"], paginas + 1
+        return ids, paginas
+
+    def test_recorre_todo_sin_duplicados_ni_huecos(self):
+        ids, paginas = self._recorrer('/api/v1/lecturas/?limit=4')
+
+        esperado = list(LecturaModel.objects.order_by('-fecha', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, esperado)
+        self.assertEqual(paginas, 2)
+
+    def test_vista_valores_es_una_sola_consulta_por_pagina(self):
+        primera = self.client.get('/api/v1/lecturas/?limit=2&vista=valores&anio=2026&mes=1')
+        with self.assertNumQueries(1):
+            segunda = self.client.get(primera.data["next"])
+
+        self.assertEqual(segunda.status_code, status.HTTP_200_OK)
+        self.assertNotIn("socio_nombre", segunda.data["results"][0])
+        self.assertEqual({fila["mes"] for fila in primera.data["results"] + segunda.data["results"]}, {1})
+
+    def test_cursor_invalido(self):
+        response = self.client.get('/api/v1/lecturas/?cursor=no-es-un-cursor')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
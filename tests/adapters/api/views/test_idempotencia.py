@@ -0,0 +1,90 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import (
+    SocioModel, CatalogoRubroModel, CuentaPorCobrarModel, PagoModel, IdempotenciaModel
+)
+from adapters.infrastructure.repositories.django_idempotencia_repository import DjangoIdempotenciaRepository
+from core.use_cases.billing.process_payment import ProcesarAbonoUseCase
+
+
+class TestIdempotenciaAbonos(APITestCase):
+    URL = '/api/v1/billing/pagar/'
+
+    def setUp(self):
+        self.client.force_authenticate(user=User.objects.create_user(username='cajero', password='x'))
+        rubro = CatalogoRubroModel.objects.create(nombre="Agua Potable", valor_unitario=Decimal('10.00'))
+        self.socio = SocioModel.objects.create(identificacion="1700000060", nombres="Eva", apellidos="Mora")
+        CuentaPorCobrarModel.objects.create(socio=self.socio, rubro=rubro, monto_inicial=Decimal('10.00'),
+                                            saldo_pendiente=Decimal('10.00'), fecha_vencimiento=date(2026, 1, 31))
+        self.cuerpo = {"socio_id": self.socio.id, "monto": "4.00", "metodo_pago": "EFECTIVO"}
+
+    def _pagar(self, clave, cuerpo=None):
+        return self.client.post(self.URL, cuerpo or self.cuerpo, format='json', HTTP_IDEMPOTENCY_KEY=clave)
+
+    def test_reintento_reproduce_la_respuesta_sin_cobrar_dos_veces(self):
+        primera = self._pagar("caja1-0001")
+        segunda = self._pagar("caja1-0001")
+
+        self.assertEqual(primera.status_code, status.HTTP_200_OK)
+        self.assertEqual(segunda.status_code, status.HTTP_200_OK)
+        self.assertEqual(segunda['Idempotent-Replayed'], 'true')
+        self.assertEqual(segunda.data["pago_id"], primera.data["pago_id"])
+        self.assertEqual(PagoModel.objects.count(), 1)
+
+        # Misma clave con otro monto: se rechaza en lugar de devolver el recibo anterior
+        distinta = self._pagar("caja1-0001", {**self.cuerpo, "monto": "5.00"})
+        self.assertEqual(distinta.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_duplicado_en_vuelo_recibe_409(self):
+        # Otro worker ya reservó la clave y sigue procesando
+        self._pagar("caja1-0002")
+        IdempotenciaModel.objects.filter(clave="caja1-0002").update(
+            estado=IdempotenciaModel.ESTADO_EN_PROCESO, respuesta=None
+        )
+
+        respuesta = self._pagar("caja1-0002")
+
+        self.assertEqual(respuesta.status_code, status.HTTP_409_CONFLICT)
+        self.assertIn('Retry-After', respuesta)
+        self.assertEqual(PagoModel.objects.count(), 1)
+
+    def test_error_interno_libera_la_clave_para_reintentar(self):
+        with patch.object(ProcesarAbonoUseCase, 'ejecutar', side_effect=RuntimeError("BD caída")):
+            fallida = self._pagar("caja1-0003")
+        self.assertEqual(fallida.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        reintento = self._pagar("caja1-0003")
+
+        self.assertEqual(reintento.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Idempotent-Replayed', reintento)
+        self.assertEqual(PagoModel.objects.count(), 1)
+
+    def test_el_cobro_y_su_respuesta_se_confirman_juntos(self):
+        # Si la respuesta no llega a guardarse, tampoco queda el cobro: la clave se puede re-ejecutar
+        with patch.object(DjangoIdempotenciaRepository, 'completar', side_effect=RuntimeError("worker muerto")):
+            with self.assertRaises(RuntimeError):
+                self._pagar("caja1-0004")
+        self.assertEqual(PagoModel.objects.count(), 0)
+
+        self.assertEqual(self._pagar("caja1-0004").status_code, status.HTTP_200_OK)
+        self.assertEqual(PagoModel.objects.count(), 1)
+
+    def test_reserva_tomada_por_otro_worker_revierte_el_cobro(self):
+        ejecutar_original = ProcesarAbonoUseCase.ejecutar
+
+        def lento(caso, *args, **kwargs):
+            # Mientras cobra, otro worker toma la clave (BLOQUEO_MAXIMO vencido)
+            IdempotenciaModel.objects.filter(clave="caja1-0005").update(fecha_actualizacion=timezone.now())
+            return ejecutar_original(caso, *args, **kwargs)
+
+        with patch.object(ProcesarAbonoUseCase, 'ejecutar', autospec=True, side_effect=lento):
+            respuesta = self._pagar("caja1-0005")
+
+        self.assertEqual(respuesta.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(PagoModel.objects.count(), 0)
@@ -0,0 +1,56 @@
+from datetime import date
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import MedidorModel, LecturaModel
+
+
+class TestImportarLecturas(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='lector', password='password')
+        self.client.force_authenticate(user=self.user)
+        self.m1 = MedidorModel.objects.create(codigo="MED-001", lectura_inicial=100)
+        self.m2 = MedidorModel.objects.create(codigo="MED-002", lectura_inicial=0)
+        LecturaModel.objects.create(
+            medidor=self.m2, valor=50, lectura_anterior=0, consumo_del_mes=50,
+            fecha=date(2026, 1, 10), anio=2026, mes=1
+        )
+
+    def test_importar_json_reporta_errores_por_fila(self):
+        payload = {"lecturas": [
+            {"medidor_id": self.m1.id, "lectura_actual": "120", "fecha_lectura": "2026-02-10"},
+            {"medidor_id": self.m2.id, "lectura_actual": "40", "fecha_lectura": "2026-02-10"},   # Menor a la anterior
+            {"medidor_id": 999999, "lectura_actual": "10", "fecha_lectura": "2026-02-10"},       # No existe
+            {"medidor_id": self.m2.id, "lectura_actual": "abc", "fecha_lectura": "2026-02-10"},  # Formato
+        ]}
+
+        # Constante: carga (2) + inserción con historial (2) + snapshot (1) + bitácora de sync offline (4)
+        with self.assertNumQueries(9):
+            response = self.client.post('/api/v1/lecturas/importar/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["creadas"], 1)
+        self.assertEqual([e["fila"] for e in response.data["errores"]], [2, 3, 4])
+        lectura = LecturaModel.objects.get(medidor=self.m1)
+        self.assertEqual(lectura.consumo_del_mes, 20)
+        self.assertEqual((lectura.anio, lectura.mes), (2026, 2))
+
+    def test_importar_csv_encadena_lecturas_del_mismo_medidor(self):
+        contenido = (
+            "medidor_id,lectura_actual,fecha_lectura,observacion\n"
+            f"{self.m2.id},80,2026-03-10,\n"
+            f"{self.m2.id},65,2026-02-10,ok\n"
+        ).encode('utf-8')
+        archivo = SimpleUploadedFile("ruta.csv", contenido, content_type="text/csv")
+
+        response = self.client.post('/api/v1/lecturas/importar/', {"archivo": archivo}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["creadas"], 2)
+        consumos = list(
+            LecturaModel.objects.filter(medidor=self.m2, anio=2026, mes__in=[2, 3]).order_by('fecha')
+            .values_list('consumo_del_mes', flat=True)
+        )
+        self.assertEqual(consumos, [15, 15])
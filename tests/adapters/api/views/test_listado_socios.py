@@ -0,0 +1,58 @@
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import SocioModel, BarrioModel
+
+
+class TestListadoSociosKeyset(APITestCase):
+    def setUp(self):
+        usuario = User.objects.create_user(username='secretaria', password='password')
+        self.client.force_authenticate(user=usuario)
+        self.centro = BarrioModel.objects.create(nombre="Centro")
+        self.norte = BarrioModel.objects.create(nombre="Norte")
+        # Apellidos repetidos: el desempate por (nombres, id) es obligatorio
+        for i, (nombres, apellidos, barrio) in enumerate([
+            ("Ana", "Vaca", self.centro), ("Luis", "Vaca", self.norte), ("Ana", "Vaca", self.centro),
+            ("Rosa", "Álvarez", self.centro), ("Pedro", "Zambrano", self.norte),
+        ]):
+            SocioModel.objects.create(identificacion=f"17000001{i:02d}", nombres=nombres, apellidos=apellidos,
+                                      barrio=barrio, esta_activo=i != 4,
+                                      usuario=User.objects.create_user(username=f"socio{i}") if i % 2 else None)
+
+    def _recorrer(self, url):
+        ids, paginas = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [fila["id"] for fila in response.data["results"]]
+            url, paginas = response.data["next"], paginas + 1
+        return ids, paginas
+
+    def test_recorre_todo_sin_duplicados_ni_huecos(self):
+        ids, paginas = self._recorrer('/api/v1/socios/?limit=2')
+
+        esperado = list(SocioModel.objects.order_by('apellidos', 'nombres', 'id').values_list('id', flat=True))
+        self.assertEqual(ids, esperado)
+        self.assertEqual(paginas, 3)
+
+    def test_filtros_y_orden_se_resuelven_en_la_bd(self):
+        ids, _ = self._recorrer(f'/api/v1/socios/?barrio={self.centro.id}&activo=true&q=ana vaca&limit=1')
+        self.assertEqual(ids, list(SocioModel.objects.filter(nombres="Ana").order_by('id').values_list('id', flat=True)))
+
+        ids, _ = self._recorrer('/api/v1/socios/?q=1700000104&activo=false')
+        self.assertEqual(len(ids), 1)
+
+        ids, _ = self._recorrer('/api/v1/socios/?ordenar=recientes&limit=3')
+        self.assertEqual(ids, list(SocioModel.objects.order_by('-id').values_list('id', flat=True)))
+
+    def test_cada_pagina_es_una_sola_consulta(self):
+        primera = self.client.get('/api/v1/socios/?limit=2')
+        with self.assertNumQueries(1):
+            segunda = self.client.get(primera.data["next"])
+        self.assertEqual(len(segunda.data["results"]), 2)
+
+    def test_parametros_invalidos(self):
+        self.assertEqual(self.client.get('/api/v1/socios/?ordenar=edad').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get('/api/v1/socios/?barrio=x').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get('/api/v1/socios/?cursor=basura').status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,59 @@
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import SocioModel, BarrioModel, TerrenoModel, MedidorModel
+
+
+class TestListadoMedidoresPorPropietario(APITestCase):
+    def setUp(self):
+        centro = BarrioModel.objects.create(nombre="Centro")
+        self.usuario = User.objects.create_user(username='socio_ana', password='x')
+        ana = SocioModel.objects.create(identificacion="1700000301", nombres="Ana", apellidos="Vaca",
+                                        usuario=self.usuario)
+        luis = SocioModel.objects.create(identificacion="1700000302", nombres="Luis", apellidos="Lema")
+        self.medidores = []
+        for i, socio in enumerate([ana, luis, ana, luis, ana]):
+            terreno = TerrenoModel.objects.create(socio=socio, barrio=centro, direccion=f"Lote {i}")
+            self.medidores.append(MedidorModel.objects.create(codigo=f"MED-30{i}", terreno=terreno))
+        # En bodega: sin terreno, solo lo ve el personal técnico
+        self.medidores.append(MedidorModel.objects.create(codigo="MED-BODEGA"))
+
+    def _recorrer(self, url):
+        filas = []
+        while url:
+            respuesta = self.client.get(url)
+            self.assertEqual(respuesta.status_code, status.HTTP_200_OK)
+            filas += respuesta.data["results"]
+            url = respuesta.data["next"]
+        return filas
+
+    def test_socio_solo_ve_sus_medidores_filtrados_en_la_bd(self):
+        self.client.force_authenticate(user=self.usuario)
+        filas = self._recorrer('/api/v1/medidores/?limit=2')
+
+        self.assertEqual([f["codigo"] for f in filas], ["MED-300", "MED-302", "MED-304"])
+        self.assertEqual(filas[0]["nombre_socio"], "Ana Vaca")
+        self.assertEqual(filas[0]["direccion_terreno"], "Lote 0")
+
+        # Usuario sin perfil de socio: ningún medidor
+        self.client.force_authenticate(user=User.objects.create_user(username='visita', password='x'))
+        self.assertEqual(self._recorrer('/api/v1/medidores/'), [])
+
+    def test_socio_administrador_ve_todo_el_inventario(self):
+        admin = User.objects.create_user(username='admin_rosa', password='x')
+        SocioModel.objects.create(identificacion="1700000303", nombres="Rosa", apellidos="Toapanta",
+                                  usuario=admin, rol="ADMINISTRADOR")
+        self.client.force_authenticate(user=admin)
+        filas = self._recorrer('/api/v1/medidores/')
+        self.assertEqual([f["id"] for f in filas], [m.id for m in self.medidores])
+
+    def test_personal_tecnico_pagina_todo_con_consultas_constantes(self):
+        self.client.force_authenticate(user=User.objects.create_user(username='op', password='x', is_staff=True))
+        filas = self._recorrer('/api/v1/medidores/?limit=4')
+        self.assertEqual([f["id"] for f in filas], [m.id for m in self.medidores])
+        self.assertEqual(filas[-1]["nombre_socio"], "Sin Socio (Inventario)")
+
+        # Página de medidores + terrenos (barrio y socio) de la página
+        with self.assertNumQueries(2):
+            self.client.get('/api/v1/medidores/?limit=4')
@@ -0,0 +1,98 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import SocioModel, PagoModel, DetallePagoModel, TrabajoReporteModel
+from adapters.infrastructure.repositories.django_trabajo_reporte_repository import DjangoTrabajoReporteRepository
+from core.use_cases.reporting.reportes_asincronos_uc import EjecutarReporteUseCase
+
+
+@patch('adapters.api.views.reporte_views.generar_reporte_task.delay', return_value=MagicMock(id='celery-1'))
+class TestReportesAsincronos(APITestCase):
+    URL = '/api/v1/reportes/'
+
+    def setUp(self):
+        self.client.force_authenticate(user=User.objects.create_user(username='tesorero', password='x'))
+        socio = SocioModel.objects.create(identificacion="1700000080", nombres="Rosa", apellidos="Paz")
+        pago = PagoModel.objects.create(socio=socio, monto_total=Decimal('12.00'))
+        DetallePagoModel.objects.create(pago=pago, metodo='EFECTIVO', monto=Decimal('12.00'))
+        self.anio = timezone.localdate().year
+
+    def _solicitar(self, **parametros):
+        return self.client.post(self.URL, {"tipo": "recaudacion_anual", "parametros": parametros}, format='json')
+
+    def test_solicitudes_identicas_comparten_un_trabajo_y_el_resultado(self, delay):
+        primera = self._solicitar(anio=self.anio)
+        segunda = self._solicitar(anio=str(self.anio))  # parámetros normalizados: misma huella
+
+        self.assertEqual(primera.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(segunda.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(segunda.data["id"], primera.data["id"])
+        self.assertTrue(segunda.data["coalescido"])
+        self.assertEqual(segunda['Retry-After'], '5')
+        delay.assert_called_once_with(primera.data["id"])
+        self.assertEqual(self.client.get(f"{self.URL}{primera.data['id']}/descargar/").status_code,
+                         status.HTTP_409_CONFLICT)
+
+        # El worker procesa el trabajo (entregas duplicadas se ignoran)
+        repo = DjangoTrabajoReporteRepository()
+        self.assertEqual(EjecutarReporteUseCase(repo).ejecutar(primera.data["id"])["filas"], 1)
+        self.assertIsNone(EjecutarReporteUseCase(repo).ejecutar(primera.data["id"]))
+
+        # Resultado vigente: se sirve sin volver a encolar
+        tercera = self._solicitar()
+        self.assertEqual(tercera.status_code, status.HTTP_200_OK)
+        self.assertEqual(tercera.data["id"], primera.data["id"])
+        self.assertEqual(delay.call_count, 1)
+
+        resultado = self.client.get(f"{self.URL}{primera.data['id']}/descargar/")
+        self.assertEqual(resultado.data["columnas"], ['mes', 'EFECTIVO', 'total'])
+        self.assertEqual(resultado.data["resumen"]["total_general"], '12.00')  # JSON persistido
+
+        csv = self.client.get(f"{self.URL}{primera.data['id']}/descargar/", {'formato': 'csv'})
+        self.assertIn(f"{self.anio}-", b''.join(csv.streaming_content).decode('utf-8-sig'))
+
+        # Vencido el TTL: 410 y la siguiente solicitud encola un trabajo nuevo
+        TrabajoReporteModel.objects.update(expira_en=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(self.client.get(f"{self.URL}{primera.data['id']}/descargar/").status_code,
+                         status.HTTP_410_GONE)
+        self.assertNotEqual(self._solicitar().data["id"], primera.data["id"])
+        self.assertEqual(delay.call_count, 2)
+
+    def test_trabajo_abandonado_se_reemplaza(self, delay):
+        abandonado = self._solicitar(anio=self.anio).data["id"]
+        TrabajoReporteModel.objects.filter(pk=abandonado).update(
+            fecha_creacion=timezone.now() - DjangoTrabajoReporteRepository.ABANDONO - timedelta(minutes=1)
+        )
+
+        nuevo = self._solicitar(anio=self.anio)
+
+        self.assertFalse(nuevo.data["coalescido"])
+        self.assertEqual(TrabajoReporteModel.objects.get(pk=abandonado).estado, TrabajoReporteModel.ESTADO_FALLIDO)
+
+    def test_huella_activa_unica_y_liberada_al_terminar(self, delay):
+        # Constraint normal (no parcial): también lo crea MySQL
+        repo = DjangoTrabajoReporteRepository()
+        trabajo, creado = repo.solicitar('recaudacion_anual', {}, 'h1')
+        self.assertTrue(creado)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            TrabajoReporteModel.objects.create(tipo='recaudacion_anual', huella='h1', huella_activa='h1')
+
+        repo.fallar(trabajo["id"], "sin datos")
+        self.assertIsNone(TrabajoReporteModel.objects.get(pk=trabajo["id"]).huella_activa)
+        nuevo, creado = repo.solicitar('recaudacion_anual', {}, 'h1')
+        self.assertTrue(creado)
+
+        repo.completar(nuevo["id"], {"filas": []}, timezone.now() + timedelta(hours=1))
+        self.assertFalse(TrabajoReporteModel.objects.filter(huella_activa__isnull=False).exists())
+
+    def test_tipo_o_parametros_invalidos(self, delay):
+        self.assertEqual(self.client.post(self.URL, {"tipo": "nada"}, format='json').status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._solicitar(anio="dos mil").status_code, status.HTTP_400_BAD_REQUEST)
+        delay.assert_not_called()
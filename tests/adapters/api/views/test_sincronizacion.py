@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import (
+    BarrioModel, SocioModel, TerrenoModel, MedidorModel, LecturaModel, CambioSyncModel
+)
+from adapters.infrastructure.repositories.django_sincronizacion_repository import DjangoSincronizacionRepository
+
+
+@override_settings(SYNC_VENTANA_SEGURIDAD_SEGUNDOS=0)
+class TestSincronizacionOffline(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='lector', password='password', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+        self.barrio = BarrioModel.objects.create(nombre="Ruta Norte")
+        otro_barrio = BarrioModel.objects.create(nombre="Ruta Sur")
+        socio = SocioModel.objects.create(identificacion="1100000001", nombres="Ana", apellidos="Lema")
+
+        self.medidores = []
+        for i, barrio in enumerate([self.barrio, self.barrio, otro_barrio]):
+            terreno = TerrenoModel.objects.create(socio=socio, barrio=barrio, direccion=f"Lote {i}")
+            self.medidores.append(MedidorModel.objects.create(codigo=f"SYNC-{i}", terreno=terreno))
+
+    def _sync(self, token=None):
+        params = {"barrio_id": self.barrio.id}
+        if token:
+            params["token"] = token
+        return self.client.get('/api/v1/sincronizacion/cambios/', params)
+
+    def test_delta_solo_trae_cambios_y_tombstones(self):
+        completo = self._sync()
+        self.assertTrue(completo.data["completo"])
+        self.assertEqual(len(completo.data["medidores"]), 2)
+
+        # Sin cambios -> respuesta vacía con el mismo token
+        vacio = self._sync(completo.data["token"])
+        self.assertFalse(vacio.data["completo"])
+        self.assertEqual(vacio.data["medidores"], [])
+        self.assertEqual(vacio.data["token"], completo.data["token"])
+
+        # Cambios: nueva lectura en un medidor, baja de otro, cambio en otra ruta
+        m1, m2, m_otro = self.medidores
+        LecturaModel.objects.create(medidor=m1, valor=12, lectura_anterior=0, consumo_del_mes=12,
+                                    fecha=date(2026, 5, 1), anio=2026, mes=5)
+        m2.estado = 'INACTIVO'
+        m2.save()
+        m_otro.observacion = "No pertenece a la ruta"
+        m_otro.save()
+
+        delta = self._sync(completo.data["token"])
+
+        self.assertEqual([m["id"] for m in delta.data["medidores"]], [m1.id])
+        self.assertEqual(delta.data["medidores"][0]["ultima_lectura"]["valor"], 12.0)
+        self.assertEqual(delta.data["eliminados"]["medidores"], [m2.id])
+        self.assertEqual(delta.data["terrenos"], [])
+
+    def test_subida_de_lecturas_es_idempotente(self):
+        payload = {"lecturas": [{
+            "referencia_cliente": "2f6c1a9e-0000-4000-8000-000000000001",
+            "medidor_id": self.medidores[0].id, "lectura_actual": "30", "fecha_lectura": "2026-06-01"
+        }]}
+
+        primera = self.client.post('/api/v1/sincronizacion/lecturas/', payload, format='json')
+        segunda = self.client.post('/api/v1/sincronizacion/lecturas/', payload, format='json')
+
+        self.assertEqual(primera.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(primera.data["aceptadas"]), 1)
+        self.assertEqual(segunda.data["aceptadas"], [])
+        self.assertEqual(segunda.data["ya_registradas"][0]["id"], primera.data["aceptadas"][0]["id"])
+        self.assertEqual(LecturaModel.objects.filter(medidor=self.medidores[0]).count(), 1)
+
+    def test_baja_de_terreno_envia_tombstone_de_su_medidor(self):
+        completo = self._sync()
+        m1 = self.medidores[0]
+        TerrenoModel.objects.get(pk=m1.terreno_id).delete()  # SET_NULL en el medidor, sin post_save
+
+        delta = self._sync(completo.data["token"])
+        self.assertEqual(delta.data["eliminados"]["medidores"], [m1.id])
+
+    def test_token_purgado_exige_resincronizar(self):
+        completo = self._sync()
+        self.medidores[0].save()
+        self.medidores[1].save()
+        CambioSyncModel.objects.update(fecha=timezone.now() - timedelta(days=200))
+
+        self.assertGreater(DjangoSincronizacionRepository().purgar(dias=90), 0)
+        respuesta = self._sync(completo.data["token"])
+        self.assertEqual(respuesta.status_code, status.HTTP_410_GONE)
+        self.assertTrue(respuesta.data["resincronizar"])
+
+        # La re-descarga entrega un token que el siguiente delta acepta
+        nuevo = self._sync()
+        self.assertEqual(self._sync(nuevo.data["token"]).status_code, status.HTTP_200_OK)
+
+    @override_settings(SYNC_VENTANA_SEGURIDAD_SEGUNDOS=300)
+    def test_token_no_supera_cambios_que_podrian_estar_sin_confirmar(self):
+        CambioSyncModel.objects.update(fecha=timezone.now() - timedelta(hours=1))
+        completo = self._sync()
+
+        m1, m2, _ = self.medidores
+        m1.save()
+        m2.save()
+        # El cambio de m1 (ID menor) aún no confirma cuando el lector sincroniza
+        pendiente = CambioSyncModel.objects.filter(entidad='MEDIDOR', objeto_id=m1.id).latest('id')
+        pendiente.delete()
+        primero = self._sync(completo.data["token"])
+        self.assertEqual([m["id"] for m in primero.data["medidores"]], [m2.id])
+        self.assertEqual(primero.data["token"], completo.data["token"])
+
+        # Confirma tarde con su ID original: el siguiente delta lo incluye
+        CambioSyncModel.objects.create(id=pendiente.id, entidad='MEDIDOR', objeto_id=m1.id, barrio_id=self.barrio.id)
+        segundo = self._sync(primero.data["token"])
+        self.assertEqual({m["id"] for m in segundo.data["medidores"]}, {m1.id, m2.id})
+
+        # Fuera de la ventana el token avanza
+        CambioSyncModel.objects.update(fecha=timezone.now() - timedelta(hours=1))
+        tercero = self._sync(segundo.data["token"])
+        self.assertNotEqual(tercero.data["token"], completo.data["token"])
+        self.assertEqual(self._sync(tercero.data["token"]).data["medidores"], [])
@@ -0,0 +1,62 @@
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import SocioModel, BarrioModel, TerrenoModel, MedidorModel
+
+
+class TestTerrenosConMedidor(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(user=User.objects.create_user(username='operador', password='x'))
+        self.centro = BarrioModel.objects.create(nombre="Centro")
+        norte = BarrioModel.objects.create(nombre="Norte")
+        self.socio = SocioModel.objects.create(identificacion="1700000201", nombres="Ana", apellidos="Vaca")
+        otro = SocioModel.objects.create(identificacion="1700000202", nombres="Luis", apellidos="Lema")
+        self.terrenos = [
+            TerrenoModel.objects.create(socio=socio, barrio=barrio, direccion=f"Lote {i}")
+            for i, (socio, barrio) in enumerate([(self.socio, self.centro), (otro, norte), (self.socio, norte),
+                                                 (otro, self.centro), (self.socio, self.centro)])
+        ]
+        # Medidor solo en los terrenos pares
+        for i in (0, 2, 4):
+            MedidorModel.objects.create(codigo=f"MED-20{i}", marca="Elster", terreno=self.terrenos[i])
+
+    def _recorrer(self, url):
+        filas, paginas = [], 0
+        while url:
+            respuesta = self.client.get(url)
+            self.assertEqual(respuesta.status_code, status.HTTP_200_OK)
+            filas += respuesta.data["results"]
+            url, paginas = respuesta.data["next"], paginas + 1
+        return filas, paginas
+
+    def test_pagina_con_medidor_y_barrio_en_una_consulta(self):
+        primera = self.client.get('/api/v1/terrenos/?limit=2')
+        with self.assertNumQueries(1):
+            segunda = self.client.get(primera.data["next"])
+
+        fila = segunda.data["results"][0]
+        self.assertEqual(fila["id"], self.terrenos[2].id)
+        self.assertEqual((fila["nombre_barrio"], fila["codigo_medidor"], fila["tiene_medidor"]),
+                         ("Norte", "MED-202", True))
+        self.assertEqual(segunda.data["results"][1]["estado_medidor"], "SIN MEDIDOR")
+
+    def test_recorre_todo_sin_tope_y_con_filtros(self):
+        filas, paginas = self._recorrer('/api/v1/terrenos/?limit=2')
+        self.assertEqual([f["id"] for f in filas], [t.id for t in self.terrenos])
+        self.assertEqual(paginas, 3)
+
+        filas, _ = self._recorrer(f'/api/v1/terrenos/?socio_id={self.socio.id}&barrio_id={self.centro.id}&limit=1')
+        self.assertEqual([f["id"] for f in filas], [self.terrenos[0].id, self.terrenos[4].id])
+
+        self.assertEqual(self.client.get('/api/v1/terrenos/?socio_id=x').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_detalle_en_una_consulta(self):
+        with self.assertNumQueries(1):
+            respuesta = self.client.get(f'/api/v1/terrenos/{self.terrenos[0].id}/')
+        self.assertEqual(respuesta.data["barrio"], {"id": self.centro.id, "nombre": "Centro"})
+        self.assertEqual(respuesta.data["medidor"]["codigo"], "MED-200")
+
+        sin_medidor = self.client.get(f'/api/v1/terrenos/{self.terrenos[1].id}/')
+        self.assertIsNone(sin_medidor.data["medidor"])
+        self.assertEqual(self.client.get('/api/v1/terrenos/99999/').status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,74 @@
+from datetime import date
+from django.test import SimpleTestCase, TestCase
+
+from adapters.infrastructure.models import MedidorModel, LecturaModel, AnomaliaLecturaModel
+from adapters.infrastructure.repositories.django_anomalia_lectura_repository import DjangoAnomaliaLecturaRepository
+from core.services.anomalias_consumo_service import DetectorAnomaliasConsumo
+from core.shared.enums import TipoAnomaliaLectura
+from core.use_cases.detectar_anomalias_lecturas_uc import DetectarAnomaliasLecturasUseCase
+
+
+def _historial(medidor_id, consumos, anio=2025):
+    return [(medidor_id, anio, mes, c) for mes, c in enumerate(consumos, start=1)]
+
+
+class TestDetectorAnomaliasConsumo(SimpleTestCase):
+    def setUp(self):
+        self.detector = DetectorAnomaliasConsumo()
+        self.historial = (
+            _historial(1, [20, 22, 19, 21, 20, 23, 20, 21, 22, 20, 19, 21])
+            + _historial(2, [15, 16, 15, 14, 16, 15, 15, 16, 14, 15, 16, 15])
+            + _historial(3, [10, 12, 11, 10, 11, 12, 10, 11, 12, 10, 11, 10])
+        )
+
+    def test_clasifica_consumos_fuera_de_rango(self):
+        candidatas = [
+            (101, 1, 2026, 1, 210.0),  # Error de digitación (x10)
+            (102, 2, 2026, 1, 0.0),    # Medidor trabado
+            (103, 3, 2026, 1, 11.0),   # Normal
+            (104, 4, 2026, 1, 500.0),  # Sin historial: no se opina
+        ]
+
+        anomalias = {a.lectura_id: a for a in self.detector.detectar(self.historial, candidatas)}
+
+        self.assertEqual(set(anomalias), {101, 102})
+        self.assertEqual(anomalias[101].tipo, TipoAnomaliaLectura.CONSUMO_ALTO)
+        self.assertEqual(anomalias[101].esperado_m3, 20.5)
+        self.assertEqual(anomalias[102].tipo, TipoAnomaliaLectura.MEDIDOR_ESTANCADO)
+
+    def test_linea_base_estacional_tolera_picos_recurrentes(self):
+        # Cada diciembre el consumo se triplica (fiestas): no es anomalía
+        historial = [
+            (1, anio, mes, 60.0 if mes == 12 else 20.0) for anio in (2022, 2023, 2024) for mes in range(1, 13)
+        ]
+
+        anomalias = self.detector.detectar(historial, [(201, 1, 2025, 12, 62.0), (202, 1, 2025, 11, 62.0)])
+
+        self.assertEqual([a.lectura_id for a in anomalias], [202])
+
+
+class TestDetectarAnomaliasLecturasUseCase(TestCase):
+    def test_persiste_marcas_y_conserva_las_revisadas(self):
+        medidor = MedidorModel.objects.create(codigo="MED-ANOM", lectura_inicial=0)
+        for mes in range(1, 9):
+            LecturaModel.objects.create(
+                medidor=medidor, valor=mes * 20, lectura_anterior=(mes - 1) * 20, consumo_del_mes=20,
+                fecha=date(2025, mes, 10), anio=2025, mes=mes, esta_facturada=True
+            )
+        sospechosa = LecturaModel.objects.create(
+            medidor=medidor, valor=1160, lectura_anterior=160, consumo_del_mes=1000,
+            fecha=date(2025, 9, 10), anio=2025, mes=9
+        )
+        uc = DetectarAnomaliasLecturasUseCase(DjangoAnomaliaLecturaRepository())
+
+        resultado = uc.ejecutar()
+
+        self.assertEqual((resultado["evaluadas"], resultado["marcadas"]), (1, 1))
+        anomalia = AnomaliaLecturaModel.objects.get(lectura=sospechosa)
+        self.assertEqual(anomalia.tipo, TipoAnomaliaLectura.CONSUMO_ALTO)
+
+        anomalia.revisada = True
+        anomalia.save()
+        resultado = uc.ejecutar()
+        self.assertTrue(AnomaliaLecturaModel.objects.get(lectura=sospechosa).revisada)
+        self.assertEqual((resultado["detectadas"], resultado["marcadas"]), (1, 0))
@@ -0,0 +1,60 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from adapters.infrastructure.models import (
+    SocioModel, FacturaModel, CorridaFacturacionModel, CorridaFacturacionItemModel
+)
+from core.services.facturacion_service import FacturacionService
+from core.shared.enums import EstadoItemCorrida
+
+
+class EmisionMasivaCorridaTests(TestCase):
+
+    def setUp(self):
+        self.socios = [
+            SocioModel.objects.create(identificacion=f"09000000{i:02d}", nombres="Socio", apellidos=f"Corrida {i}")
+            for i in range(3)
+        ]
+        self.items = [{"socio_id": s.id, "lectura_real_id": None, "subtotal": 3.00} for s in self.socios]
+        self.service = FacturacionService()
+
+    def test_primera_corrida_registra_items_completados(self):
+        resultado = self.service.ejecutar_emision_masiva(self.items)
+
+        self.assertEqual(resultado["cantidad"], 3)
+        corrida = CorridaFacturacionModel.objects.get(pk=resultado["corrida_id"])
+        self.assertEqual(corrida.completados, 3)
+        self.assertEqual(
+            CorridaFacturacionItemModel.objects.filter(corrida=corrida, factura__isnull=False).count(), 3
+        )
+
+    def test_reanudar_corrida_salta_items_completados(self):
+        """Simula una caída: solo el primer ítem quedó COMPLETADO antes de morir el proceso"""
+        resultado = self.service.ejecutar_emision_masiva(self.items[:1])
+        CorridaFacturacionItemModel.objects.create(
+            corrida_id=resultado["corrida_id"], clave=f"FIJO:{self.socios[1].id}", estado=EstadoItemCorrida.PENDIENTE
+        )
+
+        reanudada = self.service.ejecutar_emision_masiva(self.items)
+
+        self.assertEqual(reanudada["corrida_id"], resultado["corrida_id"])
+        self.assertEqual(reanudada["omitidas"], 1)
+        self.assertEqual(reanudada["cantidad"], 2)
+        self.assertEqual(FacturaModel.objects.filter(socio__in=self.socios).count(), 3)
+        self.assertEqual(CorridaFacturacionModel.objects.get(pk=resultado["corrida_id"]).ejecuciones, 2)
+
+    def test_acometidas_ya_facturadas_se_consultan_una_vez_por_lote(self):
+        self.service.ejecutar_emision_masiva(self.items[:1])
+        otros = [SocioModel.objects.create(identificacion=f"09000001{i:02d}", nombres="Socio", apellidos=f"Extra {i}")
+                 for i in range(5)]
+        items = self.items + [{"socio_id": s.id, "lectura_real_id": None, "subtotal": 3.00} for s in otros]
+
+        with CaptureQueriesContext(connection) as consultas:
+            resultado = self.service.ejecutar_emision_masiva(items, tamano_lote=100)
+
+        self.assertEqual(resultado["cantidad"], 7)
+        self.assertEqual(FacturaModel.objects.filter(socio=self.socios[0]).count(), 1)
+        verificaciones = [q for q in consultas.captured_queries
+                          if '"facturas"' in q["sql"] and '"lectura_id" IS NULL' in q["sql"]]
+        self.assertEqual(len(verificaciones), 1)
@@ -0,0 +1,66 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from adapters.infrastructure.models import (
+    SocioModel, BarrioModel, TerrenoModel, ServicioModel, FacturaModel, DetalleFacturaModel, PagoModel
+)
+from core.services.estado_cuenta_cache_service import EstadoCuentaCacheService
+from core.tasks.estado_cuenta_task import reconstruir_estados_cuenta_task
+
+
+class TestEstadoCuentaCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.socio = SocioModel.objects.create(identificacion="1700000030", nombres="Inés", apellidos="Lara")
+        barrio = BarrioModel.objects.create(nombre="Norte")
+        terreno = TerrenoModel.objects.create(socio=self.socio, barrio=barrio, direccion="Lote 7")
+        self.servicio = ServicioModel.objects.create(socio=self.socio, terreno=terreno, tipo='FIJO', activo=True)
+        self._factura(1)
+        self.servicio_cache = EstadoCuentaCacheService()
+        self.client.force_authenticate(user=User.objects.create_user(username='admin', password='x', is_staff=True))
+
+    def _factura(self, mes):
+        factura = FacturaModel.objects.create(
+            socio=self.socio, servicio=self.servicio, anio=2026, mes=mes, total=Decimal('3.00'),
+            fecha_emision=date(2026, mes, 1), fecha_vencimiento=date(2026, mes, 28)
+        )
+        DetalleFacturaModel.objects.create(factura=factura, concepto="Tarifa Fija", cantidad=1,
+                                           precio_unitario=Decimal('3.00'), subtotal=Decimal('3.00'))
+        return factura
+
+    def test_documento_cacheado_coincide_con_el_calculo_en_vivo(self):
+        url = f'/api/v1/socios/{self.socio.id}/estado-cuenta/'
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            # Portal: una sola lectura de cache
+            respuesta = self.client.get(url)
+        self.assertEqual(respuesta.data["resumen_financiero"]["cantidad_facturas_pendientes"], 1)
+
+        # Cambios de facturas y pagos: invalidación al confirmar + reconstrucción asíncrona
+        with patch.object(reconstruir_estados_cuenta_task, 'delay') as encolar:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._factura(2)
+                PagoModel.objects.create(socio=self.socio, monto_total=Decimal('3.00'), validado=True)
+
+        encolar.assert_called_once_with([self.socio.id])  # una sola tarea para varios cambios
+        self.assertIsNone(cache.get(self.servicio_cache.clave(self.socio.id)))
+        reconstruir_estados_cuenta_task(*encolar.call_args.args)  # el worker
+
+        cacheado = cache.get(self.servicio_cache.clave(self.socio.id))
+        self.assertEqual(cacheado, self.servicio_cache.calcular(self.socio.id))
+        self.assertEqual(cacheado.resumen_financiero.cantidad_facturas_pendientes, 2)
+        self.assertEqual(len(cacheado.historial_pagos_recientes), 1)
+
+    def test_sin_broker_se_reconstruye_en_la_siguiente_lectura(self):
+        self.servicio_cache.obtener(self.socio.id)
+
+        with patch.object(reconstruir_estados_cuenta_task, 'delay', side_effect=ConnectionError("sin broker")):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._factura(2)
+
+        self.assertIsNone(cache.get(self.servicio_cache.clave(self.socio.id)))
+        self.assertEqual(self.servicio_cache.obtener(self.socio.id).resumen_financiero.cantidad_facturas_pendientes, 2)
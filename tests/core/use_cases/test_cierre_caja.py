@@ -0,0 +1,56 @@
+from datetime import date, datetime
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from adapters.infrastructure.models import SocioModel, PagoModel, DetallePagoModel
+from core.use_cases.reporting.generar_cierre_caja_uc import GenerarCierreCajaUseCase
+
+GYE = ZoneInfo("America/Guayaquil")
+
+
+class TestGenerarCierreCaja(TestCase):
+    def setUp(self):
+        self.socio = SocioModel.objects.create(identificacion="1700000090", nombres="Juan", apellidos="Soto")
+        self.ana = User.objects.create_user(username='ana', password='x')
+        self.beto = User.objects.create_user(username='beto', password='x')
+
+    def _pago(self, momento, cajero, *detalles, validado=True):
+        pago = PagoModel.objects.create(socio=self.socio, usuario_cobro=cajero, validado=validado,
+                                        monto_total=sum(Decimal(m) for _, m in detalles))
+        PagoModel.objects.filter(pk=pago.pk).update(fecha_registro=momento)
+        for metodo, monto in detalles:
+            DetallePagoModel.objects.create(pago=pago, metodo=metodo, monto=Decimal(monto))
+        return pago
+
+    def test_dias_de_ecuador_metodos_y_cajeros(self):
+        # 23:30 en Guayaquil ya es el día siguiente en UTC: debe contar el 1 de marzo
+        self._pago(datetime(2026, 3, 1, 23, 30, tzinfo=GYE), self.ana, ("EFECTIVO", '10.00'))
+        self._pago(datetime(2026, 3, 2, 0, 10, tzinfo=GYE), self.beto,
+                   ("EFECTIVO", '4.00'), ("TRANSFERENCIA", '6.00'))
+        self._pago(datetime(2026, 3, 31, 12, 0, tzinfo=GYE), self.ana, ("CHEQUE", '7.00'))
+        self._pago(datetime(2026, 3, 15, 9, 0, tzinfo=GYE), self.ana, ("TRANSFERENCIA", '99.00'), validado=False)
+        self._pago(datetime(2026, 4, 1, 0, 0, tzinfo=GYE), self.ana, ("EFECTIVO", '50.00'))  # fuera del mes
+
+        uc = GenerarCierreCajaUseCase()
+        dia = uc.execute(date(2026, 3, 1))
+        self.assertEqual(dia["total_general"], Decimal('10.00'))
+        self.assertEqual(dia["cantidad_transacciones"], 1)
+
+        # Mes completo con series: desglose + conteo + una consulta por serie
+        with self.assertNumQueries(4):
+            mes = uc.execute(date(2026, 3, 1), date(2026, 3, 31), series=['dia', 'cajero'])
+
+        self.assertEqual(mes["total_general"], Decimal('27.00'))
+        self.assertEqual(mes["desglose_medios"], {"EFECTIVO": Decimal('14.00'), "TRANSFERENCIA": Decimal('6.00'),
+                                                  "OTROS": Decimal('7.00')})
+        self.assertEqual(mes["cantidad_transacciones"], 3)
+        self.assertEqual([(d["dia"], d["total"]) for d in mes["por_dia"]],
+                         [(date(2026, 3, 1), Decimal('10.00')), (date(2026, 3, 2), Decimal('10.00')),
+                          (date(2026, 3, 31), Decimal('7.00'))])
+        self.assertEqual({c["cajero"]: c["total"] for c in mes["por_cajero"]},
+                         {"ana": Decimal('17.00'), "beto": Decimal('10.00')})
+
+        solo_beto = uc.execute(date(2026, 3, 1), date(2026, 3, 31), usuario_id=self.beto.id)
+        self.assertEqual(solo_beto["por_metodo"], {"EFECTIVO": Decimal('4.00'), "TRANSFERENCIA": Decimal('6.00')})
@@ -0,0 +1,88 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+
+from adapters.infrastructure.models import (
+    SocioModel, CatalogoRubroModel, CuentaPorCobrarModel, PagoModel, DetallePagoModel, ImputacionPagoModel
+)
+from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+from core.domain.conciliacion_bancaria import leer_extracto_ofx
+from core.shared.enums import MetodoPagoEnum
+from core.shared.fechas import ZONA_CAJA
+from core.use_cases.billing.conciliar_extracto_bancario import ConciliarExtractoBancarioUseCase
+
+
+class TestConciliarExtractoBancario(TestCase):
+    def setUp(self):
+        self.rubro = CatalogoRubroModel.objects.create(nombre="Agua Potable", valor_unitario=Decimal('5.00'))
+        self.hoy = timezone.localdate()
+        self.pagos = [self._transferencia(f"17000000{50 + i}", ref, monto)
+                      for i, (ref, monto) in enumerate([("883201", '5.00'), ("A-77", '10.00'), ("990", '5.00')])]
+
+    def _transferencia(self, identificacion, referencia, monto):
+        socio = SocioModel.objects.create(identificacion=identificacion, nombres="Ana", apellidos="Ríos")
+        CuentaPorCobrarModel.objects.create(socio=socio, rubro=self.rubro, monto_inicial=Decimal(monto),
+                                            saldo_pendiente=Decimal(monto), fecha_vencimiento=date(2026, 1, 31))
+        pago = PagoModel.objects.create(socio=socio, monto_total=Decimal(monto), validado=False)
+        DetallePagoModel.objects.create(pago=pago, metodo=MetodoPagoEnum.TRANSFERENCIA.value,
+                                        monto=Decimal(monto), referencia=referencia)
+        return pago
+
+    def test_aprueba_lo_emparejado_y_devuelve_el_residuo(self):
+        fecha = self.hoy.strftime('%d/%m/%Y')
+        extracto = (
+            "Fecha;Documento;Concepto;Valor\n"
+            f"{fecha};000883201;TRANSF ANA;5,00\n"        # ceros a la izquierda
+            f"{fecha};A77;TRANSF ANA;10,00\n"             # guion omitido por el banco
+            f"{fecha};990;TRANSF ANA;7,00\n"              # monto distinto: no concilia
+            f"{fecha};55;COMISION;-1,50\n"                # débito: se ignora
+            "31/02/2026;1;ERROR;1,00\n"
+        )
+        caso = ConciliarExtractoBancarioUseCase(DjangoPagoRepository())
+        caso.TAMANO_LOTE = 1
+
+        reporte = caso.ejecutar(extracto)
+
+        self.assertEqual(reporte["aprobadas"], 2)
+        self.assertEqual({c["pago_id"] for c in reporte["conciliadas"]}, {self.pagos[0].id, self.pagos[1].id})
+        self.assertEqual([l["referencia"] for l in reporte["lineas_sin_conciliar"]], ["990"])
+        self.assertEqual([t["pago_id"] for t in reporte["transferencias_sin_conciliar"]], [self.pagos[2].id])
+        self.assertEqual(len(reporte["errores"]), 1)
+
+        self.assertEqual(list(PagoModel.objects.filter(validado=True).order_by('id').values_list('id', flat=True)),
+                         [self.pagos[0].id, self.pagos[1].id])
+        self.assertEqual(ImputacionPagoModel.objects.filter(pago_id__in=[p.id for p in self.pagos[:2]]).count(), 2)
+        self.assertEqual(CuentaPorCobrarModel.objects.filter(estado='PAGADA').count(), 2)
+
+        # Reprocesar el mismo extracto no aprueba dos veces
+        self.assertEqual(caso.ejecutar(extracto)["aprobadas"], 0)
+
+    def test_rango_de_transferencias_en_dias_locales(self):
+        # 23:59 del día local entra; 00:00 del día siguiente ya no (rango semiabierto)
+        ultimo_minuto = datetime(2026, 3, 10, 23, 59, tzinfo=ZONA_CAJA)
+        PagoModel.objects.filter(pk=self.pagos[0].pk).update(fecha_registro=ultimo_minuto)
+        PagoModel.objects.filter(pk=self.pagos[1].pk).update(fecha_registro=ultimo_minuto + timedelta(minutes=1))
+
+        pendientes = DjangoPagoRepository().obtener_transferencias_por_validar(date(2026, 3, 10), date(2026, 3, 10))
+        self.assertEqual([(t.pago_id, t.fecha) for t in pendientes], [(self.pagos[0].id, date(2026, 3, 10))])
+
+    def test_simular_no_aprueba(self):
+        extracto = f"fecha,referencia,monto\n{self.hoy.isoformat()},883201,5.00\n"
+        reporte = ConciliarExtractoBancarioUseCase(DjangoPagoRepository()).ejecutar(extracto, aprobar=False)
+
+        self.assertEqual(len(reporte["conciliadas"]), 1)
+        self.assertFalse(PagoModel.objects.filter(validado=True).exists())
+
+    def test_lee_ofx_sgml(self):
+        ofx = (
+            "OFXHEADER:100\n<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>\n"
+            "<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20260115120000\n<TRNAMT>1,234.50\n<FITID>X1\n<REFNUM>883201\n"
+            "<STMTTRN>\n<TRNTYPE>DEBIT\n<DTPOSTED>20260116\n<TRNAMT>-2.00\n<FITID>X2\n"
+            "</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>"
+        )
+        lineas, errores = leer_extracto_ofx(ofx)
+
+        self.assertEqual(errores, [])
+        self.assertEqual([(l.fecha, l.referencia, l.monto) for l in lineas],
+                         [(date(2026, 1, 15), "883201", Decimal('1234.50'))])
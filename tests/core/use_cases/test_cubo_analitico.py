@@ -0,0 +1,113 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from adapters.infrastructure.models import (
+    SocioModel, BarrioModel, TerrenoModel, ServicioModel, MedidorModel, LecturaModel, FacturaModel
+)
+from core.services.cubo_analitico_service import CuboAnaliticoService, CuboOLAP
+from core.shared.enums import EstadoFinanciero
+from core.use_cases.reporting.construir_cubo_analitico_uc import ConstruirCuboAnaliticoUseCase
+
+
+class TestCuboAnalitico(TestCase):
+    def setUp(self):
+        cache.clear()
+        CuboAnaliticoService.invalidar()
+
+        self.centro = BarrioModel.objects.create(nombre="Centro")
+        medido = self._servicio("1700000090", 'MEDIDO')
+        fijo = self._servicio("1700000091", 'FIJO')
+        medidor = MedidorModel.objects.create(codigo="MED-90", terreno=medido.terreno, lectura_inicial=0)
+
+        # Medido: noviembre en tramo base (100 m³), diciembre con excedente (150 m³)
+        for mes, consumo, total in ((11, 100, '3.00'), (12, 150, '10.50')):
+            lectura = LecturaModel.objects.create(medidor=medidor, valor=consumo, lectura_anterior=0,
+                                                  consumo_del_mes=consumo, fecha=date(2025, mes, 28),
+                                                  anio=2025, mes=mes)
+            self._factura(medido.socio, 2025, mes, total, servicio=medido, lectura=lectura)
+        self._factura(fijo.socio, 2026, 1, '3.00', servicio=fijo, estado=EstadoFinanciero.PAGADA)
+        self._factura(fijo.socio, 2025, 12, '9.00', servicio=fijo, estado=EstadoFinanciero.ANULADA)
+        # Venta POS sin servicio ni barrio
+        self._factura(SocioModel.objects.create(identificacion="1700000092", nombres="Leo", apellidos="Sol"),
+                      2026, 1, '4.00')
+
+    def tearDown(self):
+        cache.clear()
+        CuboAnaliticoService.invalidar()
+
+    def _servicio(self, identificacion, tipo):
+        socio = SocioModel.objects.create(identificacion=identificacion, nombres="Ana", apellidos="Vaca",
+                                          barrio=self.centro)
+        terreno = TerrenoModel.objects.create(socio=socio, barrio=self.centro, direccion="Calle 9")
+        return ServicioModel.objects.create(socio=socio, terreno=terreno, tipo=tipo, activo=True)
+
+    def _factura(self, socio, anio, mes, total, estado=EstadoFinanciero.PENDIENTE, **extra):
+        return FacturaModel.objects.create(socio=socio, anio=anio, mes=mes, total=Decimal(total),
+                                           estado_financiero=estado, fecha_emision=date(anio, mes, 1),
+                                           fecha_vencimiento=date(anio, mes, 28), **extra)
+
+    def test_construye_y_responde_slices_dice_y_rollup(self):
+        resumen = ConstruirCuboAnaliticoUseCase().ejecutar()
+        self.assertEqual(resumen["meses"], 3)  # 2025-11 .. 2026-01
+
+        # Lo que recibe otro proceso: los bytes publicados en el cache compartido
+        cubo = CuboOLAP.desde_bytes(cache.get(CuboAnaliticoService.clave_datos(resumen["version"])))
+        self.assertEqual(cubo.consultar()["totales"],
+                         {"consumo_m3": 250.0, "facturado": 20.5, "pagado": 3.0, "facturas": 4})
+
+        por_tipo = {f["tipo_servicio"]: f for f in cubo.consultar(por=['tipo_servicio'])["filas"]}
+        self.assertEqual(por_tipo["MEDIDO"]["consumo_m3"], 250.0)
+        self.assertEqual(por_tipo["FIJO"]["facturas"], 1)  # la anulada no cuenta
+        self.assertEqual(por_tipo["OTRO"]["facturado"], 4.0)
+
+        excedente = cubo.consultar(medidas=['facturado'], por=['mes'], filtros={'tramo': ['EXCEDENTE']})
+        self.assertEqual(excedente["filas"], [{"mes": "2025-12", "facturado": 10.5}])
+
+        por_anio = cubo.consultar(medidas=['facturas'], por=['anio', 'barrio'], desde='2025-12')
+        self.assertEqual([(f["anio"], f["barrio_nombre"], f["facturas"]) for f in por_anio["filas"]],
+                         [(2025, "Centro", 1), (2026, "Sin Barrio", 1), (2026, "Centro", 1)])
+
+        with self.assertRaises(ValueError):
+            cubo.consultar(por=['mes', 'anio'])
+
+    def test_api_carga_el_cubo_una_vez_por_version(self):
+        cliente = APIClient()
+        cliente.force_authenticate(user=User.objects.create_user(username='gerencia', password='x'))
+
+        self.assertEqual(cliente.get('/api/v1/analytics/cubo/').status_code, 503)
+        ConstruirCuboAnaliticoUseCase().ejecutar()
+
+        respuesta = cliente.get('/api/v1/analytics/cubo/', {'por': 'barrio', 'tipo_servicio': 'MEDIDO,FIJO',
+                                                            'medidas': 'facturado'})
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(respuesta.data["filas"], [
+            {"barrio": self.centro.id, "barrio_nombre": "Centro", "facturado": 16.5}
+        ])
+        cargado = CuboAnaliticoService.obtener()
+        cliente.get('/api/v1/analytics/cubo/')
+        self.assertIs(CuboAnaliticoService.obtener(), cargado)
+
+        # Nueva publicación: se recarga y la versión anterior sale del cache
+        anterior = cache.get(CuboAnaliticoService.clave_actual())
+        ConstruirCuboAnaliticoUseCase().ejecutar()
+        self.assertIsNot(CuboAnaliticoService.obtener(), cargado)
+        self.assertIsNone(cache.get(CuboAnaliticoService.clave_datos(anterior)))
+
+        self.assertEqual(cliente.get('/api/v1/analytics/cubo/', {'por': 'color'}).status_code, 400)
+
+    def test_benchmark_siembra_mide_y_revierte(self):
+        facturas = FacturaModel.objects.count()
+        salida = StringIO()
+        call_command('construir_cubo_analitico', benchmark=True, socios=30, anios=1, barrios=3,
+                     repeticiones=2, stdout=salida)
+
+        self.assertIn("Sembradas 360 facturas", salida.getvalue())
+        self.assertIn("Extracción (SQL agrupado)", salida.getvalue())
+        self.assertEqual(FacturaModel.objects.count(), facturas)
+        self.assertIsNone(cache.get(CuboAnaliticoService.clave_actual()))
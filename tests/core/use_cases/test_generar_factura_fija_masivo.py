@@ -0,0 +1,75 @@
+from datetime import date
+from unittest import mock
+from django.db import OperationalError
+from django.test import TestCase
+
+from adapters.infrastructure.models import (
+    BarrioModel, SocioModel, TerrenoModel, ServicioModel, FacturaModel, DetalleFacturaModel
+)
+from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+from adapters.infrastructure.repositories.django_servicio_repository import DjangoServicioRepository
+from core.shared.exceptions import PersistenciaTransitoriaError
+from core.use_cases.generar_factura_fija_uc import GenerarFacturaFijaUseCase
+
+
+class GenerarFacturaFijaMasivoTests(TestCase):
+
+    def setUp(self):
+        barrio = BarrioModel.objects.create(nombre="Barrio Bulk")
+        otro_barrio = BarrioModel.objects.create(nombre="Barrio Bulk 2")
+        for i in range(5):
+            socio = SocioModel.objects.create(
+                identificacion=f"17000000{i:02d}", nombres="Socio", apellidos=f"Bulk {i}",
+                barrio=barrio if i < 3 else otro_barrio
+            )
+            terreno = TerrenoModel.objects.create(socio=socio, barrio=barrio, direccion=f"Lote {i}")
+            ServicioModel.objects.create(socio=socio, terreno=terreno, tipo='FIJO', activo=True)
+
+        self.use_case = GenerarFacturaFijaUseCase(DjangoFacturaRepository(), DjangoServicioRepository())
+
+    def test_crea_facturas_en_pocas_consultas(self):
+        """El número de consultas no depende del número de servicios"""
+        with self.assertNumQueries(8):
+            reporte = self.use_case.ejecutar_masivo(anio=2026, mes=3, fecha_emision=date(2026, 3, 1))
+
+        self.assertEqual(reporte["creadas"], 5)
+        self.assertEqual(reporte["errores"], [])
+        self.assertEqual(FacturaModel.objects.filter(anio=2026, mes=3).count(), 5)
+        self.assertEqual(DetalleFacturaModel.objects.filter(factura__anio=2026, factura__mes=3).count(), 5)
+
+    def test_segunda_corrida_omite_servicios_facturados(self):
+        self.use_case.ejecutar_masivo(anio=2026, mes=3, fecha_emision=date(2026, 3, 1))
+        reporte = self.use_case.ejecutar_masivo(anio=2026, mes=3, fecha_emision=date(2026, 3, 1))
+
+        self.assertEqual(reporte["creadas"], 0)
+        self.assertEqual(reporte["omitidas"], 5)
+
+    def test_particiones_por_barrio_cubren_todos_los_servicios(self):
+        particiones = self.use_case.planificar_particiones("barrio")
+        reportes = [
+            self.use_case.ejecutar_masivo(anio=2026, mes=3, fecha_emision=date(2026, 3, 1), **p)
+            for p in particiones
+        ]
+        consolidado = GenerarFacturaFijaUseCase.consolidar_reportes(reportes)
+
+        self.assertEqual(len(particiones), 2)
+        self.assertEqual(consolidado["creadas"], 5)
+        self.assertEqual(consolidado["total_servicios"], 5)
+
+    def test_error_transitorio_de_bd_no_se_reporta_por_fila(self):
+        """Un deadlock o caída de conexión sube a la tarea (reintento), no marca todas las filas"""
+        with mock.patch.object(DjangoFacturaRepository, 'guardar_masivo',
+                               side_effect=PersistenciaTransitoriaError("deadlock")), \
+                mock.patch.object(DjangoFacturaRepository, '_crear', side_effect=OperationalError("gone away")):
+            with self.assertRaises(PersistenciaTransitoriaError):
+                self.use_case.ejecutar_masivo(anio=2026, mes=3, fecha_emision=date(2026, 3, 1))
+        self.assertFalse(FacturaModel.objects.filter(anio=2026, mes=3).exists())
+
+    def test_particion_solo_consulta_sus_servicios_facturados(self):
+        barrio_id = SocioModel.objects.filter(apellidos="Bulk 4").values_list('barrio_id', flat=True).get()
+        with mock.patch.object(DjangoFacturaRepository, 'obtener_servicios_facturados_mes',
+                               wraps=self.use_case.factura_repo.obtener_servicios_facturados_mes) as consulta:
+            self.use_case.ejecutar_masivo(anio=2026, mes=3, fecha_emision=date(2026, 3, 1), barrio_id=barrio_id)
+
+        esperados = set(ServicioModel.objects.filter(socio__barrio_id=barrio_id).values_list('id', flat=True))
+        self.assertEqual(set(consulta.call_args.kwargs["servicio_ids"]), esperados)
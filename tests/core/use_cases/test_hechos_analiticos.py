@@ -0,0 +1,105 @@
+from dataclasses import replace
+from datetime import date, timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+
+from adapters.infrastructure.models import (
+    SocioModel, BarrioModel, TerrenoModel, ServicioModel, MedidorModel, LecturaModel, FacturaModel,
+    DetalleFacturaModel, CatalogoRubroModel, PagoModel, DetallePagoModel, HechoAnaliticoModel
+)
+from adapters.infrastructure.repositories.django_hechos_analiticos_repository import DjangoHechosAnaliticosRepository
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
+from core.shared.enums import GranularidadHecho, IndicadorAnalitico, MetodoPagoEnum
+from core.use_cases.reporting.actualizar_hechos_analiticos_uc import ActualizarHechosAnaliticosUseCase, PROCESO_HECHOS
+from core.use_cases.reporting.obtener_kpis_dashboard_uc import ObtenerKpisDashboardUseCase
+
+
+class TestHechosAnaliticos(TestCase):
+    def setUp(self):
+        self.hoy = timezone.localdate()
+        self.barrio = BarrioModel.objects.create(nombre="Centro")
+        self.rubro = CatalogoRubroModel.objects.create(nombre="Agua Potable", valor_unitario=Decimal('3.00'))
+        self.socio = SocioModel.objects.create(identificacion="1700000080", nombres="Rosa", apellidos="Gil",
+                                               barrio=self.barrio)
+        terreno = TerrenoModel.objects.create(socio=self.socio, barrio=self.barrio, direccion="Calle 3")
+        self.servicio = ServicioModel.objects.create(socio=self.socio, terreno=terreno, tipo='MEDIDO', activo=True)
+        medidor = MedidorModel.objects.create(codigo="MED-80", terreno=terreno, lectura_inicial=0)
+        self.lectura = LecturaModel.objects.create(medidor=medidor, valor=12, lectura_anterior=0, consumo_del_mes=12,
+                                                   fecha=self.hoy, anio=self.hoy.year, mes=self.hoy.month)
+        self._factura(self.hoy.month, Decimal('8.00'))
+        self._pago('5.00')
+
+        self.repo = DjangoHechosAnaliticosRepository()
+        self.uc = ActualizarHechosAnaliticosUseCase(self.repo)
+
+    def _factura(self, mes, total):
+        factura = FacturaModel.objects.create(
+            socio=self.socio, servicio=self.servicio, anio=self.hoy.year, mes=mes, total=total,
+            fecha_emision=self.hoy, fecha_vencimiento=self.hoy
+        )
+        DetalleFacturaModel.objects.create(factura=factura, rubro=self.rubro, concepto="Agua", cantidad=1,
+                                           precio_unitario=total, subtotal=total)
+        return factura
+
+    def _pago(self, monto, validado=True):
+        pago = PagoModel.objects.create(socio=self.socio, monto_total=Decimal(monto), validado=validado)
+        DetallePagoModel.objects.create(pago=pago, metodo=MetodoPagoEnum.EFECTIVO.value, monto=Decimal(monto))
+        return pago
+
+    def _mes(self, indicador, por=None):
+        mes = self.hoy.replace(day=1)
+        return self.repo.totales(indicador, GranularidadHecho.MES, mes, mes, por=por)
+
+    def test_primera_corrida_completa_y_luego_solo_lo_modificado(self):
+        self.assertEqual(self.uc.ejecutar()["modo"], "completo")
+        self.assertEqual(self._mes(IndicadorAnalitico.FACTURAS), {"valor": Decimal('8.00'), "cantidad": 1})
+        self.assertEqual(self._mes(IndicadorAnalitico.RECAUDADO)["valor"], Decimal('5.00'))
+        self.assertEqual(self._mes(IndicadorAnalitico.FACTURADO_RUBRO, por='rubro')[0]["rubro__nombre"],
+                         "Agua Potable")
+
+        # Watermark posterior a los datos iniciales: la siguiente corrida no debe volver a tocarlos
+        self.repo.guardar_marca(PROCESO_HECHOS, timezone.now() + ActualizarHechosAnaliticosUseCase.MARGEN)
+        anulado = self._pago('2.00')
+        self._pago('3.00')
+        self._pago('9.00', validado=False)  # transferencia por validar: aún no es recaudación
+        PagoModel.objects.filter(pk=anulado.pk).first().delete()
+
+        resultado = self.uc.ejecutar()
+
+        self.assertEqual(resultado["modo"], "incremental")
+        self.assertEqual(resultado["dias_recalculados"][IndicadorAnalitico.RECAUDADO], 1)
+        self.assertEqual(resultado["dias_recalculados"][IndicadorAnalitico.CONSUMO_M3], 0)
+        self.assertEqual(self._mes(IndicadorAnalitico.RECAUDADO), {"valor": Decimal('8.00'), "cantidad": 2})
+        dia = self.repo.totales(IndicadorAnalitico.RECAUDADO, GranularidadHecho.DIA, self.hoy, self.hoy)
+        self.assertEqual(dia["valor"], Decimal('8.00'))
+        self.assertEqual(HechoAnaliticoModel.objects.filter(
+            indicador=IndicadorAnalitico.RECAUDADO, granularidad=GranularidadHecho.MES).count(), 1)
+
+    def test_correccion_de_lectura_refresca_el_dia_nuevo_y_el_anterior(self):
+        self.uc.ejecutar()
+        self.repo.guardar_marca(PROCESO_HECHOS, timezone.now() + ActualizarHechosAnaliticosUseCase.MARGEN)
+        ayer = self.hoy - timedelta(days=1)
+
+        lectura_repo = DjangoLecturaRepository()
+        lectura_repo.save(replace(lectura_repo.get_by_id(self.lectura.id), fecha=ayer, consumo_del_mes_m3=20))
+        resultado = self.uc.ejecutar()
+
+        self.assertEqual(resultado["dias_recalculados"][IndicadorAnalitico.CONSUMO_M3], 2)
+        del_dia = lambda dia: self.repo.totales(IndicadorAnalitico.CONSUMO_M3, GranularidadHecho.DIA, dia, dia)
+        self.assertEqual(del_dia(ayer)["valor"], Decimal('20.00'))
+        self.assertEqual(del_dia(self.hoy)["cantidad"], 0)
+
+    def test_kpis_del_dashboard(self):
+        self.uc.ejecutar()
+        DjangoSaldoSocioRepository().recalcular()
+
+        kpis = ObtenerKpisDashboardUseCase(self.repo, DjangoSaldoSocioRepository()).ejecutar(self.hoy)
+
+        self.assertEqual(kpis["facturacion_mes_actual"], Decimal('8.00'))
+        self.assertEqual(kpis["recaudacion_mes_actual"], Decimal('5.00'))
+        self.assertEqual(kpis["tasa_recaudacion"], Decimal('62.50'))
+        self.assertEqual([(c["barrio__nombre"], c["valor"]) for c in kpis["consumo_por_barrio"]],
+                         [("Centro", Decimal('12.00'))])
+        self.assertIsNotNone(kpis["actualizado_hasta"])
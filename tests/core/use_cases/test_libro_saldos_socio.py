@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+
+from adapters.infrastructure.models import (
+    SocioModel, BarrioModel, TerrenoModel, ServicioModel, CatalogoRubroModel,
+    CuentaPorCobrarModel, SaldoSocioModel
+)
+from adapters.infrastructure.repositories.django_saldo_socio_repository import DjangoSaldoSocioRepository
+from core.use_cases.billing.process_payment import ProcesarAbonoUseCase
+from core.use_cases.servicio.gestionar_corte_servicio import ProcesarCortesBatchUseCase
+
+
+class TestLibroSaldosSocio(TestCase):
+    def setUp(self):
+        self.barrio = BarrioModel.objects.create(nombre="Centro")
+        self.agua = CatalogoRubroModel.objects.create(nombre="Agua Potable", tipo="AGUA_POTABLE",
+                                                      valor_unitario=Decimal('10.00'))
+        self.hoy = date.today()
+
+    def _socio(self, identificacion, vencimientos):
+        socio = SocioModel.objects.create(identificacion=identificacion, nombres="Rosa", apellidos="Vega")
+        terreno = TerrenoModel.objects.create(socio=socio, barrio=self.barrio, direccion="Lote 1")
+        ServicioModel.objects.create(socio=socio, terreno=terreno, tipo='FIJO', activo=True)
+        for dias in vencimientos:
+            CuentaPorCobrarModel.objects.create(
+                socio=socio, rubro=self.agua, monto_inicial=Decimal('10.00'),
+                saldo_pendiente=Decimal('10.00'), fecha_vencimiento=self.hoy + timedelta(days=dias)
+            )
+        return socio
+
+    def test_cargo_abono_y_anulacion_mantienen_el_libro(self):
+        socio = self._socio("1700000020", [-60, -30, 10])
+        saldo = SaldoSocioModel.objects.get(socio=socio)
+        self.assertEqual((saldo.deuda_total, saldo.cuentas_abiertas), (Decimal('30.00'), 3))
+        self.assertEqual(saldo.vencimiento_mas_antiguo, self.hoy - timedelta(days=60))
+        self.assertEqual(saldo.vencimiento_corte, self.hoy - timedelta(days=30))
+
+        ProcesarAbonoUseCase().ejecutar(socio.id, Decimal('15.00'), usuario_id=None)
+        saldo.refresh_from_db()
+        self.assertEqual((saldo.deuda_total, saldo.cuentas_abiertas), (Decimal('15.00'), 2))
+        self.assertEqual(saldo.vencimiento_mas_antiguo, self.hoy - timedelta(days=30))
+
+        ultima = CuentaPorCobrarModel.objects.filter(socio=socio).order_by('-fecha_vencimiento').first()
+        ultima.estado, ultima.saldo_pendiente = 'ANULADO', Decimal('0.00')
+        ultima.save()
+        saldo.refresh_from_db()
+        self.assertEqual((saldo.deuda_total, saldo.cuentas_abiertas, saldo.vencimiento_corte),
+                         (Decimal('5.00'), 1, None))
+        self.assertEqual(DjangoSaldoSocioRepository().verificar([socio.id]), [])
+
+    def test_verificador_reporta_y_repara_la_deriva(self):
+        socio = self._socio("1700000021", [-10])
+        # update() no emite signals: el libro queda desfasado
+        CuentaPorCobrarModel.objects.filter(socio=socio).update(saldo_pendiente=Decimal('4.00'))
+
+        salida = StringIO()
+        call_command('verificar_saldos_socios', '--socio', str(socio.id), stdout=salida)
+        self.assertIn('1 socios con diferencias', salida.getvalue())
+
+        call_command('verificar_saldos_socios', '--reparar', stdout=StringIO())
+        self.assertEqual(SaldoSocioModel.objects.get(socio=socio).deuda_total, Decimal('4.00'))
+        self.assertEqual(DjangoSaldoSocioRepository().verificar(), [])
+
+    def test_cortes_solo_para_socios_con_dos_planillas_vencidas(self):
+        moroso = self._socio("1700000022", [-60, -30])
+        al_dia = self._socio("1700000023", [-30, 15])
+
+        self.assertEqual(DjangoSaldoSocioRepository().socios_en_mora_para_corte(self.hoy), [moroso.id])
+
+        resultado = ProcesarCortesBatchUseCase().ejecutar()
+
+        self.assertEqual(resultado["cortes_generados"], 1)
+        self.assertEqual(ServicioModel.objects.get(socio=moroso).estado, 'SUSPENDIDO')
+        self.assertEqual(ServicioModel.objects.get(socio=al_dia).estado, 'ACTIVO')
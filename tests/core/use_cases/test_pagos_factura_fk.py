@@ -0,0 +1,50 @@
+import importlib
+from datetime import date
+from decimal import Decimal
+from django.apps import apps
+from django.test import TestCase
+
+from adapters.infrastructure.models import SocioModel, FacturaModel, PagoModel, DetallePagoModel
+from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+from core.shared.enums import MetodoPagoEnum
+
+backfill = importlib.import_module('adapters.infrastructure.migrations.0012_pagos_factura_fk')
+
+
+class TestPagosFacturaFK(TestCase):
+    def setUp(self):
+        self.socio = SocioModel.objects.create(identificacion="1700000010", nombres="Luis", apellidos="Mora")
+        self.otro = SocioModel.objects.create(identificacion="1700000011", nombres="Eva", apellidos="Ruiz")
+        self.factura = FacturaModel.objects.create(
+            socio=self.socio, fecha_emision=date(2026, 1, 1), fecha_vencimiento=date(2026, 1, 31)
+        )
+
+    def _transferencia(self, socio, monto, validado, factura=None, observacion=None):
+        pago = PagoModel.objects.create(socio=socio, factura=factura, monto_total=monto,
+                                        validado=validado, observacion=observacion)
+        DetallePagoModel.objects.create(pago=pago, metodo=MetodoPagoEnum.TRANSFERENCIA.value, monto=monto)
+        return pago
+
+    def test_sumatoria_y_pendientes_usan_la_fk(self):
+        self._transferencia(self.socio, Decimal('4.00'), True, factura=self.factura)
+        self._transferencia(self.socio, Decimal('2.00'), False, factura=self.factura)
+        # Texto engañoso: "Factura #1" también aparece dentro de "Factura #12"
+        self._transferencia(self.socio, Decimal('9.00'), True, observacion=f"Factura #{self.factura.id}2")
+        repo = DjangoPagoRepository()
+
+        self.assertEqual(repo.obtener_sumatoria_validada(self.factura.id), 4.0)
+        self.assertTrue(repo.tiene_pagos_pendientes(self.factura.id))
+
+    def test_backfill_liga_solo_observaciones_del_mismo_socio(self):
+        propio = self._transferencia(self.socio, Decimal('3.00'), True,
+                                     observacion=f"Pago web para Factura #{self.factura.id}")
+        ajeno = self._transferencia(self.otro, Decimal('3.00'), True,
+                                    observacion=f"Pago web para Factura #{self.factura.id}")
+        sin_factura = self._transferencia(self.socio, Decimal('1.00'), True, observacion="Factura #999999")
+
+        backfill.poblar_factura_desde_observacion(apps, None)
+
+        propio.refresh_from_db(), ajeno.refresh_from_db(), sin_factura.refresh_from_db()
+        self.assertEqual(propio.factura_id, self.factura.id)
+        self.assertIsNone(ajeno.factura_id)
+        self.assertIsNone(sin_factura.factura_id)
@@ -0,0 +1,71 @@
+from datetime import date
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from adapters.infrastructure.models import (
+    SocioModel, CatalogoRubroModel, CuentaPorCobrarModel, ImputacionPagoModel, FacturaModel
+)
+from core.use_cases.billing.process_payment import ProcesarAbonoUseCase
+
+
+class TestProcesarAbonoFIFO(TestCase):
+    def setUp(self):
+        self.rubro = CatalogoRubroModel.objects.create(nombre="Agua Potable", valor_unitario=Decimal('10.00'))
+
+    def _socio_con_deudas(self, identificacion, cantidad):
+        socio = SocioModel.objects.create(identificacion=identificacion, nombres="Ana", apellidos="Paz")
+        cuentas = [
+            CuentaPorCobrarModel.objects.create(
+                socio=socio, rubro=self.rubro, monto_inicial=Decimal('10.00'),
+                saldo_pendiente=Decimal('10.00'), fecha_vencimiento=date(2026, 1, 31)
+            )
+            for _ in range(cantidad)
+        ]
+        return socio, cuentas
+
+    def test_imputa_fifo_y_registra_la_traza(self):
+        socio, cuentas = self._socio_con_deudas("1700000001", 4)
+
+        resultado = ProcesarAbonoUseCase().ejecutar(socio.id, Decimal('25.00'), usuario_id=None)
+
+        saldos = list(CuentaPorCobrarModel.objects.filter(socio=socio).order_by('id')
+                      .values_list('saldo_pendiente', 'estado'))
+        self.assertEqual(saldos, [
+            (Decimal('0.00'), 'PAGADA'), (Decimal('0.00'), 'PAGADA'),
+            (Decimal('5.00'), 'PENDIENTE'), (Decimal('10.00'), 'PENDIENTE'),
+        ])
+        self.assertEqual(resultado.cuentas_afectadas, 3)
+        self.assertEqual(resultado.saldo_restante_total, Decimal('15.00'))
+        traza = list(ImputacionPagoModel.objects.filter(pago_id=resultado.pago_id).order_by('cuenta_id')
+                     .values_list('cuenta_id', 'monto'))
+        self.assertEqual(traza, [(cuentas[0].id, Decimal('10.00')), (cuentas[1].id, Decimal('10.00')),
+                                 (cuentas[2].id, Decimal('5.00'))])
+
+    def test_consultas_no_crecen_con_el_numero_de_deudas(self):
+        pocas, _ = self._socio_con_deudas("1700000002", 3)
+        muchas, _ = self._socio_con_deudas("1700000003", 60)
+
+        with CaptureQueriesContext(connection) as con_pocas:
+            ProcesarAbonoUseCase().ejecutar(pocas.id, Decimal('15.00'), usuario_id=None)
+        with CaptureQueriesContext(connection) as con_muchas:
+            ProcesarAbonoUseCase().ejecutar(muchas.id, Decimal('15.00'), usuario_id=None)
+
+        self.assertEqual(len(con_pocas.captured_queries), len(con_muchas.captured_queries))
+        self.assertEqual(CuentaPorCobrarModel.objects.filter(socio=muchas, saldo_pendiente__lt=10).count(), 2)
+
+    def test_cierra_la_factura_solo_cuando_se_saldan_todas_sus_cuentas(self):
+        socio, cuentas = self._socio_con_deudas("1700000004", 2)
+        factura = FacturaModel.objects.create(socio=socio, fecha_emision=date(2026, 1, 1),
+                                              fecha_vencimiento=date(2026, 1, 31))
+        CuentaPorCobrarModel.objects.filter(pk__in=[c.id for c in cuentas]).update(factura=factura)
+
+        ProcesarAbonoUseCase().ejecutar(socio.id, Decimal('10.00'), usuario_id=None)
+        factura.refresh_from_db()
+        self.assertEqual(factura.estado_financiero, 'PENDIENTE')
+
+        resultado = ProcesarAbonoUseCase().ejecutar(socio.id, Decimal('10.00'), usuario_id=None)
+        factura.refresh_from_db()
+        self.assertEqual(factura.estado_financiero, 'PAGADA')
+        self.assertEqual(resultado.cuentas_afectadas, 1)
@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from django.test import TestCase
+
+from adapters.infrastructure.models import SocioModel, BarrioModel, TerrenoModel, ServicioModel, FacturaModel
+from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
+
+
+class TestGenerarReporteCartera(TestCase):
+    def setUp(self):
+        self.hoy = date(2026, 6, 30)
+        self.barrio = BarrioModel.objects.create(nombre="Centro")
+
+    def _socio(self, identificacion, facturas, barrio=None, estado='PENDIENTE'):
+        socio = SocioModel.objects.create(identificacion=identificacion, nombres="Luis", apellidos="Vera",
+                                          barrio=barrio)
+        terreno = TerrenoModel.objects.create(socio=socio, barrio=self.barrio, direccion="Calle 2")
+        servicio = ServicioModel.objects.create(socio=socio, terreno=terreno, tipo='FIJO', activo=True)
+        for mes, (dias, total) in enumerate(facturas, start=1):
+            emision = self.hoy - timedelta(days=dias)
+            FacturaModel.objects.create(socio=socio, servicio=servicio, anio=2026, mes=mes, total=Decimal(total),
+                                        fecha_emision=emision, fecha_vencimiento=emision,
+                                        estado_financiero=estado)
+        return socio
+
+    def test_tramos_orden_y_paginacion_en_una_consulta(self):
+        a = self._socio("1700000070", [(10, '3.00'), (30, '2.00'), (31, '4.00'), (90, '1.00'), (91, '5.00')],
+                        barrio=self.barrio)
+        b = self._socio("1700000071", [(200, '20.00')])
+        self._socio("1700000072", [(5, '50.00')], estado='PAGADA')
+
+        uc = GenerarReporteCarteraUseCase()
+        with self.assertNumQueries(1):
+            reporte = uc.execute(hoy=self.hoy)
+
+        self.assertEqual([r["socio_id"] for r in reporte], [b.id, a.id])
+        fila = reporte[1]
+        self.assertEqual((fila["corriente"], fila["vencido_1_3"], fila["incobrable"], fila["total_deuda"]),
+                         (Decimal('5.00'), Decimal('5.00'), Decimal('5.00'), Decimal('15.00')))
+        self.assertEqual(fila["facturas_pendientes"], 5)
+        self.assertEqual(fila["barrio"], "Centro")
+        self.assertEqual(reporte[0]["barrio"], "Sin Barrio")
+
+        self.assertEqual([r["socio_id"] for r in uc.execute(limite=1, offset=1, hoy=self.hoy)], [a.id])
+        self.assertEqual(uc.contar(), 2)
+        self.assertEqual(uc.resumen(hoy=self.hoy)["incobrable"], Decimal('25.00'))
@@ -0,0 +1,60 @@
+from io import StringIO
+from datetime import date
+from decimal import Decimal
+from django.core.management import call_command
+from django.test import TestCase
+
+from adapters.infrastructure.models import MedidorModel, LecturaModel
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
+from core.use_cases.lectura_dtos import RegistrarLecturaDTO
+from core.use_cases.registrar_lectura_uc import RegistrarLecturaUseCase
+
+
+class TestUltimaLecturaSnapshot(TestCase):
+    def setUp(self):
+        self.medidor = MedidorModel.objects.create(codigo="MED-SNAP", lectura_inicial=10)
+
+    def _lectura(self, valor, fecha):
+        return LecturaModel.objects.create(
+            medidor=self.medidor, valor=valor, lectura_anterior=0, consumo_del_mes=0,
+            fecha=fecha, anio=fecha.year, mes=fecha.month
+        )
+
+    def test_alta_y_borrado_mantienen_snapshot(self):
+        enero = self._lectura(30, date(2026, 1, 10))
+        febrero = self._lectura(45, date(2026, 2, 10))
+
+        self.medidor.refresh_from_db()
+        self.assertEqual(self.medidor.ultima_lectura_id, febrero.id)
+        self.assertEqual(self.medidor.ultima_lectura_valor, Decimal('45'))
+
+        febrero.delete()
+        self.medidor.refresh_from_db()
+        self.assertEqual(self.medidor.ultima_lectura_id, enero.id)
+        self.assertEqual(self.medidor.ultima_lectura_fecha, date(2026, 1, 10))
+
+    def test_registrar_lectura_usa_snapshot_como_base(self):
+        self._lectura(30, date(2026, 1, 10))
+        uc = RegistrarLecturaUseCase(DjangoLecturaRepository(), DjangoMedidorRepository())
+
+        lectura = uc.ejecutar(RegistrarLecturaDTO(
+            medidor_id=self.medidor.id, lectura_actual=42, fecha_lectura=date(2026, 2, 10), operador_id=None
+        ))
+
+        self.assertEqual(lectura.lectura_anterior, 30)
+        self.assertEqual(lectura.consumo_del_mes_m3, 12)
+        self.medidor.refresh_from_db()
+        self.assertEqual(self.medidor.ultima_lectura_id, lectura.id)
+
+    def test_comando_reconstruye_snapshot_desfasado(self):
+        lectura = self._lectura(30, date(2026, 1, 10))
+        MedidorModel.objects.filter(pk=self.medidor.pk).update(
+            ultima_lectura=None, ultima_lectura_valor=None, ultima_lectura_fecha=None
+        )
+
+        call_command('reconstruir_ultima_lectura', stdout=StringIO())
+
+        self.medidor.refresh_from_db()
+        self.assertEqual(self.medidor.ultima_lectura_id, lectura.id)
+        self.assertEqual(self.medidor.ultima_lectura_valor, Decimal('30'))